@@ -1,18 +1,19 @@
+import copy
 import fnmatch
 import json
 import logging
 import os
-import pickle
-import hmac
-import hashlib
-import base64
-import typing
+import queue
+import shutil
 import sys
 import tempfile
+import threading
 import time
 import traceback
+import typing
 import uuid
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -34,22 +35,86 @@ except ImportError:
     portalocker = None
 
 
+from src.batch_scheduler import (
+    DEFAULT_IN_FLIGHT_PER_WORKER,
+    DEFAULT_SCHEDULE,
+    SCHEDULE_POLICIES,
+    FileJob,
+    iter_bounded_submit,
+    plan_batch_jobs,
+    plan_schedule,
+)
+from src.calculator_pool import get_calculator_pool
 from src.cli_helpers import (
     BatchConfig,
     configure_logging,
     load_project_calculator,
     resolve_file_format,
 )
-from src.physics import AeroCalculator
+from src.config import get_config
+from src.dir_watcher import (
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_SETTLE_SECONDS,
+    DirectoryPoller,
+)
+from src.geometry import body_to_axes_matrices
+from src.io_pipeline import DEFAULT_PIPELINE_DEPTH, run_pipeline
+from src.output_formats import (
+    DEFAULT_OUTPUT_FORMAT,
+    OUTPUT_FORMATS,
+    ensure_output_format_available,
+    normalize_output_format,
+    open_output_writer,
+    output_suffix,
+    read_output_frame,
+    with_output_suffix,
+)
+from src.parse_cache import load_special_format_file
+from src.physics import AeroCalculator, ResultBuffer
+from src.result_cache import (
+    DEFAULT_RESULT_CACHE_MAX_MB,
+    ResultCache,
+    file_result_key,
+    get_result_cache,
+    summarize_cache_events,
+)
+from src.run_journal import RunJournal, config_hash, content_digest, stat_fingerprint
 from src.special_format_detector import looks_like_special_format
-from src.special_format_parser import parse_special_format_file
-from src.special_format_processor import process_special_format_file
+from src.special_format_parser import SpecialFormatLineParser
+from src.special_format_processor import (
+    SpecialFormatFollower,
+    process_special_format_file,
+)
+from src.table_reader import (
+    ColumnProjection,
+    coerce_float_matrix,
+    iter_projected_csv,
+    read_projected_csv,
+    sniff_projection,
+)
+from src.tail_follow import CsvLineParser, TailReader
 
-# 进程级缓存：worker 进程中可能会重用的全局变量（在子进程入口处按需初始化）
-# 在模块级预先定义可以避免 pylint 报告 "使用变量前赋值" 的错误
-_WORKER_CALCULATOR = None
-_WORKER_PROJECT_PATH = None
-_WORKER_PROJECT_DATA = None
+
+class _WorkerState:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """子进程内的工作状态：由进程池 initializer 填充，每个 worker 进程各持一份。
+
+    任务只需携带文件路径与 job id，项目配置与计算器在 worker 启动时加载一次。
+    """
+
+    def __init__(self) -> None:
+        self.project_config_path = None
+        self.calculator_key = None
+        self.project_data = None
+        self.calculator = None
+        self.config_dict = None
+        self.output_dir = None
+        self.strict = False
+        self.init_sec = 0.0
+        self.result_buffer = None
+
+
+# 模块级单例（直接赋值而非使用 global 语句）；在主进程中保持为空状态
+_WORKER_STATE = _WorkerState()
 
 
 def _error_exit_json(message: str, code: int = 2, hint: str = None):
@@ -65,67 +130,6 @@ def _error_exit_json(message: str, code: int = 2, hint: str = None):
     sys.exit(code)
 
 
-def _secure_deserialize_pickle(payload: bytes) -> typing.Any:
-    """
-    安全的 pickle 反序列化入口。
-
-    接受如下两种格式：
-    1) 签名格式： b"<hex_hmac>|<base64_payload>"，其中 hex_hmac = HMAC_SHA256(secret, payload)
-       需要环境变量 `PICKLE_HMAC_KEY` 提供 secret，用于校验签名后再反序列化。
-    2) 未签名直接 pickle bytes：仅在 `ALLOW_UNTRUSTED_PICKLE=1` 环境变量被显式设置时允许（不安全，强烈不推荐）。
-
-    返回反序列化后的对象，若校验失败则抛出 ValueError 或 RuntimeError。
-    """
-    if payload is None:
-        raise ValueError("空的 payload")
-
-    # 支持传入 str（可能来自 JSON）和 bytes
-    if isinstance(payload, str):
-        payload = payload.encode("utf-8")
-
-    # 首先尝试签名格式： signature|base64
-    try:
-        parts = payload.split(b"|", 1)
-        if len(parts) == 2:
-            signature, b64 = parts
-            try:
-                raw = base64.b64decode(b64)
-            except Exception:
-                raise ValueError("签名格式但 base64 解码失败")
-
-            secret = os.environ.get("PICKLE_HMAC_KEY")
-            if not secret:
-                raise RuntimeError(
-                    "拒绝签名 payload：环境变量 PICKLE_HMAC_KEY 未设置"
-                )
-
-            expected = hmac.new(
-                secret.encode("utf-8"), raw, hashlib.sha256
-            ).hexdigest().encode("utf-8")
-
-            if not hmac.compare_digest(signature, expected):
-                raise ValueError("HMAC 校验失败，拒绝反序列化")
-
-            # 校验通过，安全地反序列化
-            return pickle.loads(raw)
-    except Exception:
-        # 对签名尝试的异常不立即放行，后续会检查是否允许未签名 payload
-        pass
-
-    # 未签名 payload：仅在显式允许时才处理
-    allow_untrusted = os.environ.get("ALLOW_UNTRUSTED_PICKLE", "0") == "1"
-    if allow_untrusted:
-        logger = logging.getLogger(__name__)
-        logger.warning(
-            "允许未签名的 pickle 反序列化（危险）：请在生产环境中避免设置 ALLOW_UNTRUSTED_PICKLE=1"
-        )
-        return pickle.loads(payload)
-
-    raise RuntimeError(
-        "拒绝未签名的 pickle 反序列化：请使用签名格式或设置 ALLOW_UNTRUSTED_PICKLE=1（不安全）"
-    )
-
-
 # 最大文件名冲突重试次数（避免魔法数字）
 MAX_FILE_COLLISION_RETRIES = 1000
 
@@ -144,6 +148,34 @@ REPLACE_RETRY_BACKOFFS = WRITE_RETRY_BACKOFF_SECONDS
 # 默认记录非数值示例的行数（CLI 帮助文字中的默认值）
 DEFAULT_SAMPLE_ROWS = 5
 
+# 目录模式下默认匹配的数据文件（分号分隔）
+DEFAULT_FILE_PATTERN = "*.csv;*.xlsx;*.xls;*.mtfmt;*.mtdata;*.txt;*.dat"
+
+# 文件内分片并行：超过该大小（字节）的 CSV 在并行模式下按字节切分处理
+DEFAULT_SHARD_THRESHOLD_BYTES = 256 * 1024 * 1024
+
+# 单个分片的目标大小（字节），实际边界对齐到下一个换行符
+DEFAULT_SHARD_BYTES = 64 * 1024 * 1024
+
+# 拼接分片结果时的复制缓冲区大小
+SHARD_COPY_BUFFER_BYTES = 1024 * 1024
+
+# 输出结果列，顺序与 AeroCalculator.process_stacked 的 (N,12) 布局一致
+RESULT_COLUMNS = [
+    "Fx_new",
+    "Fy_new",
+    "Fz_new",
+    "Mx_new",
+    "My_new",
+    "Mz_new",
+    "Cx",
+    "Cy",
+    "Cz",
+    "Cl",
+    "Cm",
+    "Cn",
+]
+
 
 def _finalize_and_replace(
     temp_out_path: Path, out_path: Path, partial_flag: Path, complete_flag: Path, logger
@@ -218,11 +250,7 @@ def _prepare_calculator_for_file(
     否则返回传入的 `base_calculator`。
     使用智能推测引擎自动匹配 source/target part。
     """
-    from src.part_inference import (
-        format_inference_error,
-        infer_source_part,
-        infer_target_part,
-    )
+    from src.part_inference import format_inference_error, get_part_name_index
 
     calculator_to_use = base_calculator
 
@@ -235,8 +263,10 @@ def _prepare_calculator_for_file(
         return calculator_to_use
 
     try:
-        source_names = list((getattr(project_data, "source_parts", {}) or {}).keys())
-        target_names = list((getattr(project_data, "target_parts", {}) or {}).keys())
+        # 同一 ProjectData 的名称索引在各文件间共享，重复的文件名推测直接命中记忆结果
+        name_index = get_part_name_index(project_data)
+        source_names = name_index.sources.names
+        target_names = name_index.targets.names
 
         # Global默认值（来自命令行参数）
         global_source = source_part
@@ -248,9 +278,8 @@ def _prepare_calculator_for_file(
         # 第一步：尝试智能推测 source part（从文件名）
         if source_names:
             file_stem = file_path.stem  # 不含扩展名的文件名
-            source_result = infer_source_part(
+            source_result = name_index.infer_source(
                 file_stem,
-                getattr(project_data, "source_parts", {}) or {},
                 strategy="fuzzy",
                 allow_default=False,  # 不使用引擎的默认策略，我们有Global默认值
             )
@@ -312,9 +341,8 @@ def _prepare_calculator_for_file(
 
         # 第二步：智能推测 target part
         if target_names and actual_source:
-            target_result = infer_target_part(
+            target_result = name_index.infer_target(
                 actual_source,
-                getattr(project_data, "target_parts", {}) or {},
                 file_path=file_path,
                 strategy="fuzzy",
                 allow_default=False,  # 不使用引擎的默认策略，我们有Global默认值
@@ -375,11 +403,12 @@ def _prepare_calculator_for_file(
                 "文件 %s：使用全局 target part '%s'", file_path.name, global_target
             )
 
-        calculator_to_use = AeroCalculator(
+        # 几何相同的文件共享计算器池中的同一实例，避免重复构造基矩阵与校验
+        calculator_to_use = get_calculator_pool().get(
             project_data, source_part=actual_source, target_part=actual_target
         )
         logger.debug(
-            f"为文件 {file_path.name} 创建独立计算器: source={actual_source}, target={actual_target}"
+            f"为文件 {file_path.name} 获取独立计算器: source={actual_source}, target={actual_target}"
         )
     except Exception as e:
         logger.error("为文件 %s 创建计算器失败: %s", file_path.name, e)
@@ -388,19 +417,30 @@ def _prepare_calculator_for_file(
 
 
 def _handle_special_format_file(
-    file_path: Path, project_data, output_dir: Path, config: BatchConfig, logger
+    file_path: Path,
+    project_data,
+    output_dir: Path,
+    config: BatchConfig,
+    logger,
+    outputs: typing.Optional[list] = None,
 ) -> bool:
-    """处理特殊格式文件的封装函数：识别、调用 processor 并记录日志，返回是否成功。"""
+    """处理特殊格式文件的封装函数：识别、调用 processor 并记录日志，返回是否成功。
+
+    outputs 提供时追加本文件生成的各 part 输出路径。
+    """
     try:
-        outputs = process_special_format_file(
+        part_outputs = process_special_format_file(
             file_path,
             project_data,
             output_dir,
             timestamp_format=config.timestamp_format,
             overwrite=config.overwrite,
-            parse_func=parse_special_format_file,
+            output_format=getattr(config, "output_format", None),
+            parse_func=load_special_format_file,
+            max_workers=getattr(config, "part_workers", 1),
+            combine_parts=getattr(config, "combine_parts", False),
         )
-        if not outputs:
+        if not part_outputs:
             logger.warning(
                 "特殊格式文件 %s 未产生输出，可能因缺少匹配的 Target part 或列缺失",
                 file_path.name,
@@ -409,8 +449,10 @@ def _handle_special_format_file(
         logger.info(
             "特殊格式文件 %s 已处理，生成 %d 个 part 输出",
             file_path.name,
-            len(outputs),
+            len(part_outputs),
         )
+        if outputs is not None:
+            outputs.extend(part_outputs)
         return True
     except Exception as exc:
         logger.error(
@@ -423,13 +465,17 @@ def _handle_special_format_file(
 
 
 def _read_and_select_df(
-    file_path: Path, config: BatchConfig, selected_rows: set = None
+    file_path: Path,
+    config: BatchConfig,
+    selected_rows: set = None,
+    projection: typing.Optional[ColumnProjection] = None,
 ) -> pd.DataFrame:
     """读取文件为 DataFrame 并应用可选的行选择过滤。
 
     返回读取后的 DataFrame（已重置索引）。此函数封装了 CSV/Excel 的读取细节。
+    projection 提供时 CSV 只解析其中的载荷列（见 `src.table_reader`）。
     """
-    df = read_data_with_config(file_path, config)
+    df = read_data_with_config(file_path, config, projection=projection)
     if selected_rows is not None and len(selected_rows) > 0:
         selected_rows_sorted = sorted(int(x) for x in set(selected_rows))
         df = df.iloc[selected_rows_sorted].reset_index(drop=True)
@@ -438,6 +484,92 @@ def _read_and_select_df(
     return df
 
 
+def _resolve_chunk_size(config: BatchConfig) -> int:
+    """返回流式读取 CSV 的块大小（行数），<=0 表示整表读取。
+
+    优先使用 BatchConfig.chunk_size，未设置时回退到全局配置 `batch.chunk_size`。
+    """
+    size = getattr(config, "chunk_size", None)
+    if size is None:
+        try:
+            size = get_config().batch.chunk_size
+        except Exception:
+            logging.getLogger("batch").debug(
+                "读取全局 chunk_size 失败，使用整表读取", exc_info=True
+            )
+            size = 0
+    return int(size or 0)
+
+
+def _iter_csv_chunks(
+    file_path: Path,
+    config: BatchConfig,
+    chunk_size: int,
+    selected_rows: set = None,
+    projection: typing.Optional[ColumnProjection] = None,
+):
+    """按块流式读取 CSV，并跨块应用行选择（行号为表头之后的 0 基数据行号）。
+
+    每块产出已重置索引的 DataFrame；所选行全部产出后提前停止读取。
+    所选行号超出文件行数时抛出 IndexError（与整表 `iloc` 选择行为一致）。
+    projection 提供时只解析其中的载荷列。
+    """
+    selected = None
+    if selected_rows is not None and len(selected_rows) > 0:
+        selected = np.array(sorted({int(x) for x in selected_rows}), dtype=np.int64)
+
+    rows_seen = 0
+    for chunk in iter_projected_csv(
+        file_path, config.skip_rows, chunk_size, projection
+    ):
+        start = rows_seen
+        rows_seen += len(chunk)
+        if selected is None:
+            yield chunk.reset_index(drop=True)
+            continue
+        lo, hi = np.searchsorted(selected, [start, rows_seen])
+        if hi > lo:
+            yield chunk.iloc[selected[lo:hi] - start].reset_index(drop=True)
+        if hi >= len(selected):
+            return
+
+    if selected is not None:
+        raise IndexError(
+            f"所选行号超出范围：文件共 {rows_seen} 行数据，最大所选行号 {int(selected[-1])}"
+        )
+
+
+def _open_chunks(
+    file_path: Path, config: BatchConfig, selected_rows: set, logger
+) -> typing.Iterable[pd.DataFrame]:
+    """返回文件的数据块序列（已应用行选择）。
+
+    CSV 按 chunk_size 流式读取，内存占用与文件大小无关；
+    Excel 或含负数行号（需从文件末尾计数）的行选择仍整表读取。
+    CSV 先嗅探一次表头，只解析载荷列与 Alpha/Beta 列。
+    """
+    chunk_size = _resolve_chunk_size(config)
+    projection = sniff_projection(file_path, config.skip_rows)
+    if projection is not None:
+        logger.debug(
+            "列投影: 读取 %d 列 %s", len(projection.usecols), projection.usecols
+        )
+    streaming = (
+        chunk_size > 0
+        and file_path.suffix.lower() == ".csv"
+        and not (selected_rows and min(int(x) for x in selected_rows) < 0)
+    )
+    if selected_rows is not None and len(selected_rows) > 0:
+        logger.debug("按行选择过滤: %d 行", len(selected_rows))
+    if streaming:
+        logger.debug("流式读取: chunk_size=%d", chunk_size)
+        return _iter_csv_chunks(
+            file_path, config, chunk_size, selected_rows, projection
+        )
+    # 非流式：读取整表并可选行选择（已封装为辅助函数）
+    return [_read_and_select_df(file_path, config, selected_rows, projection)]
+
+
 def _create_temp_and_flags(out_path: Path):
     """为给定目标输出路径创建临时输出文件与 partial/complete 标记路径，返回三元组。
 
@@ -477,7 +609,11 @@ def generate_output_path(
     stem = file_path.stem
     timestamp = datetime.now().strftime(cfg.timestamp_format)
     name = cfg.name_template.format(stem=stem, timestamp=timestamp)
-    out_path = output_dir / name
+    # 非 CSV 输出格式时按格式替换扩展名
+    out_path = with_output_suffix(
+        output_dir / name, getattr(cfg, "output_format", None)
+    )
+    name = out_path.name
     logger = logging.getLogger("batch")
 
     base = out_path.stem
@@ -750,6 +886,33 @@ def _write_out_df(
             raise last_exc
 
 
+def _axis_angle_columns(col_map: dict, cfg: BatchConfig) -> list:
+    """输出轴系所需的角度列：体轴系为空，否则为 Alpha（及可选 Beta）列名。
+
+    角度列与载荷列一同做数值转换，非数值行按同一策略（drop/zero/nan）处理并计数。
+    """
+    axis_frame = getattr(cfg, "axis_frame", "body") or "body"
+    if axis_frame == "body":
+        return []
+    if "alpha" not in col_map:
+        raise ValueError(f"输出轴系 '{axis_frame}' 需要输入表包含 Alpha 列（单位：度）")
+    return [col_map["alpha"]] + ([col_map["beta"]] if "beta" in col_map else [])
+
+
+def _build_axis_rotations(
+    angles: np.ndarray, cfg: BatchConfig
+) -> typing.Optional[np.ndarray]:
+    """按配置的输出轴系，由 (N,1) 或 (N,2) 的 [Alpha|Beta] 数组构造 (N,3,3) 逐行旋转矩阵。
+
+    体轴系（默认）返回 None，表示沿用固定旋转矩阵。
+    """
+    axis_frame = getattr(cfg, "axis_frame", "body") or "body"
+    if axis_frame == "body":
+        return None
+    beta = angles[:, 1] if angles.shape[1] > 1 else None
+    return body_to_axes_matrices(angles[:, 0], beta, axes=axis_frame)
+
+
 def process_df_chunk(
     chunk_df: pd.DataFrame,
     calculator: AeroCalculator,
@@ -757,11 +920,80 @@ def process_df_chunk(
     out_path: Path,
     first_chunk: bool,
     logger,
+    result_buffer: typing.Optional[ResultBuffer] = None,
+    writer=None,
+    alpha_as_float: bool = False,
 ) -> tuple:
     """处理数据块并写入 out_path，支持系数或有量纲输入表头。
 
+    result_buffer: 可选的共享工作区；提供时计算结果写入其中并直接构建输出表，
+    多个数据块/文件之间复用同一块内存。
+    writer: 非 CSV 输出格式的逐块写出会话（见 `_open_result_writer`），None 时按 CSV 写出。
+    alpha_as_float: 为 True 时整型 Alpha 列统一输出为浮点（见 `_shard_worker`）。
+
     返回 (processed_rows, dropped_rows, non_numeric_count, first_chunk_flag)
     """
+    out_df, dropped, n_non = _compute_chunk_output(
+        chunk_df,
+        calculator,
+        cfg,
+        out_path.name,
+        logger,
+        result_buffer=result_buffer,
+        alpha_as_float=alpha_as_float,
+    )
+    if out_df is None:
+        # drop 策略下整块均为非数值：无可写行，保留 first_chunk 以便后续块写表头
+        return 0, dropped, n_non, first_chunk
+    _write_result_chunk(out_df, out_path, first_chunk, logger, writer)
+    return len(out_df), dropped, n_non, False
+
+
+def _write_chunk_output(
+    out_df: pd.DataFrame, out_path: Path, first_chunk: bool, logger
+) -> None:
+    """将一个数据块的结果写入 out_path：首块覆盖写入并带表头，其余块追加。"""
+    mode = "w" if first_chunk else "a"
+    # 确保父目录存在
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # 将写入与锁定逻辑抽出为独立函数以便测试和复用
+    _write_out_df(out_df, out_path, first_chunk, mode, mode, logger)
+
+
+def _open_result_writer(out_path: Path, cfg: BatchConfig):
+    """非 CSV 输出格式时为 out_path 打开逐块写出会话；CSV 沿用带锁追加写入，返回 None"""
+    fmt = normalize_output_format(getattr(cfg, "output_format", None))
+    if fmt == DEFAULT_OUTPUT_FORMAT:
+        return None
+    return open_output_writer(out_path, fmt)
+
+
+def _write_result_chunk(
+    out_df: pd.DataFrame, out_path: Path, first_chunk: bool, logger, writer=None
+) -> None:
+    """写出一个数据块的结果：有写出会话时交给会话，否则按 CSV 写入 out_path。"""
+    if writer is not None:
+        writer.write_chunk(out_df)
+    else:
+        _write_chunk_output(out_df, out_path, first_chunk, logger)
+
+
+def _compute_chunk_output(
+    chunk_df: pd.DataFrame,
+    calculator: AeroCalculator,
+    cfg: BatchConfig,
+    file_label: str,
+    logger,
+    result_buffer: typing.Optional[ResultBuffer] = None,
+    alpha_as_float: bool = False,
+) -> tuple:
+    """计算数据块的输出表（不写文件），支持系数或有量纲输入表头。
+
+    file_label 仅用于非数值示例日志。result_buffer 提供时输出表直接引用其内存，
+    在写出完成前不得将同一工作区用于下一块。alpha_as_float 为 True 时整型 Alpha 转为浮点。
+
+    返回 (out_df, dropped_rows, non_numeric_count)；drop 策略下整块无有效行时 out_df 为 None。
+    """
 
     # 数值准备与掩码逻辑函数定义（放在此处以便靠近使用处）
     def _prepare_for_batch_processing(
@@ -785,6 +1017,8 @@ def process_df_chunk(
             )
 
         alpha_col_name = col_map.get("alpha")
+        # 非体轴系输出时 Alpha/Beta 追加在载荷列之后（第 6 列起）
+        angle_cols = _axis_angle_columns(col_map, cfg)
 
         if has_dimensional:
             cols = [
@@ -795,9 +1029,8 @@ def process_df_chunk(
                 col_map["my"],
                 col_map["mz"],
             ]
-            numeric_df = chunk_df[cols].apply(pd.to_numeric, errors="coerce")
-            forces_df = numeric_df.iloc[:, :3]
-            moments_df = numeric_df.iloc[:, 3:]
+            # 已解析为数值的列直接使用，仅非数值列逐列强制转换
+            numeric = coerce_float_matrix(chunk_df, cols + angle_cols)
         else:
             cols = [
                 col_map["cx"],
@@ -807,9 +1040,7 @@ def process_df_chunk(
                 col_map["cmy"],
                 col_map["cmz"],
             ]
-            numeric_df = chunk_df[cols].apply(pd.to_numeric, errors="coerce")
-            coeff_force_df = numeric_df.iloc[:, :3]
-            coeff_moment_df = numeric_df.iloc[:, 3:]
+            numeric = coerce_float_matrix(chunk_df, cols + angle_cols)
 
             try:
                 q = calculator.target_frame.q
@@ -819,45 +1050,40 @@ def process_df_chunk(
             except Exception as e:  # pragma: no cover - 防御性日志
                 raise ValueError(f"无法从计算器获取参考值: {e}") from e
 
-            forces_df = coeff_force_df * (q * s_ref)
-            moments_df = pd.DataFrame(
-                {
-                    "mx": coeff_moment_df.iloc[:, 0] * (q * s_ref * b_ref),
-                    "my": coeff_moment_df.iloc[:, 1] * (q * s_ref * c_ref),
-                    "mz": coeff_moment_df.iloc[:, 2] * (q * s_ref * b_ref),
-                }
-            )
+            # 系数转为有量纲：力 × qS，滚转/偏航力矩 × qSb，俯仰力矩 × qSc
+            numeric[:, :3] *= q * s_ref
+            numeric[:, 3] *= q * s_ref * b_ref
+            numeric[:, 4] *= q * s_ref * c_ref
+            numeric[:, 5] *= q * s_ref * b_ref
 
-        mask_non_numeric = forces_df.isna().any(axis=1) | moments_df.isna().any(axis=1)
-        mask_array = mask_non_numeric.to_numpy()
-        n_non = int(mask_non_numeric.sum())
+        mask_array = np.isnan(numeric).any(axis=1)
+        n_non = int(mask_array.sum())
 
         # 根据配置处理非数值行，返回 forces/moments/data_df 供后续计算使用
         if cfg.treat_non_numeric == "drop":
-            valid_idx = ~mask_non_numeric
-            if valid_idx.sum() == 0:
+            valid_idx = ~mask_array
+            if not valid_idx.any():
                 # 全部丢弃
-                return None, None, chunk_df, n_non, mask_array, alpha_col_name
-            forces = forces_df.loc[valid_idx].to_numpy(dtype=float)
-            moments = moments_df.loc[valid_idx].to_numpy(dtype=float)
+                return None, None, None, chunk_df, n_non, mask_array, alpha_col_name
+            numeric = numeric[valid_idx]
             data_df = chunk_df.loc[valid_idx].reset_index(drop=True)
         elif cfg.treat_non_numeric == "nan":
-            forces = forces_df.to_numpy(dtype=float)
-            moments = moments_df.to_numpy(dtype=float)
             data_df = chunk_df.reset_index(drop=True)
         else:
-            forces = forces_df.fillna(0.0).to_numpy(dtype=float)
-            moments = moments_df.fillna(0.0).to_numpy(dtype=float)
+            np.copyto(numeric, 0.0, where=np.isnan(numeric))
             data_df = chunk_df.reset_index(drop=True)
 
-        return forces, moments, data_df, n_non, mask_array, alpha_col_name
+        forces = numeric[:, :3]
+        moments = numeric[:, 3:6]
+        angles = numeric[:, 6:]
+        return forces, moments, angles, data_df, n_non, mask_array, alpha_col_name
 
     # 统一列名（忽略大小写和前后空格）
     # 将数值准备与非数值掩码逻辑抽取为独立函数以降低复杂度
-    forces, moments, data_df, n_non, mask_array, alpha_col_name = (
+    forces, moments, angles, data_df, n_non, mask_array, alpha_col_name = (
         _prepare_for_batch_processing(chunk_df, calculator, cfg)
     )
-    dropped = 0
+    dropped = n_non if cfg.treat_non_numeric == "drop" else 0
 
     if n_non:
         sample_rows_val = (
@@ -870,7 +1096,7 @@ def process_df_chunk(
             if n_non > samp_n:
                 logger.warning(
                     "文件 %s: 共 %d 行非数值，仅记录前 %d 条示例: %s",
-                    out_path.name,
+                    file_label,
                     n_non,
                     samp_n,
                     examples,
@@ -878,83 +1104,59 @@ def process_df_chunk(
             else:
                 logger.warning(
                     "文件 %s: 共 %d 行非数值，示例: %s",
-                    out_path.name,
+                    file_label,
                     n_non,
                     examples,
                 )
 
+    if forces is None:
+        return None, dropped, n_non
+
     logger.info("  执行坐标变换... 行数=%d", len(forces))
-    results = calculator.process_batch(forces, moments)
-
-    # 使用向量化方式构建输出 DataFrame，避免逐列赋值
-    # 创建字典：所有结果列直接从 numpy 数组列映射
-    out_data = {
-        "Fx_new": results["force_transformed"][:, 0],
-        "Fy_new": results["force_transformed"][:, 1],
-        "Fz_new": results["force_transformed"][:, 2],
-        "Mx_new": results["moment_transformed"][:, 0],
-        "My_new": results["moment_transformed"][:, 1],
-        "Mz_new": results["moment_transformed"][:, 2],
-        "Cx": results["coeff_force"][:, 0],
-        "Cy": results["coeff_force"][:, 1],
-        "Cz": results["coeff_force"][:, 2],
-        "Cl": results["coeff_moment"][:, 0],
-        "Cm": results["coeff_moment"][:, 1],
-        "Cn": results["coeff_moment"][:, 2],
-    }
+    # 稳定轴/风轴输出：由 Alpha/Beta 列向量化构造逐行旋转，交由计算器批量施加
+    batch_kwargs = {}
+    axis_rotations = _build_axis_rotations(angles, cfg)
+    if axis_rotations is not None:
+        batch_kwargs["axis_rotations"] = axis_rotations
+
+    if result_buffer is not None:
+        calculator.process_batch(forces, moments, out=result_buffer, **batch_kwargs)
+        # 结果已按 [F'|M'|C_F|C_M] 写入共享工作区，直接以 (N,12) 块构建 DataFrame
+        out_df = pd.DataFrame(
+            result_buffer.result(len(forces)), columns=RESULT_COLUMNS, copy=False
+        )
+    else:
+        results = calculator.process_batch(forces, moments, **batch_kwargs)
+
+        # 使用向量化方式构建输出 DataFrame，避免逐列赋值
+        # 创建字典：所有结果列直接从 numpy 数组列映射
+        result_arrays = (
+            results["force_transformed"],
+            results["moment_transformed"],
+            results["coeff_force"],
+            results["coeff_moment"],
+        )
+        out_data = {
+            name: result_arrays[idx // 3][:, idx % 3]
+            for idx, name in enumerate(RESULT_COLUMNS)
+        }
+        # 一次性从字典构建 DataFrame（远比逐列赋值高效）
+        out_df = pd.DataFrame(out_data)
 
     # 添加 alpha 列（如果存在 Alpha 表头）
     if alpha_col_name and alpha_col_name in chunk_df.columns:
-        alpha_series = chunk_df[alpha_col_name].reset_index(drop=True)
-        if cfg.treat_non_numeric == "drop" and n_non:
-            alpha_series = alpha_series.loc[data_df.index].reset_index(drop=True)
-        out_data["Alpha"] = alpha_series
-
-    # 一次性从字典构建 DataFrame（远比逐列赋值高效）
-    out_df = pd.DataFrame(out_data)
+        # data_df 已按非数值策略过滤并重置索引，与结果行一一对应
+        alpha_values = data_df[alpha_col_name].to_numpy()
+        if alpha_as_float and alpha_values.dtype.kind in "iub":
+            alpha_values = alpha_values.astype(float)
+        out_df["Alpha"] = alpha_values
 
     # 对于 'nan' 策略，将原始存在缺失的行对应计算列置为 NaN（向量化）
     if cfg.treat_non_numeric == "nan" and n_non > 0:
         # 使用 NumPy 的高效布尔掩码而非逐行 loc
-        comp_cols = [
-            "Fx_new",
-            "Fy_new",
-            "Fz_new",
-            "Mx_new",
-            "My_new",
-            "Mz_new",
-            "Cx",
-            "Cy",
-            "Cz",
-            "Cl",
-            "Cm",
-            "Cn",
-        ]
-        out_df.loc[mask_array, comp_cols] = np.nan
-
-    mode = "w" if first_chunk else "a"
-    header = first_chunk
-
-    # 确保父目录存在
-    out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_df.loc[mask_array, RESULT_COLUMNS] = np.nan
 
-    open_mode = "w" if mode == "w" else "a"
-
-    # 写入重试参数（使用模块级常量）
-    last_exc = None
-    # 将写入与锁定逻辑抽出为独立函数以便测试和复用
-    _write_out_df(
-        out_df,
-        out_path,
-        header,
-        mode,
-        open_mode,
-        logger,
-    )
-
-    processed = len(out_df)
-    first_chunk = False
-    return processed, dropped, n_non, first_chunk
+    return out_df, dropped, n_non
 
 
 def find_matching_files(directory: str, pattern: str) -> list:
@@ -978,15 +1180,19 @@ def find_matching_files(directory: str, pattern: str) -> list:
     return sorted(matched_files)
 
 
-def read_data_with_config(file_path: Path, config: BatchConfig) -> pd.DataFrame:
+def read_data_with_config(
+    file_path: Path,
+    config: BatchConfig,
+    projection: typing.Optional[ColumnProjection] = None,
+) -> pd.DataFrame:
     """根据 `config` 读取整个数据表（非流式模式）。
 
-    返回 pandas DataFrame，读取首行为表头。
+    返回 pandas DataFrame，读取首行为表头；projection 提供时 CSV 只解析投影列。
     """
     p = Path(file_path)
     ext = p.suffix.lower()
     if ext == ".csv":
-        return pd.read_csv(p, header=0, skiprows=config.skip_rows)
+        return read_projected_csv(p, config.skip_rows, projection)
     elif ext in {".xls", ".xlsx", ".xlsm", ".xlsb", ".odf", ".ods", ".odt"}:
         return pd.read_excel(p, header=0, skiprows=config.skip_rows)
     else:
@@ -996,6 +1202,44 @@ def read_data_with_config(file_path: Path, config: BatchConfig) -> pd.DataFrame:
         )
 
 
+def _lookup_cached_result(
+    file_path: Path,
+    config: BatchConfig,
+    calculator: AeroCalculator,
+    output_dir: Path,
+    selected_rows: set,
+    logger,
+) -> typing.Tuple[
+    typing.Optional[ResultCache], typing.Optional[str], typing.Optional[Path]
+]:
+    """查询结果缓存，返回 (cache, 缓存键, 命中时恢复的输出路径)。
+
+    未启用缓存时 cache 为 None；命中时按常规输出协议（临时文件 + 原子替换 + 完成标记）
+    把缓存条目落盘到新生成的输出路径。未命中时调用方在写出成功后以缓存键存入结果。
+    """
+    cache = get_result_cache(config)
+    if cache is None:
+        return None, None, None
+    key = file_result_key(file_path, config, calculator, selected_rows)
+    if key is None or not cache.lookup(key):
+        return cache, key, None
+    out_path = generate_output_path(file_path, output_dir, config)
+    temp_out_path, partial_flag, complete_flag = _create_temp_and_flags(out_path)
+    if cache.fetch(key, temp_out_path):
+        _finalize_and_replace(
+            temp_out_path, out_path, partial_flag, complete_flag, logger
+        )
+        logger.info("结果缓存命中: %s -> %s", file_path.name, out_path)
+        return cache, key, out_path
+    # 条目在检查后被淘汰：撤销占位文件，回退为重新计算
+    for path in (temp_out_path, partial_flag, out_path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    return cache, key, None
+
+
 def process_single_file(
     file_path: Path,
     calculator: AeroCalculator,
@@ -1005,6 +1249,9 @@ def process_single_file(
     source_part: str = None,
     target_part: str = None,
     selected_rows: set = None,
+    result_buffer: typing.Optional[ResultBuffer] = None,
+    outputs: typing.Optional[list] = None,
+    report: typing.Optional[dict] = None,
 ) -> bool:
     """处理单个文件（支持 chunked CSV）。
 
@@ -1013,11 +1260,15 @@ def process_single_file(
     - 在写入开始写入 `.partial`，成功时写入 `.complete`；
     - 在异常时清理临时并在 partial 中记录错误信息。
     - 支持每文件指定 source/target part 和行过滤
+    - CSV 按 chunk_size（BatchConfig.chunk_size 或全局 batch.chunk_size）流式读取并追加写入
 
     参数：
     - source_part: 该文件使用的 source part（若提供则覆盖全局设置）
     - target_part: 该文件使用的 target part（若提供则覆盖全局设置）
     - selected_rows: 要处理的行索引集合，若为 None 则处理全部
+    - result_buffer: 计算结果工作区；跨文件传入同一实例可复用内存，None 时为本文件新建
+    - outputs: 若提供，成功时追加本文件的输出路径（特殊格式为各 part 输出）
+    - report: 若提供，写入本文件的附加信息（启用结果缓存时 cache 为 hit/miss）
     """
     logger = logging.getLogger("batch")
 
@@ -1029,13 +1280,20 @@ def process_single_file(
     # 特殊格式路径：直接用专用解析器处理并按 part 输出
     if project_data is not None and looks_like_special_format(file_path):
         return _handle_special_format_file(
-            file_path, project_data, output_dir, config, logger
+            file_path, project_data, output_dir, config, logger, outputs
         )
 
-    # 非流式：读取整表并可选行选择（已封装为辅助函数）
-    df = _read_and_select_df(file_path, config, selected_rows)
-    if selected_rows is not None and len(selected_rows) > 0:
-        logger.debug("按行选择过滤: %d 行", len(selected_rows))
+    cache, cache_key, restored = _lookup_cached_result(
+        file_path, config, calculator_to_use, output_dir, selected_rows, logger
+    )
+    if cache is not None and report is not None:
+        report["cache"] = "miss" if restored is None else "hit"
+    if restored is not None:
+        if outputs is not None:
+            outputs.append(restored)
+        return True
+
+    chunks = _open_chunks(file_path, config, selected_rows, logger)
 
     out_path = generate_output_path(file_path, output_dir, config)
     temp_out_path, partial_flag, complete_flag = _create_temp_and_flags(out_path)
@@ -1044,19 +1302,35 @@ def process_single_file(
     total_processed = 0
     total_dropped = 0
     total_non_numeric = 0
+    writer = None
+    if result_buffer is None:
+        result_buffer = ResultBuffer()
+    # 非数值示例按文件计数：各块共享同一示例配额
+    sample_budget = (
+        config.sample_rows if config.sample_rows is not None else DEFAULT_SAMPLE_ROWS
+    )
 
     try:
-        proc, dropped, non_num, first_chunk = process_df_chunk(
-            df,
-            calculator_to_use,
-            config,
-            temp_out_path,
-            first_chunk,
-            logger,
-        )
-        total_processed += proc
-        total_dropped += dropped
-        total_non_numeric += non_num
+        writer = _open_result_writer(temp_out_path, config)
+        for chunk_df in chunks:
+            chunk_cfg = copy.copy(config)
+            chunk_cfg.sample_rows = max(int(sample_budget) - total_non_numeric, 0)
+            proc, dropped, non_num, first_chunk = process_df_chunk(
+                chunk_df,
+                calculator_to_use,
+                chunk_cfg,
+                temp_out_path,
+                first_chunk,
+                logger,
+                result_buffer=result_buffer,
+                writer=writer,
+            )
+            total_processed += proc
+            total_dropped += dropped
+            total_non_numeric += non_num
+        if writer is not None:
+            writer.close()
+            writer = None
 
         # 完成后使用封装的替换工具完成原子替换与标记写入（见 _finalize_and_replace）
         _finalize_and_replace(
@@ -1067,9 +1341,15 @@ def process_single_file(
             f"处理完成: 已输出 {total_processed} 行；非数值总计 {total_non_numeric} 行；丢弃 {total_dropped} 行"
         )
         logger.info("结果文件: %s", out_path)
+        if cache is not None:
+            cache.store(cache_key, out_path)
+        if outputs is not None:
+            outputs.append(out_path)
         return True
 
     except Exception as e:
+        if writer is not None:
+            writer.abort()
         try:
             if temp_out_path.exists():
                 temp_out_path.unlink()
@@ -1083,160 +1363,1198 @@ def process_single_file(
         return False
 
 
-def _worker_process(args):
-    """在子进程中运行单个文件的处理（用于并行）。
+def _batch_config_to_dict(cfg: BatchConfig) -> dict:
+    """将 BatchConfig 序列化为可跨进程传递的 dict（与 `_batch_config_from_dict` 对应）。"""
+    return {
+        "skip_rows": cfg.skip_rows,
+        "name_template": cfg.name_template,
+        "timestamp_format": cfg.timestamp_format,
+        "overwrite": cfg.overwrite,
+        "treat_non_numeric": cfg.treat_non_numeric,
+        "sample_rows": cfg.sample_rows,
+        "axis_frame": cfg.axis_frame,
+        "chunk_size": cfg.chunk_size,
+        "output_format": cfg.output_format,
+        "result_cache_dir": cfg.result_cache_dir,
+        "result_cache_max_mb": cfg.result_cache_max_mb,
+        "result_cache_hardlink": cfg.result_cache_hardlink,
+        "part_workers": cfg.part_workers,
+        "combine_parts": cfg.combine_parts,
+    }
+
+
+def _batch_config_from_dict(config_dict: dict) -> BatchConfig:
+    """在子进程中由 dict 重建 BatchConfig，缺失键使用默认值。"""
+    cfg = BatchConfig()
+    cfg.skip_rows = int(config_dict.get("skip_rows", 0))
+    cfg.name_template = config_dict.get("name_template", cfg.name_template)
+    cfg.timestamp_format = config_dict.get("timestamp_format", cfg.timestamp_format)
+    cfg.overwrite = bool(config_dict.get("overwrite", cfg.overwrite))
+    cfg.treat_non_numeric = config_dict.get("treat_non_numeric", cfg.treat_non_numeric)
+    cfg.sample_rows = config_dict.get("sample_rows", cfg.sample_rows)
+    cfg.axis_frame = config_dict.get("axis_frame", cfg.axis_frame)
+    cfg.chunk_size = config_dict.get("chunk_size", cfg.chunk_size)
+    cfg.output_format = config_dict.get("output_format", cfg.output_format)
+    cfg.result_cache_dir = config_dict.get("result_cache_dir", cfg.result_cache_dir)
+    cfg.result_cache_max_mb = config_dict.get(
+        "result_cache_max_mb", cfg.result_cache_max_mb
+    )
+    cfg.result_cache_hardlink = bool(
+        config_dict.get("result_cache_hardlink", cfg.result_cache_hardlink)
+    )
+    cfg.part_workers = int(config_dict.get("part_workers", cfg.part_workers))
+    cfg.combine_parts = bool(config_dict.get("combine_parts", cfg.combine_parts))
+    return cfg
+
+
+def _calculator_cache_key(project_config_path: str, part_kwargs: dict):
+    """由配置路径与 part 参数生成 worker 内计算器的缓存键。"""
+    return (project_config_path, tuple(sorted((part_kwargs or {}).items())))
+
 
-    args_tuple: (file_path_str, config_dict, config_path, output_dir_str)
-    - config_dict: dict representation of BatchConfig (keys: skip_rows, name_template, timestamp_format, overwrite)
-    - config_path: path to JSON config for AeroCalculator (project geometry)
+def _load_worker_calculator(project_config_path: str, **part_kwargs):
+    """返回 worker 内的 (project_data, calculator)；与 initializer 加载的一致时直接复用。
+
+    part_kwargs 透传给 `load_project_calculator`（source_part/target_part/target_variant 等）。
     """
-    try:
-        # 期望 args 为 dict，包含明确字段，减少位置参数易碎性
-        if not isinstance(args, dict):
-            raise ValueError(
-                "子进程参数必须为 dict，推荐键: file_path, config_dict, project_config_path, output_dir, registry_db, strict"
-            )
+    state = _WORKER_STATE
+    key = _calculator_cache_key(project_config_path, part_kwargs)
+    if state.calculator is not None and state.calculator_key == key:
+        return state.project_data, state.calculator
+    project_data, calculator = load_project_calculator(
+        project_config_path, **part_kwargs
+    )
+    state.project_config_path = project_config_path
+    state.calculator_key = key
+    state.project_data = project_data
+    state.calculator = calculator
+    return project_data, calculator
+
+
+def _default_prebuild_pairs(project_data) -> typing.List[typing.Tuple[str, str]]:
+    """推断特殊格式处理会用到的 (source, target) 组合：同名 part 配对，单侧唯一时与另一侧全部配对。"""
+    sources = list((getattr(project_data, "source_parts", {}) or {}).keys())
+    targets = list((getattr(project_data, "target_parts", {}) or {}).keys())
+    if len(sources) == 1:
+        return [(sources[0], t) for t in targets]
+    if len(targets) == 1:
+        return [(src, targets[0]) for src in sources]
+    return [(name, name) for name in sources if name in targets]
+
+
+def _init_worker(
+    project_config_path: str,
+    config_dict: dict,
+    output_dir: str,
+    part_kwargs: dict = None,
+    prebuild_parts: list = None,
+    strict: bool = False,
+) -> None:
+    """进程池 initializer：每个 worker 启动时加载一次项目配置并预构建计算器。
 
-        file_path_str = args.get("file_path", "<unknown>")
-        config_dict = args.get("config_dict")
-        project_config_path = args.get("project_config_path")
-        output_dir_str = args.get("output_dir")
-        _registry_db = args.get("registry_db", None)
-        # 标记已读取但可选的参数，避免 lint 报告未使用变量
-        _ = _registry_db
-        strict = bool(args.get("strict", False))
-
-        if not all(
-            [
-                file_path_str,
-                config_dict is not None,
-                project_config_path,
-                output_dir_str is not None,
-            ]
-        ):
-            raise ValueError(
-                "子进程参数不完整，至少需要 file_path, config_dict, project_config_path, output_dir"
+    prebuild_parts 为 (source_part, target_part) 列表，用于预热计算器池，
+    使特殊格式文件的各 part 无需在任务中构造计算器；为 None 时按项目配置推断。
+    """
+    t0 = time.perf_counter()
+    state = _WORKER_STATE
+    state.config_dict = dict(config_dict)
+    state.output_dir = output_dir
+    state.strict = bool(strict)
+    # 同一 worker 内的所有任务共享计算工作区，与串行路径一致
+    state.result_buffer = ResultBuffer()
+    project_data, _ = _load_worker_calculator(
+        project_config_path, **(part_kwargs or {})
+    )
+    if prebuild_parts is None:
+        prebuild_parts = _default_prebuild_pairs(project_data)
+    pool = get_calculator_pool()
+    for src_part, tgt_part in prebuild_parts:
+        try:
+            pool.get(project_data, source_part=src_part, target_part=tgt_part)
+        except Exception:
+            logging.getLogger("batch").debug(
+                "预构建计算器失败: source=%s target=%s",
+                src_part,
+                tgt_part,
+                exc_info=True,
             )
+    state.init_sec = time.perf_counter() - t0
 
-        file_path = Path(file_path_str)
-        output_dir = Path(output_dir_str)
-
-        # 进程内缓存：避免对大量小文件重复加载配置带来的开销
-        # 若调用方传入序列化的计算器（calculator_pickle），优先使用并缓存
-        # 否则：若当前进程已缓存相同 project_config_path 的计算器，则重用
-        # 否则按需加载一次并缓存
-        _gw = globals()
-        # 确保模块级缓存键存在并获得快照，避免使用 `global` 语句
-        if "_WORKER_CALCULATOR" not in _gw:
-            _gw["_WORKER_CALCULATOR"] = None
-            _gw["_WORKER_PROJECT_PATH"] = None
-            _gw["_WORKER_PROJECT_DATA"] = None
-
-        worker_calc = _gw.get("_WORKER_CALCULATOR")
-        worker_proj = _gw.get("_WORKER_PROJECT_PATH")
-        worker_data = _gw.get("_WORKER_PROJECT_DATA")
-
-        project_data = None
-        calculator = None
-
-        # 支持传入序列化对象（caller 可通过 pickle.dumps((project_data, calculator)) 传入 bytes）
-        calc_pickle = args.get("calculator_pickle")
-        if calc_pickle:
-            try:
-                project_data, calculator = _secure_deserialize_pickle(calc_pickle)
-                # 更新模块级缓存
-                _gw["_WORKER_CALCULATOR"] = calculator
-                _gw["_WORKER_PROJECT_PATH"] = project_config_path
-                _gw["_WORKER_PROJECT_DATA"] = project_data
-            except Exception as e:
-                logger = logging.getLogger(__name__)
-                logger.warning(
-                    "拒绝反序列化传入的 calculator（安全原因），回退到按路径加载: %s",
-                    e,
-                )
 
-        if calculator is None:
-            if worker_calc is not None and project_config_path == worker_proj:
-                # 重用已缓存的计算器（使用快照值）
-                calculator = worker_calc
-                project_data = worker_data
-            else:
-                # 仅在必要时加载一次并缓存到进程模块级缓存
-                project_data, calculator = load_project_calculator(project_config_path)
-                _gw["_WORKER_CALCULATOR"] = calculator
-                _gw["_WORKER_PROJECT_PATH"] = project_config_path
-                _gw["_WORKER_PROJECT_DATA"] = project_data
-
-        # 构造 BatchConfig
-        cfg = BatchConfig()
-        cfg.skip_rows = int(config_dict.get("skip_rows", 0))
-        cfg.name_template = config_dict.get("name_template", cfg.name_template)
-        cfg.timestamp_format = config_dict.get("timestamp_format", cfg.timestamp_format)
-        cfg.overwrite = bool(config_dict.get("overwrite", cfg.overwrite))
-        cfg.treat_non_numeric = config_dict.get(
-            "treat_non_numeric", cfg.treat_non_numeric
-        )
-        cfg.sample_rows = config_dict.get("sample_rows", cfg.sample_rows)
+def _run_worker_job(job: typing.Tuple) -> dict:
+    """在子进程中处理单个文件。
 
-        # 使用全局配置处理每个文件（不再支持 per-file 覆盖）
+    job 为 `FileJob.task()` 生成的 (job_id, file_path) 或 (job_id, file_path, overrides)，
+    overrides 可含 source_part/target_part/selected_rows，语义与串行路径相同。
+    返回 dict：job_id, file, success, error, outputs, pid, init_sec, started_at, finished_at
+    （时间戳为 time.time()，供主进程计算排队与调度开销）。
+    """
+    job_id, file_path_str = job[0], job[1]
+    overrides = (job[2] if len(job) > 2 else None) or {}
+    started_at = time.time()
+    state = _WORKER_STATE
+    record = {
+        "job_id": job_id,
+        "file": file_path_str,
+        "success": False,
+        "error": None,
+        "outputs": [],
+        "pid": os.getpid(),
+        "init_sec": round(state.init_sec, 6),
+        "started_at": started_at,
+    }
+    try:
+        if state.calculator is None or state.config_dict is None:
+            raise RuntimeError("worker 未初始化：请通过 _init_worker 创建进程池")
+        file_path = Path(file_path_str)
+        cfg = _batch_config_from_dict(state.config_dict)
         try:
-            # `resolve_file_format` 已在模块顶层导入，直接调用以避免重复导入警告
             cfg = resolve_file_format(str(file_path), cfg)
         except Exception as e:
-            logger = logging.getLogger(__name__)
-            if strict:
-                # 严格模式下：解析失败视为致命错误，交由上层统一处理
-                logger.warning(
-                    '处理文件"%s"时配置解析失败，错误：%s',
-                    str(file_path),
-                    e,
-                )
+            if state.strict:
                 raise
-            # 非严格模式：记录警告并回退到全局配置
-            logger.warning(
-                "处理文件 '%s' 时配置解析失败，使用全局配置：%s",
-                str(file_path),
-                e,
+            logging.getLogger("batch").warning(
+                "处理文件 '%s' 时配置解析失败，使用全局配置：%s", str(file_path), e
+            )
+        outputs = []
+        report = {}
+        record["success"] = bool(
+            process_single_file(
+                file_path,
+                state.calculator,
+                cfg,
+                Path(state.output_dir),
+                state.project_data,
+                source_part=overrides.get("source_part"),
+                target_part=overrides.get("target_part"),
+                selected_rows=overrides.get("selected_rows"),
+                result_buffer=state.result_buffer,
+                outputs=outputs,
+                report=report,
             )
-
-        success = process_single_file(
-            file_path, calculator, cfg, output_dir, project_data
         )
-        return (str(file_path), success, None)
+        record["outputs"] = [str(p) for p in outputs]
+        record["cache"] = report.get("cache")
     except Exception:
         # 捕获子进程中任何异常，返回失败信息以便主进程记录
-        tb = traceback.format_exc()
-        return (file_path_str, False, tb)
+        record["error"] = traceback.format_exc()
+    record["finished_at"] = time.time()
+    return record
+
+
+def _create_worker_pool(
+    workers: int,
+    project_config_path: str,
+    config_dict: dict,
+    output_dir: str,
+    *,
+    part_kwargs: dict = None,
+    prebuild_parts: list = None,
+    strict: bool = False,
+    max_tasks_per_child: int = None,
+) -> ProcessPoolExecutor:
+    """创建带 initializer 的进程池；max_tasks_per_child 需 Python 3.11+，更低版本忽略并告警。"""
+    pool_kwargs = {
+        "max_workers": workers,
+        "initializer": _init_worker,
+        "initargs": (
+            project_config_path,
+            config_dict,
+            output_dir,
+            part_kwargs,
+            prebuild_parts,
+            strict,
+        ),
+    }
+    if max_tasks_per_child:
+        if sys.version_info >= (3, 11):
+            pool_kwargs["max_tasks_per_child"] = int(max_tasks_per_child)
+        else:
+            logging.getLogger("batch").warning(
+                "当前 Python %d.%d 不支持 max_tasks_per_child（需 3.11+），已忽略",
+                sys.version_info[0],
+                sys.version_info[1],
+            )
+    return ProcessPoolExecutor(**pool_kwargs)
+
+
+def _summarize_pool_overhead(
+    pool_created_at: float, job_records: typing.List[dict], workers: int
+) -> dict:
+    """汇总进程池启动耗时与每任务调度开销（提交到返回的墙钟时间减去任务实际执行时间）。"""
+    summary = {"workers": workers, "tasks": len(job_records)}
+    if not job_records:
+        return summary
+    first_start = min(r["started_at"] for r in job_records)
+    init_by_pid = {r["pid"]: r.get("init_sec", 0.0) for r in job_records}
+    overheads = [
+        max(
+            (r["received_at"] - r["submitted_at"])
+            - (r["finished_at"] - r["started_at"]),
+            0.0,
+        )
+        for r in job_records
+    ]
+    summary.update(
+        {
+            "spinup_sec": round(max(first_start - pool_created_at, 0.0), 4),
+            "worker_processes": len(init_by_pid),
+            "worker_init_sec_avg": round(
+                sum(init_by_pid.values()) / len(init_by_pid), 4
+            ),
+            "worker_init_sec_max": round(max(init_by_pid.values()), 4),
+            "task_overhead_sec_avg": round(sum(overheads) / len(overheads), 4),
+            "task_overhead_sec_max": round(max(overheads), 4),
+            "task_overhead_sec_total": round(sum(overheads), 4),
+        }
+    )
+    return summary
 
 
-def run_batch_processing(
-    config_path: str,
-    input_path: str,
-    data_config: BatchConfig = None,
-    strict: bool = False,  # 保留用于向前兼容和子进程传递
-    dry_run: bool = False,
-    show_progress: bool = False,
-    output_json: str = None,
-    summary: bool = False,
-    source_part: str = None,
-    target_part: str = None,
-    target_variant: int = 0,
-    file_source_target_map: dict = None,
-    file_row_selection: dict = None,
-):
-    """批处理主函数"""
+def _compute_shard_ranges(
+    file_path: Path, skip_rows: int, shard_bytes: int
+) -> typing.Tuple[int, typing.List[typing.Tuple[int, int]]]:
+    """按换行对齐的字节偏移把 CSV 数据区切分为若干分片。
+
+    返回 (data_start, [(start, end), ...])：data_start 为表头（含 skip_rows 行）之后的偏移，
+    每个分片的边界都落在某行的 '\n' 之后。不支持字段内含换行的带引号 CSV。
+    """
+    size = file_path.stat().st_size
+    shard_bytes = max(int(shard_bytes), 1)
+    with open(file_path, "rb") as fh:
+        for _ in range(int(skip_rows) + 1):
+            fh.readline()
+        data_start = fh.tell()
+        bounds = [data_start]
+        while bounds[-1] + shard_bytes < size:
+            # 从目标偏移前一个字节开始读到行尾：若该字节恰为 '\n'，边界即为目标偏移
+            fh.seek(bounds[-1] + shard_bytes - 1)
+            fh.readline()
+            boundary = fh.tell()
+            if boundary >= size:
+                break
+            bounds.append(boundary)
+    bounds.append(size)
+    ranges = [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+    return data_start, ranges
+
+
+def _shard_worker(args: dict) -> typing.Tuple[int, int, int, int]:
+    """子进程：解析一个字节分片、完成坐标变换并写入独立的分片结果文件。
+
+    args 键：file_path, project_config_path, config_dict, shard_index, start, end,
+    part_path, part_kwargs（构造基准计算器的 source/target part 参数），
+    file_parts（可选的文件级 source_part/target_part 覆盖，按串行路径的推测逻辑解析）。
+    返回 (shard_index, processed, dropped, non_numeric)。
+    """
     logger = logging.getLogger("batch")
+    file_path = Path(args["file_path"])
+    cfg = _batch_config_from_dict(args["config_dict"])
+    project_data, calculator = _load_worker_calculator(
+        args["project_config_path"], **(args.get("part_kwargs") or {})
+    )
+    file_parts = args.get("file_parts") or {}
+    calculator = _prepare_calculator_for_file(
+        file_path,
+        calculator,
+        project_data,
+        file_parts.get("source_part"),
+        file_parts.get("target_part"),
+        logger,
+    )
 
-    logger.info("%s", "=" * 70)
-    logger.info("MomentConversion Batch Processing")
-    logger.info("%s", "=" * 70)
-    logger.info("[1/5] 加载几何配置: %s", config_path)
+    # 表头（含 skip_rows 行）取自文件开头，分片只解析 [start, end) 区间内的数据行，
+    # 并与串行路径一样按 chunk_size 分块，单个分片的内存占用不随分片大小增长
+    projection = sniff_projection(file_path, cfg.skip_rows)
+    chunk_size = _resolve_chunk_size(cfg)
+    chunks = iter_projected_csv(
+        file_path,
+        cfg.skip_rows,
+        chunk_size if chunk_size > 0 else sys.maxsize,
+        projection,
+        byte_range=(args["start"], args["end"]),
+    )
+
+    part_path = Path(args["part_path"])
+    writer = _open_result_writer(part_path, cfg)
+    result_buffer = ResultBuffer()
+    first_chunk = True
+    processed = dropped = n_non = 0
+    sample_budget = (
+        cfg.sample_rows if cfg.sample_rows is not None else DEFAULT_SAMPLE_ROWS
+    )
     try:
-        project_data, calculator = load_project_calculator(
-            config_path,
-            source_part=source_part,
-            target_part=target_part,
-            target_variant=target_variant,
+        for chunk_df in chunks:
+            chunk_cfg = copy.copy(cfg)
+            chunk_cfg.sample_rows = max(int(sample_budget) - n_non, 0)
+            proc, drop, non_num, first_chunk = process_df_chunk(
+                chunk_df,
+                calculator,
+                chunk_cfg,
+                part_path,
+                first_chunk,
+                logger,
+                result_buffer=result_buffer,
+                writer=writer,
+                # 各分片按块推断的 Alpha 类型可能不同（整型/浮点），统一为浮点使合并后的
+                # 输出格式一致；串行路径保持按读取类型输出
+                alpha_as_float=True,
+            )
+            processed += proc
+            dropped += drop
+            n_non += non_num
+    except Exception:
+        if writer is not None:
+            writer.abort()
+        raise
+    if writer is not None:
+        writer.close()
+    return args["shard_index"], processed, dropped, n_non
+
+
+def _concat_shard_parts(part_paths: typing.List[Path], out_path: Path) -> None:
+    """按顺序拼接分片结果：保留首个非空分片的表头，其余分片跳过表头行。"""
+    header_written = False
+    with open(out_path, "wb") as out_fh:
+        for part in part_paths:
+            if not part.exists() or part.stat().st_size == 0:
+                # drop 策略下整片无有效行时分片为空
+                continue
+            with open(part, "rb") as in_fh:
+                if header_written:
+                    in_fh.readline()
+                shutil.copyfileobj(in_fh, out_fh, SHARD_COPY_BUFFER_BYTES)
+            header_written = True
+
+
+def _merge_shard_parts(
+    part_paths: typing.List[Path], out_path: Path, cfg: BatchConfig
+) -> None:
+    """非 CSV 输出格式：按顺序逐个读回分片结果并作为数据块写入最终输出。"""
+    with open_output_writer(out_path, cfg.output_format) as writer:
+        for part in part_paths:
+            if not part.exists():
+                continue
+            part_df = read_output_frame(part, cfg.output_format)
+            if part_df.shape[1] == 0:
+                # drop 策略下整片无有效行时分片不含任何列
+                continue
+            writer.write_chunk(part_df)
+
+
+def should_shard_file(file_path: Path, threshold_bytes: int) -> bool:
+    """判断文件是否走文件内分片并行：仅针对超过阈值的普通 CSV（非特殊格式）。"""
+    if threshold_bytes <= 0 or file_path.suffix.lower() != ".csv":
+        return False
+    try:
+        if file_path.stat().st_size < threshold_bytes:
+            return False
+    except OSError:
+        return False
+    return not looks_like_special_format(file_path)
+
+
+def process_file_sharded(
+    file_path: Path,
+    config: BatchConfig,
+    output_dir: Path,
+    project_config_path: str,
+    executor,
+    *,
+    shard_bytes: int = DEFAULT_SHARD_BYTES,
+    source_part: str = None,
+    target_part: str = None,
+    target_variant: int = 0,
+    file_parts: dict = None,
+    outputs: typing.Optional[list] = None,
+) -> bool:
+    """将单个大 CSV 按字节分片交给进程池并行处理，再按序拼接为最终输出。
+
+    输出与串行路径逐字节一致；仍遵循临时文件 + `.partial`/`.complete` 的原子替换协议。
+    executor 为调用方持有的 ProcessPoolExecutor（分片任务与其它文件任务共享进程池）。
+    source_part/target_part/target_variant 为构造基准计算器的 part（与 CLI 全局参数一致），
+    file_parts 为文件级 source_part/target_part 覆盖（对应串行路径的 file_source_target_map）。
+    outputs 提供时成功后追加输出路径。
+    """
+    logger = logging.getLogger("batch")
+    _, ranges = _compute_shard_ranges(file_path, config.skip_rows, shard_bytes)
+    logger.info("文件 %s 切分为 %d 个分片并行处理", file_path.name, len(ranges))
+
+    out_path = generate_output_path(file_path, output_dir, config)
+    temp_out_path, partial_flag, complete_flag = _create_temp_and_flags(out_path)
+    shard_dir = Path(
+        tempfile.mkdtemp(prefix=out_path.name + ".shards.", dir=str(out_path.parent))
+    )
+    part_suffix = output_suffix(config.output_format)
+    part_paths = [
+        shard_dir / f"part_{idx:06d}{part_suffix}" for idx in range(len(ranges))
+    ]
+    config_dict = _batch_config_to_dict(config)
+    futures = []
+
+    try:
+        futures = [
+            executor.submit(
+                _shard_worker,
+                {
+                    "file_path": str(file_path),
+                    "project_config_path": project_config_path,
+                    "config_dict": config_dict,
+                    "shard_index": idx,
+                    "start": start,
+                    "end": end,
+                    "part_path": str(part_paths[idx]),
+                    "part_kwargs": {
+                        "source_part": source_part,
+                        "target_part": target_part,
+                        "target_variant": target_variant,
+                    },
+                    "file_parts": file_parts,
+                },
+            )
+            for idx, (start, end) in enumerate(ranges)
+        ]
+        total_processed = total_dropped = total_non_numeric = 0
+        for fut in futures:
+            _, proc, dropped, non_num = fut.result()
+            total_processed += proc
+            total_dropped += dropped
+            total_non_numeric += non_num
+
+        if normalize_output_format(config.output_format) == DEFAULT_OUTPUT_FORMAT:
+            _concat_shard_parts(part_paths, temp_out_path)
+        else:
+            _merge_shard_parts(part_paths, temp_out_path, config)
+        _finalize_and_replace(
+            temp_out_path, out_path, partial_flag, complete_flag, logger
+        )
+        logger.info(
+            "分片处理完成: 已输出 %d 行；非数值总计 %d 行；丢弃 %d 行",
+            total_processed,
+            total_non_numeric,
+            total_dropped,
+        )
+        logger.info("结果文件: %s", out_path)
+        if outputs is not None:
+            outputs.append(out_path)
+        return True
+    except Exception as e:
+        for fut in futures:
+            fut.cancel()
+        try:
+            if temp_out_path.exists():
+                temp_out_path.unlink()
+        except Exception:
+            pass
+        try:
+            partial_flag.write_text(f"error: {str(e)}\n{traceback.format_exc()}")
+        except Exception:
+            pass
+        logger.error("  ✗ 分片处理失败: %s", str(e), exc_info=True)
+        return False
+    finally:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+
+
+@dataclass
+class ParallelOptions:  # pylint: disable=too-many-instance-attributes
+    """并行执行参数；workers 为 None/0 时按 CPU 核数与任务自动决定，<=1 时走串行路径。"""
+
+    workers: typing.Optional[int] = 1
+    schedule: str = DEFAULT_SCHEDULE
+    max_in_flight: typing.Optional[int] = None
+    max_tasks_per_child: typing.Optional[int] = None
+    shard_threshold_bytes: int = DEFAULT_SHARD_THRESHOLD_BYTES
+    shard_bytes: int = DEFAULT_SHARD_BYTES
+
+
+def resolve_worker_count(
+    requested: typing.Optional[int],
+    jobs: typing.List[FileJob],
+    shard_threshold_bytes: int = DEFAULT_SHARD_THRESHOLD_BYTES,
+) -> int:
+    """确定实际 worker 数：显式指定时照用；自动模式下多核机器默认并行。
+
+    自动模式的 worker 数不超过文件数；存在可文件内分片的大 CSV 时用满全部核。
+    """
+    if requested is not None and requested > 0:
+        return int(requested)
+    cpus = os.cpu_count() or 1
+    if cpus <= 1 or not jobs:
+        return 1
+    if any(should_shard_file(job.path, shard_threshold_bytes) for job in jobs):
+        return cpus
+    return min(cpus, len(jobs))
+
+
+def _report_progress(
+    logger,
+    completed: int,
+    total: int,
+    file_name: str,
+    ok: bool,
+    elapsed: float,
+    start_time: datetime,
+) -> None:
+    """记录稳定的 ETA 估算（基于墙钟时间下的平均每文件耗时），并向 stdout 输出进度 JSON。"""
+    files_left = total - completed
+    total_elapsed = (datetime.now() - start_time).total_seconds()
+    avg_per_file = total_elapsed / completed if completed else 0.0
+    eta_seconds = int(avg_per_file * files_left)
+    logger.info(
+        "已完成 %d/%d，累计耗时 %.1fs，本文件耗时 %.2fs，平均 %.2fs/文件，预计剩余 %ds",
+        completed,
+        total,
+        total_elapsed,
+        elapsed,
+        avg_per_file,
+        eta_seconds,
+    )
+    # 同步向 stdout 输出可机器解析的进度行（JSON），便于监控系统采集
+    try:
+        prog = {
+            "completed": completed,
+            "total": total,
+            "file": file_name,
+            "success": bool(ok),
+            "elapsed_sec": round(elapsed or 0.0, 3),
+            "avg_sec": round(avg_per_file or 0.0, 3),
+            "eta_sec": eta_seconds,
+        }
+        # 进度 JSON 写入 stdout 以便外部监控程序解析
+        print(json.dumps(prog, ensure_ascii=False))
+        sys.stdout.flush()
+    except Exception:
+        try:
+            logger.info(
+                "[%d/%d] %s success=%s elapsed=%.2fs eta=%ds",
+                completed,
+                total,
+                file_name,
+                ok,
+                elapsed,
+                eta_seconds,
+            )
+        except Exception:
+            pass
+
+
+def _run_jobs_serial(
+    jobs: typing.List[FileJob],
+    calculator: AeroCalculator,
+    project_data,
+    data_config: BatchConfig,
+    output_dir: Path,
+    show_progress: bool = False,
+    on_result: typing.Optional[typing.Callable[[dict], None]] = None,
+) -> typing.List[dict]:
+    """在当前进程中按顺序处理任务，返回每文件结果记录。
+
+    on_result 在每个文件处理结束后以其结果记录调用（用于写入运行日志）。
+    """
+    logger = logging.getLogger("batch")
+    start_time = datetime.now()
+    results = []
+    # 所有文件共享同一计算工作区，稳态下不再为结果数组重复分配内存
+    result_buffer = ResultBuffer()
+    for i, job in enumerate(jobs, 1):
+        file_path = job.path
+        logger.info("进度: [%d/%d] %s", i, len(jobs), file_path.name)
+        # 使用全局配置处理每个文件
+        cfg_local = resolve_file_format(str(file_path), data_config)
+
+        t0 = datetime.now()
+        outputs = []
+        report = {}
+        ok = process_single_file(
+            file_path,
+            calculator,
+            cfg_local,
+            output_dir,
+            project_data,
+            source_part=job.source_part,
+            target_part=job.target_part,
+            selected_rows=job.selected_rows,
+            result_buffer=result_buffer,
+            outputs=outputs,
+            report=report,
+        )
+        elapsed = (datetime.now() - t0).total_seconds()
+
+        # 收集结果以支持 --output-json/--summary
+        results.append(
+            {
+                "file": str(file_path),
+                "success": bool(ok),
+                "error": None,
+                "elapsed_sec": round(elapsed, 3),
+                "outputs": [str(p) for p in outputs],
+                "cache": report.get("cache"),
+            }
+        )
+        if on_result is not None:
+            on_result(results[-1])
+
+        # 总是记录每文件耗时，便于 log-file 中查看详情
+        logger.info(
+            "文件 %s 处理完成: 成功=%s, 耗时=%.2fs",
+            file_path.name,
+            ok,
+            elapsed,
+        )
+        if show_progress:
+            _report_progress(
+                logger, i, len(jobs), file_path.name, ok, elapsed, start_time
+            )
+
+    if result_buffer.reuses:
+        logger.info(
+            "  工作区复用: %d 次，节省分配 %.2f MB",
+            result_buffer.reuses,
+            result_buffer.bytes_saved / 1024 / 1024,
+        )
+    return results
+
+
+class _PipelineFile:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """流水线中单个文件的处理状态；各字段仅由注释所示的单一阶段写入。"""
+
+    def __init__(self, index: int, job: FileJob, cfg: BatchConfig) -> None:
+        # 读取线程
+        self.index = index
+        self.job = job
+        self.cfg = cfg
+        self.started = time.perf_counter()
+        # 结果缓存（启用时由读取线程查询；计算器也在读取线程中准备）
+        self.cache = None
+        self.cache_key = None
+        self.cache_event = None
+        # 计算阶段
+        self.calculator = None
+        self.out_path = None
+        self.temp_out_path = None
+        self.partial_flag = None
+        self.complete_flag = None
+        self.non_numeric = 0
+        self.failed = False
+        self.outputs = []
+        # 写出线程
+        self.writer = None
+        self.writer_opened = False
+        self.first_chunk = True
+        self.processed = 0
+        self.dropped = 0
+        self.done = False
+
+
+class _PipelineUnit:  # pylint: disable=too-few-public-methods
+    """流水线数据项：kind 为 chunk（数据块）、end（文件结束）、special（特殊格式整文件）
+    或 cached（结果缓存命中，输出已落盘）"""
+
+    def __init__(self, state: _PipelineFile, kind: str, df=None, error=None) -> None:
+        self.state = state
+        self.kind = kind
+        self.df = df
+        self.error = error
+        self.out_df = None
+        self.buffer = None
+        self.dropped = 0
+        self.ok = False
+
+
+def _run_jobs_pipelined(
+    jobs: typing.List[FileJob],
+    calculator: AeroCalculator,
+    project_data,
+    data_config: BatchConfig,
+    output_dir: Path,
+    show_progress: bool = False,
+    depth: int = DEFAULT_PIPELINE_DEPTH,
+    on_result: typing.Optional[typing.Callable[[dict], None]] = None,
+) -> typing.List[dict]:
+    """在当前进程中以 读取/计算/写出 三级流水线处理任务，输出与 `_run_jobs_serial` 一致。
+
+    读取线程按块预取并解析后续文件，写出线程消化有界的输出队列；
+    流水线以数据块为单位，大文件仍保持流式读取的内存上限。
+    """
+    logger = logging.getLogger("batch")
+    start_time = datetime.now()
+    results = []
+    # 输出表直接引用工作区内存，写出完成前不能复用：按队列深度轮换一组工作区
+    ring = [ResultBuffer() for _ in range(depth + 2)]
+    free_buffers = queue.SimpleQueue()
+    for buf in ring:
+        free_buffers.put(buf)
+
+    def _take_buffer() -> ResultBuffer:
+        try:
+            return free_buffers.get_nowait()
+        except queue.Empty:
+            # 仅在异常中止等极端情况下才会耗尽，此时临时新建而非阻塞
+            buf = ResultBuffer()
+            ring.append(buf)
+            return buf
+
+    def _source():
+        for i, job in enumerate(jobs, 1):
+            cfg_local = resolve_file_format(str(job.path), data_config)
+            state = _PipelineFile(i, job, cfg_local)
+            if project_data is not None and looks_like_special_format(job.path):
+                yield _PipelineUnit(state, "special")
+                continue
+            try:
+                if get_result_cache(cfg_local) is not None:
+                    state.calculator = _prepare_calculator_for_file(
+                        job.path,
+                        calculator,
+                        project_data,
+                        job.source_part,
+                        job.target_part,
+                        logger,
+                    )
+                    state.cache, state.cache_key, restored = _lookup_cached_result(
+                        job.path,
+                        cfg_local,
+                        state.calculator,
+                        output_dir,
+                        job.selected_rows,
+                        logger,
+                    )
+                    state.cache_event = "miss" if restored is None else "hit"
+                    if restored is not None:
+                        state.outputs.append(restored)
+                        yield _PipelineUnit(state, "cached")
+                        continue
+                for chunk_df in _open_chunks(
+                    job.path, cfg_local, job.selected_rows, logger
+                ):
+                    yield _PipelineUnit(state, "chunk", df=chunk_df)
+            except Exception as e:
+                yield _PipelineUnit(state, "chunk", error=e)
+                continue
+            yield _PipelineUnit(state, "end")
+
+    def _compute(unit: _PipelineUnit) -> _PipelineUnit:
+        state = unit.state
+        job = state.job
+        if unit.kind == "special":
+            logger.info("进度: [%d/%d] %s", state.index, len(jobs), job.path.name)
+            unit.ok = _handle_special_format_file(
+                job.path, project_data, output_dir, state.cfg, logger, state.outputs
+            )
+            return unit
+        if unit.kind == "cached":
+            logger.info("进度: [%d/%d] %s", state.index, len(jobs), job.path.name)
+            return unit
+        if state.failed:
+            return unit
+        try:
+            if state.out_path is None:
+                logger.info("进度: [%d/%d] %s", state.index, len(jobs), job.path.name)
+                if state.calculator is None:
+                    state.calculator = _prepare_calculator_for_file(
+                        job.path,
+                        calculator,
+                        project_data,
+                        job.source_part,
+                        job.target_part,
+                        logger,
+                    )
+                state.out_path = generate_output_path(job.path, output_dir, state.cfg)
+                (
+                    state.temp_out_path,
+                    state.partial_flag,
+                    state.complete_flag,
+                ) = _create_temp_and_flags(state.out_path)
+            if unit.error is None and unit.kind == "chunk":
+                # 非数值示例按文件计数：各块共享同一示例配额
+                chunk_cfg = copy.copy(state.cfg)
+                budget = (
+                    state.cfg.sample_rows
+                    if state.cfg.sample_rows is not None
+                    else DEFAULT_SAMPLE_ROWS
+                )
+                chunk_cfg.sample_rows = max(int(budget) - state.non_numeric, 0)
+                unit.buffer = _take_buffer()
+                unit.out_df, unit.dropped, n_non = _compute_chunk_output(
+                    unit.df,
+                    state.calculator,
+                    chunk_cfg,
+                    state.out_path.name,
+                    logger,
+                    result_buffer=unit.buffer,
+                )
+                state.non_numeric += n_non
+        except Exception as e:
+            unit.error = e
+        unit.df = None
+        if unit.error is not None:
+            state.failed = True
+        return unit
+
+    def _finish(state: _PipelineFile, ok: bool, error: str = None) -> None:
+        state.done = True
+        elapsed = time.perf_counter() - state.started
+        results.append(
+            {
+                "file": str(state.job.path),
+                "success": bool(ok),
+                "error": error,
+                "elapsed_sec": round(elapsed, 3),
+                "outputs": [str(p) for p in state.outputs] if ok else [],
+                "cache": state.cache_event,
+            }
+        )
+        if on_result is not None:
+            on_result(results[-1])
+        logger.info(
+            "文件 %s 处理完成: 成功=%s, 耗时=%.2fs",
+            state.job.path.name,
+            ok,
+            elapsed,
+        )
+        if show_progress:
+            _report_progress(
+                logger,
+                len(results),
+                len(jobs),
+                state.job.path.name,
+                ok,
+                elapsed,
+                start_time,
+            )
+
+    def _sink(unit: _PipelineUnit) -> None:
+        state = unit.state
+        try:
+            if unit.kind in ("special", "cached"):
+                _finish(state, unit.kind == "cached" or unit.ok)
+                return
+            if state.done:
+                return
+            if not state.writer_opened and state.temp_out_path is not None:
+                state.writer = _open_result_writer(state.temp_out_path, state.cfg)
+                state.writer_opened = True
+            if unit.error is None and unit.out_df is not None:
+                _write_result_chunk(
+                    unit.out_df,
+                    state.temp_out_path,
+                    state.first_chunk,
+                    logger,
+                    state.writer,
+                )
+                state.first_chunk = False
+                state.processed += len(unit.out_df)
+            state.dropped += unit.dropped
+            if unit.error is not None:
+                raise unit.error
+            if unit.kind == "end":
+                if state.writer is not None:
+                    state.writer.close()
+                    state.writer = None
+                _finalize_and_replace(
+                    state.temp_out_path,
+                    state.out_path,
+                    state.partial_flag,
+                    state.complete_flag,
+                    logger,
+                )
+                logger.info(
+                    "处理完成: 已输出 %d 行；非数值总计 %d 行；丢弃 %d 行",
+                    state.processed,
+                    state.non_numeric,
+                    state.dropped,
+                )
+                logger.info("结果文件: %s", state.out_path)
+                if state.cache is not None:
+                    state.cache.store(state.cache_key, state.out_path)
+                state.outputs.append(state.out_path)
+                _finish(state, True)
+        except Exception as e:
+            if state.writer is not None:
+                state.writer.abort()
+                state.writer = None
+            try:
+                if state.temp_out_path is not None and state.temp_out_path.exists():
+                    state.temp_out_path.unlink()
+            except Exception:
+                pass
+            try:
+                if state.partial_flag is not None:
+                    state.partial_flag.write_text(
+                        f"error: {str(e)}\n{traceback.format_exc()}"
+                    )
+            except Exception:
+                pass
+            logger.error("  ✗ 处理失败: %s", str(e), exc_info=True)
+            _finish(state, False, str(e))
+        finally:
+            unit.out_df = None
+            if unit.buffer is not None:
+                free_buffers.put(unit.buffer)
+
+    stats = run_pipeline(
+        _source(),
+        _compute,
+        _sink,
+        read_ahead=depth,
+        write_behind=depth,
+        name="batch-pipeline",
+    )
+    logger.info("  流水线统计: %s", stats.as_dict())
+    reuses = sum(buf.reuses for buf in ring)
+    if reuses:
+        logger.info(
+            "  工作区复用: %d 次，节省分配 %.2f MB",
+            reuses,
+            sum(buf.bytes_saved for buf in ring) / 1024 / 1024,
+        )
+    return results
+
+
+def _run_jobs_parallel(
+    jobs: typing.List[FileJob],
+    config_path: str,
+    data_config: BatchConfig,
+    output_dir: Path,
+    parallel: ParallelOptions,
+    *,
+    part_kwargs: dict,
+    strict: bool = False,
+    show_progress: bool = False,
+    on_result: typing.Optional[typing.Callable[[dict], None]] = None,
+) -> typing.Tuple[typing.List[dict], dict]:
+    """通过进程池处理任务，返回 (每文件结果记录, 进程池开销统计)。
+
+    超过分片阈值且无行选择的 CSV 在文件内按字节分片；其余文件按调度策略有界提交。
+    文件级 source/target 覆盖与行选择随任务下发，语义与串行路径一致。
+    on_result 在主进程收到每个文件的结果时调用（用于写入运行日志）。
+    """
+    logger = logging.getLogger("batch")
+    workers = parallel.workers
+    config_dict = _batch_config_to_dict(data_config)
+    # 仅当存在特殊格式文件时才预热各 part 的计算器（None 表示由 worker 按配置推断）
+    prebuild_parts = (
+        None if any(looks_like_special_format(job.path) for job in jobs) else []
+    )
+    in_flight = parallel.max_in_flight or workers * DEFAULT_IN_FLIGHT_PER_WORKER
+    results = []
+    job_records = []
+    completed = 0
+    start_time = datetime.now()
+    pool_created_at = time.time()
+    with _create_worker_pool(
+        workers,
+        config_path,
+        config_dict,
+        str(output_dir),
+        part_kwargs=part_kwargs,
+        prebuild_parts=prebuild_parts,
+        strict=strict,
+        max_tasks_per_child=parallel.max_tasks_per_child,
+    ) as exe:
+        per_file = []
+        for job in jobs:
+            # 行选择使用全局行号，分片无法独立定位，按整文件任务处理
+            if job.selected_rows or not should_shard_file(
+                job.path, parallel.shard_threshold_bytes
+            ):
+                per_file.append(job)
+                continue
+            # 大文件：文件内按字节分片，占满全部 worker 后再处理其余文件
+            t0 = datetime.now()
+            outputs = []
+            ok = process_file_sharded(
+                job.path,
+                resolve_file_format(str(job.path), data_config),
+                output_dir,
+                config_path,
+                exe,
+                shard_bytes=parallel.shard_bytes,
+                file_parts={
+                    "source_part": job.source_part,
+                    "target_part": job.target_part,
+                },
+                outputs=outputs,
+                **part_kwargs,
+            )
+            elapsed = (datetime.now() - t0).total_seconds()
+            results.append(
+                {
+                    "file": str(job.path),
+                    "success": bool(ok),
+                    "error": None if ok else "sharded processing failed",
+                    "elapsed_sec": round(elapsed, 3),
+                    "outputs": [str(p) for p in outputs],
+                }
+            )
+            if on_result is not None:
+                on_result(results[-1])
+            completed += 1
+            if show_progress:
+                _report_progress(
+                    logger, completed, len(jobs), job.path.name, ok, elapsed, start_time
+                )
+
+        # 按调度策略排序后有界提交；任务仅携带 job id、文件路径与文件级覆盖参数，
+        # 项目配置与基准计算器已由 initializer 加载
+        ordered = plan_schedule(per_file, parallel.schedule)
+        logger.info("调度策略: %s，在途任务上限: %d", parallel.schedule, in_flight)
+        for job, fut, submitted_at in iter_bounded_submit(
+            exe, _run_worker_job, ordered, FileJob.task, in_flight
+        ):
+            completed += 1
+            try:
+                record = fut.result()
+            except Exception as e:
+                logger.exception("任务异常: %s", job.path)
+                results.append(
+                    {
+                        "file": str(job.path),
+                        "success": False,
+                        "error": str(e),
+                        "elapsed_sec": round(time.time() - submitted_at, 3),
+                        "outputs": [],
+                    }
+                )
+                if on_result is not None:
+                    on_result(results[-1])
+                continue
+            record["submitted_at"] = submitted_at
+            record["received_at"] = time.time()
+            job_records.append(record)
+            ok = record["success"]
+            elapsed = record["received_at"] - submitted_at
+            results.append(
+                {
+                    "file": record["file"],
+                    "success": bool(ok),
+                    "error": record["error"],
+                    "elapsed_sec": round(elapsed, 3),
+                    "outputs": record.get("outputs") or [],
+                    "cache": record.get("cache"),
+                }
+            )
+            if on_result is not None:
+                on_result(results[-1])
+            if ok:
+                logger.info("处理成功: %s (耗时: %.2fs)", record["file"], elapsed)
+            else:
+                logger.error(
+                    "处理失败: %s 错误: %s (耗时: %.2fs)",
+                    record["file"],
+                    record["error"],
+                    elapsed,
+                )
+            if show_progress:
+                _report_progress(
+                    logger, completed, len(jobs), job.path.name, ok, elapsed, start_time
+                )
+
+    pool_stats = _summarize_pool_overhead(pool_created_at, job_records, workers)
+    pool_stats.update(
+        {
+            "schedule": parallel.schedule,
+            "max_in_flight": in_flight,
+            "max_tasks_per_child": parallel.max_tasks_per_child,
+        }
+    )
+    logger.info("进程池开销: %s", pool_stats)
+    return results, pool_stats
+
+
+def _open_run_journal(
+    jobs: typing.List[FileJob],
+    output_dir: Path,
+    config_path: str,
+    data_config: BatchConfig,
+    part_kwargs: dict,
+    resume: bool,
+    journal: typing.Optional[RunJournal] = None,
+) -> typing.Tuple[typing.List[FileJob], typing.List[FileJob], typing.Callable]:
+    """打开输出目录下的运行日志，返回 (待处理任务, 已完成而跳过的任务, on_result 回调)。
+
+    配置哈希覆盖项目配置文件内容、全局 part 参数、批处理格式配置与文件级覆盖参数；
+    resume 为 True 时跳过日志中以相同内容与配置完成且输出仍存在的文件。
+    journal 提供时复用其已加载的记录（监视模式下避免每轮重读日志）。
+    """
+    if journal is None:
+        journal = RunJournal(output_dir)
+    try:
+        project_digest = content_digest(config_path)
+    except OSError:
+        project_digest = str(config_path)
+    # 结果缓存设置不影响输出内容，不参与配置哈希
+    cfg_dict = {
+        key: value
+        for key, value in _batch_config_to_dict(data_config).items()
+        if not key.startswith("result_cache")
+    }
+    base = [project_digest, part_kwargs, cfg_dict]
+    hashes = {str(job.path): config_hash(*base, job.overrides()) for job in jobs}
+
+    skipped = []
+    if resume:
+        jobs, skipped = journal.partition(
+            jobs, lambda job: (job.path, hashes[str(job.path)])
+        )
+    # 处理开始前的 stat 指纹，用于识别处理期间被修改的输入
+    planned = {str(job.path): stat_fingerprint(job.path) for job in jobs}
+
+    def _on_result(result: dict) -> None:
+        journal.record_outcome(
+            result["file"],
+            hashes[result["file"]],
+            bool(result["success"]),
+            outputs=result.get("outputs") or (),
+            error=result.get("error"),
+            planned=planned.get(result["file"]),
+        )
+
+    return jobs, skipped, _on_result
+
+
+def run_batch_processing(
+    config_path: str,
+    input_path: str,
+    data_config: BatchConfig = None,
+    strict: bool = False,
+    dry_run: bool = False,
+    show_progress: bool = False,
+    output_json: str = None,
+    summary: bool = False,
+    source_part: str = None,
+    target_part: str = None,
+    target_variant: int = 0,
+    file_source_target_map: dict = None,
+    file_row_selection: dict = None,
+    pattern: str = None,
+    parallel: ParallelOptions = None,
+    pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+    resume: bool = False,
+):
+    """批处理主函数（串行与并行共用同一任务规划）。
+
+    parallel 为 None 时串行处理；否则按 `ParallelOptions.workers` 决定 worker 数，
+    file_source_target_map / file_row_selection / dry_run 在两种模式下语义一致。
+    串行模式下 pipeline_depth>0 时以 读取/计算/写出 流水线执行（预取与写出队列深度），
+    0 表示严格顺序执行。
+    每个文件的结果都写入输出目录下的运行日志（见 `src.run_journal`）；resume 为 True 时
+    跳过日志中已以相同内容与配置完成的文件（计入汇总的 skipped）。
+    返回汇总 dict（total/success/fail/files，并行时含 pool），配置加载失败时返回 None。
+    """
+    logger = logging.getLogger("batch")
+
+    logger.info("%s", "=" * 70)
+    logger.info("MomentConversion Batch Processing")
+    logger.info("%s", "=" * 70)
+    logger.info("[1/5] 加载几何配置: %s", config_path)
+    try:
+        project_data, calculator = load_project_calculator(
+            config_path,
+            source_part=source_part,
+            target_part=target_part,
+            target_variant=target_variant,
         )
         # 显示实际使用的 Target part 名称
         used_target = getattr(calculator, "target_frame", None)
@@ -1249,7 +2567,7 @@ def run_batch_processing(
         logger.error(
             "  提示: 请检查 JSON 是否包含 Target 的 CoordSystem/MomentCenter/Q/S 或使用 GUI/creator.py 生成兼容的配置。"
         )
-        return
+        return None
 
     # 2. 构造数据格式配置（固定表头语义）
     logger.info("[2/5] 配置数据格式")
@@ -1261,7 +2579,6 @@ def run_batch_processing(
     input_path = Path(input_path)
     files_to_process = []
 
-    # 若提供了 data_config 且同时提供了 registry_db，则视为非交互自动模式，避免使用 input() 阶段
     # 预初始化 output_dir，避免在后续条件分支中被可能未赋值后使用
     output_dir = input_path
 
@@ -1271,181 +2588,524 @@ def run_batch_processing(
         output_dir = input_path.parent
     elif input_path.is_dir():
         logger.info("  模式: 目录批处理")
-        # 使用默认模式匹配所有常见数据文件
-        pattern = "*.csv;*.xlsx;*.xls;*.mtfmt;*.mtdata;*.txt;*.dat"
-        files = find_matching_files(str(input_path), pattern)
+        # 未指定时使用默认模式匹配所有常见数据文件
+        files = find_matching_files(str(input_path), pattern or DEFAULT_FILE_PATTERN)
         logger.info("  找到 %d 个匹配文件", len(files))
         files_to_process = files
         output_dir = input_path
     else:
         logger.error("  [错误] 无效的输入路径: %s", input_path)
 
+    jobs = plan_batch_jobs(
+        files_to_process,
+        file_source_target_map=file_source_target_map,
+        file_row_selection=file_row_selection,
+    )
+    part_kwargs = {
+        "source_part": source_part,
+        "target_part": target_part,
+        "target_variant": target_variant,
+    }
+    jobs, skipped, on_result = _open_run_journal(
+        jobs, output_dir, config_path, data_config, part_kwargs, resume
+    )
+    if skipped:
+        logger.info("  续跑: 跳过 %d 个已完成的文件", len(skipped))
+        for job in skipped:
+            logger.debug("  跳过（已完成）: %s", job.path)
+    if parallel is None:
+        parallel = ParallelOptions()
+    workers = resolve_worker_count(
+        parallel.workers, jobs, parallel.shard_threshold_bytes
+    )
+
     # 4. 验证
-    logger.info("[4/5] 准备处理 %d 个文件", len(files_to_process))
+    logger.info("[4/5] 准备处理 %d 个文件", len(jobs))
     logger.info("  输出目录: %s", output_dir)
-
-    # 5. 批量处理
-    logger.info("[5/5] 开始批量处理...")
-    success_count = 0
+    if workers > 1:
+        logger.info("  并行处理模式: workers=%d", workers)
 
     # Dry-run: 仅打印将处理的文件、解析的格式与目标输出路径，然后返回
     if dry_run:
         logger.info("Dry-run 模式：不写入文件，仅显示解析结果。")
-        for fp in files_to_process:
-            cfg_local = resolve_file_format(str(fp), data_config)
+        planned = []
+        for job in jobs:
+            cfg_local = resolve_file_format(str(job.path), data_config)
             out_path = generate_output_path(
-                fp, output_dir, cfg_local, create_placeholder=False
+                job.path, output_dir, cfg_local, create_placeholder=False
+            )
+            sharded = (
+                workers > 1
+                and not job.selected_rows
+                and should_shard_file(job.path, parallel.shard_threshold_bytes)
             )
             logger.info(
-                "将处理: %s -> %s",
-                fp,
+                "将处理: %s -> %s%s",
+                job.path,
                 out_path,
+                "（文件内分片并行）" if sharded else "",
             )
-        return
-
-    # 若在外部通过 CLI 提供了并行参数，会由外层主函数处理；这里保持串行以便直接调用
-    # 记录开始时间以便估算 ETA
-    start_time = datetime.now()
-    # 确保收集结果的容器始终存在，避免在空文件列表下引用未定义变量
-    results = []
-    for i, file_path in enumerate(files_to_process, 1):
-        logger.info("进度: [%d/%d] %s", i, len(files_to_process), file_path.name)
-        # 使用全局配置处理每个文件
-        cfg_local = resolve_file_format(str(file_path), data_config)
-
-        # 获取该文件的 source/target part 映射（若提供）
-        file_source = None
-        file_target = None
-        if file_source_target_map and str(file_path) in file_source_target_map:
-            mapping = file_source_target_map[str(file_path)]
-            file_source = mapping.get("source")
-            file_target = mapping.get("target")
-
-        # 获取该文件的行选择（若提供）
-        selected_rows = None
-        if file_row_selection and str(file_path) in file_row_selection:
-            selected_rows = file_row_selection[str(file_path)]
+            planned.append(
+                {"file": str(job.path), "output": str(out_path), "sharded": sharded}
+            )
+        return {
+            "total": len(jobs),
+            "success": 0,
+            "fail": 0,
+            "skipped": len(skipped),
+            "dry_run": True,
+            "files": planned,
+        }
 
-        t0 = datetime.now()
-        ok = process_single_file(
-            file_path,
-            calculator,
-            cfg_local,
+    # 5. 批量处理
+    logger.info("[5/5] 开始批量处理...")
+    pool_stats = None
+    if workers > 1:
+        parallel_run = copy.copy(parallel)
+        parallel_run.workers = workers
+        results, pool_stats = _run_jobs_parallel(
+            jobs,
+            config_path,
+            data_config,
             output_dir,
-            project_data,
-            source_part=file_source,
-            target_part=file_target,
-            selected_rows=selected_rows,
+            parallel_run,
+            part_kwargs=part_kwargs,
+            strict=strict,
+            show_progress=show_progress,
+            on_result=on_result,
         )
-        elapsed = (datetime.now() - t0).total_seconds()
-        if ok:
-            success_count += 1
-
-        # 收集结果以支持 --output-json/--summary
-        results.append(
-            {
-                "file": str(file_path),
-                "success": bool(ok),
-                "elapsed_sec": round(elapsed, 3),
-            }
+    elif pipeline_depth and pipeline_depth > 0:
+        results = _run_jobs_pipelined(
+            jobs,
+            calculator,
+            project_data,
+            data_config,
+            output_dir,
+            show_progress,
+            depth=pipeline_depth,
+            on_result=on_result,
         )
-
-        # 总是记录每文件耗时，便于 log-file 中查看详情
-        logger.info(
-            "文件 %s 处理完成: 成功=%s, 耗时=%.2fs",
-            file_path.name,
-            ok,
-            elapsed,
+    else:
+        results = _run_jobs_serial(
+            jobs,
+            calculator,
+            project_data,
+            data_config,
+            output_dir,
+            show_progress,
+            on_result=on_result,
         )
-
-        # 若开启进度显示，则打印稳定的 ETA 估算（基于平均每文件耗时）
-        if show_progress:
-            files_done = i
-            files_left = len(files_to_process) - files_done
-            avg_per_file = (datetime.now() - start_time).total_seconds() / files_done
-            eta_seconds = int(avg_per_file * files_left)
-            logger.info(
-                "已完成 %d/%d，累计耗时 %.1fs，本文件耗时 %.2fs，平均 %.2fs/文件，预计剩余 %ds",
-                files_done,
-                len(files_to_process),
-                (datetime.now() - start_time).total_seconds(),
-                elapsed,
-                avg_per_file,
-                eta_seconds,
-            )
-            # 同步向 stdout 输出可机器解析的进度行（JSON），便于监控系统采集
-            try:
-                prog = {
-                    "completed": files_done,
-                    "total": len(files_to_process),
-                    "file": str(file_path.name),
-                    "success": bool(ok),
-                    "elapsed_sec": round(elapsed or 0.0, 3),
-                    "avg_sec": round(avg_per_file or 0.0, 3),
-                    "eta_sec": eta_seconds,
-                }
-                # 进度 JSON 写入 stdout 以便外部监控程序解析
-                print(json.dumps(prog, ensure_ascii=False))
-                sys.stdout.flush()
-            except Exception:
-                try:
-                    logger.info(
-                        "[%d/%d] %s success=%s elapsed=%.2fs eta=%ds",
-                        files_done,
-                        len(files_to_process),
-                        file_path.name,
-                        ok,
-                        elapsed,
-                        eta_seconds,
-                    )
-                except Exception:
-                    pass
+    success_count = sum(1 for r in results if r["success"])
 
     # 总结
     logger.info("%s", "\n" + "=" * 70)
     logger.info("批处理完成!")
-    logger.info("  成功: %d/%d", success_count, len(files_to_process))
-    logger.info(
-        "  失败: %d/%d",
-        len(files_to_process) - success_count,
-        len(files_to_process),
-    )
+    logger.info("  成功: %d/%d", success_count, len(jobs))
+    logger.info("  失败: %d/%d", len(jobs) - success_count, len(jobs))
+    if skipped:
+        logger.info("  跳过（已完成）: %d", len(skipped))
     logger.info("%s", "=" * 70)
 
+    summary_payload = {
+        "total": len(jobs),
+        "success": success_count,
+        "fail": len(jobs) - success_count,
+        "skipped": len(skipped),
+    }
+    cache_stats = summarize_cache_events(results)
+    if cache_stats is not None:
+        summary_payload["cache"] = cache_stats
+        logger.info(
+            "  结果缓存: 命中 %d，未命中 %d，命中率 %.1f%%",
+            cache_stats["hits"],
+            cache_stats["misses"],
+            cache_stats["hit_rate"] * 100,
+        )
+    if pool_stats is not None:
+        summary_payload["pool"] = pool_stats
+
     # 写出 JSON 汇总（若请求）
     if output_json:
-        try:
-            results  # 确保 results 已定义；若未定义则回退为空列表
-        except NameError:
-            results = []
-        summary_payload = {
-            "total": len(files_to_process),
-            "success": success_count,
-            "fail": len(files_to_process) - success_count,
-            "files": results,
-        }
         try:
             with open(output_json, "w", encoding="utf-8") as fh:
-                json.dump(summary_payload, fh, ensure_ascii=False, indent=2)
+                json.dump(
+                    dict(summary_payload, files=results),
+                    fh,
+                    ensure_ascii=False,
+                    indent=2,
+                )
             logger.info("已将处理结果写入 %s", output_json)
         except Exception:
             logger.exception("写入 output_json 失败")
 
     if summary:
         try:
-            print(
-                json.dumps(
-                    {
-                        "total": len(files_to_process),
-                        "success": success_count,
-                        "fail": len(files_to_process) - success_count,
-                    },
-                    ensure_ascii=False,
-                )
-            )
+            # summary 以 JSON 输出到 stdout 以便脚本化处理
+            print(json.dumps(summary_payload, ensure_ascii=False))
         except Exception:
             logger.exception("打印 summary 失败")
 
+    return dict(summary_payload, files=results)
+
+
+def _latency_summary(latencies: typing.List[float]) -> dict:
+    """到达→结果延迟（毫秒）的中位数与最大值"""
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+    return {
+        "latency_ms_p50": round(ordered[len(ordered) // 2] * 1000, 1),
+        "latency_ms_max": round(ordered[-1] * 1000, 1),
+    }
+
+
+def _retire_previous_outputs(
+    journal: RunJournal, jobs: typing.List[FileJob], logger
+) -> None:
+    """删除将被重新处理的输入在日志中记录的旧输出。
+
+    输入在处理后又被修改（如仍在追加写入）时，旧结果已过期；先删除再处理，
+    新结果沿用同一输出名，不会逐次累积带序号后缀的过期文件。
+    """
+    for job in jobs:
+        for out in journal.recorded_outputs(job.path):
+            try:
+                os.remove(out)
+                logger.info("  移除过期输出: %s", out)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("  无法移除过期输出 %s: %s", out, e)
+                continue
+            # 同时清理该输出的完成标记
+            Path(out + ".complete").unlink(missing_ok=True)
+
+
+def run_watch_mode(
+    config_path: str,
+    input_dir: str,
+    data_config: BatchConfig = None,
+    *,
+    pattern: str = None,
+    source_part: str = None,
+    target_part: str = None,
+    target_variant: int = 0,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+    stop_event: typing.Optional[threading.Event] = None,
+) -> typing.Optional[dict]:
+    """监视模式：常驻进程，持续处理目录中新增或变化的数据文件。
+
+    项目配置与计算器只加载一次；每轮以 `DirectoryPoller` 轮询目录（scandir + stat 索引），
+    写入稳定（stat 至少两次轮询不变且静默 settle_seconds 秒）的新文件经 `_run_jobs_serial`
+    （即常规的原子写出路径）处理并记入运行日志。
+    启动时目录中已有的文件按续跑语义处理：日志中已以相同内容与配置完成的文件跳过；
+    本进程与历史运行写出的结果文件不会被当作输入。文件被修改后重新处理时，
+    先删除其上次的输出（见 `_retire_previous_outputs`）。
+
+    stop_event 被设置（或收到 KeyboardInterrupt）时退出，返回汇总 dict
+    （total/success/fail/skipped 与到达→结果延迟），配置加载失败时返回 None。
+    """
+    logger = logging.getLogger("batch")
+    try:
+        project_data, calculator = load_project_calculator(
+            config_path,
+            source_part=source_part,
+            target_part=target_part,
+            target_variant=target_variant,
+        )
+    except Exception as e:
+        logger.error("  ✗ 配置加载失败: %s", e)
+        return None
+    if data_config is None:
+        data_config = BatchConfig()
+    if stop_event is None:
+        stop_event = threading.Event()
+
+    output_dir = Path(input_dir)
+    part_kwargs = {
+        "source_part": source_part,
+        "target_part": target_part,
+        "target_variant": target_variant,
+    }
+    journal = RunJournal(output_dir)
+    poller = DirectoryPoller(
+        output_dir, pattern or DEFAULT_FILE_PATTERN, settle_seconds=settle_seconds
+    )
+    # 历史运行写出的结果文件不作为输入
+    poller.ignore(
+        out for rec in journal.load().values() for out in rec.get("outputs") or []
+    )
+    logger.info(
+        "监视模式: %s（模式 %s，轮询间隔 %.3fs），按 Ctrl+C 退出",
+        output_dir,
+        pattern or DEFAULT_FILE_PATTERN,
+        poll_interval,
+    )
+
+    results = []
+    latencies = []
+    skipped_total = 0
+    try:
+        while not stop_event.is_set():
+            ready = poller.poll()
+            if not ready:
+                stop_event.wait(poll_interval)
+                continue
+            arrivals = {}
+            for path in ready:
+                try:
+                    arrivals[str(path)] = path.stat().st_mtime
+                except OSError:
+                    pass
+            jobs, skipped, on_result = _open_run_journal(
+                plan_batch_jobs(ready),
+                output_dir,
+                config_path,
+                data_config,
+                part_kwargs,
+                resume=True,
+                journal=journal,
+            )
+            skipped_total += len(skipped)
+            for job in skipped:
+                logger.debug("  跳过（已完成）: %s", job.path)
+            _retire_previous_outputs(journal, jobs, logger)
+            for record in _run_jobs_serial(
+                jobs,
+                calculator,
+                project_data,
+                data_config,
+                output_dir,
+                on_result=on_result,
+            ):
+                poller.ignore(record["outputs"])
+                arrived = arrivals.get(record["file"])
+                if arrived is not None:
+                    record["latency_sec"] = round(max(time.time() - arrived, 0.0), 4)
+                    latencies.append(record["latency_sec"])
+                    logger.info(
+                        "  到达→结果延迟: %.1f ms (%s)",
+                        record["latency_sec"] * 1000,
+                        Path(record["file"]).name,
+                    )
+                results.append(record)
+    except KeyboardInterrupt:
+        logger.info("收到中断，退出监视模式")
+
+    success_count = sum(1 for r in results if r["success"])
+    summary_payload = {
+        "total": len(results),
+        "success": success_count,
+        "fail": len(results) - success_count,
+        "skipped": skipped_total,
+        "polls": poller.scans,
+    }
+    summary_payload.update(_latency_summary(latencies))
+    logger.info("监视模式结束: %s", summary_payload)
+    return dict(summary_payload, files=results)
+
+
+class _FileFollower:  # pylint: disable=too-many-instance-attributes
+    """跟踪单个不断追加的数据文件：只解析新增字节，变换后追加写入结果文件。
+
+    CSV 经 `CsvLineParser` 解析新增行，按常规数据块路径（`process_df_chunk`）计算并追加；
+    特殊格式经 `SpecialFormatLineParser` 保存 part/表头/暂存行状态，
+    各 part 的新增行由 `SpecialFormatFollower` 变换并追加到各自的输出。
+    文件被截断或替换时丢弃全部状态，从头重新跟踪并写出新的结果文件。
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        calculator: AeroCalculator,
+        project_data,
+        config: BatchConfig,
+        output_dir: Path,
+        logger,
+    ) -> None:
+        self.file_path = Path(file_path)
+        self.project_data = project_data
+        self.config = config
+        self.output_dir = Path(output_dir)
+        self.logger = logger
+        self.special = project_data is not None and looks_like_special_format(
+            self.file_path
+        )
+        if not self.special and self.file_path.suffix.lower() != ".csv":
+            raise ValueError(f"跟踪模式仅支持 CSV 与特殊格式文件: {self.file_path}")
+        # 全局 source/target 已用于构建 calculator（与批处理未指定文件级映射时一致）
+        self.calculator = calculator
+        self.reader = TailReader(self.file_path)
+        self.result_buffer = ResultBuffer()
+        self.rows = 0
+        self.restarts = 0
+        self.outputs: typing.List[Path] = []
+        self._start()
+
+    def _start(self) -> None:
+        if self.special:
+            self.parser = SpecialFormatLineParser(self.file_path)
+            self.sink = SpecialFormatFollower(
+                self.file_path,
+                self.project_data,
+                self.output_dir,
+                timestamp_format=self.config.timestamp_format,
+                overwrite=self.config.overwrite,
+            )
+        else:
+            self.parser = CsvLineParser(self.config.skip_rows)
+            self.out_path = None
+            self.first_chunk = True
+
+    def poll(self) -> int:
+        """读取并处理新增的完整行，返回本次写出的结果行数"""
+        lines = self.reader.read_lines()
+        if lines is None:
+            self.logger.warning("文件被截断或替换，从头重新跟踪: %s", self.file_path)
+            self._close_outputs()
+            self.reader.reset()
+            self.restarts += 1
+            self._start()
+            lines = self.reader.read_lines() or []
+        return self._consume(lines)
+
+    def close(self) -> int:
+        """处理剩余字节（含未以换行结尾的最后一行），并为各输出写入完成标记"""
+        lines = (self.reader.read_lines() or []) + self.reader.flush_partial()
+        written = self._consume(lines, final=True)
+        self._close_outputs()
+        return written
+
+    def _consume(self, lines: typing.List[str], final: bool = False) -> int:
+        if self.special:
+            written = self._consume_special(lines, final)
+        else:
+            written = self._consume_csv(lines)
+        self.rows += written
+        return written
+
+    def _consume_csv(self, lines: typing.List[str]) -> int:
+        df = self.parser.feed(lines)
+        if df is None or len(df) == 0:
+            return 0
+        if self.out_path is None:
+            self.out_path = generate_output_path(
+                self.file_path, self.output_dir, self.config
+            )
+            self.logger.info("跟踪输出: %s", self.out_path)
+        processed, _, _, self.first_chunk = process_df_chunk(
+            df.reset_index(drop=True),
+            self.calculator,
+            self.config,
+            self.out_path,
+            self.first_chunk,
+            self.logger,
+            result_buffer=self.result_buffer,
+        )
+        return processed
+
+    def _consume_special(self, lines: typing.List[str], final: bool) -> int:
+        new_rows = self.parser.feed(lines)
+        if final:
+            for part_name, rows in self.parser.finish().items():
+                new_rows.setdefault(part_name, []).extend(rows)
+        written = 0
+        for part_name, rows in new_rows.items():
+            written += self.sink.append(
+                part_name, self.parser.build_frame(part_name, rows)
+            )
+        return written
+
+    def _current_outputs(self) -> typing.List[Path]:
+        if self.special:
+            return self.sink.outputs
+        return [self.out_path] if self.out_path is not None else []
+
+    def _close_outputs(self) -> None:
+        for out_path in self._current_outputs():
+            try:
+                out_path.with_name(out_path.name + ".complete").write_text(
+                    datetime.now().isoformat()
+                )
+            except OSError:
+                pass
+            self.outputs.append(out_path)
+
+
+def run_follow_mode(
+    config_path: str,
+    input_file: str,
+    data_config: BatchConfig = None,
+    *,
+    source_part: str = None,
+    target_part: str = None,
+    target_variant: int = 0,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    stop_event: typing.Optional[threading.Event] = None,
+) -> typing.Optional[dict]:
+    """跟踪模式：持续处理单个不断追加的 CSV 或特殊格式文件。
+
+    记录已读取的字节偏移与解析状态，每轮只解析新追加的字节并把变换结果追加到结果文件，
+    每次更新的开销与新增数据量成正比，而非与文件大小成正比。结果固定为 CSV（需追加写入）。
+
+    stop_event 被设置（或收到 KeyboardInterrupt）时处理剩余数据后退出，返回汇总 dict
+    （rows/bytes_read/polls/restarts/outputs），配置加载失败或输入不受支持时返回 None。
+    """
+    logger = logging.getLogger("batch")
+    if data_config is None:
+        data_config = BatchConfig()
+    if (
+        normalize_output_format(getattr(data_config, "output_format", None))
+        != DEFAULT_OUTPUT_FORMAT
+    ):
+        logger.error("  ✗ 跟踪模式仅支持 CSV 结果格式（需追加写入）")
+        return None
+    try:
+        project_data, calculator = load_project_calculator(
+            config_path,
+            source_part=source_part,
+            target_part=target_part,
+            target_variant=target_variant,
+        )
+        follower = _FileFollower(
+            Path(input_file),
+            calculator,
+            project_data,
+            data_config,
+            Path(input_file).parent,
+            logger,
+        )
+    except Exception as e:
+        logger.error("  ✗ 跟踪模式初始化失败: %s", e)
+        return None
+    if stop_event is None:
+        stop_event = threading.Event()
+
+    logger.info(
+        "跟踪模式: %s（轮询间隔 %.3fs），按 Ctrl+C 退出", input_file, poll_interval
+    )
+    polls = 0
+    try:
+        while not stop_event.is_set():
+            polls += 1
+            if follower.poll() == 0:
+                stop_event.wait(poll_interval)
+    except KeyboardInterrupt:
+        logger.info("收到中断，退出跟踪模式")
+    finally:
+        follower.close()
+
+    summary_payload = {
+        "rows": follower.rows,
+        "bytes_read": follower.reader.bytes_read,
+        "polls": polls,
+        "restarts": follower.restarts,
+        "outputs": [str(p) for p in follower.outputs],
+    }
+    logger.info("跟踪模式结束: %s", summary_payload)
+    return summary_payload
+
 
 @click.command(context_settings={"help_option_names": ["-h", "--help"]})
 @click.option("-c", "--config", "config", required=True, help="配置文件路径 (JSON)")
@@ -1461,9 +3121,99 @@ def run_batch_processing(
 @click.option(
     "--workers",
     "workers",
-    type=int,
-    default=1,
-    help="并行工作进程数（默认为1，表示串行）",
+    type=click.IntRange(min=0),
+    default=None,
+    help="并行工作进程数；默认（或 0）按 CPU 核数与文件数自动选择，1 表示串行",
+)
+@click.option(
+    "--pipeline-depth",
+    "pipeline_depth",
+    type=click.IntRange(min=0),
+    default=DEFAULT_PIPELINE_DEPTH,
+    show_default=True,
+    help="串行模式下读取预取与写出队列的深度（数据块数），0 表示不使用流水线",
+)
+@click.option(
+    "--parse-cache",
+    "parse_cache_dir",
+    default=None,
+    help="特殊格式解析缓存目录：同一 .mtfmt 文件再次处理时直接读取二进制解析结果（默认关闭）",
+)
+@click.option(
+    "--result-cache",
+    "result_cache_dir",
+    default=None,
+    help="结果缓存目录：输入内容、几何与输出选项均未变时直接复用上次的输出",
+)
+@click.option(
+    "--result-cache-max-mb",
+    "result_cache_max_mb",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_RESULT_CACHE_MAX_MB,
+    show_default=True,
+    help="结果缓存大小预算（MB），超出时淘汰最久未使用的条目",
+)
+@click.option(
+    "--result-cache-hardlink",
+    "result_cache_hardlink",
+    is_flag=True,
+    help="缓存命中时以硬链接代替复制（同一文件系统；输出不应被就地修改）",
+)
+@click.option(
+    "--watch",
+    "watch",
+    is_flag=True,
+    help="监视模式：常驻进程，持续处理输入目录中新增或变化的文件（Ctrl+C 退出）",
+)
+@click.option(
+    "--follow",
+    "follow",
+    is_flag=True,
+    help="跟踪模式：持续处理单个不断追加的 CSV/特殊格式文件，只解析新增数据并追加结果",
+)
+@click.option(
+    "--poll-interval",
+    "poll_interval",
+    type=click.FloatRange(min=0.001),
+    default=DEFAULT_POLL_INTERVAL,
+    show_default=True,
+    help="监视/跟踪模式下的轮询间隔（秒）",
+)
+@click.option(
+    "--settle-seconds",
+    "settle_seconds",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_SETTLE_SECONDS,
+    show_default=True,
+    help="监视模式下文件需保持不变（至少两次轮询）的静默时长（秒），之后才视为写入完成",
+)
+@click.option(
+    "--resume",
+    "resume",
+    is_flag=True,
+    help="续跑：跳过运行日志中已以相同内容与配置完成且输出仍存在的文件",
+)
+@click.option(
+    "--schedule",
+    "schedule",
+    type=click.Choice(list(SCHEDULE_POLICIES)),
+    default=DEFAULT_SCHEDULE,
+    show_default=True,
+    help="并行模式的提交顺序: name（文件名）| size（大小降序）| lpt（估计开销降序）",
+)
+@click.option(
+    "--max-in-flight",
+    "max_in_flight",
+    type=click.IntRange(min=1),
+    default=None,
+    help=f"并行模式下同时在途的任务数上限（默认 workers×{DEFAULT_IN_FLIGHT_PER_WORKER}）",
+)
+@click.option(
+    "--max-tasks-per-child",
+    "max_tasks_per_child",
+    type=click.IntRange(min=1),
+    default=None,
+    help="并行模式下每个 worker 进程处理的任务数上限，达到后回收重建（需 Python 3.11+）",
 )
 @click.option(
     "--overwrite",
@@ -1483,6 +3233,14 @@ def run_batch_processing(
     default=None,
     help="时间戳格式，用于 {timestamp} 占位符，默认 %%Y%%m%%d_%%H%%M%%S",
 )
+@click.option(
+    "--output-format",
+    "output_format",
+    type=click.Choice(list(OUTPUT_FORMATS)),
+    default=DEFAULT_OUTPUT_FORMAT,
+    show_default=True,
+    help="结果文件格式: csv | parquet | feather（需 pyarrow）| npz，按块写出",
+)
 @click.option(
     "--treat-non-numeric",
     "treat_non_numeric",
@@ -1497,6 +3255,50 @@ def run_batch_processing(
     default=None,
     help="记录非数值示例的行数上限 (默认5)",
 )
+@click.option(
+    "--shard-threshold-mb",
+    "shard_threshold_mb",
+    type=float,
+    default=DEFAULT_SHARD_THRESHOLD_BYTES / (1024 * 1024),
+    show_default=True,
+    help="并行模式下超过该大小（MB）的 CSV 在文件内按字节分片并行处理；0 表示禁用",
+)
+@click.option(
+    "--shard-size-mb",
+    "shard_size_mb",
+    type=float,
+    default=DEFAULT_SHARD_BYTES / (1024 * 1024),
+    show_default=True,
+    help="文件内分片的目标大小（MB），分片边界对齐到换行",
+)
+@click.option(
+    "--chunk-size",
+    "chunk_size",
+    type=int,
+    default=None,
+    help="CSV 流式读取的块大小（行数），默认取全局配置 batch.chunk_size；0 表示整表读取",
+)
+@click.option(
+    "--part-workers",
+    "part_workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="特殊格式文件内并行处理 part 的线程数；报告仍按 part 原始顺序输出",
+)
+@click.option(
+    "--combine-parts",
+    "combine_parts",
+    is_flag=True,
+    help="特殊格式文件的所有 part 合并输出为一个长表文件（含 part/source_part/target_part 列）",
+)
+@click.option(
+    "--axes",
+    "axis_frame",
+    type=click.Choice(["body", "stability", "wind"]),
+    default=None,
+    help="输出轴系: body（默认）| stability | wind，后两者按 Alpha/Beta 列逐行旋转",
+)
 @click.option(
     "--source-part",
     "source_part",
@@ -1555,11 +3357,31 @@ def main(**cli_options):
     log_file = cli_options.get("log_file")
     verbose = cli_options.get("verbose")
     workers = cli_options.get("workers")
+    max_tasks_per_child = cli_options.get("max_tasks_per_child")
+    schedule = cli_options.get("schedule")
+    pipeline_depth = cli_options.get("pipeline_depth")
+    resume = cli_options.get("resume")
+    watch = cli_options.get("watch")
+    follow = cli_options.get("follow")
+    poll_interval = cli_options.get("poll_interval")
+    settle_seconds = cli_options.get("settle_seconds")
+    max_in_flight = cli_options.get("max_in_flight")
     overwrite = cli_options.get("overwrite")
     name_template = cli_options.get("name_template")
     timestamp_format = cli_options.get("timestamp_format")
+    output_format = cli_options.get("output_format")
     treat_non_numeric = cli_options.get("treat_non_numeric")
     sample_rows = cli_options.get("sample_rows")
+    axis_frame = cli_options.get("axis_frame")
+    chunk_size = cli_options.get("chunk_size")
+    part_workers = cli_options.get("part_workers")
+    combine_parts = cli_options.get("combine_parts")
+    result_cache_dir = cli_options.get("result_cache_dir")
+    parse_cache_dir = cli_options.get("parse_cache_dir")
+    result_cache_max_mb = cli_options.get("result_cache_max_mb")
+    result_cache_hardlink = cli_options.get("result_cache_hardlink")
+    shard_threshold_mb = cli_options.get("shard_threshold_mb")
+    shard_size_mb = cli_options.get("shard_size_mb")
     source_part = cli_options.get("source_part")
     target_part = cli_options.get("target_part")
     target_variant = cli_options.get("target_variant")
@@ -1584,215 +3406,114 @@ def main(**cli_options):
         data_config.treat_non_numeric = treat_non_numeric
     if sample_rows is not None:
         data_config.sample_rows = sample_rows
-
-    # 根据 pattern 参数或交互获取 pattern
-    pat = pattern or "*.csv;*.xlsx;*.xls;*.mtfmt;*.mtdata;*.txt;*.dat"
-
-    # 并行处理支持：若 workers>1，则使用 ProcessPoolExecutor
+    if axis_frame:
+        data_config.axis_frame = axis_frame
+    if chunk_size is not None:
+        data_config.chunk_size = chunk_size
+    if part_workers:
+        data_config.part_workers = part_workers
+    if combine_parts:
+        data_config.combine_parts = True
+    if parse_cache_dir:
+        # 解析缓存由全局配置控制（GUI 与批处理共用，见 src.parse_cache）
+        get_config().batch.parse_cache_enabled = True
+        get_config().batch.parse_cache_dir = parse_cache_dir
+    if result_cache_dir:
+        data_config.result_cache_dir = result_cache_dir
+        data_config.result_cache_max_mb = result_cache_max_mb
+        data_config.result_cache_hardlink = bool(result_cache_hardlink)
     try:
-        if workers > 1:
-            logger.info("并行处理模式: workers=%d", workers)
-            # 构造文件列表
-            input_path_obj = Path(input_path)
-            files_to_process = []
-            output_dir = None
-            if input_path_obj.is_file():
-                files_to_process = [input_path_obj]
-                output_dir = input_path_obj.parent
-            elif input_path_obj.is_dir():
-                pat_use = pat
-                files = find_matching_files(str(input_path_obj), pat_use)
-                # 并行模式下不提供交互选择：自动处理所有匹配到的文件
-                # 选择 all
-                chosen_idxs = list(range(len(files)))
-                files_to_process = [files[i] for i in chosen_idxs]
-                output_dir = input_path_obj
-            else:
-                _error_exit_json(f"无效的输入路径: {input_path}", code=4)
-
-            # 准备并行任务参数（将 data_config 序列化为 dict）
-            config_dict = {
-                "skip_rows": data_config.skip_rows,
-                "name_template": data_config.name_template,
-                "timestamp_format": data_config.timestamp_format,
-                "overwrite": data_config.overwrite,
-                "treat_non_numeric": data_config.treat_non_numeric,
-                "sample_rows": data_config.sample_rows,
-            }
-
-            with ProcessPoolExecutor(max_workers=workers) as exe:
-                futures = {}
-                start_times = {}
-                results = []
-                for fp in files_to_process:
-                    worker_args = {
-                        "file_path": str(fp),
-                        "config_dict": config_dict,
-                        "project_config_path": config,
-                        "output_dir": str(output_dir),
-                        "strict": strict,
-                    }
-                    fut = exe.submit(_worker_process, worker_args)
-                    futures[fut] = fp
-                    start_times[fut] = datetime.now()
-
-                success_count = 0
-                # 统计完成的任务以计算平均耗时并估算 ETA
-                completed = 0
-                total = len(futures)
-                elapsed_sum = 0.0
-                for fut in as_completed(futures):
-                    fp = futures[fut]
-                    st = start_times.get(fut, None)
-                    try:
-                        file_str, ok, err = fut.result()
-                        endt = datetime.now()
-                        elapsed = (endt - st).total_seconds() if st else None
-                        if elapsed is not None:
-                            elapsed_sum += elapsed
-                            completed += 1
-                        avg = (elapsed_sum / completed) if completed else None
-                        remaining = total - completed
-                        eta = int(avg * remaining) if avg is not None else None
-
-                        # 收集并记录
-                        results.append(
-                            {
-                                "file": file_str,
-                                "success": bool(ok),
-                                "error": err,
-                                "elapsed_sec": round(elapsed or 0.0, 3),
-                            }
-                        )
-
-                        if ok:
-                            logger.info(
-                                "处理成功: %s (耗时: %.2fs)",
-                                file_str,
-                                elapsed if elapsed else 0.0,
-                            )
-                            success_count += 1
-                        else:
-                            logger.error(
-                                "处理失败: %s 错误: %s (耗时: %.2fs)",
-                                file_str,
-                                err,
-                                elapsed if elapsed else 0.0,
-                            )
-
-                        # 当请求进度显示时，记录 ETA 与平均每文件耗时
-                        if show_progress and eta is not None:
-                            logger.info(
-                                "已完成 %d/%d，平均每文件耗时 %.2fs，预计剩余 %ds",
-                                completed,
-                                total,
-                                avg,
-                                eta,
-                            )
-                            # 同步向 stdout 输出可机器解析的进度行（JSON），便于监控系统采集
-                            try:
-                                prog = {
-                                    "completed": completed,
-                                    "total": total,
-                                    "file": file_str,
-                                    "success": bool(ok),
-                                    "elapsed_sec": round(elapsed or 0.0, 3),
-                                    "avg_sec": round(avg or 0.0, 3),
-                                    "eta_sec": eta,
-                                }
-                                print(json.dumps(prog, ensure_ascii=False))
-                                sys.stdout.flush()
-                            except Exception:
-                                # 回退到日志输出
-                                try:
-                                    logger.info(
-                                        "[%d/%d] %s success=%s elapsed=%.2fs eta=%ds",
-                                        completed,
-                                        total,
-                                        file_str,
-                                        ok,
-                                        elapsed,
-                                        eta,
-                                    )
-                                except Exception:
-                                    pass
-                        else:
-                            logger.info("已完成 %d/%d", completed, total)
-                            if show_progress:
-                                try:
-                                    print(
-                                        json.dumps(
-                                            {
-                                                "completed": completed,
-                                                "total": total,
-                                            },
-                                            ensure_ascii=False,
-                                        )
-                                    )
-                                    sys.stdout.flush()
-                                except Exception:
-                                    # 忽略无法写 stdout 的情况
-                                    pass
-
-                    except Exception:
-                        logger.exception("任务异常: %s", fp)
-
-            # 写出 JSON 汇总（若请求）
-            if output_json:
-                summary_payload = {
-                    "total": len(files_to_process),
-                    "success": success_count,
-                    "fail": len(files_to_process) - success_count,
-                    "files": results,
-                }
-                try:
-                    with open(output_json, "w", encoding="utf-8") as fh:
-                        json.dump(summary_payload, fh, ensure_ascii=False, indent=2)
-                    logger.info("已将处理结果写入 %s", output_json)
-                except Exception:
-                    logger.exception("写入 output_json 失败")
-
-            if summary:
-                # summary 以 JSON 输出到 stdout 以便脚本化处理
-                print(
-                    json.dumps(
-                        {
-                            "total": len(files_to_process),
-                            "success": success_count,
-                            "fail": len(files_to_process) - success_count,
-                        },
-                        ensure_ascii=False,
-                    )
-                )
-
-            logger.info(
-                "并行处理完成: 成功 %d/%d",
-                success_count,
-                len(files_to_process),
+        data_config.output_format = ensure_output_format_available(output_format)
+    except ValueError as e:
+        _error_exit_json(str(e), code=2, hint="安装 pyarrow 或改用 csv / npz 格式")
+
+    if not Path(input_path).exists():
+        _error_exit_json(f"无效的输入路径: {input_path}", code=4)
+
+    if follow:
+        if watch or not Path(input_path).is_file():
+            _error_exit_json(
+                f"跟踪模式需要单个输入文件（不可与 --watch 同用）: {input_path}",
+                code=4,
             )
-            sys.exit(0 if success_count == len(files_to_process) else 1)
-
-        else:
-            # 串行模式：调用批处理函数
-            run_batch_processing(
+        try:
+            result = run_follow_mode(
+                config,
+                input_path,
+                data_config,
+                source_part=source_part,
+                target_part=target_part,
+                target_variant=target_variant,
+                poll_interval=poll_interval,
+            )
+        except Exception:
+            logger.exception("跟踪模式失败")
+            sys.exit(5)
+        if result is None:
+            sys.exit(1)
+        if summary:
+            print(json.dumps(result, ensure_ascii=False))
+        sys.exit(0)
+
+    if watch:
+        if not Path(input_path).is_dir():
+            _error_exit_json(f"监视模式需要输入目录: {input_path}", code=4)
+        try:
+            result = run_watch_mode(
                 config,
                 input_path,
                 data_config,
-                strict=strict,
-                dry_run=dry_run,
-                show_progress=show_progress,
-                output_json=output_json,
-                summary=summary,
+                pattern=pattern,
                 source_part=source_part,
                 target_part=target_part,
                 target_variant=target_variant,
-                file_source_target_map=None,
-                file_row_selection=None,
+                poll_interval=poll_interval,
+                settle_seconds=settle_seconds,
             )
-            sys.exit(0)
+        except Exception:
+            logger.exception("监视模式失败")
+            sys.exit(5)
+        if result is None:
+            sys.exit(1)
+        if summary:
+            payload = {k: v for k, v in result.items() if k != "files"}
+            print(json.dumps(payload, ensure_ascii=False))
+        sys.exit(0)
+
+    parallel = ParallelOptions(
+        workers=workers,
+        schedule=schedule,
+        max_in_flight=max_in_flight,
+        max_tasks_per_child=max_tasks_per_child,
+        shard_threshold_bytes=int(shard_threshold_mb * 1024 * 1024),
+        shard_bytes=int(shard_size_mb * 1024 * 1024),
+    )
+
+    # 串行与并行共用同一任务规划；所有选项在两种模式下语义一致
+    try:
+        result = run_batch_processing(
+            config,
+            input_path,
+            data_config,
+            strict=strict,
+            dry_run=dry_run,
+            show_progress=show_progress,
+            output_json=output_json,
+            summary=summary,
+            source_part=source_part,
+            target_part=target_part,
+            target_variant=target_variant,
+            file_source_target_map=None,
+            file_row_selection=None,
+            pattern=pattern,
+            parallel=parallel,
+            pipeline_depth=pipeline_depth,
+            resume=resume,
+        )
     except Exception:
         logger.exception("批处理失败")
         sys.exit(5)
+    sys.exit(0 if result is not None and result["fail"] == 0 else 1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+"""基准：偏斜语料下 name / size / lpt 三种提交顺序的整体完成时间（makespan）。
+
+语料由大量小 CSV 与少量按文件名排在末尾的大 CSV 组成，
+模拟按文件名顺序提交时大文件最后才开始处理的情形。
+
+用法（在项目根目录）：
+    python benchmarks/bench_lpt_schedule.py --small 200 --large 3 --large-rows 400000 --workers 4
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+# pylint: disable=wrong-import-position
+import batch  # noqa: E402
+from src.batch_scheduler import (  # noqa: E402
+    SCHEDULE_POLICIES,
+    iter_bounded_submit,
+    plan_schedule,
+)
+
+_PROJECT = str(_ROOT / "data" / "input.json")
+_TARGET = "TestModel"
+
+
+def _write_csv(path: Path, rows: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        rng.normal(size=(rows, 6)) * 100.0,
+        columns=["Fx", "Fy", "Fz", "Mx", "My", "Mz"],
+    )
+    df.to_csv(path, index=False)
+
+
+def _build_corpus(root: Path, small: int, small_rows: int, large: int, large_rows):
+    files = []
+    for i in range(small):
+        path = root / f"a_{i:05d}.csv"
+        _write_csv(path, small_rows, i)
+        files.append(path)
+    # 大文件名以 z_ 开头，按文件名排序时排在最后
+    for i in range(large):
+        path = root / f"z_{i:03d}.csv"
+        _write_csv(path, large_rows, 10_000 + i)
+        files.append(path)
+    return sorted(files)
+
+
+def _run(files, policy: str, workers: int, out_dir: Path, max_in_flight: int):
+    out_dir.mkdir()
+    config_dict = batch._batch_config_to_dict(  # pylint: disable=protected-access
+        batch.BatchConfig()
+    )
+    with batch._create_worker_pool(  # pylint: disable=protected-access
+        workers,
+        _PROJECT,
+        config_dict,
+        str(out_dir),
+        part_kwargs={"target_part": _TARGET},
+        prebuild_parts=[],
+    ) as exe:
+        # 预热：等待全部 worker 完成初始化，避免把进程启动计入 makespan
+        list(exe.map(abs, range(workers)))
+        t0 = time.perf_counter()
+        jobs = list(enumerate(plan_schedule(files, policy)))
+        t_plan = time.perf_counter() - t0
+        failures = 0
+        for _, fut, _ in iter_bounded_submit(
+            exe,
+            batch._run_worker_job,  # pylint: disable=protected-access
+            jobs,
+            lambda item: (item[0], str(item[1].path)),
+            max_in_flight,
+        ):
+            failures += 0 if fut.result()["success"] else 1
+        makespan = time.perf_counter() - t0
+    return makespan, t_plan, failures
+
+
+def main() -> None:
+    """生成偏斜语料，分别计时三种调度策略。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--small", type=int, default=200)
+    parser.add_argument("--small-rows", type=int, default=200)
+    parser.add_argument("--large", type=int, default=3)
+    parser.add_argument("--large-rows", type=int, default=400_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-in-flight", type=int, default=None)
+    args = parser.parse_args()
+    max_in_flight = args.max_in_flight or args.workers * 4
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        corpus = tmp_path / "corpus"
+        corpus.mkdir()
+        files = _build_corpus(
+            corpus, args.small, args.small_rows, args.large, args.large_rows
+        )
+        print(
+            f"files={len(files)} (small={args.small}x{args.small_rows} rows, "
+            f"large={args.large}x{args.large_rows} rows) workers={args.workers} "
+            f"max_in_flight={max_in_flight}"
+        )
+        baseline = None
+        for policy in SCHEDULE_POLICIES:
+            makespan, t_plan, failures = _run(
+                files, policy, args.workers, tmp_path / f"out_{policy}", max_in_flight
+            )
+            baseline = baseline or makespan
+            print(
+                f"{policy:5s}: makespan {makespan:7.2f} s  "
+                f"(plan {t_plan * 1000:6.1f} ms, x{baseline / makespan:.2f} vs name, "
+                f"failures={failures})"
+            )
+
+
+if __name__ == "__main__":
+    main()
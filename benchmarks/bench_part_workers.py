@@ -0,0 +1,68 @@
+"""基准：特殊格式文件按 part 并行处理（--part-workers）——串行 vs 线程池。
+
+合成文件含 parts 个 part（每个 rows 行），所有 part 映射到同一对 source/target，
+分别以不同线程数调用 `process_special_format_file` 并计时（含变换与 CSV 写出）。
+
+用法（在项目根目录）：
+    python benchmarks/bench_part_workers.py --parts 64 --rows 50000 --workers 1 2 4
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+# pylint: disable=wrong-import-position
+from bench_process_batch import _make_project  # noqa: E402
+from bench_special_format_parse import _write_file  # noqa: E402
+
+from src.special_format_parser import parse_special_format_file  # noqa: E402
+from src.special_format_processor import process_special_format_file  # noqa: E402
+
+
+def main() -> None:
+    """生成合成文件，按各线程数处理并打印耗时与相对串行的加速比。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parts", type=int, default=64)
+    parser.add_argument("--rows", type=int, default=50_000, help="每个 part 的行数")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    project = _make_project()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "synthetic.mtfmt"
+        _write_file(path, args.parts, args.rows)
+        names = [f"PART{p}" for p in range(args.parts)]
+        print(f"文件: {args.parts} 个 part × {args.rows} 行")
+
+        baseline = None
+        for workers in args.workers:
+            out_dir = Path(tmp) / f"out_{workers}"
+            start = time.perf_counter()
+            outputs = process_special_format_file(
+                path,
+                project,
+                out_dir,
+                part_source_mapping=dict.fromkeys(names, "S"),
+                part_target_mapping=dict.fromkeys(names, "T"),
+                parse_func=parse_special_format_file,
+                max_workers=workers,
+            )
+            elapsed = time.perf_counter() - start
+            assert len(outputs) == args.parts
+            baseline = baseline or elapsed
+            print(
+                f"part_workers={workers:<3d} {elapsed:8.2f} s  "
+                f"(加速比 {baseline / elapsed:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""基准：AeroCalculator 融合算子 vs 逐步参考路径。
+
+用法（在项目根目录）：
+    python benchmarks/bench_process_batch.py --rows 2000000 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+# pylint: disable=wrong-import-position,protected-access
+from src.data_loader import (  # noqa: E402
+    CoordSystemDefinition,
+    FrameConfiguration,
+    ProjectData,
+)
+from src.geometry import euler_angles_to_basis  # noqa: E402
+from src.physics import AeroCalculator  # noqa: E402
+
+
+def _make_project() -> ProjectData:
+    basis = euler_angles_to_basis(3.0, 2.0, 45.0)
+    src = FrameConfiguration(
+        part_name="S",
+        coord_system=CoordSystemDefinition(
+            origin=[0.1, 0.2, 0.3],
+            x_axis=basis[0].tolist(),
+            y_axis=basis[1].tolist(),
+            z_axis=basis[2].tolist(),
+        ),
+    )
+    tgt = FrameConfiguration(
+        part_name="T",
+        coord_system=CoordSystemDefinition(
+            origin=[0, 0, 0], x_axis=[1, 0, 0], y_axis=[0, 1, 0], z_axis=[0, 0, 1]
+        ),
+        moment_center=[0.5, -0.2, 1.0],
+        c_ref=0.3,
+        b_ref=2.0,
+        q=120.0,
+        s_ref=0.8,
+    )
+    return ProjectData(source_parts={"S": [src]}, target_parts={"T": [tgt]})
+
+
+def _make_calculator() -> AeroCalculator:
+    return AeroCalculator(_make_project())
+
+
+def _best_of(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    """运行基准并打印两条路径的耗时与最大偏差。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    calc = _make_calculator()
+    rng = np.random.default_rng(0)
+    forces = rng.normal(size=(args.rows, 3)) * 100.0
+    moments = rng.normal(size=(args.rows, 3)) * 10.0
+    loads = np.hstack((forces, moments))
+
+    t_ref = _best_of(
+        lambda: calc._process_batch_reference(forces, moments), args.repeat
+    )
+    t_batch = _best_of(lambda: calc.process_batch(forces, moments), args.repeat)
+    t_stacked = _best_of(lambda: calc.process_stacked(loads), args.repeat)
+
+    ref = calc._process_batch_reference(forces, moments)
+    fused = calc.process_batch(forces, moments)
+    max_err = max(float(np.max(np.abs(fused[k] - ref[k]))) for k in ref)
+
+    print(f"rows={args.rows} repeat={args.repeat}")
+    print(f"reference path      : {t_ref * 1000:9.2f} ms")
+    print(f"process_batch fused : {t_batch * 1000:9.2f} ms  (x{t_ref / t_batch:.2f})")
+    print(
+        f"process_stacked     : {t_stacked * 1000:9.2f} ms  (x{t_ref / t_stacked:.2f})"
+    )
+    print(f"max |fused - ref|   : {max_err:.3e}")
+
+
+if __name__ == "__main__":
+    main()
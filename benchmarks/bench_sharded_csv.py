@@ -0,0 +1,86 @@
+"""基准：单个大 CSV 的串行处理 vs 文件内字节分片并行处理。
+
+用法（在项目根目录）：
+    python benchmarks/bench_sharded_csv.py --rows 2000000 --workers 4 --shard-mb 16
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+# pylint: disable=wrong-import-position
+import batch  # noqa: E402
+from src.cli_helpers import load_project_calculator  # noqa: E402
+
+_PROJECT = str(_ROOT / "data" / "input.json")
+_TARGET = "TestModel"
+
+
+def _write_input(path: Path, rows: int) -> None:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        rng.normal(size=(rows, 6)) * 100.0,
+        columns=["Fx", "Fy", "Fz", "Mx", "My", "Mz"],
+    )
+    df.to_csv(path, index=False)
+
+
+def main() -> None:
+    """生成输入文件，分别计时串行与分片并行路径并校验输出一致。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--shard-mb", type=float, default=16.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        csv_path = tmp_path / "big.csv"
+        _write_input(csv_path, args.rows)
+        size_mb = csv_path.stat().st_size / 1024 / 1024
+
+        cfg = batch.BatchConfig()
+        _, calc = load_project_calculator(_PROJECT, target_part=_TARGET)
+        t0 = time.perf_counter()
+        batch.process_single_file(csv_path, calc, cfg, tmp_path / "serial")
+        t_serial = time.perf_counter() - t0
+
+        with ProcessPoolExecutor(max_workers=args.workers) as exe:
+            t0 = time.perf_counter()
+            batch.process_file_sharded(
+                csv_path,
+                cfg,
+                tmp_path / "sharded",
+                _PROJECT,
+                exe,
+                shard_bytes=int(args.shard_mb * 1024 * 1024),
+                target_part=_TARGET,
+            )
+            t_sharded = time.perf_counter() - t0
+
+        same = (
+            next((tmp_path / "serial").glob("*.csv")).read_bytes()
+            == next((tmp_path / "sharded").glob("*.csv")).read_bytes()
+        )
+
+    print(f"rows={args.rows} size={size_mb:.1f}MB workers={args.workers}")
+    print(f"serial  : {t_serial:8.2f} s  ({args.rows / t_serial:,.0f} rows/s)")
+    print(
+        f"sharded : {t_sharded:8.2f} s  ({args.rows / t_sharded:,.0f} rows/s, "
+        f"x{t_serial / t_sharded:.2f})"
+    )
+    print(f"identical output: {same}")
+
+
+if __name__ == "__main__":
+    main()
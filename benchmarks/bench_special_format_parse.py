@@ -0,0 +1,97 @@
+"""基准：特殊格式（.mtfmt）文件解析——单次扫描批量转换 vs 逐行状态机。
+
+逐行路径即 `_extract_parts_from_lines` + `_finalize_part`（每行多次分类，
+字符串 token 按列 `pd.to_numeric`）；单次扫描路径为 `parse_special_format_file`。
+
+用法（在项目根目录）：
+    python benchmarks/bench_special_format_parse.py --parts 1000 --rows 1000
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+# pylint: disable=wrong-import-position
+from src.special_format_detector import _read_text_file_lines  # noqa: E402
+from src.special_format_parser import (  # noqa: E402
+    _extract_parts_from_lines,
+    _finalize_part,
+    parse_special_format_file,
+)
+
+HEADER = "Alpha CL CD Cm Cc Cn C1 K CDp CDv Swet Cx Cy Cz/FN CMx CMy CMz"
+
+
+def _write_file(path: Path, parts: int, rows: int, seed: int = 0) -> None:
+    """生成含 parts 个 part、每个 rows 行数据（17 列）及汇总行的合成文件"""
+    rng = np.random.default_rng(seed)
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("计算坐标系：X向后、Y向右、z向上\n参考面积：9.73m2\n")
+        for p in range(parts):
+            fh.write(f"PART{p}\n{HEADER}\n")
+            block = rng.normal(size=(rows, 17))
+            np.savetxt(fh, block, fmt="%.5f", delimiter=" ")
+            fh.write("CLa cdmin CmCL Cm0 Kmax\n")
+            fh.write("0.01343 0.02233 0.56813 0.02137 2.94582\n\n")
+
+
+def _parse_line_by_line(path: Path) -> dict:
+    lines = _read_text_file_lines(path)
+    result = {}
+    for name, (hdr, rows) in _extract_parts_from_lines(lines, path).items():
+        _finalize_part(name, hdr, rows, result)
+    return result
+
+
+def _timed(func, path: Path):
+    start = time.perf_counter()
+    result = func(path)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """生成合成文件并分别计时两种解析路径，校验结果一致。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parts", type=int, default=1000)
+    parser.add_argument("--rows", type=int, default=1000, help="每个 part 的行数")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "synthetic.mtfmt"
+        _write_file(path, args.parts, args.rows)
+        size_mb = path.stat().st_size / (1024 * 1024)
+        print(
+            f"文件: {args.parts} 个 part × {args.rows} 行 = "
+            f"{args.parts * args.rows} 行, {size_mb:.1f} MB"
+        )
+
+        t_old, old = _timed(_parse_line_by_line, path)
+        t_new, new = _timed(parse_special_format_file, path)
+
+        assert list(old) == list(new)
+        for name, df in new.items():
+            np.testing.assert_array_equal(
+                old[name].to_numpy(dtype=np.float64), df.to_numpy()
+            )
+
+        print(
+            f"逐行状态机:   {t_old:8.2f} s  ({args.parts * args.rows / t_old:,.0f} 行/s)"
+        )
+        print(
+            f"单次扫描批量: {t_new:8.2f} s  ({args.parts * args.rows / t_new:,.0f} 行/s)"
+        )
+        print(f"加速比: {t_old / t_new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
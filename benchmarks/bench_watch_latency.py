@@ -0,0 +1,98 @@
+"""基准：监视模式（--watch）下单个运行文件从落盘到结果写出的延迟。
+
+对比每次重新启动 batch.py 的开销时，可用 `time python batch.py ...` 测量单次冷启动。
+
+用法（在项目根目录）：
+    python benchmarks/bench_watch_latency.py --files 20 --rows 2000 --interval 0.2
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+# pylint: disable=wrong-import-position
+from batch import BatchConfig, run_watch_mode  # noqa: E402
+
+
+def _drop_file(path: Path, rows: int, seed: int) -> None:
+    """先写临时名再改名，模拟采集系统的原子落盘"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        rng.normal(size=(rows, 6)) * 100.0,
+        columns=["Fx", "Fy", "Fz", "Mx", "My", "Mz"],
+    )
+    tmp = path.with_name(path.name + ".tmp")
+    df.to_csv(tmp, index=False, float_format="%.6f")
+    os.replace(tmp, path)
+
+
+def main() -> None:
+    """在监视进程运行时按间隔投放文件，统计到达→结果延迟。"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--interval", type=float, default=0.2)
+    parser.add_argument("--poll", type=float, default=0.02)
+    parser.add_argument("--config", default=str(_ROOT / "data" / "input.json"))
+    parser.add_argument("--target-part", default="TestModel")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        cfg = BatchConfig()
+        cfg.name_template = "{stem}_result.csv"
+        stop = threading.Event()
+        box = {}
+        watcher = threading.Thread(
+            target=lambda: box.update(
+                result=run_watch_mode(
+                    args.config,
+                    str(root),
+                    cfg,
+                    target_part=args.target_part,
+                    poll_interval=args.poll,
+                    settle_seconds=0.0,
+                    stop_event=stop,
+                )
+            )
+        )
+        watcher.start()
+        time.sleep(0.5)
+        for i in range(args.files):
+            _drop_file(root / f"run_{i:04d}.csv", args.rows, i)
+            time.sleep(args.interval)
+        deadline = time.time() + 30
+        while len(list(root.glob("*_result.csv"))) < args.files:
+            if time.time() > deadline:
+                break
+            time.sleep(args.poll)
+        stop.set()
+        watcher.join()
+
+    result = box["result"]
+    latencies = sorted(r["latency_sec"] * 1000 for r in result["files"])
+    print(
+        f"files={args.files} rows={args.rows} poll={args.poll}s "
+        f"processed={result['success']}/{result['total']}"
+    )
+    print(
+        f"arrival->result latency: p50 {latencies[len(latencies) // 2]:.1f} ms, "
+        f"max {latencies[-1]:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
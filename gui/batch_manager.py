@@ -498,6 +498,10 @@ class BatchManager:
         """获取特殊格式解析结果（带 mtime 缓存）- 委托给 batch_state"""
         return self._batch_state.get_special_data_dict(file_path, self)
 
+    def _get_special_part_df(self, file_path: Path, part_name: str):
+        """按 part 偏移索引获取单个 part 的数据（带缓存）- 委托给 batch_state"""
+        return self._batch_state.get_special_part_df(file_path, part_name)
+
     def _format_preview_value(self, v):
         """将单元格值格式化为便于显示的字符串（处理 None/NaN 和异常）。"""
         # 委托到 preview 子模块实现（已在模块顶层导入）
@@ -1697,6 +1701,12 @@ class BatchManager:
         """安全地填充单个 special part 的数据预览表格（捕获异常）。"""
         try:
             df = (data_dict or {}).get(str(source_part))
+            if df is None:
+                # 整文件尚未解析完成时，仅在该 part 已按索引单独解析过时显示
+                cached = self._batch_state.special_part_cache.get(
+                    (str(file_path), str(source_part))
+                )
+                df = (cached or {}).get("df")
             if df is not None:
                 sp = str(source_part)
                 self._populate_special_data_rows(child, file_path, sp, df)
@@ -277,7 +277,7 @@ def create_batch_thread(
         
         fp_sel = getattr(manager.gui, "file_part_selection_by_file", {})
 
-        return BatchProcessThread(
+        thread = BatchProcessThread(
             calc,
             files_to_process,
             output_path,
@@ -289,6 +289,18 @@ def create_batch_thread(
             file_part_selection_by_file=fp_sel,
             table_row_selection_by_file=tbl_sel,
         )
+        batch_panel = getattr(manager.gui, "batch_panel", None)
+        spin = getattr(batch_panel, "spin_part_workers", None)
+        if spin is not None:
+            thread.config.part_workers = int(spin.value())
+        chk = getattr(batch_panel, "chk_combine_parts", None)
+        if chk is not None:
+            thread.config.combine_parts = bool(chk.isChecked())
+        cfg_mgr = getattr(manager.gui, "config_manager", None)
+        if cfg_mgr is not None and hasattr(cfg_mgr, "saved_config_path"):
+            saved = cfg_mgr.saved_config_path()
+            thread.config.project_config_path = str(saved) if saved else None
+        return thread
     except Exception:
         logger.debug("创建 BatchProcessThread 失败", exc_info=True)
         return None
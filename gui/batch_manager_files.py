@@ -16,6 +16,7 @@ from PySide6.QtWidgets import QTreeWidgetItem
 
 from src.cli_helpers import BatchConfig, resolve_file_format
 from src.file_cache import get_file_cache
+from src.part_inference import get_part_name_index_for_names
 from src.special_format_detector import looks_like_special_format
 from src.special_format_parser import get_part_names
 from gui.status_message_queue import MessagePriority
@@ -405,9 +406,9 @@ def _ensure_regular_file_selector_rows(manager, file_item, file_path: Path) -> N
 def _infer_source_part(manager, part_name: str, source_names: list) -> Optional[str]:
     """智能推测source part（内部部件名与配置中的source part对应关系）。
 
-    策略：
+    策略（与 src.part_inference 共享同一名称索引）：
     1. 在source_names中查找同名的
-    2. 不区分大小写查找
+    2. 不区分大小写查找，其次移除特殊字符后比较（均要求唯一命中）
     3. 若找不到，不默认选择，避免误选
     """
     result = None
@@ -416,33 +417,7 @@ def _infer_source_part(manager, part_name: str, source_names: list) -> Optional[
         if pn:
             sns = [str(x) for x in (source_names or []) if str(x).strip()]
             if sns:
-                # 策略1：完全匹配
-                if pn in sns:
-                    result = pn
-                else:
-                    # 策略2：不区分大小写
-                    pn_lower = pn.lower()
-                    ci = [s for s in sns if s.lower() == pn_lower]
-                    if len(ci) == 1:
-                        result = ci[0]
-                    else:
-                        # 策略3：移除特殊字符后比较
-                        def norm(s: str) -> str:
-                            try:
-                                s2 = "".join(
-                                    ch
-                                    for ch in (s or "")
-                                    if ch.isalnum() or ("\u4e00" <= ch <= "\u9fff")
-                                )
-                                return s2.lower()
-                            except Exception:
-                                return (s or "").lower()
-
-                        pn_norm = norm(pn)
-                        if pn_norm:
-                            nm = [s for s in sns if norm(s) == pn_norm]
-                            if len(nm) == 1:
-                                result = nm[0]
+                result = get_part_name_index_for_names(source_names=sns).match_source(pn)
                 # 不再默认选择 Global，避免误映射
     except Exception:
         logger.debug("推测 source part 失败", exc_info=True)
@@ -458,31 +433,7 @@ def _infer_target_part(manager, source_part: str, target_names: list) -> Optiona
         if sp:
             tns = [str(x) for x in (target_names or []) if str(x).strip()]
             if tns:
-                if sp in tns:
-                    result = sp
-                else:
-                    sp_lower = sp.lower()
-                    ci = [t for t in tns if t.lower() == sp_lower]
-                    if len(ci) == 1:
-                        result = ci[0]
-                    else:
-
-                        def norm(s: str) -> str:
-                            try:
-                                s2 = "".join(
-                                    ch
-                                    for ch in (s or "")
-                                    if ch.isalnum() or ("\u4e00" <= ch <= "\u9fff")
-                                )
-                                return s2.lower()
-                            except Exception:
-                                return (s or "").lower()
-
-                        sp_norm = norm(sp)
-                        if sp_norm:
-                            nm = [t for t in tns if norm(t) == sp_norm]
-                            if len(nm) == 1:
-                                result = nm[0]
+                result = get_part_name_index_for_names(target_names=tns).match_target(sp)
     except Exception:
         logger.debug("推测 target part 失败", exc_info=True)
         result = None
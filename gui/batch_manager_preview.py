@@ -504,9 +504,8 @@ def _apply_quick_filter_to_special_table(
             return
 
         file_path_obj = Path(file_path_str)
-        get_special = getattr(manager, "_get_special_data_dict", None)
-        data_dict = get_special(file_path_obj) if callable(get_special) else {}
-        df = data_dict.get(source_part)
+        get_part = getattr(manager, "_get_special_part_df", None)
+        df = get_part(file_path_obj, source_part) if callable(get_part) else None
         if df is None or df.empty:
             return
         if qcol not in df.columns:
@@ -28,6 +28,10 @@ class BatchStateManager:
         # key: file_path_str -> {"mtime": float, "data": Dict[str, DataFrame]}
         self.special_data_cache: Dict = {}
 
+        # 特殊格式：按 part 偏移索引单独解析的 part（未整文件解析时使用）
+        # key: (file_path_str, part_name) -> {"mtime": float, "df": DataFrame}
+        self.special_part_cache: Dict = {}
+
         # 常规表格（CSV/Excel）：缓存预览数据
         # key: file_path_str -> {"mtime": float, "df": DataFrame, "preview_rows": int}
         self.table_data_cache: Dict = {}
@@ -126,6 +130,39 @@ class BatchStateManager:
             self.table_row_selection.clear()
             self.special_row_selection.clear()
 
+    def get_special_part_df(self, file_path: Path, part_name: str):
+        """获取特殊格式文件中单个 part 的 DataFrame（带 mtime 缓存）
+
+        已有整文件解析结果时直接取用；否则借助 part 偏移索引只读取并解析该 part
+        的字节区间，不触发整文件解析。part 不存在或解析失败时返回 None。
+        """
+        from src.special_format_parser import parse_special_format_part
+
+        fp_str = str(file_path)
+        part_name = str(part_name)
+        try:
+            mtime = file_path.stat().st_mtime
+        except OSError:
+            return None
+
+        cached = self.special_data_cache.get(fp_str)
+        if cached and cached.get("mtime") == mtime and cached.get("data") is not None:
+            return cached["data"].get(part_name)
+
+        key = (fp_str, part_name)
+        cached_part = self.special_part_cache.get(key)
+        if cached_part and cached_part.get("mtime") == mtime:
+            return cached_part.get("df")
+        try:
+            df = parse_special_format_part(file_path, part_name)
+        except Exception:
+            logger.debug(
+                "按索引解析 part 失败: %s / %s", fp_str, part_name, exc_info=True
+            )
+            return None
+        self.special_part_cache[key] = {"mtime": mtime, "df": df}
+        return df
+
     def get_special_data_dict(self, file_path: Path, manager_instance):
         """获取特殊格式解析结果（带 mtime 缓存）
 
@@ -145,7 +182,7 @@ class BatchStateManager:
         from gui.managers import _report_ui_exception, report_user_error
         from gui.signal_bus import SignalBus
         from gui.status_message_queue import MessagePriority
-        from src.special_format_parser import parse_special_format_file
+        from src.parse_cache import load_special_format_file
 
         fp_str = str(file_path)
         try:
@@ -208,9 +245,11 @@ class BatchStateManager:
                 except Exception:
                     # 直接在当前线程尝试解析以触发异常处理路径并清理标志
                     try:
-                        parse_special_format_file(file_path)
+                        load_special_format_file(file_path)
                     except Exception:
-                        # 确保在异常路径清理标志
+                        logger.debug("同步回退解析失败: %s", fp_str, exc_info=True)
+                    finally:
+                        # 同步回退已结束（含命中解析缓存的情形），确保清理标志
                         try:
                             setattr(manager_instance, in_progress_key, False)
                             setattr(manager_instance, parsing_timeout_key, None)
@@ -223,7 +262,7 @@ class BatchStateManager:
                 pool = get_thread_pool()
 
                 def _task():
-                    return parse_special_format_file(file_path)
+                    return load_special_format_file(file_path)
 
                 future, task_id = pool.submit(
                     _task,
@@ -356,7 +395,7 @@ class BatchStateManager:
                 # 回退到非阻塞守护线程
                 def _fallback_thread_worker():
                     try:
-                        data_dict = parse_special_format_file(file_path)
+                        data_dict = load_special_format_file(file_path)
                         try:
                             self.special_data_cache[fp_str] = {
                                 "mtime": mtime,
@@ -453,7 +492,7 @@ class BatchStateManager:
 
             def _fallback_thread_worker():
                 try:
-                    data_dict = parse_special_format_file(file_path)
+                    data_dict = load_special_format_file(file_path)
                     try:
                         self.special_data_cache[fp_str] = {
                             "mtime": mtime,
@@ -994,6 +1033,8 @@ class BatchStateManager:
             try:
                 if fp_str in self.special_data_cache:
                     del self.special_data_cache[fp_str]
+                for key in [k for k in self.special_part_cache if k[0] == fp_str]:
+                    del self.special_part_cache[key]
                     logger.info("已清除文件 %s 的特殊格式缓存", fp_str)
             except Exception as e:
                 logger.error("清除缓存失败: %s", e)
@@ -36,8 +36,22 @@ from pathlib import Path
 import pandas as pd
 from PySide6.QtCore import QThread, Signal
 
+from src.io_pipeline import DEFAULT_PIPELINE_DEPTH, run_pipeline
+from src.output_formats import (
+    DEFAULT_OUTPUT_FORMAT,
+    normalize_output_format,
+    output_suffix,
+    write_frame_atomic,
+)
+from src.run_journal import (
+    RunJournal,
+    config_hash,
+    content_digest,
+    stat_fingerprint,
+)
 from src.special_format_detector import looks_like_special_format
 from src.special_format_parser import process_special_format_file
+from src.table_reader import read_projected_csv, sniff_projection
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +76,33 @@ class BatchThreadConfig:
     special_row_selection_by_file: dict = None
     file_part_selection_by_file: dict = None
     table_row_selection_by_file: dict = None
+    # 读/算/写流水线的预取与写出深度；0 表示逐文件串行处理
+    pipeline_depth: int = DEFAULT_PIPELINE_DEPTH
+    # 结果文件格式：csv | parquet | feather | npz
+    output_format: str = DEFAULT_OUTPUT_FORMAT
+    # 续跑：跳过输出目录运行日志中已以相同内容与配置完成的文件
+    resume: bool = False
+    # 特殊格式文件内并行处理 part 的线程数（1 表示串行）
+    part_workers: int = 1
+    # 特殊格式文件的所有 part 合并输出为一个长表文件
+    combine_parts: bool = False
+    # 与 project_data 一致的项目配置文件（运行日志按其内容计算配置哈希；None 时哈希内存中的配置）
+    project_config_path: str = None
+
+
+@dataclass
+class _PipelineTask:  # pylint: disable=too-many-instance-attributes
+    """流水线中单个文件的处理状态；各字段只由一个阶段写入。"""
+
+    index: int
+    file_path: Path
+    started: datetime
+    special: bool = False
+    df: pd.DataFrame = None
+    output_df: pd.DataFrame = None
+    output_file: object = None
+    error: Exception = None
+    cancelled: bool = False
 
 
 class BatchProcessThread(QThread):
@@ -93,6 +134,10 @@ class BatchProcessThread(QThread):
         self.output_dir = Path(output_dir)
         self.data_config = data_config
         self._stop_requested = False
+        # 运行日志（在主循环开始时打开，见 _prepare_journal）
+        self._journal = None
+        self._journal_base = None
+        self._journal_planned = {}
         # 配置对象优先；为兼容旧调用，合并提供的参数
         if config is None:
             config = BatchThreadConfig(
@@ -307,7 +352,10 @@ class BatchProcessThread(QThread):
             part_row_selection=row_selection,
             timestamp_format=self.config.timestamp_format,
             overwrite=overwrite_flag,
+            output_format=self._output_format(),
             return_report=True,
+            max_workers=getattr(self.config, "part_workers", 1),
+            combine_parts=getattr(self.config, "combine_parts", False),
         )
 
         # 将详细报告转换为 GUI 日志消息，按 part 显示成功/跳过/失败原因
@@ -334,6 +382,17 @@ class BatchProcessThread(QThread):
         if out is not None:
             return out
 
+        df = self._read_table_input(file_path)
+
+        # 提取列、构造 inputs 并创建 per-file 计算器（如果需要）
+        inputs, calc_to_use = self._prepare_inputs_and_calc(file_path, df)
+
+        # 执行计算并写出，返回输出文件路径
+        output = self._compute_and_write_output(calc_to_use, inputs)
+        return output
+
+    def _read_table_input(self, file_path) -> pd.DataFrame:
+        """解析 per-file 格式并读取表格输入，应用 GUI 中的行选择后返回 DataFrame。"""
         try:
             if self._stop_requested:
                 raise RuntimeError("处理已被请求停止")
@@ -351,14 +410,7 @@ class BatchProcessThread(QThread):
         if self._stop_requested:
             raise RuntimeError("处理已被请求停止")
         # 应用用户在 GUI 中按文件选择的行过滤（若有）
-        df = self._apply_table_row_selection(file_path, df)
-
-        # 提取列、构造 inputs 并创建 per-file 计算器（如果需要）
-        inputs, calc_to_use = self._prepare_inputs_and_calc(file_path, df)
-
-        # 执行计算并写出，返回输出文件路径
-        output = self._compute_and_write_output(calc_to_use, inputs)
-        return output
+        return self._apply_table_row_selection(file_path, df)
 
     def _prepare_inputs_and_calc(self, file_path, df: pd.DataFrame):
         """为给定文件和 DataFrame 构建 ProcessInputs 并返回 (inputs, calc_to_use)。"""
@@ -627,6 +679,12 @@ class BatchProcessThread(QThread):
 
     def _compute_and_write_output(self, calc_to_use, inputs: ProcessInputs) -> Path:
         """将输入转为有量纲数组，调用计算器批量计算并把结果写出为 CSV（原子写入）。"""
+        output_df, output_file = self._compute_output(calc_to_use, inputs)
+        self._write_output(output_df, output_file)
+        return output_file
+
+    def _compute_output(self, calc_to_use, inputs: ProcessInputs):
+        """批量计算并构建输出表，返回 (output_df, output_file)，不做任何写入。"""
         forces_dimensional, moments_dimensional = self._prepare_dimensional_arrays(
             calc_to_use,
             inputs.forces_df,
@@ -647,18 +705,26 @@ class BatchProcessThread(QThread):
         # 生成更高分辨率且具唯一性的文件名，减少同名冲突
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         unique = uuid.uuid4().hex[:8]
-        filename = f"{inputs.file_path.stem}_result_{timestamp}_{unique}.csv"
-        output_file = self.output_dir / filename
+        ext = output_suffix(self._output_format())
+        filename = f"{inputs.file_path.stem}_result_{timestamp}_{unique}{ext}"
+        return output_df, self.output_dir / filename
 
+    def _output_format(self) -> str:
+        return normalize_output_format(getattr(self.config, "output_format", None))
+
+    def _write_output(self, output_df: pd.DataFrame, output_file: Path) -> None:
+        """确保输出目录存在并原子写入结果。"""
         try:
             os.makedirs(self.output_dir, exist_ok=True)
         except Exception:
             pass
 
         # 原子写入
-        self._atomic_write(output_df, output_file)
-
-        return output_file
+        fmt = self._output_format()
+        if fmt == DEFAULT_OUTPUT_FORMAT:
+            self._atomic_write(output_df, output_file)
+        else:
+            write_frame_atomic(output_df, output_file, fmt)
 
     def _process_single_file(self, i: int, file_path: Path, total: int):
         """处理单个文件并返回 (success_flag, output_file, file_elapsed, success_msg)。"""
@@ -670,8 +736,16 @@ class BatchProcessThread(QThread):
                 logger.debug("无法发出开始处理消息: %s", file_path, exc_info=True)
 
             output_file = self.process_file(file_path)
-            file_elapsed = (datetime.now() - file_start).total_seconds()
+        except Exception as e:
+            return self._report_file_outcome(file_path, file_start, error=e)
+        return self._report_file_outcome(file_path, file_start, output_file)
 
+    def _report_file_outcome(
+        self, file_path: Path, file_start: datetime, output_file=None, error=None
+    ):
+        """发送单个文件的完成/失败消息，返回 (success_flag, output_file, file_elapsed, msg)。"""
+        file_elapsed = (datetime.now() - file_start).total_seconds()
+        if error is None:
             # 兼容特殊格式返回多个输出文件的情况，并生成 summary
             success_flag, success_msg = self._format_output_summary(output_file)
             try:
@@ -692,41 +766,39 @@ class BatchProcessThread(QThread):
 
             return success_flag, output_file, file_elapsed, success_msg
 
-        except (ValueError, IndexError, OSError) as e:
-            file_elapsed = (datetime.now() - file_start).total_seconds()
+        if isinstance(error, (ValueError, IndexError, OSError)):
             try:
-                self.log_message.emit(f"  ✗ 失败: {e} (耗时: {file_elapsed:.2f}s)")
+                self.log_message.emit(f"  ✗ 失败: {error} (耗时: {file_elapsed:.2f}s)")
             except Exception:
                 logger.debug(
                     "Cannot emit failure message for %s: %s",
                     file_path,
-                    e,
+                    error,
                     exc_info=True,
                 )
-            return False, None, file_elapsed, str(e)
+            return False, None, file_elapsed, str(error)
 
+        logger.error("Unexpected error processing file %s", file_path, exc_info=error)
+        try:
+            self.log_message.emit(f"  ✗ 未知错误 (耗时: {file_elapsed:.2f}s)")
         except Exception:
-            file_elapsed = (datetime.now() - file_start).total_seconds()
-            logger.exception("Unexpected error processing file %s", file_path)
-            try:
-                self.log_message.emit(f"  ✗ 未知错误 (耗时: {file_elapsed:.2f}s)")
-            except Exception:
-                logger.debug(
-                    "Cannot emit unknown error message for %s",
-                    file_path,
-                    exc_info=True,
-                )
-            return False, None, file_elapsed, "未知错误"
+            logger.debug(
+                "Cannot emit unknown error message for %s",
+                file_path,
+                exc_info=True,
+            )
+        return False, None, file_elapsed, "未知错误"
 
     def _read_input_dataframe(self, file_path: Path, cfg_to_use):
         """读取输入文件为 DataFrame（CSV 或 Excel），并发送日志。"""
         from gui.progress_config import BATCH_LARGE_FILE_ROW_THRESHOLD
-        
+
         try:
             if file_path.suffix.lower() == ".csv":
-                df = pd.read_csv(
-                    file_path,
-                    skiprows=int(getattr(cfg_to_use, "skip_rows", 0)),
+                # 只解析载荷列与 Alpha/Beta 列（宽表日志可大幅减少解析量）
+                skip_rows = int(getattr(cfg_to_use, "skip_rows", 0))
+                df = read_projected_csv(
+                    file_path, skip_rows, sniff_projection(file_path, skip_rows)
                 )
                 logger.debug("CSV 读取完成: %s 行, %s 列", df.shape[0], df.shape[1])
                 row_count = df.shape[0]
@@ -855,36 +927,153 @@ class BatchProcessThread(QThread):
         except Exception:
             logger.debug("Cannot emit finished signal", exc_info=True)
 
+    def _emit_cancel_log(self) -> None:
+        try:
+            self.log_message.emit("用户取消：正在停止批处理")
+        except Exception:
+            logger.debug("Cannot emit cancel log message", exc_info=True)
+
+    def _emit_file_start(self, i: int, total: int, file_path: Path) -> None:
+        """发送开始处理某文件的日志与进度信息。"""
+        try:
+            self.log_message.emit(f"处理 [{i+1}/{total}]: {file_path.name}")
+        except Exception:
+            logger.debug("无法发出开始处理消息: %s", file_path, exc_info=True)
+
+        try:
+            pct_start = int((i / total) * 100) if total else 0
+            start_msg = f"正在处理 {i+1}/{total}: {file_path.name}"
+            self._emit_progress_detail(pct_start, start_msg)
+        except Exception:
+            logger.debug("无法发送开始处理进度信息", exc_info=True)
+
+    def _emit_file_done(
+        self, i: int, total: int, file_path: Path, elapsed_list: list
+    ) -> None:
+        """发送某文件处理结束后的进度与详细进度信息。"""
+        try:
+            pct = int((i + 1) / total * 100)
+            self.progress.emit(pct)
+
+            # 发送详细进度信息
+            try:
+                detail_msg = self._build_progress_detail(
+                    i + 1,
+                    total,
+                    elapsed_list,
+                    current_file_name=file_path.name,
+                )
+                self._emit_progress_detail(pct, detail_msg)
+            except Exception:
+                logger.debug("无法发送详细进度信息", exc_info=True)
+        except Exception:
+            logger.debug(
+                "Unable to emit progress value for %s",
+                file_path,
+                exc_info=True,
+            )
+
+    def _journal_config_hash(self, file_path) -> str:
+        """单个文件的配置哈希：项目/计算器配置、批处理格式与该文件的 part/行选择"""
+        key = str(Path(file_path))
+        per_file = [
+            (getattr(self.config, name, None) or {}).get(key)
+            for name in (
+                "file_part_selection_by_file",
+                "table_row_selection_by_file",
+                "special_part_mapping_by_file",
+                "special_row_selection_by_file",
+            )
+        ]
+        return config_hash(self._journal_base, per_file)
+
+    def _journal_project_digest(self) -> str:
+        """项目配置摘要：有对应的配置文件时取其内容摘要（同 CLI），否则哈希内存中的配置"""
+        path = getattr(self.config, "project_config_path", None)
+        if path:
+            try:
+                return content_digest(path)
+            except OSError:
+                logger.debug("无法读取项目配置文件: %s", path, exc_info=True)
+        return config_hash(self.config.project_data)
+
+    def _prepare_journal(self) -> None:
+        """打开输出目录下的运行日志；resume 时从文件列表中移除已完成的文件。
+
+        各文件共享的配置部分只在此处哈希一次，逐文件只哈希该文件的 part/行选择。
+        """
+        self._journal = RunJournal(self.output_dir)
+        self._journal_base = config_hash(
+            self._journal_project_digest(),
+            getattr(self.calculator, "source_frame", None),
+            getattr(self.calculator, "target_frame", None),
+            self._global_batch_cfg,
+            self.data_config,
+            self.config.timestamp_format,
+            self._output_format(),
+        )
+        if getattr(self.config, "resume", False):
+            self._journal.load()
+            pending, skipped = self._journal.partition(
+                self.file_list, lambda fp: (fp, self._journal_config_hash(fp))
+            )
+            if skipped:
+                self.file_list = pending
+                try:
+                    self.log_message.emit(f"续跑：跳过 {len(skipped)} 个已完成的文件")
+                except Exception:
+                    logger.debug("无法发出续跑消息", exc_info=True)
+        self._journal_planned = {
+            str(Path(fp)): stat_fingerprint(fp) for fp in self.file_list
+        }
+
+    def _journal_outcome(self, file_path, success_flag, output_file, msg) -> None:
+        """将单个文件的处理结果写入运行日志（失败不影响批处理）。"""
+        if self._journal is None:
+            return
+        if isinstance(output_file, (list, tuple)):
+            outputs = list(output_file)
+        else:
+            outputs = [] if output_file is None else [output_file]
+        try:
+            self._journal.record_outcome(
+                file_path,
+                self._journal_config_hash(file_path),
+                bool(success_flag),
+                outputs=outputs if success_flag else (),
+                error=None if success_flag else msg,
+                planned=self._journal_planned.get(str(Path(file_path))),
+            )
+        except Exception:
+            logger.debug("无法写入运行日志: %s", file_path, exc_info=True)
+
     def _run_main_loop(self):
         """主循环：遍历文件列表，调用单文件处理并更新进度。返回 (success_count, elapsed_list)。"""
+        try:
+            self._prepare_journal()
+        except Exception:
+            self._journal = None
+            logger.debug("无法打开运行日志", exc_info=True)
         total = len(self.file_list)
+        depth = int(getattr(self.config, "pipeline_depth", 0) or 0)
+        if depth > 0 and total > 1:
+            return self._run_pipelined_loop(depth)
+
         success = 0
         elapsed_list = []
 
         for i, file_path in enumerate(self.file_list):
             if self._stop_requested:
-                try:
-                    self.log_message.emit("用户取消：正在停止批处理")
-                except Exception:
-                    logger.debug("Cannot emit cancel log message", exc_info=True)
+                self._emit_cancel_log()
                 break
 
             file_start = datetime.now()
-            try:
-                self.log_message.emit(f"处理 [{i+1}/{total}]: {file_path.name}")
-            except Exception:
-                logger.debug("无法发出开始处理消息: %s", file_path, exc_info=True)
-
-            try:
-                pct_start = int((i / total) * 100) if total else 0
-                start_msg = f"正在处理 {i+1}/{total}: {file_path.name}"
-                self._emit_progress_detail(pct_start, start_msg)
-            except Exception:
-                logger.debug("无法发送开始处理进度信息", exc_info=True)
+            self._emit_file_start(i, total, file_path)
 
             try:
                 res = self._process_single_file(i, file_path, total)
                 success_flag, output_file, file_elapsed, success_msg = res
+                self._journal_outcome(file_path, success_flag, output_file, success_msg)
                 elapsed_list.append(file_elapsed)
                 try:
                     self._emit_eta(i + 1, total, elapsed_list)
@@ -907,29 +1096,102 @@ class BatchProcessThread(QThread):
                         exc_info=True,
                     )
 
-            try:
-                pct = int((i + 1) / total * 100)
-                self.progress.emit(pct)
+            self._emit_file_done(i, total, file_path, elapsed_list)
+
+        return success, elapsed_list
+
+    def _run_pipelined_loop(self, depth: int):
+        """以读/算/写三级流水线处理文件列表，返回值与 `_run_main_loop` 相同。
+
+        读取线程预取至多 depth 个已解析的表格文件，写出线程异步落盘；
+        特殊格式文件自带多 part 的读写，整体在计算阶段处理。
+        日志、进度与结果统计按文件顺序在写出阶段发送，与串行模式一致。
+        """
+        total = len(self.file_list)
+        counts = {"success": 0}
+        elapsed_list = []
 
-                # 发送详细进度信息
+        def _source():
+            for i, file_path in enumerate(self.file_list):
+                if self._stop_requested:
+                    self._emit_cancel_log()
+                    return
+                task = _PipelineTask(
+                    index=i, file_path=Path(file_path), started=datetime.now()
+                )
                 try:
-                    detail_msg = self._build_progress_detail(
-                        i + 1,
-                        total,
-                        elapsed_list,
-                        current_file_name=file_path.name,
-                    )
-                    self._emit_progress_detail(pct, detail_msg)
-                except Exception:
-                    logger.debug("无法发送详细进度信息", exc_info=True)
-            except Exception:
-                logger.debug(
-                    "Unable to emit progress value for %s",
-                    file_path,
-                    exc_info=True,
+                    if self.config.project_data is not None and (
+                        looks_like_special_format(task.file_path)
+                    ):
+                        task.special = True
+                    else:
+                        task.df = self._read_table_input(task.file_path)
+                except Exception as e:  # pylint: disable=broad-except
+                    task.error = e
+                yield task
+
+        def _compute(task: _PipelineTask) -> _PipelineTask:
+            if self._stop_requested:
+                task.cancelled = True
+                task.df = None
+                return task
+            self._emit_file_start(task.index, total, task.file_path)
+            if task.error is not None:
+                return task
+            try:
+                if task.special:
+                    out = self._process_special_format_branch(task.file_path)
+                    if out is not None:
+                        task.output_file = out
+                        return task
+                    # 特殊格式未提取到 part：回退为常规表格处理
+                    task.df = self._read_table_input(task.file_path)
+                inputs, calc_to_use = self._prepare_inputs_and_calc(
+                    task.file_path, task.df
                 )
-
-        return success, elapsed_list
+                task.output_df, task.output_file = self._compute_output(
+                    calc_to_use, inputs
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                task.error = e
+            task.df = None
+            return task
+
+        def _sink(task: _PipelineTask) -> None:
+            if task.cancelled:
+                return
+            if task.error is None and task.output_df is not None:
+                try:
+                    self._write_output(task.output_df, task.output_file)
+                except Exception as e:  # pylint: disable=broad-except
+                    task.error = e
+                task.output_df = None
+            success_flag, output_file, file_elapsed, msg = self._report_file_outcome(
+                task.file_path,
+                task.started,
+                None if task.error is not None else task.output_file,
+                task.error,
+            )
+            self._journal_outcome(task.file_path, success_flag, output_file, msg)
+            elapsed_list.append(file_elapsed)
+            try:
+                self._emit_eta(task.index + 1, total, elapsed_list)
+            except Exception:
+                logger.debug("无法发出 ETA 消息", exc_info=True)
+            if success_flag:
+                counts["success"] += 1
+            self._emit_file_done(task.index, total, task.file_path, elapsed_list)
+
+        stats = run_pipeline(
+            _source(),
+            _compute,
+            _sink,
+            read_ahead=depth,
+            write_behind=depth,
+            name="gui-batch",
+        )
+        logger.debug("GUI 批处理流水线统计: %s", stats.as_dict())
+        return counts["success"], elapsed_list
 
     def run(self):
         try:
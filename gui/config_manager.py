@@ -18,6 +18,7 @@ from gui.delay_scheduler import DelayScheduler
 from gui.status_message_queue import MessagePriority
 from src.data_loader import ProjectData
 from src.models import ProjectConfigModel
+from src.transform_table import build_transform_table
 
 logger = logging.getLogger(__name__)
 
@@ -170,6 +171,8 @@ class ConfigManager:
                 return
 
             project = ProjectData.from_dict(data)
+            # 与 load_data 一致：加载时预计算全部 source×target variant 的变换表
+            project.transform_table = build_transform_table(project)
             mm.current_config = project
             # 同步到 gui 顶层属性，确保其他模块（如 BatchManager）能通过
             # `self.gui.current_config` 或 `self.gui.project_model` 访问到最新数据。
@@ -850,6 +853,12 @@ class ConfigManager:
         """
         logger.debug("ConfigManager.apply_config 已被移除（no-op）")
 
+    def saved_config_path(self):
+        """当前配置与磁盘上的配置文件一致（已加载/保存且未修改）时返回其路径，否则返回 None"""
+        if self._config_modified or not self._last_loaded_config_path:
+            return None
+        return Path(self._last_loaded_config_path)
+
     def is_config_modified(self):
         """返回配置是否被修改"""
         return self._config_modified
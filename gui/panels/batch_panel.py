@@ -3,6 +3,7 @@
 """
 
 import logging
+import os
 
 from PySide6.QtCore import QEvent, QStringListModel, Qt, Signal
 from PySide6.QtGui import QDoubleValidator, QFont
@@ -19,6 +20,7 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QPushButton,
     QSizePolicy,
+    QSpinBox,
     QTabWidget,
     QTextEdit,
     QTreeWidget,
@@ -441,6 +443,29 @@ class BatchPanel(QWidget):
             pass
         btn_row.addWidget(self.chk_bulk_row_selection)
 
+        # 特殊格式文件内并行处理的 part 数
+        btn_row.addWidget(QLabel("Part并行:"))
+        self.spin_part_workers = QSpinBox()
+        try:
+            self.spin_part_workers.setRange(1, max(1, os.cpu_count() or 1))
+            self.spin_part_workers.setValue(1)
+            self.spin_part_workers.setToolTip(
+                "特殊格式文件内同时处理的 part 数（1 表示逐个处理）"
+            )
+        except Exception:
+            pass
+        btn_row.addWidget(self.spin_part_workers)
+
+        self.chk_combine_parts = QCheckBox("合并Part输出")
+        try:
+            self.chk_combine_parts.setToolTip(
+                "勾选后：特殊格式文件的所有 part 写入一个长表文件（含 part 列），"
+                "而非每个 part 一个文件"
+            )
+        except Exception:
+            pass
+        btn_row.addWidget(self.chk_combine_parts)
+
         # 快速筛选：简洁的单列筛选
         filter_label = QLabel("快速筛选:")
         filter_label.setStyleSheet("margin-left: 10px;")
@@ -353,8 +353,7 @@ class QuickSelectDialog(QDialog):
                         df = self.batch._get_table_df_preview(fp, max_rows=200)
                         row_count = len(df) if df is not None else 0
                     else:
-                        data = self.batch._get_special_data_dict(fp)
-                        df = (data or {}).get(str(part))
+                        df = self.batch._get_special_part_df(fp, part)
                         row_count = len(df) if df is not None else 0
                     if row_count > 0:
                         txt = ",".join(str(i) for i in range(1, row_count + 1))
@@ -404,8 +403,7 @@ class QuickSelectDialog(QDialog):
                         out.append(f"第{r+1}条数据: " + " | ".join(vals))
                 return out
             else:
-                data = self.batch._get_special_data_dict(fp)
-                df = (data or {}).get(str(part))
+                df = self.batch._get_special_part_df(fp, part)
                 if df is None:
                     return []
                 out = [f"文件: {fp.name}  part: {part}"]
@@ -460,8 +458,7 @@ class QuickSelectDialog(QDialog):
                             except Exception:
                                 pass
                     else:
-                        data = self.batch._get_special_data_dict(fp)
-                        df = (data or {}).get(str(part))
+                        df = self.batch._get_special_part_df(fp, part)
                         row_count = len(df) if df is not None else 0
                         by_file = (
                             getattr(gui, "special_part_row_selection_by_file", {}) or {}
@@ -507,8 +504,7 @@ class QuickSelectDialog(QDialog):
                     if table is not None and hasattr(table, "uncheck_rows_if_visible"):
                         table.uncheck_rows_if_visible(rows)
                 else:
-                    data = self.batch._get_special_data_dict(fp)
-                    df = (data or {}).get(str(part))
+                    df = self.batch._get_special_part_df(fp, part)
                     row_count = len(df) if df is not None else (max(rows) + 1)
                     by_file = (
                         getattr(gui, "special_part_row_selection_by_file", {}) or {}
@@ -701,8 +697,7 @@ class QuickSelectDialog(QDialog):
                             sel = by_part.get(str(part)) or by_part.get(part)
                         if sel is not None:
                             it.setCheckState(0, Qt.Checked)
-                            data = self.batch._get_special_data_dict(Path(fp_norm))
-                            df = (data or {}).get(str(part))
+                            df = self.batch._get_special_part_df(Path(fp_norm), part)
                             row_count = len(df) if df is not None else 0
                             skipped = []
                             for r in range(row_count):
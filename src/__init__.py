@@ -15,6 +15,7 @@ TargetDefinition = _data_loader.TargetDefinition
 
 AeroCalculator = _physics.AeroCalculator
 AeroResult = _physics.AeroResult
+MultiTargetCalculator = _physics.MultiTargetCalculator
 
 construct_basis_matrix = _geometry.construct_basis_matrix
 
@@ -25,6 +26,7 @@ __all__ = [
     "TargetDefinition",
     "AeroCalculator",
     "AeroResult",
+    "MultiTargetCalculator",
     "construct_basis_matrix",
 ]
 
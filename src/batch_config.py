@@ -14,6 +14,20 @@ class BatchConfig:  # pylint: disable=R0902,R0903
         self.overwrite = False
         self.treat_non_numeric = "zero"
         self.sample_rows = 5
+        # 输出轴系：body（目标坐标系）| stability | wind（按 Alpha/Beta 列逐行旋转）
+        self.axis_frame = "body"
+        # 流式读取 CSV 的块大小（行数）；None 表示使用全局配置 batch.chunk_size，<=0 表示整表读取
+        self.chunk_size = None
+        # 结果文件格式：csv | parquet | feather | npz（见 src.output_formats）
+        self.output_format = "csv"
+        # 结果缓存目录（None 表示不启用，见 src.result_cache）、大小预算（MB）与命中时是否硬链接
+        self.result_cache_dir = None
+        self.result_cache_max_mb = 1024.0
+        self.result_cache_hardlink = False
+        # 特殊格式文件内并行处理 part 的线程数（1 表示逐个 part 串行处理）
+        self.part_workers = 1
+        # 特殊格式文件的所有 part 是否合并输出为一个长表文件（默认每个 part 一个文件）
+        self.combine_parts = False
 
 
 def resolve_file_format(
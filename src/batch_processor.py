@@ -19,6 +19,12 @@ import numpy as np
 import pandas as pd
 
 from src.execution import ExecutionEngine, ExecutionResult
+from src.output_formats import (
+    DEFAULT_OUTPUT_FORMAT,
+    FORMAT_SUFFIXES,
+    output_suffix,
+    write_frame_atomic,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,15 +68,18 @@ class BatchProcessor:
         self,
         engine: ExecutionEngine,
         on_progress: Optional[Callable[[int, int], None]] = None,
+        output_format: str = DEFAULT_OUTPUT_FORMAT,
     ):
         """初始化批处理器。
 
         参数：
             engine: ExecutionEngine 实例
             on_progress: 进度回调函数 (processed, total)
+            output_format: process_batch 生成的结果文件格式（csv/parquet/feather/npz）
         """
         self.engine = engine
         self.on_progress = on_progress
+        self.output_format = output_format
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
     def process_file(
@@ -156,7 +165,9 @@ class BatchProcessor:
         for idx, file_path in enumerate(file_list):
             try:
                 output_path = (
-                    output_dir / file_path.stem / f"{file_path.stem}_result.csv"
+                    output_dir
+                    / file_path.stem
+                    / f"{file_path.stem}_result{output_suffix(self.output_format)}"
                 )
                 exec_result = self.process_file(file_path, output_path, **kwargs)
 
@@ -218,7 +229,7 @@ class BatchProcessor:
         original_df: pd.DataFrame,
         batch_result: Dict[str, np.ndarray],
     ):
-        """保存计算结果到文件。"""
+        """保存计算结果到文件；格式由 output_path 的扩展名决定（默认 CSV）。"""
         # 创建结果数据框
         result_df = original_df.copy()
 
@@ -249,4 +260,10 @@ class BatchProcessor:
 
         # 保存到文件
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        fmt = {suffix: name for name, suffix in FORMAT_SUFFIXES.items()}.get(
+            output_path.suffix.lower(), DEFAULT_OUTPUT_FORMAT
+        )
+        if fmt != DEFAULT_OUTPUT_FORMAT:
+            write_frame_atomic(result_df, output_path, fmt)
+            return
         result_df.to_csv(output_path, index=False, encoding="utf-8-sig")
@@ -0,0 +1,168 @@
+"""
+计算器池 - 在进程内复用几何完全相同的 AeroCalculator 实例
+
+构造 `AeroCalculator` 需要重建基向量矩阵、执行正交性/行列式校验并查询缓存，
+在成千上万个小文件或多 part 文件场景下，构造开销会超过实际计算。
+本模块按 (source part, source variant, target part, target variant, 配置内容哈希)
+为键缓存计算器实例（LRU 淘汰），解析出的几何相同的请求共享同一实例。
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from src.physics import AeroCalculator
+
+logger = logging.getLogger(__name__)
+
+# 默认最多缓存的计算器数量
+DEFAULT_POOL_SIZE = 256
+
+
+def _frames_content_hash(
+    project_data,
+    source_part: Optional[str],
+    source_variant: int,
+    target_part,
+    target_variant: int,
+) -> Optional[str]:
+    """返回解析后 source/target 坐标系配置的内容哈希；无法解析时返回 None。"""
+    try:
+        if source_part is not None:
+            source_frame = project_data.get_source_part(source_part, source_variant)
+        else:
+            source_frame = project_data.source_config
+        target_frame = project_data.get_target_part(target_part, target_variant)
+    except Exception:  # pylint: disable=broad-except
+        return None
+    # 项目加载时预计算的变换表已保存各 variant 的内容指纹，命中时无需重新序列化
+    table = getattr(project_data, "transform_table", None)
+    if table is not None:
+        fingerprint = table.pair_fingerprint(source_frame, target_frame)
+        if fingerprint is not None:
+            return fingerprint
+    # dataclass 的 repr 覆盖全部字段（坐标系、矩心、参考量），可作为内容指纹
+    payload = repr((source_frame, target_frame)).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
+
+
+class CalculatorPool:
+    """按解析后几何内容复用 `AeroCalculator` 的 LRU 池（线程安全）。"""
+
+    def __init__(self, max_entries: int = DEFAULT_POOL_SIZE):
+        self.max_entries = max_entries
+        self._pool: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        project_data,
+        *,
+        source_part: Optional[str] = None,
+        source_variant: int = 0,
+        target_part: Optional[str] = None,
+        target_variant: int = 0,
+        factory: Optional[Callable[..., Any]] = None,
+    ):
+        """返回与请求几何一致的计算器，未命中时通过 factory 构造并入池。
+
+        factory 默认为 `AeroCalculator`，调用约定与其构造函数一致；
+        构造失败的异常原样抛出且不会入池。
+        """
+        if factory is None:
+            factory = AeroCalculator
+
+        resolved_target = target_part
+        if resolved_target is None:
+            targets = list((getattr(project_data, "target_parts", {}) or {}).keys())
+            if len(targets) == 1:
+                resolved_target = targets[0]
+
+        content_hash = None
+        if resolved_target is not None:
+            content_hash = _frames_content_hash(
+                project_data,
+                source_part,
+                source_variant,
+                resolved_target,
+                target_variant,
+            )
+        # 仅在非默认时传递 variant，兼容只接受 source_part/target_part 的工厂
+        factory_kwargs = {"source_part": source_part, "target_part": target_part}
+        if source_variant:
+            factory_kwargs["source_variant"] = source_variant
+        if target_variant:
+            factory_kwargs["target_variant"] = target_variant
+
+        if content_hash is None:
+            # 无法解析几何（缺失 part 等）：直接构造，由 factory 给出原有的错误信息
+            return factory(project_data, **factory_kwargs)
+
+        key: Tuple = (
+            source_part,
+            source_variant,
+            resolved_target,
+            target_variant,
+            content_hash,
+            factory,
+        )
+        with self._lock:
+            calc = self._pool.get(key)
+            if calc is not None:
+                self._pool.move_to_end(key)
+                self.hits += 1
+                return calc
+            self.misses += 1
+
+        calc = factory(project_data, **factory_kwargs)
+        with self._lock:
+            self._pool[key] = calc
+            self._pool.move_to_end(key)
+            while len(self._pool) > self.max_entries:
+                self._pool.popitem(last=False)
+        logger.debug(
+            "计算器池新增实例: source=%s[%s], target=%s[%s]",
+            source_part,
+            source_variant,
+            resolved_target,
+            target_variant,
+        )
+        return calc
+
+    def clear(self) -> None:
+        """清空池并重置统计"""
+        with self._lock:
+            self._pool.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """获取池统计信息"""
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total * 100) if total > 0 else 0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "total": total,
+            "hit_rate": f"{hit_rate:.1f}%",
+            "entries": len(self._pool),
+            "max_entries": self.max_entries,
+        }
+
+
+# 模块级单例（直接赋值而非使用 global 语句）
+_CALCULATOR_POOL = CalculatorPool()
+
+
+def get_calculator_pool() -> CalculatorPool:
+    """获取进程内共享的计算器池"""
+    return _CALCULATOR_POOL
+
+
+def clear_calculator_pool() -> None:
+    """清空进程内共享的计算器池"""
+    _CALCULATOR_POOL.clear()
@@ -64,6 +64,11 @@ class BatchProcessConfig:  # pylint: disable=R0902
     enable_parallel: bool = True
     # 并行工作进程数（0 = CPU 核心数）
     num_workers: int = 0
+    # 特殊格式解析缓存（见 src.parse_cache）：是否启用（默认关闭，CLI 以 --parse-cache 启用）、
+    # 目录（空 = ~/.momentconversion/parse_cache）与大小预算（MB）
+    parse_cache_enabled: bool = False
+    parse_cache_dir: str = ""
+    parse_cache_max_mb: float = 512.0
 
 
 @dataclass
@@ -295,6 +295,9 @@ class ProjectData:
 
     source_parts: Dict[str, List[FrameConfiguration]]
     target_parts: Dict[str, List[FrameConfiguration]]
+    # 加载时预计算的全部 source×target variant 几何（src.transform_table.TransformTable，可选）。
+    # 不声明为 dataclass 字段：该派生数据不进入 asdict、运行日志/缓存的配置哈希与比较
+    transform_table = None
 
     @classmethod
     def _parse_parts_section(
@@ -462,18 +465,18 @@ class ProjectData:
             ) from exc
 
 
-def load_data(file_path: str) -> ProjectData:
+def load_data(file_path: str, *, build_transform_table: bool = True) -> ProjectData:
     """
     读取 JSON 文件并转换为 Python 对象
     :param file_path: 配置文件路径
+    :param build_transform_table: 是否预计算全部 source×target variant 对的变换表
     :return: ProjectData 对象
     """
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             raw_data = json.load(f)
 
-        return ProjectData.from_dict(raw_data)
-
+        project = ProjectData.from_dict(raw_data)
     except FileNotFoundError as exc:
         raise FileNotFoundError(f"错误: 找不到文件 {file_path}，请检查路径。") from exc
     except json.JSONDecodeError as exc:
@@ -481,6 +484,13 @@ def load_data(file_path: str) -> ProjectData:
     except KeyError as e:
         raise KeyError(f"错误: JSON 数据缺少关键字段 {e}，请检查输入文件结构。") from e
 
+    if build_transform_table:
+        # pylint: disable=import-outside-toplevel
+        from src.transform_table import build_transform_table as _build_table
+
+        project.transform_table = _build_table(project)
+    return project
+
 
 def try_load_project_data(file_path: str, *, strict: bool = True):
     """
@@ -0,0 +1,127 @@
+"""
+目录轮询 - 为 `batch.py --watch` 找出新增或变化的数据文件
+
+每次轮询以 os.scandir 递归遍历目录，只对文件名匹配模式的条目取 stat，
+并维护 {路径: (大小, mtime_ns)} 索引：
+- 与上次处理时的 stat 不同（新增或被修改）的文件才会返回；
+- 文件需“写入稳定”后才返回：stat 在至少 MIN_STABLE_POLLS 次轮询中保持不变，且自首次
+  观察到该 stat 起已静默 settle 秒，避免处理仍在追加写入的文件（如采集系统持续写入的 CSV）；
+  静默时长按本进程的观察计时，不依赖 mtime（网络盘上服务器时钟可能与本机不一致）；
+- 调用方可通过 `ignore` 排除自身生成的输出文件（输出目录常与输入目录相同）。
+
+不依赖 inotify 等平台接口，在网络盘与本地盘上行为一致。
+"""
+
+import fnmatch
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+# 默认轮询间隔（秒）
+DEFAULT_POLL_INTERVAL = 0.05
+# 默认写入稳定时间（秒）：stat 保持不变达到该时长的文件视为已写完
+DEFAULT_SETTLE_SECONDS = 2.0
+# 判定写入稳定所需的最少轮询次数（同一 stat 被连续观察到的次数）
+MIN_STABLE_POLLS = 2
+
+_Stat = Tuple[int, int]
+
+
+class _Observation(NamedTuple):
+    """某文件当前 stat 的观察记录：首次观察到该 stat 的时间与连续观察次数"""
+
+    stat: _Stat
+    since_ns: int
+    polls: int
+
+
+def split_patterns(pattern: str) -> List[str]:
+    """拆分分号分隔的多模式（与 `find_matching_files` 一致）"""
+    patterns = [p.strip() for p in (pattern or "").split(";") if p.strip()]
+    return patterns or ["*"]
+
+
+class DirectoryPoller:
+    """基于 scandir 与 stat 索引的目录轮询器。"""
+
+    def __init__(
+        self,
+        root,
+        pattern: str,
+        *,
+        recursive: bool = True,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+    ):
+        self.root = Path(root)
+        self.patterns = split_patterns(pattern)
+        self.recursive = recursive
+        self.settle_ns = int(settle_seconds * 1e9)
+        # 上次轮询观察到的 stat 及其静默起点
+        self._observed: Dict[str, _Observation] = {}
+        # 已交给调用方处理时的 stat
+        self._dispatched: Dict[str, _Stat] = {}
+        self._ignored: Set[str] = set()
+        self.scans = 0
+
+    def ignore(self, paths: Iterable) -> None:
+        """排除指定文件（如本进程写出的结果文件）"""
+        for p in paths:
+            self._ignored.add(os.path.abspath(str(p)))
+
+    def _matches(self, name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pat) for pat in self.patterns)
+
+    def _scan(self, directory: str) -> Iterator[Tuple[str, _Stat]]:
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if self.recursive:
+                        yield from self._scan(entry.path)
+                    continue
+                if not self._matches(entry.name) or not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            yield entry.path, (st.st_size, st.st_mtime_ns)
+
+    def poll(self, now_ns: Optional[int] = None) -> List[Path]:
+        """扫描一次目录，返回写入稳定且自上次处理后新增或变化的文件（按路径排序）。
+
+        返回的文件即视为已交付处理；之后只有其 stat 再次变化才会被重新返回。
+        """
+        now_ns = time.time_ns() if now_ns is None else now_ns
+        self.scans += 1
+        observed: Dict[str, _Observation] = {}
+        ready = []
+        for path, stat in self._scan(str(self.root)):
+            key = os.path.abspath(path)
+            if key in self._ignored:
+                continue
+            prev = self._observed.get(key)
+            if prev is not None and prev.stat == stat:
+                obs = prev._replace(polls=prev.polls + 1)
+            else:
+                # 新文件或 stat 变化：重新开始计算静默时长
+                obs = _Observation(stat, now_ns, 1)
+            observed[key] = obs
+            if self._dispatched.get(key) == stat:
+                continue
+            settled = (
+                obs.polls >= MIN_STABLE_POLLS
+                and now_ns - obs.since_ns >= self.settle_ns
+            )
+            if settled:
+                self._dispatched[key] = stat
+                ready.append(Path(path))
+        self._observed = observed
+        # 已删除的文件不再保留处理记录，重新出现时按新文件处理
+        for key in [k for k in self._dispatched if k not in observed]:
+            del self._dispatched[key]
+        return sorted(ready)
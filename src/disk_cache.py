@@ -0,0 +1,101 @@
+"""
+磁盘 LRU 缓存目录 - 结果缓存（`src.result_cache`）与解析缓存（`src.parse_cache`）的共用部分
+
+- 条目为缓存目录下以缓存键命名的文件，以临时文件（以 "." 开头）+ os.replace 原子写入；
+- 最近使用时间记录在条目的 mtime 上（命中时刷新），总大小超过预算时从最旧的条目开始淘汰；
+- 同一目录可被多个进程共享，淘汰与读取之间的竞争只会导致一次未命中。
+"""
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+class DiskLruCache:
+    """本地磁盘上的缓存目录，带大小预算、LRU 淘汰与命中/未命中/写入/淘汰计数。"""
+
+    def __init__(self, cache_dir, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _count(self, attr: str, n: int = 1) -> None:
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + n)
+
+    def _temp_entry(self, key: str) -> Tuple[int, str]:
+        """在缓存目录中创建条目的临时文件，返回 (fd, 路径)；淘汰时忽略这些文件"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return tempfile.mkstemp(
+            prefix=f".{key}.", suffix=".tmp", dir=str(self.cache_dir)
+        )
+
+    @staticmethod
+    def _touch(entry: Path) -> None:
+        # 刷新 mtime 作为最近使用时间
+        os.utime(entry, None)
+
+    def evict(self) -> int:
+        """按 mtime 从旧到新淘汰条目直到总大小不超过预算，返回淘汰数量"""
+        entries = []
+        try:
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and not entry.name.startswith("."):
+                    st = entry.stat()
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+        except OSError:
+            return 0
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            self._count("evictions", removed)
+        return removed
+
+    def stats(self) -> Dict:
+        """命中/未命中/写入/淘汰计数"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+            }
+
+
+# 使用管理器单例，避免模块级 global
+class DiskCacheManager:
+    """按 (目录, 其余构造参数) 管理每个进程内共享的缓存实例（子类指定 cache_class）。"""
+
+    cache_class = DiskLruCache
+
+    def __init__(self) -> None:
+        self._caches: Dict[tuple, DiskLruCache] = {}
+        self._lock = threading.Lock()
+
+    def get(self, cache_dir, *args):
+        key = (str(Path(cache_dir).resolve()),) + args
+        with self._lock:
+            cache = self._caches.get(key)
+            if cache is None:
+                cache = self.cache_class(cache_dir, *args)
+                self._caches[key] = cache
+            return cache
+
+    def clear(self) -> None:
+        with self._lock:
+            self._caches.clear()
@@ -4,11 +4,12 @@
 用于减少重复读取文件，提高性能并避免Win7下可能的I/O冲突
 """
 import hashlib
+import os
 import threading
-from functools import lru_cache
+from collections import OrderedDict
 from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class FileCache:
@@ -17,16 +18,19 @@ class FileCache:
     提供文件内容和元数据的缓存功能
     """
 
-    def __init__(self, max_file_size_mb: float = 10):
+    def __init__(self, max_file_size_mb: float = 10, max_metadata_entries: int = 256):
         """
         初始化文件缓存
 
         Args:
             max_file_size_mb: 缓存文件的最大大小（MB），超过此大小的文件不缓存
+            max_metadata_entries: 元数据缓存的最大条目数，超过时淘汰最久未使用的条目
         """
         self.max_file_size = max_file_size_mb * 1024 * 1024  # 转换为字节
+        self.max_metadata_entries = max_metadata_entries
         self._content_cache: Dict[str, str] = {}  # 文件内容缓存
-        self._metadata_cache: Dict[str, Dict[str, Any]] = {}  # 元数据缓存
+        # 元数据缓存（键含文件 stat，文件变化后旧键不再命中，按 LRU 淘汰）
+        self._metadata_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._lock = threading.Lock()
         # 每个 cache_key 的细粒度锁，避免多个线程同时读取并缓存同一文件
         self._key_locks: Dict[str, threading.Lock] = {}
@@ -50,6 +54,17 @@ class FileCache:
             # 如果无法获取文件状态（权限/不存在等），使用路径作为键
             return hashlib.md5(str(file_path).encode()).hexdigest()
 
+    def _metadata_entry(self, cache_key: str, create: bool = False):
+        """返回元数据条目并标记为最近使用；create 时不存在则新建并按上限淘汰（需持有 _lock）"""
+        entry = self._metadata_cache.get(cache_key)
+        if entry is not None:
+            self._metadata_cache.move_to_end(cache_key)
+        elif create:
+            entry = self._metadata_cache[cache_key] = {}
+            while len(self._metadata_cache) > self.max_metadata_entries:
+                self._metadata_cache.popitem(last=False)
+        return entry
+
     def get_file_content(
         self, file_path: Path, encoding: str = "utf-8-sig"
     ) -> Optional[str]:
@@ -134,8 +149,9 @@ class FileCache:
 
         # 检查元数据缓存
         with self._lock:
-            if cache_key in self._metadata_cache:
-                return self._metadata_cache[cache_key].get("header")
+            entry = self._metadata_entry(cache_key)
+            if entry is not None:
+                return entry.get("header")
 
         # 读取文件头部（短文件也返回已有行，不把 StopIteration 视为错误）
         try:
@@ -144,7 +160,7 @@ class FileCache:
 
             # 存入缓存
             with self._lock:
-                self._metadata_cache[cache_key] = {"header": lines}
+                self._metadata_entry(cache_key, create=True)["header"] = lines
 
             return lines
         except (OSError, UnicodeDecodeError):
@@ -162,9 +178,7 @@ class FileCache:
         cache_key = self._get_file_key(file_path)
 
         with self._lock:
-            if cache_key not in self._metadata_cache:
-                self._metadata_cache[cache_key] = {}
-            self._metadata_cache[cache_key][key] = value
+            self._metadata_entry(cache_key, create=True)[key] = value
 
     def get_metadata(self, file_path: Path, key: str) -> Optional[Any]:
         """
@@ -180,8 +194,9 @@ class FileCache:
         cache_key = self._get_file_key(file_path)
 
         with self._lock:
-            if cache_key in self._metadata_cache:
-                return self._metadata_cache[cache_key].get(key)
+            entry = self._metadata_entry(cache_key)
+            if entry is not None:
+                return entry.get(key)
 
         return None
 
@@ -253,10 +268,65 @@ def get_file_cache() -> FileCache:
     return _FILE_CACHE_MANAGER.get_file_cache()
 
 
-@lru_cache(maxsize=128)
+class FileHashCache:
+    """文件内容哈希缓存：按路径缓存，以 (大小, mtime_ns) 校验。
+
+    文件被修改后 stat 变化即重新计算，避免按路径缓存返回过期哈希；
+    超过 maxsize 时淘汰最久未使用的条目。
+    """
+
+    def __init__(self, maxsize: int = 128, block_size: int = 1024 * 1024) -> None:
+        self.maxsize = maxsize
+        self.block_size = block_size
+        self._entries: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, file_path: str) -> Optional[str]:
+        """返回文件内容的 MD5；文件不存在或不可读时返回 None"""
+        key = str(file_path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[:2] == (st.st_size, st.st_mtime_ns):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+        try:
+            md5_hash = hashlib.md5()
+            with open(key, "rb") as f:
+                # 分块读取以处理大文件
+                for chunk in iter(lambda: f.read(self.block_size), b""):
+                    md5_hash.update(chunk)
+        except OSError:
+            return None
+        digest = md5_hash.hexdigest()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (st.st_size, st.st_mtime_ns, digest)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return digest
+
+    def clear(self) -> None:
+        """清空哈希缓存"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_FILE_HASH_CACHE = FileHashCache()
+
+
 def get_file_hash(file_path: str) -> Optional[str]:
     """
-    计算文件的MD5哈希值（带LRU缓存）
+    计算文件的MD5哈希值（按 stat 校验的缓存）
 
     Args:
         file_path: 文件路径字符串
@@ -264,17 +334,9 @@ def get_file_hash(file_path: str) -> Optional[str]:
     Returns:
         MD5哈希值，失败返回None
     """
-    try:
-        path = Path(file_path)
-        if not path.exists():
-            return None
+    return _FILE_HASH_CACHE.get(file_path)
 
-        md5_hash = hashlib.md5()
-        with open(path, "rb") as f:
-            # 分块读取以处理大文件
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5_hash.update(chunk)
 
-        return md5_hash.hexdigest()
-    except OSError:
-        return None
+def clear_file_hash_cache() -> None:
+    """清空 `get_file_hash` 的缓存"""
+    _FILE_HASH_CACHE.clear()
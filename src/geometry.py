@@ -216,6 +216,76 @@ def project_vector_to_frame(
     )
 
 
+def skew_symmetric_matrix(vec: np.ndarray) -> np.ndarray:
+    """
+    构造向量的反对称（叉乘）矩阵 [v]x，使得 [v]x · u == v × u。
+
+    用途:
+    将移轴力矩 r × F 表达为线性算子，便于与旋转矩阵合并为单一矩阵乘法。
+    """
+    v = np.asarray(vec, dtype=float).reshape(3)
+    return np.array(
+        [
+            [0.0, -v[2], v[1]],
+            [v[2], 0.0, -v[0]],
+            [-v[1], v[0], 0.0],
+        ]
+    )
+
+
+# 支持的气动轴系：体轴系（不旋转）、稳定轴系（绕 Y 转 alpha）、风轴系（再绕 Z 转 beta）
+AXIS_FRAMES = ("body", "stability", "wind")
+
+
+def body_to_axes_matrices(
+    alpha_deg: np.ndarray,
+    beta_deg: Optional[np.ndarray] = None,
+    axes: str = "wind",
+) -> np.ndarray:
+    """
+    按行构造体轴系 -> 稳定轴系/风轴系的旋转矩阵堆叠 (N,3,3)。
+
+    数学原理:
+    C_sb = Ry(alpha)（体轴 -> 稳定轴），C_ws = Rz(-beta)（稳定轴 -> 风轴），C_wb = C_ws · C_sb
+        C_wb = [[ cosα·cosβ,  sinβ,  sinα·cosβ],
+                [-cosα·sinβ,  cosβ, -sinα·sinβ],
+                [-sinα,       0,     cosα     ]]
+    V_axes[i] = C[i] · V_body[i]；全部使用向量化三角函数，无逐行 Python 循环。
+
+    :param alpha_deg: 攻角（度），长度 N
+    :param beta_deg: 侧滑角（度），长度 N；None 视为 0
+    :param axes: "body" | "stability" | "wind"（"stability" 忽略 beta）
+    :return: (N,3,3) 旋转矩阵堆叠
+    """
+    if axes not in AXIS_FRAMES:
+        raise ValueError(f"axes 必须为 {AXIS_FRAMES} 之一，当前: {axes!r}")
+    alpha = np.radians(np.asarray(alpha_deg, dtype=float).reshape(-1))
+    n = alpha.shape[0]
+    if beta_deg is None or axes != "wind":
+        beta = np.zeros(n)
+    else:
+        beta = np.radians(np.asarray(beta_deg, dtype=float).reshape(-1))
+        if beta.shape[0] != n:
+            raise ValueError(f"beta 长度 {beta.shape[0]} 与 alpha 长度 {n} 不一致")
+
+    mats = np.zeros((n, 3, 3), dtype=float)
+    if axes == "body":
+        mats[:, 0, 0] = mats[:, 1, 1] = mats[:, 2, 2] = 1.0
+        return mats
+
+    ca, sa = np.cos(alpha), np.sin(alpha)
+    cb, sb = np.cos(beta), np.sin(beta)
+    mats[:, 0, 0] = ca * cb
+    mats[:, 0, 1] = sb
+    mats[:, 0, 2] = sa * cb
+    mats[:, 1, 0] = -ca * sb
+    mats[:, 1, 1] = cb
+    mats[:, 1, 2] = -sa * sb
+    mats[:, 2, 0] = -sa
+    mats[:, 2, 2] = ca
+    return mats
+
+
 def euler_angles_to_basis(
     roll_deg: float, pitch_deg: float, yaw_deg: float
 ) -> np.ndarray:
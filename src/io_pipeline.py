@@ -0,0 +1,145 @@
+"""
+读/算/写三级流水线 - 让磁盘 I/O 与计算重叠执行
+
+批处理的串行循环按 "读文件 → 计算 → 写文件" 依次执行，磁盘与 CPU 从不同时忙碌。
+本模块把三个阶段拆到不同线程：
+1. 读取线程：迭代 source（迭代本身即完成读取/解析），预取至多 read_ahead 项；
+2. 计算阶段：在调用线程中对每项执行 compute；
+3. 写出线程：从至多 write_behind 项的有界队列中取出结果执行 sink。
+
+两个队列均有上限，任一阶段变慢时上游阻塞（背压），内存占用与输入规模无关。
+pandas 解析与文件写入在长时间段内释放 GIL，因此线程即可实现阶段重叠。
+任一阶段抛出的异常会中止整条流水线，并在所有线程退出后于调用线程重新抛出；
+逐项的可恢复错误应由各阶段自行捕获并随数据项向下游传递。
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+# 默认的预取/写出队列深度
+DEFAULT_PIPELINE_DEPTH = 2
+
+# 阶段间阻塞等待时检查中止标志的间隔（秒）
+_POLL_SECONDS = 0.05
+
+# 队列结束标记
+_END = object()
+
+
+class PipelineStats:  # pylint: disable=too-few-public-methods
+    """流水线运行统计：计算阶段等待输入/等待写出的时间可用于判断瓶颈所在阶段。"""
+
+    def __init__(self) -> None:
+        self.items = 0
+        self.read_wait_sec = 0.0
+        self.write_wait_sec = 0.0
+        self.elapsed_sec = 0.0
+
+    def as_dict(self) -> dict:
+        """以 dict 形式返回统计（秒数保留 4 位小数）"""
+        return {
+            "items": self.items,
+            "read_wait_sec": round(self.read_wait_sec, 4),
+            "write_wait_sec": round(self.write_wait_sec, 4),
+            "elapsed_sec": round(self.elapsed_sec, 4),
+        }
+
+
+def run_pipeline(
+    source: Iterable,
+    compute: Callable[[Any], Any],
+    sink: Callable[[Any], None],
+    *,
+    read_ahead: int = DEFAULT_PIPELINE_DEPTH,
+    write_behind: int = DEFAULT_PIPELINE_DEPTH,
+    name: str = "pipeline",
+) -> PipelineStats:
+    """以三级流水线处理 source 中的每一项，按输入顺序依次交给 sink。
+
+    source 在读取线程中迭代，compute 在调用线程中执行，sink 在写出线程中执行；
+    三者各自只在一个线程中运行，无需额外加锁。返回 `PipelineStats`。
+    """
+    in_queue: queue.Queue = queue.Queue(maxsize=max(int(read_ahead), 1))
+    out_queue: queue.Queue = queue.Queue(maxsize=max(int(write_behind), 1))
+    abort = threading.Event()
+    errors = []
+    stats = PipelineStats()
+    t_start = time.perf_counter()
+
+    def _put(q: queue.Queue, item) -> bool:
+        while not abort.is_set():
+            try:
+                q.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(q: queue.Queue):
+        while not abort.is_set():
+            try:
+                return q.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _fail(exc: BaseException) -> None:
+        errors.append(exc)
+        abort.set()
+
+    def _reader() -> None:
+        try:
+            for item in source:
+                if not _put(in_queue, item):
+                    return
+        except BaseException as exc:  # pylint: disable=broad-except
+            _fail(exc)
+            return
+        _put(in_queue, _END)
+
+    def _writer() -> None:
+        try:
+            while True:
+                item = _get(out_queue)
+                if item is _END:
+                    return
+                sink(item)
+        except BaseException as exc:  # pylint: disable=broad-except
+            _fail(exc)
+
+    reader = threading.Thread(target=_reader, name=f"{name}-reader", daemon=True)
+    writer = threading.Thread(target=_writer, name=f"{name}-writer", daemon=True)
+    reader.start()
+    writer.start()
+    try:
+        while True:
+            t0 = time.perf_counter()
+            item = _get(in_queue)
+            stats.read_wait_sec += time.perf_counter() - t0
+            if item is _END:
+                break
+            result = compute(item)
+            t0 = time.perf_counter()
+            if not _put(out_queue, result):
+                break
+            stats.write_wait_sec += time.perf_counter() - t0
+            stats.items += 1
+        _put(out_queue, _END)
+    except BaseException as exc:  # pylint: disable=broad-except
+        _fail(exc)
+    finally:
+        writer.join()
+        # 正常结束时读取线程已放入结束标记；异常中止时通过 abort 标志退出
+        abort.set()
+        reader.join()
+        stats.elapsed_sec = time.perf_counter() - t_start
+
+    if errors:
+        raise errors[0]
+    logger.debug("%s 完成: %s", name, stats.as_dict())
+    return stats
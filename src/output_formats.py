@@ -0,0 +1,528 @@
+"""
+结果输出格式 - CSV / Parquet / Feather / NPZ 的逐块写出与读回
+
+批处理结果默认写为 CSV，浮点数格式化为文本是写出侧最大的开销，下游读取时又要重新解析。
+本模块以 `OutputPlugin` 接口提供内置的列式/二进制输出格式：
+1. parquet / feather：基于 pyarrow（可选依赖），按数据块写入 row group / record batch；
+2. npz：每列先追加写入临时的原始字节文件，完成时一次性组装为未压缩的 .npz，内存不随行数增长；
+3. csv：与其余调用方一致的 UTF-8 CSV。
+
+写出始终先写入同目录的临时文件再原子替换（见 `write_frame_atomic`；batch.py 复用自己的
+临时文件 + `.partial`/`.complete` 协议）。插件注册表中声明支持同名格式的插件优先于内置实现。
+
+多 part 结果可经 `LongFormatWriter` 合并为一个长表文件（以 part/source_part/target_part 列区分），
+避免每个 part 单独成文件。
+"""
+
+import logging
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.plugin import ChunkWriter, OutputPlugin, PluginMetadata, get_plugin_registry
+
+logger = logging.getLogger(__name__)
+
+# 尝试导入 pyarrow（可选，parquet/feather 输出需要）
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pa_parquet
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    logger.debug("pyarrow 不可用，parquet/feather 输出格式不可用")
+
+OUTPUT_FORMATS = ("csv", "parquet", "feather", "npz")
+DEFAULT_OUTPUT_FORMAT = "csv"
+
+# 各格式对应的输出文件扩展名
+FORMAT_SUFFIXES = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "feather": ".feather",
+    "npz": ".npz",
+}
+
+# 需要 pyarrow 的格式
+_ARROW_FORMATS = ("parquet", "feather")
+
+# 长表输出中标识数据来源的键列（位于各结果列之前）
+LONG_FORMAT_KEY_COLUMNS = ("part", "source_part", "target_part")
+# 与键列重名的结果列在长表中追加的后缀
+LONG_FORMAT_RENAME_SUFFIX = "_data"
+
+# NPZ 组装时的复制缓冲区大小
+_NPZ_COPY_BUFFER_BYTES = 1024 * 1024
+
+
+def normalize_output_format(fmt: Optional[str]) -> str:
+    """规范化格式名（None/空串为 csv），未知格式抛出 ValueError"""
+    fmt = (fmt or DEFAULT_OUTPUT_FORMAT).strip().lower()
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"未知的输出格式: {fmt}，可选: {', '.join(OUTPUT_FORMATS)}")
+    return fmt
+
+
+def output_suffix(fmt: Optional[str]) -> str:
+    """返回格式对应的文件扩展名（含点号）"""
+    return FORMAT_SUFFIXES[normalize_output_format(fmt)]
+
+
+def with_output_suffix(path: Path, fmt: Optional[str]) -> Path:
+    """把路径的扩展名替换为格式对应的扩展名（csv 时原样返回）"""
+    fmt = normalize_output_format(fmt)
+    path = Path(path)
+    if fmt == DEFAULT_OUTPUT_FORMAT:
+        return path
+    return path.with_suffix(FORMAT_SUFFIXES[fmt])
+
+
+def ensure_output_format_available(fmt: Optional[str]) -> str:
+    """检查格式所需的依赖是否可用，返回规范化后的格式名；不可用时抛出 ValueError"""
+    fmt = normalize_output_format(fmt)
+    if fmt in _ARROW_FORMATS and not PYARROW_AVAILABLE:
+        if get_plugin_registry().get_output_plugin_for_format(fmt) is None:
+            raise ValueError(f"输出格式 {fmt} 需要安装 pyarrow（pip install pyarrow）")
+    return fmt
+
+
+class _CsvChunkWriter(ChunkWriter):
+    """首块带表头覆盖写入，其余块追加（与 batch 的 CSV 输出逐字节一致）"""
+
+    def __init__(self, plugin: OutputPlugin, output_path: Path, **kwargs) -> None:
+        super().__init__(plugin, output_path, **kwargs)
+        # pylint: disable=consider-using-with
+        self._fh = open(self.output_path, "w", encoding="utf-8", newline="")
+        self._header = True
+
+    def write_chunk(self, df) -> None:
+        df.to_csv(self._fh, index=False, header=self._header)
+        self._header = False
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def abort(self) -> None:
+        self._fh.close()
+
+
+class _ArrowChunkWriter(ChunkWriter):
+    """Parquet / Feather(Arrow IPC) 逐块写出：首块确定 schema，后续块按该 schema 转换
+
+    后续块的数值列需要更宽的类型时（如整数列出现小数或 NaN）提升 schema 并重写已写出的数据；
+    无法转换的列（如数值列出现字符串）抛出 ValueError。
+    """
+
+    def __init__(
+        self, plugin: OutputPlugin, output_path: Path, fmt: str, **kwargs
+    ) -> None:
+        super().__init__(plugin, output_path, **kwargs)
+        self._fmt = fmt
+        self._schema = None
+        self._writer = None
+
+    def _open(self, schema) -> None:
+        if self._fmt == "parquet":
+            self._writer = pa_parquet.ParquetWriter(str(self.output_path), schema)
+        else:
+            self._writer = pa_ipc.new_file(str(self.output_path), schema)
+
+    def write_chunk(self, df) -> None:
+        if self._writer is None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            self._schema = table.schema
+            self._open(self._schema)
+        else:
+            promoted = self._promoted_schema(df)
+            try:
+                table = pa.Table.from_pandas(
+                    df, schema=promoted or self._schema, preserve_index=False
+                )
+            except (pa.ArrowInvalid, pa.ArrowTypeError, KeyError) as exc:
+                raise ValueError(f"数据块与已写出的列类型不兼容: {exc}") from exc
+            if promoted is not None:
+                self._rewrite(table.schema)
+        self._writer.write_table(table)
+
+    def _promoted_schema(self, df):
+        """按本块数据提升 schema 中的数值列类型（如 int64 → float64），无需提升时返回 None"""
+        fields = []
+        changed = False
+        for fld in self._schema:
+            new_type = fld.type
+            numeric = pa.types.is_integer(fld.type) or pa.types.is_floating(fld.type)
+            if (numeric or pa.types.is_boolean(fld.type)) and fld.name in df.columns:
+                dtype = df[fld.name].dtype
+                if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+                    new_type = pa.from_numpy_dtype(
+                        np.result_type(fld.type.to_pandas_dtype(), dtype)
+                    )
+            changed = changed or new_type != fld.type
+            fields.append(fld.with_type(new_type))
+        return pa.schema(fields) if changed else None
+
+    def _iter_written_batches(self, path: Path):
+        if self._fmt == "parquet":
+            with open(path, "rb") as fh:
+                yield from pa_parquet.ParquetFile(fh).iter_batches()
+        else:
+            with pa.memory_map(str(path)) as source:
+                reader = pa_ipc.open_file(source)
+                for i in range(reader.num_record_batches):
+                    yield reader.get_batch(i)
+
+    def _rewrite(self, schema) -> None:
+        """schema 提升后按新类型逐批重写已写出的数据（格式不支持中途变更 schema）"""
+        self._writer.close()
+        self._writer = None
+        old_path = self.output_path.with_name(self.output_path.name + ".promote")
+        os.replace(self.output_path, old_path)
+        try:
+            self._open(schema)
+            for batch in self._iter_written_batches(old_path):
+                self._writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+        finally:
+            old_path.unlink(missing_ok=True)
+        self._schema = schema
+
+    def close(self) -> None:
+        if self._writer is None:
+            # 无任何数据块：写出不含列的空表，保证输出文件格式有效
+            self._open(pa.schema([]))
+        self._writer.close()
+        self._writer = None
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:  # pylint: disable=broad-except
+                logger.debug("关闭 %s 写出器失败（忽略）", self._fmt, exc_info=True)
+            self._writer = None
+
+
+class _NpzChunkWriter(ChunkWriter):
+    """NPZ 逐块写出：数值列追加到临时原始字节文件，close 时组装为未压缩 .npz
+
+    非数值列（如字符串）在内存中累积，close 时转换为定长 unicode 数组。
+    后续块的数值列需要更宽的类型时（如整数列出现小数或 NaN）按 `np.result_type` 提升，
+    并把该列已写出的临时数据转换为新类型；数值列出现非数值数据时抛出 ValueError。
+    """
+
+    def __init__(self, plugin: OutputPlugin, output_path: Path, **kwargs) -> None:
+        super().__init__(plugin, output_path, **kwargs)
+        self._spill_dir = tempfile.mkdtemp(
+            prefix=self.output_path.name + ".cols.", dir=str(self.output_path.parent)
+        )
+        self._order: List[str] = []
+        self._dtypes: Dict[str, np.dtype] = {}
+        self._counts: Dict[str, int] = {}
+        self._spills: Dict[str, object] = {}
+        self._objects: Dict[str, List[np.ndarray]] = {}
+
+    def write_chunk(self, df) -> None:
+        for col in df.columns:
+            name = str(col)
+            values = df[col].to_numpy()
+            if name not in self._dtypes:
+                self._order.append(name)
+                self._dtypes[name] = values.dtype
+                self._counts[name] = 0
+                if values.dtype.kind in "biufcmM":
+                    spill_path = os.path.join(
+                        self._spill_dir, f"{len(self._order)}.bin"
+                    )
+                    # pylint: disable=consider-using-with
+                    self._spills[name] = open(spill_path, "w+b")
+                else:
+                    self._objects[name] = []
+            if name in self._spills:
+                self._promote_spill(name, values.dtype)
+                values = np.ascontiguousarray(values, dtype=self._dtypes[name])
+            self._counts[name] += len(values)
+            if name in self._spills:
+                self._spills[name].write(values.tobytes())
+            else:
+                self._objects[name].append(values)
+
+    def _promote_spill(self, name: str, dtype: np.dtype) -> None:
+        """按本块 dtype 提升数值列类型，必要时把已写出的临时数据转换为新类型"""
+        current = self._dtypes[name]
+        if dtype == current:
+            return
+        promoted = None
+        if dtype.kind in "biufcmM":
+            try:
+                promoted = np.result_type(current, dtype)
+            except TypeError:
+                promoted = None
+        if promoted is None:
+            raise ValueError(
+                f"列 {name} 的数据块类型 {dtype} 与已写出的类型 {current} 不兼容"
+            )
+        if promoted == current:
+            return
+        old = self._spills[name]
+        old.flush()
+        old.seek(0)
+        index = self._order.index(name) + 1
+        new_path = os.path.join(self._spill_dir, f"{index}.{promoted.name}.bin")
+        # pylint: disable=consider-using-with
+        new = open(new_path, "w+b")
+        step = max(1, _NPZ_COPY_BUFFER_BYTES // current.itemsize) * current.itemsize
+        while True:
+            buf = old.read(step)
+            if not buf:
+                break
+            new.write(np.frombuffer(buf, dtype=current).astype(promoted).tobytes())
+        old.close()
+        os.unlink(old.name)
+        self._spills[name] = new
+        self._dtypes[name] = promoted
+
+    def close(self) -> None:
+        try:
+            with zipfile.ZipFile(
+                self.output_path, "w", compression=zipfile.ZIP_STORED, allowZip64=True
+            ) as zf:
+                for name in self._order:
+                    if name in self._spills:
+                        self._write_spilled(zf, name)
+                    else:
+                        array = np.concatenate(self._objects.pop(name)).astype(str)
+                        with zf.open(f"{name}.npy", "w", force_zip64=True) as fh:
+                            np.lib.format.write_array(fh, array, allow_pickle=False)
+        finally:
+            self.abort()
+
+    def _write_spilled(self, zf: zipfile.ZipFile, name: str) -> None:
+        spill = self._spills[name]
+        header = {
+            "descr": np.lib.format.dtype_to_descr(self._dtypes[name]),
+            "fortran_order": False,
+            "shape": (self._counts[name],),
+        }
+        spill.flush()
+        spill.seek(0)
+        with zf.open(f"{name}.npy", "w", force_zip64=True) as fh:
+            np.lib.format.write_array_header_1_0(fh, header)
+            while True:
+                buf = spill.read(_NPZ_COPY_BUFFER_BYTES)
+                if not buf:
+                    break
+                fh.write(buf)
+
+    def abort(self) -> None:
+        for spill in self._spills.values():
+            try:
+                spill.close()
+            except Exception:  # pylint: disable=broad-except
+                pass
+        self._spills = {}
+        self._objects = {}
+        for entry in Path(self._spill_dir).glob("*"):
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+        try:
+            os.rmdir(self._spill_dir)
+        except OSError:
+            pass
+
+
+class BuiltinOutputPlugin(OutputPlugin):
+    """内置输出格式插件（每个实例对应一种格式）"""
+
+    def __init__(self, fmt: str) -> None:
+        self.fmt = normalize_output_format(fmt)
+        self._meta = PluginMetadata(
+            name=f"builtin_{self.fmt}_output",
+            version="1.0",
+            author="MomentConversion",
+            description=f"内置 {self.fmt} 结果输出（逐块写出）",
+            plugin_type="output",
+        )
+
+    @property
+    def metadata(self) -> PluginMetadata:
+        return self._meta
+
+    def get_supported_formats(self) -> List[str]:
+        return [self.fmt]
+
+    def open_writer(self, output_path: Path, **kwargs) -> ChunkWriter:
+        if self.fmt == "csv":
+            return _CsvChunkWriter(self, output_path, **kwargs)
+        if self.fmt == "npz":
+            return _NpzChunkWriter(self, output_path, **kwargs)
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError(f"输出格式 {self.fmt} 需要安装 pyarrow")
+        return _ArrowChunkWriter(self, output_path, self.fmt, **kwargs)
+
+    def write(self, data: Dict[str, np.ndarray], output_path: Path, **kwargs) -> None:
+        with self.open_writer(output_path, **kwargs) as writer:
+            writer.write_chunk(pd.DataFrame(data))
+
+
+class _BuiltinPluginManager:  # pylint: disable=too-few-public-methods
+    """按需创建并缓存内置输出插件实例"""
+
+    def __init__(self) -> None:
+        self._plugins: Dict[str, BuiltinOutputPlugin] = {}
+
+    def get(self, fmt: str) -> BuiltinOutputPlugin:
+        if fmt not in self._plugins:
+            self._plugins[fmt] = BuiltinOutputPlugin(fmt)
+        return self._plugins[fmt]
+
+
+_BUILTIN_PLUGINS = _BuiltinPluginManager()
+
+
+def get_output_plugin(fmt: Optional[str]) -> OutputPlugin:
+    """返回格式对应的输出插件：注册表中的同名格式插件优先，否则使用内置实现"""
+    fmt = normalize_output_format(fmt)
+    plugin = get_plugin_registry().get_output_plugin_for_format(fmt)
+    if plugin is not None:
+        return plugin
+    return _BUILTIN_PLUGINS.get(fmt)
+
+
+def open_output_writer(output_path: Path, fmt: Optional[str]) -> ChunkWriter:
+    """为 output_path 打开指定格式的逐块写出会话"""
+    return get_output_plugin(fmt).open_writer(Path(output_path))
+
+
+def _make_temp_output_path(output_path: Path) -> Path:
+    """在 output_path 同目录创建并返回一个临时文件路径（用于写完后原子替换）"""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=output_path.name + ".", suffix=".tmp", dir=str(output_path.parent)
+    )
+    os.close(fd)
+    return Path(tmp_name)
+
+
+def write_frame_atomic(df: pd.DataFrame, output_path: Path, fmt: Optional[str]) -> None:
+    """以指定格式写出整表：先写入同目录临时文件，成功后原子替换到 output_path"""
+    output_path = Path(output_path)
+    tmp_path = _make_temp_output_path(output_path)
+    try:
+        with open_output_writer(tmp_path, fmt) as writer:
+            writer.write_chunk(df)
+        os.replace(str(tmp_path), str(output_path))
+    except Exception:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        raise
+
+
+class LongFormatWriter:
+    """把多个 part 的结果表按长表格式写入同一个输出文件
+
+    每个数据块前置 `LONG_FORMAT_KEY_COLUMNS`（part/source_part/target_part）列，结果列统一为
+    构造时给出的 value_columns（某 part 缺少的列补 NaN），因此各块列名与顺序一致，可直接交给
+    任意格式的逐块写出器。与键列重名的结果列追加 `LONG_FORMAT_RENAME_SUFFIX` 后缀改名
+    （见 `renames`）。写出先进入同目录临时文件，close 成功后原子替换到 output_path，
+    abort 时删除临时文件。
+    """
+
+    def __init__(
+        self, output_path: Path, fmt: Optional[str], value_columns: Iterable[str]
+    ) -> None:
+        columns = list(dict.fromkeys(str(c) for c in value_columns))
+        taken = set(columns).union(LONG_FORMAT_KEY_COLUMNS)
+        self.renames: Dict[str, str] = {}
+        for name in columns:
+            if name in LONG_FORMAT_KEY_COLUMNS:
+                new_name = name + LONG_FORMAT_RENAME_SUFFIX
+                while new_name in taken:
+                    new_name += LONG_FORMAT_RENAME_SUFFIX
+                taken.add(new_name)
+                self.renames[name] = new_name
+        if self.renames:
+            logger.warning("长表中与键列重名的结果列已改名: %s", self.renames)
+        self.output_path = Path(output_path)
+        self.columns = [self.renames.get(c, c) for c in columns]
+        self.rows_written = 0
+        self._tmp_path = _make_temp_output_path(self.output_path)
+        try:
+            self._writer = open_output_writer(self._tmp_path, fmt)
+        except Exception:
+            self._tmp_path.unlink(missing_ok=True)
+            raise
+
+    def write_part(
+        self,
+        df: pd.DataFrame,
+        part: str,
+        source_part: Optional[str] = None,
+        target_part: Optional[str] = None,
+    ) -> None:
+        """追加一个 part 的结果表"""
+        if self.renames:
+            df = df.rename(columns=self.renames)
+        chunk = df.reindex(columns=self.columns)
+        keys = (part, source_part, target_part)
+        for pos, (name, value) in enumerate(zip(LONG_FORMAT_KEY_COLUMNS, keys)):
+            chunk.insert(pos, name, "" if value is None else str(value))
+        self._writer.write_chunk(chunk)
+        self.rows_written += len(chunk)
+
+    def close(self) -> None:
+        """完成写出并原子替换到 output_path"""
+        try:
+            self._writer.close()
+            os.replace(str(self._tmp_path), str(self.output_path))
+        except Exception:
+            self._tmp_path.unlink(missing_ok=True)
+            raise
+
+    def abort(self) -> None:
+        """放弃写出并删除临时文件"""
+        try:
+            self._writer.abort()
+        finally:
+            try:
+                self._tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def __enter__(self) -> "LongFormatWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def read_output_frame(path: Path, fmt: Optional[str] = None) -> pd.DataFrame:
+    """读回结果文件为 DataFrame；fmt 为 None 时按扩展名判断格式"""
+    path = Path(path)
+    if fmt is None:
+        by_suffix = {suffix: name for name, suffix in FORMAT_SUFFIXES.items()}
+        fmt = by_suffix.get(path.suffix.lower(), DEFAULT_OUTPUT_FORMAT)
+    fmt = normalize_output_format(fmt)
+    if fmt == "csv":
+        return pd.read_csv(path)
+    if fmt == "npz":
+        with np.load(path, allow_pickle=False) as data:
+            return pd.DataFrame({name: data[name] for name in data.files})
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError(f"读取 {fmt} 结果需要安装 pyarrow")
+    if fmt == "parquet":
+        return pa_parquet.read_table(str(path)).to_pandas()
+    with pa.memory_map(str(path), "r") as source:
+        return pa_ipc.open_file(source).read_all().to_pandas()
@@ -0,0 +1,178 @@
+"""
+特殊格式解析缓存 - 把 `parse_special_format_file` 的结果以二进制 sidecar 存入缓存目录
+
+同一 `.mtfmt` 文件会被 GUI 预览、行选择对话框、GUI 批处理线程与 `batch.py` 分别解析；
+本模块让这些消费者共享一次解析结果：
+
+- 缓存键由文件内容哈希（`src.file_cache.get_file_hash`，按大小与 mtime 校验）与
+  `PARSER_VERSION` 组成，文件内容或解析规则变化后自动失效；
+- 条目为未压缩的 `.npz`：每个 part 一个 float64 数组，列名、int64 列与 part 顺序存于 JSON 元数据，
+  读取时每个 part 只需一次顺序读取，不再做文本解析；
+- 总大小超过预算时按最近使用时间（mtime，命中时刷新）淘汰最旧条目（`src.disk_cache`）。
+
+缓存默认关闭（`batch.parse_cache_enabled`）：启用后首次解析前需对整个文件计算内容哈希，
+并在缓存目录（默认 ~/.momentconversion/parse_cache）写入最多 `parse_cache_max_mb` 的条目。
+`batch.py --parse-cache DIR` 为本次运行启用并指定目录。
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from src import special_format_parser
+from src.config import get_config
+from src.disk_cache import DiskCacheManager, DiskLruCache
+from src.file_cache import get_file_hash
+
+logger = logging.getLogger(__name__)
+
+# 解析规则或条目布局变化时递增，使旧条目失效
+PARSER_VERSION = 2
+# 默认缓存大小预算（MB）
+DEFAULT_PARSE_CACHE_MAX_MB = 512.0
+# 条目中保存 part 名与列名的 JSON 元数据成员名
+_META_KEY = "__meta__"
+
+
+def parse_cache_key(content_hash: str) -> Optional[str]:
+    """由文件内容哈希与解析器版本生成缓存键；哈希缺失时返回 None"""
+    if not content_hash:
+        return None
+    payload = f"{content_hash}:{PARSER_VERSION}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ParseCache(DiskLruCache):
+    """本地磁盘上的解析结果缓存，带大小预算与 LRU 淘汰（见 `src.disk_cache`）。
+
+    同一目录可被 GUI 与批处理进程共享。
+    """
+
+    def __init__(
+        self,
+        cache_dir,
+        max_bytes: int = int(DEFAULT_PARSE_CACHE_MAX_MB * 1024 * 1024),
+    ):
+        super().__init__(cache_dir, max_bytes)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npz"
+
+    def load(self, key: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """读取条目并还原为 {part_name: DataFrame}；不存在或损坏时返回 None"""
+        entry = self._entry_path(key) if key else None
+        if entry is None or not entry.is_file():
+            self._count("misses")
+            return None
+        try:
+            with np.load(entry, allow_pickle=False) as npz:
+                meta = json.loads(npz[_META_KEY].tobytes().decode("utf-8"))
+                result = {
+                    part["name"]: special_format_parser._numeric_frame(
+                        npz[f"part_{i}"],
+                        part["columns"],
+                        [j in part["int_columns"] for j in range(len(part["columns"]))],
+                    )
+                    for i, part in enumerate(meta["parts"])
+                }
+            self._touch(entry)
+        except (OSError, ValueError, KeyError) as exc:
+            logger.debug("读取解析缓存条目失败: %s (%s)", entry, exc)
+            self._count("misses")
+            return None
+        self._count("hits")
+        return result
+
+    def store(self, key: str, data: Dict[str, pd.DataFrame]) -> bool:
+        """把解析结果写入缓存（原子写入），随后按预算淘汰；成功返回 True
+
+        只缓存各列为 float64 或 int64 的结果（单次扫描解析器的输出总是如此）；
+        int64 列以 float64 存储，读取时按元数据还原。
+        """
+        if not key:
+            return False
+        arrays = {}
+        parts = []
+        for i, (name, df) in enumerate(data.items()):
+            if not all(dtype in (np.float64, np.int64) for dtype in df.dtypes):
+                return False
+            arrays[f"part_{i}"] = df.to_numpy(dtype=np.float64)
+            parts.append(
+                {
+                    "name": name,
+                    "columns": [str(c) for c in df.columns],
+                    "int_columns": [
+                        j for j, dtype in enumerate(df.dtypes) if dtype == np.int64
+                    ],
+                }
+            )
+        meta = json.dumps({"parts": parts}, ensure_ascii=False).encode("utf-8")
+        arrays[_META_KEY] = np.frombuffer(meta, dtype=np.uint8)
+        try:
+            fd, tmp_name = self._temp_entry(key)
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    np.savez(fh, **arrays)
+                if os.path.getsize(tmp_name) > self.max_bytes:
+                    Path(tmp_name).unlink(missing_ok=True)
+                    return False
+                os.replace(tmp_name, self._entry_path(key))
+            except OSError:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.debug("写入解析缓存失败: %s", key, exc_info=True)
+            return False
+        self._count("stores")
+        self.evict()
+        return True
+
+
+class ParseCacheManager(DiskCacheManager):
+    """按 (目录, 预算) 管理每个进程内共享的 `ParseCache` 实例。"""
+
+    cache_class = ParseCache
+
+
+_PARSE_CACHE_MANAGER = ParseCacheManager()
+
+
+def default_parse_cache_dir() -> Path:
+    """默认缓存目录：用户目录下 .momentconversion/parse_cache（测试环境使用临时目录）"""
+    if os.environ.get("TESTING") == "1":
+        base_dir = Path(tempfile.gettempdir()) / ".momentconversion_test"
+    else:
+        base_dir = Path.home() / ".momentconversion"
+    return base_dir / "parse_cache"
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """按全局配置 batch.parse_cache_* 返回缓存实例；未启用时返回 None"""
+    batch_cfg = get_config().batch
+    if not batch_cfg.parse_cache_enabled:
+        return None
+    cache_dir = batch_cfg.parse_cache_dir or default_parse_cache_dir()
+    max_mb = batch_cfg.parse_cache_max_mb or DEFAULT_PARSE_CACHE_MAX_MB
+    return _PARSE_CACHE_MANAGER.get(cache_dir, int(float(max_mb) * 1024 * 1024))
+
+
+def load_special_format_file(file_path: Path) -> Dict[str, pd.DataFrame]:
+    """带解析缓存的 `parse_special_format_file`：命中时直接读取 sidecar，否则解析后写入"""
+    cache = get_parse_cache()
+    key = parse_cache_key(get_file_hash(str(file_path))) if cache else None
+    if key:
+        cached = cache.load(key)
+        if cached is not None:
+            logger.debug("解析缓存命中: %s", file_path)
+            return cached
+    data = special_format_parser.parse_special_format_file(file_path)
+    if key:
+        cache.store(key, data)
+    return data
@@ -5,12 +5,19 @@
 2. 模糊匹配（大小写不敏感、去除特殊字符）
 3. 包含关系匹配（子串匹配）
 4. 默认策略（选择第一个可用项并警告）
+
+候选名称的标准化结果、标准化哈希表与包含匹配用的 n-gram 索引由 `PartNameIndex` 预先构建，
+同一组 source/target 名称（通常即一个 ProjectData）共享一个索引（见 `get_part_name_index`），
+索引对推测结果做记忆化，`infer_many` 可一次推测大量名称。
 """
 
 import logging
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -48,91 +55,202 @@ class PartInferenceResult:
         )
 
 
+_SEPARATOR_RE = re.compile(r"[_\-\s]+")
+
+
+@lru_cache(maxsize=65536)
+def _normalize_str(name: str) -> str:
+    return _SEPARATOR_RE.sub("", name.lower())
+
+
 def _normalize_name(name: str) -> str:
     """标准化名称：转小写、去除下划线/连字符/空格。"""
     if not isinstance(name, str):
         return ""
-    return re.sub(r"[_\-\s]+", "", name.lower())
+    return _normalize_str(name)
 
 
-def _exact_match(query: str, available_parts: Dict) -> Optional[str]:
-    """精确匹配：查找完全相同的part名称（大小写敏感）。"""
-    return query if query in available_parts else None
+def _strip_non_alnum(name: str) -> str:
+    """GUI 映射用的标准化：去除字母数字与中文以外的全部字符并转小写。"""
+    return "".join(
+        ch for ch in name if ch.isalnum() or ("\u4e00" <= ch <= "\u9fff")
+    ).lower()
 
 
-def _fuzzy_match(query: str, available_parts: Dict) -> Optional[str]:
-    """模糊匹配：标准化后比较（大小写不敏感、忽略分隔符）。"""
-    normalized_query = _normalize_name(query)
-    if not normalized_query:
-        return None
+# 包含匹配索引使用的 n-gram 长度
+_NGRAM_SIZE = 3
 
-    for part_name in available_parts.keys():
-        if _normalize_name(part_name) == normalized_query:
-            return part_name
-    return None
+# 每个索引最多记忆的推测结果数（超出后清空重新累积）
+_MEMO_MAX_ENTRIES = 200_000
 
+# 进程内最多缓存的索引数（按名称集合区分，LRU 淘汰）
+_INDEX_CACHE_SIZE = 16
 
-def _contains_match(query: str, available_parts: Dict) -> Optional[str]:
-    """包含关系匹配：查找query包含part名或part名包含query的情况。"""
-    normalized_query = _normalize_name(query)
-    if not normalized_query:
-        return None
 
-    # 优先查找：query 包含 part名
-    for part_name in available_parts.keys():
-        normalized_part = _normalize_name(part_name)
-        if normalized_part and normalized_part in normalized_query:
+class _NameSet:
+    """一组候选 part 名称的匹配索引。
+
+    构造时一次性计算各名称的标准化形式与 标准化名 -> 首个名称 的哈希表；包含匹配所需的
+    n-gram 倒排索引在首次使用时构建。各匹配方法的结果与按名称顺序逐个比较的结果一致
+    （多个候选满足时返回顺序最靠前者）。
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names: List[str] = list(names)
+        self._exact = set(self.names)
+        self._norms = [_normalize_name(name) for name in self.names]
+        self._by_norm: Dict[str, int] = {}
+        for i, norm in enumerate(self._norms):
+            if norm:
+                self._by_norm.setdefault(norm, i)
+        # gram -> 包含该 gram 的名称下标；key gram -> 以其为最稀有 gram 的名称下标
+        self._grams: Optional[Dict[str, set]] = None
+        self._keys: Optional[Dict[str, List[int]]] = None
+        self._short: List[int] = []
+        # 小写名 / 去特殊字符名 -> 名称下标列表（唯一性匹配用，首次使用时构建）
+        self._by_lower: Optional[Dict[str, List[int]]] = None
+        self._by_alnum: Optional[Dict[str, List[int]]] = None
+
+    def exact(self, query: str) -> Optional[str]:
+        """精确匹配：查找完全相同的part名称（大小写敏感）。"""
+        return query if query in self._exact else None
+
+    def fuzzy(self, query: str) -> Optional[str]:
+        """模糊匹配：标准化后比较（大小写不敏感、忽略分隔符）。"""
+        i = self._by_norm.get(_normalize_name(query))
+        return None if i is None else self.names[i]
+
+    def _ensure_grams(self) -> None:
+        if self._grams is not None:
+            return
+        grams: Dict[str, set] = {}
+        short: List[int] = []
+        n = _NGRAM_SIZE
+        for i, norm in enumerate(self._norms):
+            if not norm:
+                continue
+            if len(norm) < n:
+                short.append(i)
+                continue
+            for j in range(len(norm) - n + 1):
+                grams.setdefault(norm[j : j + n], set()).add(i)
+        # 每个名称只登记其最稀有的 gram：名称被 query 包含时该 gram 必然出现在 query 中，
+        # 而共享前缀（如 Part_1/Part_2）不会让每次查询都退化为全量比较
+        keys: Dict[str, List[int]] = {}
+        for i, norm in enumerate(self._norms):
+            if len(norm) >= n:
+                key = min(
+                    (norm[j : j + n] for j in range(len(norm) - n + 1)),
+                    key=lambda gram: len(grams[gram]),
+                )
+                keys.setdefault(key, []).append(i)
+        self._keys, self._short, self._grams = keys, short, grams
+
+    def contains(self, query: str) -> Optional[str]:
+        """包含关系匹配：查找query包含part名或part名包含query的情况。"""
+        normalized_query = _normalize_name(query)
+        if not normalized_query:
+            return None
+        self._ensure_grams()
+        n = _NGRAM_SIZE
+        query_grams = [
+            normalized_query[j : j + n] for j in range(len(normalized_query) - n + 1)
+        ]
+
+        # 优先查找：query 包含 part名（part 的 key gram 必然出现在 query 中）
+        norms = self._norms
+        hits = [i for i in self._short if norms[i] in normalized_query]
+        for gram in query_grams:
+            ids = self._keys.get(gram)
+            if ids:
+                hits.extend(i for i in ids if norms[i] in normalized_query)
+        if hits:
+            part_name = self.names[min(hits)]
             logger.debug("包含匹配成功：'%s' 包含 '%s'", query, part_name)
             return part_name
 
-    # 次选：part名 包含 query
-    for part_name in available_parts.keys():
-        normalized_part = _normalize_name(part_name)
-        if normalized_part and normalized_query in normalized_part:
+        # 次选：part名 包含 query（part 需包含 query 的全部 gram）
+        if query_grams:
+            postings = []
+            for gram in query_grams:
+                posting = self._grams.get(gram)
+                if not posting:
+                    return None
+                postings.append(posting)
+            candidates = set.intersection(*sorted(postings, key=len))
+        else:
+            candidates = range(len(self.names))
+        hits = [i for i in candidates if normalized_query in norms[i]]
+        if hits:
+            part_name = self.names[min(hits)]
             logger.debug("包含匹配成功：'%s' 包含于 '%s'", query, part_name)
             return part_name
 
-    return None
-
+        return None
 
-def infer_source_part(
+    def _ensure_unique_maps(self) -> None:
+        if self._by_lower is not None:
+            return
+        by_lower: Dict[str, List[int]] = {}
+        by_alnum: Dict[str, List[int]] = {}
+        for i, name in enumerate(self.names):
+            by_lower.setdefault(name.lower(), []).append(i)
+            norm = _strip_non_alnum(name)
+            if norm:
+                by_alnum.setdefault(norm, []).append(i)
+        self._by_alnum, self._by_lower = by_alnum, by_lower
+
+    def unique(self, query: str) -> Optional[str]:
+        """保守匹配：精确；否则大小写不敏感；否则去除特殊字符后比较。
+
+        大小写不敏感或去特殊字符后命中多个候选时不选择（返回 None），避免误选。
+        """
+        if query in self._exact:
+            return query
+        self._ensure_unique_maps()
+        hits = self._by_lower.get(query.lower(), [])
+        if len(hits) != 1:
+            norm = _strip_non_alnum(query)
+            hits = self._by_alnum.get(norm, []) if norm else []
+        return self.names[hits[0]] if len(hits) == 1 else None
+
+    def match(self, query: str, strategy: str = "strict") -> Optional[str]:
+        """唯一性匹配（见 `unique`），fuzzy 策略下再尝试包含匹配，不使用任何默认值。"""
+        result = self.unique(query)
+        if not result and strategy == "fuzzy":
+            result = self.contains(query)
+        return result
+
+
+def _infer_source(
     part_name: str,
-    available_sources: Dict,
-    strategy: str = "fuzzy",
-    allow_default: bool = True,
+    sources: _NameSet,
+    strategy: str,
+    allow_default: bool,
 ) -> PartInferenceResult:
-    """智能推测 source part。
-
-    Args:
-        part_name: 来自文件的 part 名称
-        available_sources: 配置中的 source_parts 字典
-        strategy: 推测策略 "strict"（仅精确+模糊）或 "fuzzy"（包含所有策略）
-        allow_default: 无法推测时是否允许使用默认值（第一个可用项）
-
-    Returns:
-        PartInferenceResult 对象
-    """
-    if not available_sources:
+    """`infer_source_part` 的实现，候选名称来自预建的 `_NameSet`。"""
+    if not sources.names:
         logger.warning("配置中无可用的 source parts")
         return PartInferenceResult(None, "none", "failed", [])
 
-    available_names = list(available_sources.keys())
+    # 候选列表在同一 _NameSet 的各推测结果间共享（只读）
+    available_names = sources.names
 
     # 策略1: 精确匹配
-    result = _exact_match(part_name, available_sources)
+    result = sources.exact(part_name)
     if result:
         logger.info("Source part 精确匹配成功：'%s' → '%s'", part_name, result)
         return PartInferenceResult(result, "high", "exact", available_names)
 
     # 策略2: 模糊匹配（标准化比较）
-    result = _fuzzy_match(part_name, available_sources)
+    result = sources.fuzzy(part_name)
     if result:
         logger.info("Source part 模糊匹配成功：'%s' → '%s'", part_name, result)
         return PartInferenceResult(result, "high", "fuzzy", available_names)
 
     # 策略3: 包含关系匹配（仅在 fuzzy 策略时启用）
     if strategy == "fuzzy":
-        result = _contains_match(part_name, available_sources)
+        result = sources.contains(part_name)
         if result:
             logger.info("Source part 包含匹配成功：'%s' → '%s'", part_name, result)
             return PartInferenceResult(result, "medium", "contains", available_names)
@@ -167,33 +285,45 @@ def infer_source_part(
     return PartInferenceResult(None, "none", "failed", available_names)
 
 
-def infer_target_part(
-    source_part: str,
-    available_targets: Dict,
-    file_path: Optional[Path] = None,
+def infer_source_part(
+    part_name: str,
+    available_sources: Dict,
     strategy: str = "fuzzy",
     allow_default: bool = True,
 ) -> PartInferenceResult:
-    """智能推测 target part。
+    """智能推测 source part。
 
     Args:
-        source_part: 已确定的 source part 名称
-        available_targets: 配置中的 target_parts 字典
-        file_path: 输入文件路径（用于文件名匹配）
-        strategy: 推测策略 "strict" 或 "fuzzy"
-        allow_default: 无法推测时是否允许使用默认值
+        part_name: 来自文件的 part 名称
+        available_sources: 配置中的 source_parts 字典
+        strategy: 推测策略 "strict"（仅精确+模糊）或 "fuzzy"（包含所有策略）
+        allow_default: 无法推测时是否允许使用默认值（第一个可用项）
 
     Returns:
         PartInferenceResult 对象
     """
-    if not available_targets:
+    return _infer_source(
+        part_name, _NameSet(available_sources or {}), strategy, allow_default
+    )
+
+
+def _infer_target(
+    source_part: str,
+    targets: _NameSet,
+    file_path: Optional[Path],
+    strategy: str,
+    allow_default: bool,
+) -> PartInferenceResult:
+    """`infer_target_part` 的实现，候选名称来自预建的 `_NameSet`。"""
+    if not targets.names:
         logger.warning("配置中无可用的 target parts")
         return PartInferenceResult(None, "none", "failed", [])
 
-    available_names = list(available_targets.keys())
+    # 候选列表在同一 _NameSet 的各推测结果间共享（只读）
+    available_names = targets.names
 
     # 策略1: 精确匹配（同名 target）
-    result = _exact_match(source_part, available_targets)
+    result = targets.exact(source_part)
     if result:
         logger.info(
             "Target part 精确匹配成功（同名）：source '%s' → target '%s'",
@@ -205,7 +335,7 @@ def infer_target_part(
     # 策略2: 文件名匹配（如果提供了文件路径）
     if file_path:
         file_stem = file_path.stem  # 不含扩展名的文件名
-        result = _fuzzy_match(file_stem, available_targets)
+        result = targets.fuzzy(file_stem)
         if result:
             logger.info(
                 "Target part 文件名匹配成功：file '%s' → target '%s'",
@@ -215,7 +345,7 @@ def infer_target_part(
             return PartInferenceResult(result, "medium", "fuzzy", available_names)
 
     # 策略3: 模糊匹配 source_part 到 target
-    result = _fuzzy_match(source_part, available_targets)
+    result = targets.fuzzy(source_part)
     if result:
         logger.info(
             "Target part 模糊匹配成功：source '%s' → target '%s'",
@@ -226,7 +356,7 @@ def infer_target_part(
 
     # 策略4: 包含关系匹配
     if strategy == "fuzzy":
-        result = _contains_match(source_part, available_targets)
+        result = targets.contains(source_part)
         if result:
             logger.info(
                 "Target part 包含匹配成功：source '%s' → target '%s'",
@@ -261,6 +391,185 @@ def infer_target_part(
     return PartInferenceResult(None, "none", "failed", available_names)
 
 
+def infer_target_part(
+    source_part: str,
+    available_targets: Dict,
+    file_path: Optional[Path] = None,
+    strategy: str = "fuzzy",
+    allow_default: bool = True,
+) -> PartInferenceResult:
+    """智能推测 target part。
+
+    Args:
+        source_part: 已确定的 source part 名称
+        available_targets: 配置中的 target_parts 字典
+        file_path: 输入文件路径（用于文件名匹配）
+        strategy: 推测策略 "strict" 或 "fuzzy"
+        allow_default: 无法推测时是否允许使用默认值
+
+    Returns:
+        PartInferenceResult 对象
+    """
+    return _infer_target(
+        source_part,
+        _NameSet(available_targets or {}),
+        file_path,
+        strategy,
+        allow_default,
+    )
+
+
+class PartNameIndex:
+    """一组 source/target part 名称的推测索引（预建匹配结构 + 结果记忆化）。
+
+    推测规则与 `infer_source_part` / `infer_target_part` / `infer_parts_for_file` 完全一致，
+    相同参数的重复推测直接返回记忆的结果（不再重复输出日志）。实例可在线程间共享。
+    """
+
+    def __init__(self, source_names: Iterable[str], target_names: Iterable[str]):
+        self.sources = _NameSet(source_names)
+        self.targets = _NameSet(target_names)
+        self._memo: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def _memoized(self, key: tuple, compute):
+        result = self._memo.get(key)
+        if result is None:
+            result = compute()
+            with self._lock:
+                if len(self._memo) >= _MEMO_MAX_ENTRIES:
+                    self._memo.clear()
+                self._memo[key] = result
+        return result
+
+    def infer_source(
+        self, part_name: str, strategy: str = "fuzzy", allow_default: bool = True
+    ) -> PartInferenceResult:
+        """推测 source part（规则同 `infer_source_part`）。"""
+        return self._memoized(
+            ("source", part_name, strategy, allow_default),
+            lambda: _infer_source(part_name, self.sources, strategy, allow_default),
+        )
+
+    def infer_target(
+        self,
+        source_part: str,
+        file_path: Optional[Path] = None,
+        strategy: str = "fuzzy",
+        allow_default: bool = True,
+    ) -> PartInferenceResult:
+        """推测 target part（规则同 `infer_target_part`）。"""
+        path = Path(file_path) if file_path else None
+        return self._memoized(
+            (
+                "target",
+                source_part,
+                path.stem if path else None,
+                strategy,
+                allow_default,
+            ),
+            lambda: _infer_target(
+                source_part, self.targets, path, strategy, allow_default
+            ),
+        )
+
+    def infer_parts(
+        self,
+        part_name: str,
+        file_path: Optional[Path] = None,
+        strategy: str = "fuzzy",
+        allow_default: bool = True,
+    ) -> Tuple[PartInferenceResult, PartInferenceResult]:
+        """同时推测 source 和 target part（规则同 `infer_parts_for_file`）。"""
+        source_result = self.infer_source(part_name, strategy, allow_default)
+        if not source_result.is_successful():
+            return source_result, PartInferenceResult(
+                None, "none", "failed", self.targets.names
+            )
+        target_result = self.infer_target(
+            source_result.part_name, file_path, strategy, allow_default
+        )
+        return source_result, target_result
+
+    def infer_many(
+        self,
+        names: Iterable[str],
+        file_paths: Optional[Sequence[Optional[Path]]] = None,
+        strategy: str = "fuzzy",
+        allow_default: bool = True,
+    ) -> List[Tuple[PartInferenceResult, PartInferenceResult]]:
+        """批量推测：对 names 中每个名称返回 (source_result, target_result)。
+
+        file_paths 提供时与 names 一一对应，用于 target 的文件名匹配；重复名称只计算一次。
+        """
+        names = list(names)
+        paths = list(file_paths) if file_paths is not None else [None] * len(names)
+        if len(paths) != len(names):
+            raise ValueError("file_paths 与 names 长度不一致")
+        return [
+            self.infer_parts(name, path, strategy, allow_default)
+            for name, path in zip(names, paths)
+        ]
+
+    def match_source(self, query: str, strategy: str = "strict") -> Optional[str]:
+        """只做名称匹配（规则见 `_NameSet.unique`），匹配不到或有歧义时返回 None。
+
+        供 GUI 自动映射使用：不使用默认值，多个候选同时命中时不选择。
+        """
+        return self.sources.match(query, strategy)
+
+    def match_target(self, query: str, strategy: str = "strict") -> Optional[str]:
+        """同 `match_source`，在 target 名称中匹配。"""
+        return self.targets.match(query, strategy)
+
+
+class _PartNameIndexCache:
+    """按 (source 名称, target 名称) 缓存 `PartNameIndex` 的 LRU（线程安全）。"""
+
+    def __init__(self, max_entries: int = _INDEX_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._indexes: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, source_names: Tuple[str, ...], target_names: Tuple[str, ...]):
+        key = (source_names, target_names)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                return index
+        index = PartNameIndex(source_names, target_names)
+        with self._lock:
+            self._indexes[key] = index
+            while len(self._indexes) > self.max_entries:
+                self._indexes.popitem(last=False)
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+
+_PART_NAME_INDEXES = _PartNameIndexCache()
+
+
+def get_part_name_index(project_data) -> PartNameIndex:
+    """返回 project_data 当前 source/target 名称对应的共享索引。
+
+    索引以名称集合为键缓存，ProjectData 的 part 增删或改名后自动使用新索引。
+    """
+    source_names = tuple((getattr(project_data, "source_parts", {}) or {}).keys())
+    target_names = tuple((getattr(project_data, "target_parts", {}) or {}).keys())
+    return _PART_NAME_INDEXES.get(source_names, target_names)
+
+
+def get_part_name_index_for_names(
+    source_names: Iterable[str] = (), target_names: Iterable[str] = ()
+) -> PartNameIndex:
+    """返回给定名称列表对应的共享索引（供只持有名称列表的 GUI 调用）。"""
+    return _PART_NAME_INDEXES.get(tuple(source_names), tuple(target_names))
+
+
 def infer_parts_for_file(
     part_name: str,
     project_data,
@@ -280,31 +589,11 @@ def infer_parts_for_file(
     Returns:
         (source_result, target_result) 元组
     """
-    source_parts = getattr(project_data, "source_parts", {}) or {}
-    target_parts = getattr(project_data, "target_parts", {}) or {}
-
-    # 推测 source part
-    source_result = infer_source_part(
-        part_name, source_parts, strategy=strategy, allow_default=allow_default
+    # source 推测失败时 target 也无法推测（见 PartNameIndex.infer_parts）
+    return get_part_name_index(project_data).infer_parts(
+        part_name, file_path=file_path, strategy=strategy, allow_default=allow_default
     )
 
-    # 推测 target part
-    if source_result.is_successful():
-        target_result = infer_target_part(
-            source_result.part_name,
-            target_parts,
-            file_path=file_path,
-            strategy=strategy,
-            allow_default=allow_default,
-        )
-    else:
-        # source 推测失败，target 也无法推测
-        target_result = PartInferenceResult(
-            None, "none", "failed", list(target_parts.keys())
-        )
-
-    return source_result, target_result
-
 
 def format_inference_error(
     part_name: str,
@@ -345,6 +634,9 @@ def format_inference_error(
 
 __all__ = [
     "PartInferenceResult",
+    "PartNameIndex",
+    "get_part_name_index",
+    "get_part_name_index_for_names",
     "infer_source_part",
     "infer_target_part",
     "infer_parts_for_file",
@@ -64,6 +64,8 @@ class PerformanceMonitor:
     def __init__(self):
         """初始化监控器"""
         self.metrics: Dict[str, list] = defaultdict(list)
+        # 累加型计数器（如复用缓冲区节省的字节数），与耗时类指标分开存放
+        self.counters: Dict[str, float] = defaultdict(float)
         self.process = psutil.Process() if PSUTIL_AVAILABLE else None
         self.lock = threading.Lock()
 
@@ -124,6 +126,16 @@ class PerformanceMonitor:
         with self.lock:
             self.metrics[metric_name].append(metrics)
 
+    def increment_counter(self, counter_name: str, value: float = 1) -> None:
+        """累加计数器"""
+        with self.lock:
+            self.counters[counter_name] += value
+
+    def get_counters(self) -> Dict[str, float]:
+        """获取所有计数器的当前值"""
+        with self.lock:
+            return dict(self.counters)
+
     @contextmanager
     def measure(self, metric_name: str):
         """上下文管理器 - 测量代码块的执行时间"""
@@ -192,8 +204,10 @@ class PerformanceMonitor:
             if metric_name:
                 if metric_name in self.metrics:
                     del self.metrics[metric_name]
+                self.counters.pop(metric_name, None)
             else:
                 self.metrics.clear()
+                self.counters.clear()
 
     def log_summary(self) -> None:
         """记录性能摘要"""
@@ -220,6 +234,9 @@ class PerformanceMonitor:
                     stats["memory_mb"]["avg"],
                 )
 
+        for counter_name, value in self.get_counters().items():
+            logger.info("%s: %s", counter_name, value)
+
 
 def measure_performance(func: Callable) -> Callable:
     """装饰器 - 自动测量函数性能"""
@@ -3,8 +3,13 @@
 公共 API:
 - `AeroCalculator(config, source_part=None, target_part=None, ...)`
     - `process_batch(forces, moments)`：批量计算，输入/输出均为 (N,3) 数组。
+    - `process_stacked(loads, out=None)`：输入 (N,6) 的 [F|M]，返回 (N,12) 的 [F'|M'|C_F|C_M]。
+    - `process_batch(..., out=ResultBuffer|ndarray)`：写入调用方提供的工作区，分块处理时可零分配复用。
     - `process_frame(force, moment)`：单点计算接口，返回 `AeroResult`。
 
+批量计算使用构造时预编译的 (6,12) 融合算子（旋转、移轴叉乘与无量纲化合并为一次矩阵乘法），
+逐步实现的参考路径保留为 `_process_batch_reference`，用于非有限输入行与基准对比。
+
 示例:
     >>> from src.data_loader import FrameConfiguration
     >>> from src.physics import AeroCalculator
@@ -18,10 +23,11 @@
 # 临时允许文件级 `line-too-long`（待逐步拆分长注释与字符串）
 # pylint: disable=line-too-long
 
+import hashlib
 import logging
 import warnings
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -29,11 +35,93 @@ from src import geometry
 from src.cache import get_rotation_cache, get_transformation_cache
 from src.config import get_config
 from src.data_loader import FrameConfiguration, ProjectData
+from src.performance import get_performance_monitor
 
 logger = logging.getLogger(__name__)
 # 该模块包含物理学惯例命名（如 R, F_rotated 等），接受非 snake_case 命名风格
 # pylint: disable=invalid-name,too-many-arguments
 
+# 无量纲化分母为零时的警告文本（参考路径与融合算子共用，保证行为一致）
+_FORCE_DENOM_WARNING = (
+    "动压(q) 或 参考面积 s_ref 为零，无法计算力系数，已将力系数设为 0。"
+)
+_MOMENT_DENOM_WARNING = (
+    "动压(q) 或 参考长度 b_ref/c_ref 为零，相关轴的力矩系数已设为0。"
+)
+
+# 结果工作区的列数：[F'(3) | M'(3) | C_F(3) | C_M(3)]
+RESULT_WIDTH = 12
+# 输入工作区的列数：[F(3) | M(3)]
+LOADS_WIDTH = 6
+
+
+class ResultBuffer:
+    """可复用的批量计算工作区，供分块流水线在多个数据块之间共享。
+
+    持有连续的 (capacity, 6) 输入区与 (capacity, 12) float64 结果区；容量不足时按 1.5 倍扩容，
+    其余调用直接复用已有内存。每次复用节省的分配字节数累计到 `bytes_saved`，
+    并上报到性能监控器的 `physics.result_buffer.bytes_saved` 计数器。
+    """
+
+    METRIC_BYTES_SAVED = "physics.result_buffer.bytes_saved"
+
+    def __init__(self, capacity: int = 0):
+        self._loads = np.empty((0, LOADS_WIDTH), dtype=np.float64)
+        self._result = np.empty((0, RESULT_WIDTH), dtype=np.float64)
+        self.allocations = 0
+        self.reuses = 0
+        self.bytes_saved = 0
+        if capacity:
+            self.reserve(capacity)
+
+    @property
+    def capacity(self) -> int:
+        """当前可容纳的最大行数。"""
+        return self._result.shape[0]
+
+    def reserve(self, rows: int) -> bool:
+        """确保容量至少为 rows 行，发生扩容时返回 True。"""
+        rows = int(rows)
+        if rows <= self.capacity:
+            return False
+        new_capacity = max(rows, int(self.capacity * 1.5))
+        self._loads = np.empty((new_capacity, LOADS_WIDTH), dtype=np.float64)
+        self._result = np.empty((new_capacity, RESULT_WIDTH), dtype=np.float64)
+        self.allocations += 1
+        return True
+
+    def acquire(self, rows: int) -> Tuple[np.ndarray, np.ndarray]:
+        """返回 (loads, result) 两块前 rows 行的连续视图，必要时扩容。"""
+        if not self.reserve(rows):
+            saved = int(rows) * (LOADS_WIDTH + RESULT_WIDTH) * 8
+            self.reuses += 1
+            self.bytes_saved += saved
+            get_performance_monitor().increment_counter(self.METRIC_BYTES_SAVED, saved)
+        return self._loads[:rows], self._result[:rows]
+
+    def result(self, rows: int) -> np.ndarray:
+        """返回最近一次计算结果的前 rows 行视图 (rows, 12)。"""
+        return self._result[:rows]
+
+    def stats(self) -> Dict[str, int]:
+        """返回工作区复用统计信息。"""
+        return {
+            "capacity": self.capacity,
+            "allocations": self.allocations,
+            "reuses": self.reuses,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+def _split_result_columns(result: np.ndarray) -> Dict[str, np.ndarray]:
+    """将 (..., 12) 结果数组拆分为 process_batch 约定的四组列视图（不复制）。"""
+    return {
+        "force_transformed": result[..., 0:3],
+        "moment_transformed": result[..., 3:6],
+        "coeff_force": result[..., 6:9],
+        "coeff_moment": result[..., 9:12],
+    }
+
 
 @dataclass
 class AeroResult:
@@ -192,7 +280,41 @@ class AeroCalculator:
         self.source_frame = source_frame
         self.target_frame = target_frame
 
-        # --- 几何初始化（带缓存支持）---
+        # 支持依赖注入的缓存提供者（便于测试与替换）
+        self._cache_provider = cache_provider
+
+        # 项目加载时预计算的变换表命中时直接取用几何量（注入缓存提供者时仍走缓存路径）
+        pair = None
+        table = getattr(config, "transform_table", None)
+        if table is not None and cache_provider is None:
+            pair = table.lookup(source_frame, target_frame)
+        if pair is not None:
+            self.basis_source = pair.basis_source
+            self.basis_target = pair.basis_target
+            self.rotation_matrix = pair.rotation
+            self.r_global = pair.lever_arm_global
+            self.r_target = pair.lever_arm
+        else:
+            self._init_geometry(cache_cfg)
+
+        # 构造时验证 target 必需字段
+        if self.target_frame.moment_center is None:
+            raise ValueError("目标 variant 必须包含 MomentCenter 字段（长度为3的列表）")
+        if self.target_frame.q is None:
+            raise ValueError("目标 variant 必须包含动压 Q（数值）")
+        if self.target_frame.s_ref is None:
+            raise ValueError("目标 variant 必须包含参考面积 S（数值）")
+
+        # 预编译融合变换算子（旋转 + 移轴 + 无量纲化），批量计算时仅需一次矩阵乘法
+        self._kernel: Optional[np.ndarray] = None
+        self._kernel_key: Optional[tuple] = None
+        self._kernel_warnings: List[str] = []
+        self._coeff_scale: np.ndarray = np.zeros(6)
+        self._coeff_zero: np.ndarray = np.zeros(6, dtype=bool)
+        self._build_transform_kernel()
+
+    def _init_geometry(self, cache_cfg) -> None:
+        """逐个计算基矩阵、旋转矩阵与力臂（带缓存支持），未命中变换表时使用。"""
         src = self.source_frame.coord_system
         tgt = self.target_frame.coord_system
         self.basis_source = geometry.construct_basis_matrix(
@@ -202,9 +324,6 @@ class AeroCalculator:
             tgt.x_axis, tgt.y_axis, tgt.z_axis
         )
 
-        # 支持依赖注入的缓存提供者（便于测试与替换）
-        self._cache_provider = cache_provider
-
         # 从参数优先获取 cache_cfg，否则从全局配置读取（向后兼容）
         if cache_cfg is None:
             cfg = get_config()
@@ -231,21 +350,18 @@ class AeroCalculator:
         self._validate_and_fix_R()
         self._validate_and_fix_r_target()
 
-        # 构造时验证 target 必需字段
-        if self.target_frame.moment_center is None:
-            raise ValueError("目标 variant 必须包含 MomentCenter 字段（长度为3的列表）")
-        if self.target_frame.q is None:
-            raise ValueError("目标 variant 必须包含动压 Q（数值）")
-        if self.target_frame.s_ref is None:
-            raise ValueError("目标 variant 必须包含参考面积 S（数值）")
-
     def _safe_divide(
-        self, numerator: np.ndarray, denominator, warn_msg: str = None
+        self,
+        numerator: np.ndarray,
+        denominator,
+        warn_msg: str = None,
+        warn: bool = True,
     ) -> np.ndarray:
         """安全除法，处理标量或按轴数组的分母。
 
         - numerator: (N, M) 或 (M,) 的数组
         - denominator: 标量或 1D 数组（长度为 M）
+        - warn: 为 False 时不发出分母警告（调用方已发出过同一警告）
         当分母接近零时：发出警告并将对应结果置为 0，避免除以零或 NaN。
         """
         denom_arr = np.array(denominator, dtype=float)
@@ -253,16 +369,16 @@ class AeroCalculator:
         # 标量分母情况
         if denom_arr.ndim == 0:
             if np.isclose(denom_arr, 0.0):
-                if warn_msg is None:
+                if warn and warn_msg is None:
                     warnings.warn("分母为零，已将结果设为 0。", UserWarning)
-                else:
+                elif warn:
                     warnings.warn(warn_msg, UserWarning)
                 return np.zeros_like(numerator)
             return numerator / denom_arr
 
         # 数组分母情况（按轴分母，例如 moment_length_vector）
         zero_mask = np.isclose(denom_arr, 0.0)
-        if np.any(zero_mask):
+        if np.any(zero_mask) and warn:
             if warn_msg is None:
                 warnings.warn(
                     "分母向量中存在零或未定义值，相关轴的结果将被设为 0。",
@@ -516,9 +632,12 @@ class AeroCalculator:
                 out[i] = np.cross(self.r_target, f)
             return out
 
-    def _compute_coefficients(self, F_final: np.ndarray, M_final: np.ndarray) -> tuple:
+    def _compute_coefficients(
+        self, F_final: np.ndarray, M_final: np.ndarray, warn: bool = True
+    ) -> tuple:
         """
         计算力与力矩的无量纲系数，封装无量纲化逻辑以便测试与复用。
+        warn=False 时不发出分母警告。
 
         返回: (C_F, C_M)
         """
@@ -531,7 +650,8 @@ class AeroCalculator:
         C_F = self._safe_divide(
             F_final,
             denom_force,
-            warn_msg="动压(q) 或 参考面积 s_ref 为零，无法计算力系数，已将力系数设为 0。",
+            warn_msg=_FORCE_DENOM_WARNING,
+            warn=warn,
         )
 
         b_val = float(b) if (b is not None) else 0.0
@@ -543,9 +663,8 @@ class AeroCalculator:
         C_M = self._safe_divide(
             M_final,
             denom_moment,
-            warn_msg=(
-                "动压(q) 或 参考长度 b_ref/c_ref 为零，相关轴的力矩系数已设为0。"
-            ),
+            warn_msg=_MOMENT_DENOM_WARNING,
+            warn=warn,
         )
 
         # 返回力和力矩的无量纲系数 (C_F, C_M)。
@@ -553,6 +672,186 @@ class AeroCalculator:
 
         return C_F, C_M
 
+    @staticmethod
+    def _safe_reciprocal(denominator) -> Tuple[np.ndarray, bool]:
+        """返回分母的倒数与是否存在零分母，零（接近零）分母对应的倒数置为 0。
+
+        与 `_safe_divide` 使用相同的零判定（`np.isclose(x, 0.0)`），保证融合算子与参考路径一致。
+        """
+        denom_arr = np.atleast_1d(np.array(denominator, dtype=float))
+        zero_mask = np.isclose(denom_arr, 0.0)
+        inv = np.zeros_like(denom_arr)
+        np.divide(1.0, denom_arr, out=inv, where=~zero_mask)
+        return inv, bool(np.any(zero_mask))
+
+    def _current_kernel_key(self) -> tuple:
+        """返回决定融合算子内容的几何/参考量快照，用于检测构造后被外部修改的情况。"""
+        tf = self.target_frame
+        return (
+            np.asarray(self.rotation_matrix, dtype=float).tobytes(),
+            np.asarray(self.r_target, dtype=float).tobytes(),
+            getattr(tf, "q", None),
+            getattr(tf, "s_ref", None),
+            getattr(tf, "b_ref", None),
+            getattr(tf, "c_ref", None),
+        )
+
+    def geometry_hash(self) -> str:
+        """当前几何与参考量的摘要（决定变换结果的全部参数），用作结果缓存键的一部分。
+
+        只依赖数值（旋转矩阵、力臂、Q/S/b/c），与 part 名称无关：
+        不同 part 解析为相同几何时得到相同摘要。
+        """
+        digest = hashlib.sha256()
+        for item in self._current_kernel_key():
+            digest.update(item if isinstance(item, bytes) else repr(item).encode())
+            digest.update(b"|")
+        return digest.hexdigest()
+
+    def _build_transform_kernel(self) -> np.ndarray:
+        """构造 (6,12) 融合算子 K，使得 [F|M] @ K == [F'|M'|C_F|C_M]（行向量约定）。
+
+        - F' = F·Rᵀ
+        - M' = M·Rᵀ + r × F' = M·Rᵀ + F·Rᵀ·[r]xᵀ（[r]x 为 r_target 的反对称矩阵）
+        - C_F / C_M 为对应列乘以预先计算的分母倒数（零分母列置 0，与 `_safe_divide` 一致）
+        """
+        R_t = np.asarray(self.rotation_matrix, dtype=float).T
+        skew_t = geometry.skew_symmetric_matrix(self.r_target).T
+
+        q = getattr(self.target_frame, "q", None)
+        s = getattr(self.target_frame, "s_ref", None)
+        b = getattr(self.target_frame, "b_ref", None)
+        c = getattr(self.target_frame, "c_ref", None)
+        denom_force = q * s
+        b_val = float(b) if (b is not None) else 0.0
+        c_val = float(c) if (c is not None) else 0.0
+        denom_moment = denom_force * np.array([b_val, c_val, b_val], dtype=float)
+
+        inv_force, force_zero = self._safe_reciprocal(denom_force)
+        inv_moment, moment_zero = self._safe_reciprocal(denom_moment)
+
+        kernel = np.zeros((6, 12), dtype=float)
+        kernel[0:3, 0:3] = R_t
+        kernel[0:3, 3:6] = R_t @ skew_t
+        kernel[3:6, 3:6] = R_t
+        kernel[:, 6:9] = kernel[:, 0:3] * inv_force
+        kernel[:, 9:12] = kernel[:, 3:6] * inv_moment
+
+        # 零分母警告在每次批量计算时发出（与参考路径逐次调用 `_safe_divide` 的行为保持一致）
+        warn_msgs: List[str] = []
+        if force_zero:
+            warn_msgs.append(_FORCE_DENOM_WARNING)
+        if moment_zero:
+            warn_msgs.append(_MOMENT_DENOM_WARNING)
+
+        self._kernel = kernel
+        self._kernel_key = self._current_kernel_key()
+        self._kernel_warnings = warn_msgs
+        # 按列的无量纲化倍率及零分母掩码：按行轴系旋转后需对旋转后的 F'/M' 重新无量纲化
+        self._coeff_scale = np.concatenate((np.full(3, inv_force), inv_moment))
+        self._coeff_zero = np.concatenate(
+            (np.full(3, force_zero), np.isclose(denom_moment, 0.0))
+        )
+        return kernel
+
+    def _get_transform_kernel(self) -> np.ndarray:
+        """返回当前有效的融合算子；若旋转矩阵/力臂/参考量在构造后被修改则重建。"""
+        if self._kernel is None or self._kernel_key != self._current_kernel_key():
+            logger.debug("检测到几何或参考量变化，重建融合变换算子")
+            return self._build_transform_kernel()
+        return self._kernel
+
+    @staticmethod
+    def _as_rows3(arr, name: str) -> np.ndarray:
+        """将输入规范为 (N,3) 的 float 数组（允许长度为 3 的单个向量）。"""
+        arr = np.asarray(arr, dtype=float)
+        if arr.ndim == 1:
+            if arr.size == 3:
+                return arr.reshape(1, 3)
+            raise ValueError(f"{name} 必须为形状 (N,3) 或长度为3 的向量")
+        return arr
+
+    def _process_batch_reference(
+        self, forces: np.ndarray, moments: np.ndarray, warn: bool = True
+    ) -> Dict[str, np.ndarray]:
+        """逐步实现的参考路径：旋转 -> 移轴 -> 无量纲化（多次遍历与临时数组）。
+
+        融合算子与该路径数值等价；保留它用于含 NaN/Inf 的输入行（保持原有的非有限值传播语义）
+        以及基准测试对比。warn=False 时不发出分母警告。
+        """
+        F_rotated = self._rotate_vectors(forces)
+        M_rotated = self._rotate_vectors(moments)
+        M_transfer = self._transfer_moments(F_rotated)
+
+        F_final = F_rotated
+        M_final = M_rotated + M_transfer
+
+        C_F, C_M = self._compute_coefficients(F_final, M_final, warn=warn)
+
+        return {
+            "force_transformed": F_final,
+            "moment_transformed": M_final,
+            "coeff_force": C_F,
+            "coeff_moment": C_M,
+        }
+
+    def process_stacked(
+        self, loads: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """使用融合算子批量计算。
+
+        输入:
+            loads: (N, 6) 数组，列顺序为 [Fx, Fy, Fz, Mx, My, Mz]
+            out: 可选的 (N, 12) C 连续 float64 数组，结果直接写入其中（不分配新数组）
+        输出:
+            (N, 12) 数组，列顺序为 [F'(3) | M'(3) | C_F(3) | C_M(3)]；传入 out 时返回 out
+        """
+        loads = np.asarray(loads, dtype=float)
+        if loads.ndim == 1 and loads.size == LOADS_WIDTH:
+            loads = loads.reshape(1, LOADS_WIDTH)
+        if loads.ndim != 2 or loads.shape[1] != LOADS_WIDTH:
+            raise ValueError("loads 必须为形状 (N,6) 的 [F|M] 数组")
+        if out is not None:
+            if not isinstance(out, np.ndarray) or out.dtype != np.float64:
+                raise TypeError("out 必须为 float64 的 numpy 数组")
+            if out.shape != (loads.shape[0], RESULT_WIDTH):
+                raise ValueError(
+                    f"out 形状必须为 ({loads.shape[0]}, {RESULT_WIDTH})，当前: {out.shape}"
+                )
+            if not out.flags.c_contiguous:
+                raise ValueError("out 必须为 C 连续数组")
+
+        kernel = self._get_transform_kernel()
+        for msg in self._kernel_warnings:
+            warnings.warn(msg, UserWarning)
+
+        with np.errstate(invalid="ignore", over="ignore"):
+            # 含非有限值的行会在下方由参考路径重算，此处无需为其发出浮点警告
+            out = np.matmul(loads, kernel, out=out)
+
+        # 矩阵乘法会把 NaN/Inf 扩散到同一行的所有输出列（0*NaN=NaN），
+        # 为保持参考路径的传播语义，仅对含非有限值的行回退到参考路径重算。
+        # 先用一次求和归约快速判断（有限值求和溢出只会触发精确检查，不影响正确性）。
+        if loads.size and not np.isfinite(loads.sum()):
+            bad_rows = ~np.isfinite(loads).all(axis=1)
+            if np.any(bad_rows):
+                self._recompute_rows_reference(loads, out, bad_rows)
+
+        return out
+
+    def _recompute_rows_reference(
+        self, loads: np.ndarray, out: np.ndarray, rows: np.ndarray
+    ) -> None:
+        """用参考路径重算 rows 指定的行并写回 out（用于含非有限值的输入行）。"""
+        # 分母警告已由调用方发出，避免重复；不修改全局警告过滤器（多线程下不安全）
+        ref = self._process_batch_reference(
+            loads[rows, 0:3], loads[rows, 3:6], warn=False
+        )
+        out[rows, 0:3] = ref["force_transformed"]
+        out[rows, 3:6] = ref["moment_transformed"]
+        out[rows, 6:9] = ref["coeff_force"]
+        out[rows, 9:12] = ref["coeff_moment"]
+
     def process_frame(
         self, force_raw: List[float], moment_raw: List[float]
     ) -> AeroResult:
@@ -570,50 +869,209 @@ class AeroCalculator:
         )
 
     def process_batch(
-        self, forces: np.ndarray, moments: np.ndarray
+        self,
+        forces: np.ndarray,
+        moments: np.ndarray,
+        out: Optional[Union[np.ndarray, ResultBuffer]] = None,
+        axis_rotations: Optional[np.ndarray] = None,
     ) -> Dict[str, np.ndarray]:
         """
         [新增] 高性能批处理方法
         输入:
             forces: (N, 3) Numpy Array
             moments: (N, 3) Numpy Array
+            out: 可选输出工作区：
+                - `ResultBuffer`：输入拼接区与结果区均复用，稳态下不分配新的大数组；
+                - (N, 12) C 连续 float64 数组：结果直接写入其中。
+            axis_rotations: 可选的 (N, 3, 3) 按行旋转矩阵（如 `geometry.body_to_axes_matrices`
+                由 Alpha/Beta 生成的体轴 -> 稳定轴/风轴旋转），在目标坐标系结果上逐行施加，
+                系数按旋转后的力/力矩重新无量纲化。
         输出:
-            Dictionary containing (N, 3) arrays
+            Dictionary containing (N, 3) arrays（为同一 (N,12) 结果数组的列视图）
         """
-        # 输入校验并强制为 numpy 数组
-        forces = np.asarray(forces, dtype=float)
-        moments = np.asarray(moments, dtype=float)
-
-        # 强制形状为 (N,3)
-        if forces.ndim == 1:
-            if forces.size == 3:
-                forces = forces.reshape(1, 3)
-            else:
-                raise ValueError("forces 必须为形状 (N,3) 或长度为3 的向量")
-        if moments.ndim == 1:
-            if moments.size == 3:
-                moments = moments.reshape(1, 3)
-            else:
-                raise ValueError("moments 必须为形状 (N,3) 或长度为3 的向量")
+        # 输入校验并强制为 (N,3) numpy 数组
+        forces = self._as_rows3(forces, "forces")
+        moments = self._as_rows3(moments, "moments")
 
         if forces.shape != moments.shape:
             raise ValueError("forces 与 moments 必须具有相同形状")
 
-        # 1. 批量旋转与移轴（提取为独立私有方法以便测试与复用）
-        F_rotated = self._rotate_vectors(forces)
-        M_rotated = self._rotate_vectors(moments)
-        M_transfer = self._transfer_moments(F_rotated)
+        if forces.ndim != 2 or forces.shape[1] != 3:
+            # 非 (N,3) 输入无法使用融合算子，交由参考路径处理（保持原有报错行为）
+            return self._process_batch_reference(forces, moments)
 
-        # 3. 结果汇总
-        F_final = F_rotated
-        M_final = M_rotated + M_transfer
+        # 旋转、移轴与无量纲化合并为一次 (N,6)@(6,12) 矩阵乘法
+        if isinstance(out, ResultBuffer):
+            loads, result = out.acquire(forces.shape[0])
+            loads[:, 0:3] = forces
+            loads[:, 3:6] = moments
+            result = self.process_stacked(loads, out=result)
+        else:
+            result = self.process_stacked(np.hstack((forces, moments)), out=out)
+
+        if axis_rotations is not None:
+            self._apply_axis_rotations(result, axis_rotations)
+
+        return _split_result_columns(result)
+
+    def _apply_axis_rotations(
+        self, result: np.ndarray, axis_rotations: np.ndarray
+    ) -> None:
+        """对 (N,12) 结果逐行施加 (N,3,3) 轴系旋转（原地），并重算系数列。"""
+        rotations = np.asarray(axis_rotations, dtype=float)
+        n = result.shape[0]
+        if rotations.shape != (n, 3, 3):
+            raise ValueError(
+                f"axis_rotations 形状必须为 ({n}, 3, 3)，当前: {rotations.shape}"
+            )
+        # 逐行矩阵-向量乘积用 einsum 计算（比 (N,3,3)@(N,3,1) 的批量 matmul 快约 2 倍）
+        result[:, 0:3] = np.einsum("nij,nj->ni", rotations, result[:, 0:3])
+        result[:, 3:6] = np.einsum("nij,nj->ni", rotations, result[:, 3:6])
+        np.multiply(result[:, 0:6], self._coeff_scale, out=result[:, 6:12])
+        if np.any(self._coeff_zero):
+            # 与 `_safe_divide` 一致：零分母列直接置 0（含非有限值行）
+            result[:, 6:12][:, self._coeff_zero] = 0.0
 
-        # 4. 无量纲化（使用选定的 target_frame）
-        C_F, C_M = self._compute_coefficients(F_final, M_final)
 
-        return {
-            "force_transformed": F_final,
-            "moment_transformed": M_final,
-            "coeff_force": C_F,
-            "coeff_moment": C_M,
-        }
+class MultiTargetResult:
+    """多目标计算结果：底层为一块 (K, N, 12) 数组，按目标惰性切片。
+
+    - `array`：完整的 (K, N, 12) 结果；
+    - `result[k]` / `result["Part"]` / `result[("Part", variant)]`：返回该目标的
+      process_batch 风格字典（均为 `array` 的视图，不复制）。
+    """
+
+    def __init__(self, array: np.ndarray, targets: List[Tuple[str, int]]):
+        self.array = array
+        self.targets = list(targets)
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def __iter__(self):
+        for idx in range(len(self.targets)):
+            yield self.targets[idx], self[idx]
+
+    def index_of(self, key: Union[int, str, Tuple[str, int]]) -> int:
+        """将目标键（序号、part 名或 (part, variant)）解析为第一维序号。"""
+        if isinstance(key, (int, np.integer)):
+            if not -len(self.targets) <= key < len(self.targets):
+                raise IndexError(f"目标序号越界: {key}")
+            return int(key) % len(self.targets)
+        if isinstance(key, str):
+            key = (key, 0)
+        try:
+            return self.targets.index(tuple(key))
+        except ValueError as exc:
+            raise KeyError(f"未找到目标 {key}，可用: {self.targets}") from exc
+
+    def __getitem__(self, key) -> Dict[str, np.ndarray]:
+        return _split_result_columns(self.array[self.index_of(key)])
+
+
+class MultiTargetCalculator:
+    """将同一 source 数据一次性变换到多个 target（part/variant）。
+
+    为每个目标构造一个 `AeroCalculator`（复用其校验、缓存与零分母处理），
+    再把各自的 (6,12) 融合算子堆叠为 (K,6,12)，一次广播矩阵乘法得到 (K,N,12) 结果，
+    避免对同一批载荷重复读取与旋转 K 次。`rotation_matrices` (K,3,3) 与
+    `lever_arms` (K,3) 为对应的几何量，便于检查与调试。
+    """
+
+    def __init__(
+        self,
+        project: ProjectData,
+        targets: Optional[List[Tuple[str, int]]] = None,
+        *,
+        source_part: Optional[str] = None,
+        source_variant: int = 0,
+        cache_provider: Optional[Any] = None,
+        cache_cfg: Optional[Any] = None,
+    ):
+        """
+        参数：
+        - project: 项目配置；
+        - targets: (part, variant) 列表，默认使用 `project.target_parts` 中的全部 part 与 variant；
+        - source_part/source_variant: 所有目标共用的 source 坐标系。
+        """
+        if not isinstance(project, ProjectData):
+            raise TypeError("MultiTargetCalculator 的第一个参数必须是 ProjectData")
+        if targets is None:
+            targets = [
+                (name, idx)
+                for name, variants in project.target_parts.items()
+                for idx in range(len(variants))
+            ]
+        if not targets:
+            raise ValueError("配置不包含任何 Target 坐标系定义")
+
+        self.targets: List[Tuple[str, int]] = [
+            (str(name), int(variant)) for name, variant in targets
+        ]
+        self.calculators: List[AeroCalculator] = [
+            AeroCalculator(
+                project,
+                source_part=source_part,
+                source_variant=source_variant,
+                target_part=name,
+                target_variant=variant,
+                cache_provider=cache_provider,
+                cache_cfg=cache_cfg,
+            )
+            for name, variant in self.targets
+        ]
+
+    @property
+    def rotation_matrices(self) -> np.ndarray:
+        """(K,3,3) 旋转矩阵堆叠。"""
+        return np.stack([np.asarray(c.rotation_matrix) for c in self.calculators])
+
+    @property
+    def lever_arms(self) -> np.ndarray:
+        """(K,3) 目标坐标系下的力臂堆叠。"""
+        return np.stack([np.asarray(c.r_target) for c in self.calculators])
+
+    def _stacked_kernels(self) -> np.ndarray:
+        """返回 (K,6,12) 融合算子堆叠，并发出各目标的零分母警告。"""
+        # pylint: disable=protected-access
+        kernels = np.stack([c._get_transform_kernel() for c in self.calculators])
+        for calc in self.calculators:
+            for msg in calc._kernel_warnings:
+                warnings.warn(msg, UserWarning)
+        return kernels
+
+    def process_stacked(self, loads: np.ndarray) -> np.ndarray:
+        """输入 (N,6) 的 [F|M]，返回 (K,N,12) 结果（第一维顺序与 `targets` 一致）。"""
+        loads = np.asarray(loads, dtype=float)
+        if loads.ndim == 1 and loads.size == LOADS_WIDTH:
+            loads = loads.reshape(1, LOADS_WIDTH)
+        if loads.ndim != 2 or loads.shape[1] != LOADS_WIDTH:
+            raise ValueError("loads 必须为形状 (N,6) 的 [F|M] 数组")
+
+        kernels = self._stacked_kernels()
+        with np.errstate(invalid="ignore", over="ignore"):
+            # 等价于 einsum("nj,kjm->knm")；广播 matmul 直接产出 C 连续的 (K,N,12) 且更快
+            out = np.matmul(loads, kernels)
+
+        # 与单目标路径一致：含非有限值的行逐目标回退到参考路径重算
+        if loads.size and not np.isfinite(loads.sum()):
+            bad_rows = ~np.isfinite(loads).all(axis=1)
+            if np.any(bad_rows):
+                # pylint: disable=protected-access
+                for idx, calc in enumerate(self.calculators):
+                    calc._recompute_rows_reference(loads, out[idx], bad_rows)
+        return out
+
+    def process_batch(
+        self, forces: np.ndarray, moments: np.ndarray
+    ) -> MultiTargetResult:
+        """输入 (N,3) 的力与力矩，返回按目标惰性切片的 `MultiTargetResult`。"""
+        forces = AeroCalculator._as_rows3(forces, "forces")
+        moments = AeroCalculator._as_rows3(moments, "moments")
+        if forces.shape != moments.shape:
+            raise ValueError("forces 与 moments 必须具有相同形状")
+        if forces.ndim != 2 or forces.shape[1] != 3:
+            raise ValueError("forces 与 moments 必须为形状 (N,3) 的数组")
+        return MultiTargetResult(
+            self.process_stacked(np.hstack((forces, moments))), self.targets
+        )
@@ -107,6 +107,44 @@ class TransformationPlugin(BasePlugin):
         raise NotImplementedError()
 
 
+class ChunkWriter:
+    """逐块写出会话：多次调用 write_chunk 追加数据块，close 完成文件，abort 放弃写入。
+
+    默认实现把数据块缓存在内存中，close 时合并为一份调用插件的 `write`；
+    支持真正流式写出的插件应重写 `OutputPlugin.open_writer` 返回自己的实现。
+    """
+
+    def __init__(self, plugin: "OutputPlugin", output_path: Path, **kwargs) -> None:
+        self.plugin = plugin
+        self.output_path = Path(output_path)
+        self.kwargs = kwargs
+        self._columns: Dict[str, List[np.ndarray]] = {}
+
+    def write_chunk(self, df) -> None:
+        """追加一个数据块（pandas.DataFrame，各块列名与顺序一致）"""
+        for col in df.columns:
+            self._columns.setdefault(str(col), []).append(df[col].to_numpy())
+
+    def close(self) -> None:
+        """完成写出"""
+        data = {name: np.concatenate(parts) for name, parts in self._columns.items()}
+        self._columns = {}
+        self.plugin.write(data, self.output_path, **self.kwargs)
+
+    def abort(self) -> None:
+        """放弃写出并释放资源（不删除目标文件，由调用方负责清理）"""
+        self._columns = {}
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
 class OutputPlugin(BasePlugin):
     """自定义输出格式插件"""
 
@@ -127,6 +165,10 @@ class OutputPlugin(BasePlugin):
         """获取支持的文件格式"""
         raise NotImplementedError()
 
+    def open_writer(self, output_path: Path, **kwargs) -> ChunkWriter:
+        """打开逐块写出会话（默认缓存全部数据块，close 时调用 write）"""
+        return ChunkWriter(self, output_path, **kwargs)
+
 
 class PluginRegistry:
     """插件注册表 - 管理所有已加载的插件"""
@@ -190,6 +232,19 @@ class PluginRegistry:
         """获取输出插件"""
         return self.output_plugins.get(name)
 
+    def get_output_plugin_for_format(self, fmt: str) -> Optional[OutputPlugin]:
+        """按格式名查找支持该格式的输出插件（后注册者优先）"""
+        fmt = str(fmt).lower()
+        for plugin in reversed(list(self.output_plugins.values())):
+            try:
+                formats = [str(f).lower() for f in plugin.get_supported_formats()]
+            except Exception:  # pylint: disable=broad-except
+                logger.debug("读取输出插件支持的格式失败", exc_info=True)
+                continue
+            if fmt in formats:
+                return plugin
+        return None
+
     def list_plugins(self, plugin_type: Optional[str] = None) -> List[str]:
         """列出所有插件"""
         if plugin_type == "coord_system":
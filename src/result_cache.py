@@ -0,0 +1,204 @@
+"""
+结果缓存 - 按内容寻址，输入与几何未变时直接复用上次的输出文件
+
+缓存键由四部分组成：
+1. 输入文件内容哈希（`src.file_cache.get_file_hash`，按 stat 校验）；
+2. 解析后的 Source/Target 几何摘要（`AeroCalculator.geometry_hash`，与 part 名称无关）；
+3. 影响输出内容的选项（跳过行数、非数值策略、输出轴系、格式与行选择）；
+4. `RESULT_FORMAT_VERSION`，输出内容的写法（列、数值格式等）变化后旧条目自动失效。
+
+输出文件名模板、时间戳与覆盖策略只影响输出位置，块大小只影响读取方式（输出内容相同），
+均不参与缓存键。
+
+缓存条目为本地目录下以缓存键命名的文件；总大小超过预算时按最近使用时间（mtime，
+命中时刷新）淘汰最旧条目（`src.disk_cache`）。命中时默认复制到目标位置，可选硬链接（同一文件系统上
+零拷贝，但输出与缓存条目共享数据，不应就地修改输出）。
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.disk_cache import DiskCacheManager, DiskLruCache
+from src.file_cache import get_file_hash
+
+logger = logging.getLogger(__name__)
+
+# 输出内容的写法（列、数值格式等）变化时递增，使旧条目失效
+RESULT_FORMAT_VERSION = 1
+# 默认缓存大小预算（MB）
+DEFAULT_RESULT_CACHE_MAX_MB = 1024.0
+# 参与缓存键的输出选项（BatchConfig 属性名）
+RESULT_OPTION_KEYS = (
+    "skip_rows",
+    "treat_non_numeric",
+    "axis_frame",
+    "output_format",
+)
+
+
+def result_cache_key(
+    input_hash: str, geometry_hash: str, options: Dict
+) -> Optional[str]:
+    """由输入内容哈希、几何摘要、输出选项与输出格式版本生成缓存键；任一哈希缺失时返回 None"""
+    if not input_hash or not geometry_hash:
+        return None
+    payload = json.dumps(
+        {
+            "input": input_hash,
+            "geometry": geometry_hash,
+            "options": options,
+            "version": RESULT_FORMAT_VERSION,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def output_options(cfg, selected_rows=None) -> Dict:
+    """提取 BatchConfig 中影响输出内容的选项（行选择按排序后的列表）"""
+    options = {key: getattr(cfg, key, None) for key in RESULT_OPTION_KEYS}
+    options["selected_rows"] = (
+        sorted(int(x) for x in selected_rows) if selected_rows else None
+    )
+    return options
+
+
+def file_result_key(file_path, cfg, calculator, selected_rows=None) -> Optional[str]:
+    """单个输入文件的缓存键；无法计算输入哈希或几何摘要时返回 None"""
+    geometry_hash = getattr(calculator, "geometry_hash", None)
+    if not callable(geometry_hash):
+        return None
+    input_hash = get_file_hash(str(file_path))
+    try:
+        geometry = geometry_hash()
+    except Exception:  # pylint: disable=broad-except
+        logger.debug("无法计算几何摘要: %s", file_path, exc_info=True)
+        return None
+    return result_cache_key(input_hash, geometry, output_options(cfg, selected_rows))
+
+
+class ResultCache(DiskLruCache):
+    """本地磁盘上的结果缓存，带大小预算与 LRU 淘汰（见 `src.disk_cache`）。
+
+    同一目录可被多个进程共享。
+    """
+
+    def __init__(
+        self,
+        cache_dir,
+        max_bytes: int = int(DEFAULT_RESULT_CACHE_MAX_MB * 1024 * 1024),
+        use_hardlinks: bool = False,
+    ):
+        super().__init__(cache_dir, max_bytes)
+        self.use_hardlinks = bool(use_hardlinks)
+
+    def _entry_path(self, key: str) -> Path:
+        # 键已包含输出格式，条目无需扩展名
+        return self.cache_dir / key
+
+    def lookup(self, key: str) -> bool:
+        """条目是否存在；不存在时计为一次未命中"""
+        if key and self._entry_path(key).is_file():
+            return True
+        self._count("misses")
+        return False
+
+    def fetch(self, key: str, dest: Path) -> bool:
+        """命中时把缓存条目复制（或硬链接）到 dest 并返回 True"""
+        entry = self._entry_path(key) if key else None
+        if entry is None or not entry.is_file():
+            self._count("misses")
+            return False
+        dest = Path(dest)
+        try:
+            if dest.exists():
+                dest.unlink()
+            linked = False
+            if self.use_hardlinks:
+                try:
+                    os.link(entry, dest)
+                    linked = True
+                except OSError:
+                    logger.debug("硬链接失败，改为复制: %s", entry, exc_info=True)
+            if not linked:
+                shutil.copyfile(entry, dest)
+            self._touch(entry)
+        except OSError:
+            logger.debug("读取结果缓存条目失败: %s", entry, exc_info=True)
+            self._count("misses")
+            return False
+        self._count("hits")
+        return True
+
+    def store(self, key: str, src: Path) -> bool:
+        """把输出文件存入缓存（原子写入），随后按预算淘汰；成功返回 True"""
+        if not key:
+            return False
+        src = Path(src)
+        try:
+            size = src.stat().st_size
+            if size > self.max_bytes:
+                return False
+            fd, tmp_name = self._temp_entry(key)
+            os.close(fd)
+            try:
+                shutil.copyfile(src, tmp_name)
+                os.replace(tmp_name, self._entry_path(key))
+            except OSError:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.debug("写入结果缓存失败: %s", src, exc_info=True)
+            return False
+        self._count("stores")
+        self.evict()
+        return True
+
+    def stats(self) -> Dict:
+        """命中/未命中/写入/淘汰计数与命中率"""
+        stats = super().stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        return stats
+
+
+class ResultCacheManager(DiskCacheManager):
+    """按 (目录, 预算, 硬链接) 管理每个进程内共享的 `ResultCache` 实例。"""
+
+    cache_class = ResultCache
+
+
+_RESULT_CACHE_MANAGER = ResultCacheManager()
+
+
+def get_result_cache(cfg) -> Optional[ResultCache]:
+    """按 BatchConfig 的 result_cache_dir / result_cache_max_mb 返回缓存实例；未启用时返回 None"""
+    cache_dir = getattr(cfg, "result_cache_dir", None)
+    if not cache_dir:
+        return None
+    max_mb = getattr(cfg, "result_cache_max_mb", None) or DEFAULT_RESULT_CACHE_MAX_MB
+    return _RESULT_CACHE_MANAGER.get(
+        cache_dir,
+        int(float(max_mb) * 1024 * 1024),
+        bool(getattr(cfg, "result_cache_hardlink", False)),
+    )
+
+
+def summarize_cache_events(results) -> Optional[Dict]:
+    """由每文件结果记录中的 cache 字段（hit/miss）汇总命中率；无缓存查询时返回 None"""
+    events = [r.get("cache") for r in results if r.get("cache") in ("hit", "miss")]
+    if not events:
+        return None
+    hits = events.count("hit")
+    return {
+        "hits": hits,
+        "misses": len(events) - hits,
+        "hit_rate": round(hits / len(events), 4),
+    }
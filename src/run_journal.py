@@ -0,0 +1,264 @@
+"""
+批处理运行日志（run journal）- 支持中断后的续跑
+
+在输出目录下以追加写入的 JSONL 文件记录每个输入文件的处理结果：
+- 内容指纹（大小、mtime_ns 与 SHA-256）；
+- 配置哈希（批处理格式配置、项目配置与文件级覆盖参数）；
+- 输出文件路径与状态（complete / failed）。
+
+续跑（resume）时，同一输入若最后一条记录为 complete、配置哈希一致、输出文件仍存在
+且内容指纹未变，则跳过该文件。大小与 mtime_ns 均未变时直接视为内容未变；
+仅 mtime 变化时重新计算 SHA-256 比对，避免“touch”或复制导致的无谓重算。
+
+日志为追加写入且每条记录落盘后 fsync，进程崩溃最多丢失最后一条不完整的行，
+读取时忽略无法解析的行。
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = ".batch_journal.jsonl"
+STATUS_COMPLETE = "complete"
+STATUS_FAILED = "failed"
+# 计算内容摘要时的读取块大小
+DIGEST_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass
+class FileFingerprint:
+    """输入文件指纹；sha256 为 None 表示仅有 stat 信息"""
+
+    size: int
+    mtime_ns: int
+    sha256: Optional[str] = None
+
+    def same_stat(self, other: "FileFingerprint") -> bool:
+        return self.size == other.size and self.mtime_ns == other.mtime_ns
+
+
+def stat_fingerprint(file_path) -> Optional[FileFingerprint]:
+    """只取 stat 信息的指纹；文件不存在或不可访问时返回 None"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return FileFingerprint(size=st.st_size, mtime_ns=st.st_mtime_ns)
+
+
+def content_digest(file_path, block_size: int = DIGEST_BLOCK_SIZE) -> str:
+    """按块流式计算文件内容的 SHA-256"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as fh:
+        for block in iter(lambda: fh.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fingerprint_file(file_path) -> Optional[FileFingerprint]:
+    """stat 信息加内容摘要；文件不可读时返回 None"""
+    fp = stat_fingerprint(file_path)
+    if fp is None:
+        return None
+    try:
+        fp.sha256 = content_digest(file_path)
+    except OSError:
+        return None
+    return fp
+
+
+def _json_default(obj):
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    tolist = getattr(obj, "tolist", None)
+    if callable(tolist):
+        return tolist()
+    if hasattr(obj, "__dict__"):
+        # 普通配置对象（如 BatchConfig）按属性序列化，避免 repr 中的内存地址
+        return vars(obj)
+    return str(obj)
+
+
+def config_hash(*parts) -> str:
+    """对若干可 JSON 化的配置片段计算稳定哈希（键排序，集合按排序后的列表）"""
+    payload = json.dumps(
+        list(parts), sort_keys=True, ensure_ascii=False, default=_json_default
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _journal_key(file_path) -> str:
+    try:
+        return str(Path(file_path).resolve())
+    except OSError:
+        return str(Path(file_path).absolute())
+
+
+class RunJournal:
+    """输出目录下的追加式运行日志；同一输入以最后一条记录为准。
+
+    record/load 可在多个线程中调用（流水线写出线程与主线程），内部以锁串行化。
+    """
+
+    def __init__(self, output_dir, filename: str = JOURNAL_FILENAME):
+        self.path = Path(output_dir) / filename
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+
+    def load(self) -> Dict[str, dict]:
+        """读取日志，返回 {输入文件绝对路径: 最后一条记录}"""
+        entries: Dict[str, dict] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                for line in fh:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        # 崩溃时可能留下半行，忽略即可
+                        logger.debug("忽略无法解析的日志行: %s", self.path)
+                        continue
+                    if isinstance(rec, dict) and rec.get("input"):
+                        entries[rec["input"]] = rec
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("无法读取运行日志 %s: %s", self.path, e)
+        with self._lock:
+            self._entries = entries
+        return entries
+
+    def _append(self, rec: dict) -> None:
+        line = json.dumps(rec, ensure_ascii=False) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as fh:
+                fh.write(line)
+                fh.flush()
+                os.fsync(fh.fileno())
+            if self._entries is not None:
+                self._entries[rec["input"]] = rec
+
+    def record(
+        self,
+        input_path,
+        *,
+        status: str,
+        cfg_hash: str,
+        fingerprint: Optional[FileFingerprint] = None,
+        outputs: Iterable = (),
+        error: Optional[str] = None,
+    ) -> dict:
+        """追加一条记录并返回该记录"""
+        rec = {
+            "input": _journal_key(input_path),
+            "status": status,
+            "config_hash": cfg_hash,
+            "size": fingerprint.size if fingerprint else None,
+            "mtime_ns": fingerprint.mtime_ns if fingerprint else None,
+            "sha256": fingerprint.sha256 if fingerprint else None,
+            "outputs": [str(p) for p in outputs],
+            "error": error,
+            "recorded_at": datetime.now().isoformat(),
+        }
+        try:
+            self._append(rec)
+        except OSError as e:
+            # 日志写失败不影响批处理本身，仅失去续跑能力
+            logger.warning("无法写入运行日志 %s: %s", self.path, e)
+        return rec
+
+    def record_outcome(
+        self,
+        input_path,
+        cfg_hash: str,
+        ok: bool,
+        *,
+        outputs: Iterable = (),
+        error: Optional[str] = None,
+        planned: Optional[FileFingerprint] = None,
+    ) -> dict:
+        """记录单个文件的处理结果。
+
+        成功时计算内容指纹；planned 为处理开始前的 stat 指纹，
+        若处理期间输入被修改则记为失败，续跑时会重新处理。
+        """
+        if not ok:
+            return self.record(
+                input_path,
+                status=STATUS_FAILED,
+                cfg_hash=cfg_hash,
+                fingerprint=stat_fingerprint(input_path),
+                outputs=outputs,
+                error=error,
+            )
+        fp = fingerprint_file(input_path)
+        if fp is None or (planned is not None and not fp.same_stat(planned)):
+            return self.record(
+                input_path,
+                status=STATUS_FAILED,
+                cfg_hash=cfg_hash,
+                fingerprint=fp,
+                outputs=outputs,
+                error="输入文件在处理期间被修改或不可读",
+            )
+        return self.record(
+            input_path,
+            status=STATUS_COMPLETE,
+            cfg_hash=cfg_hash,
+            fingerprint=fp,
+            outputs=outputs,
+        )
+
+    def recorded_outputs(self, input_path) -> List[str]:
+        """日志中该输入最后一条记录的输出路径（无记录时为空列表）"""
+        if self._entries is None:
+            self.load()
+        rec = (self._entries or {}).get(_journal_key(input_path)) or {}
+        return list(rec.get("outputs") or [])
+
+    def is_complete(self, input_path, cfg_hash: str) -> bool:
+        """输入是否已以相同配置与内容处理完成且输出仍存在"""
+        if self._entries is None:
+            self.load()
+        rec = (self._entries or {}).get(_journal_key(input_path))
+        if not rec or rec.get("status") != STATUS_COMPLETE:
+            return False
+        if rec.get("config_hash") != cfg_hash:
+            return False
+        outputs = rec.get("outputs") or []
+        if not outputs or not all(Path(p).exists() for p in outputs):
+            return False
+        current = stat_fingerprint(input_path)
+        if current is None or current.size != rec.get("size"):
+            return False
+        if current.mtime_ns == rec.get("mtime_ns"):
+            return True
+        try:
+            return content_digest(input_path) == rec.get("sha256")
+        except OSError:
+            return False
+
+    def partition(self, items: Iterable, key_and_hash) -> Tuple[List, List]:
+        """按是否已完成划分待处理项，返回 (pending, skipped)。
+
+        key_and_hash(item) 返回 (输入路径, 配置哈希)。
+        """
+        pending, skipped = [], []
+        for item in items:
+            path, cfg_hash = key_and_hash(item)
+            (skipped if self.is_complete(path, cfg_hash) else pending).append(item)
+        return pending, skipped
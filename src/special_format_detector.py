@@ -3,41 +3,97 @@
 负责判断文件是否为特殊格式，以及识别文件中的元数据/表头/数据/part 名行。
 """
 
+import codecs
 import logging
 import re
+from itertools import islice
 from pathlib import Path
 from typing import List, Optional
 
+from src.file_cache import get_file_cache
+
 logger = logging.getLogger(__name__)
 
 # 推荐/支持的扩展名常量
 RECOMMENDED_EXT = ".mtfmt"
 SUPPORTED_EXTS = {".mtfmt", ".mtdata", ".txt", ".dat"}
 
+# 编码探测最多读取的前缀字节数
+ENCODING_SNIFF_BYTES = 64 * 1024
+# 探测结果在 FileCache 元数据中的键名
+ENCODING_METADATA_KEY = "text_encoding"
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
 
-def _read_text_file_lines(
-    file_path: Path,
-    *,
-    max_lines: Optional[int] = None,
-    encodings: Optional[List[str]] = None,
-) -> List[str]:
-    """尝试以多种编码读取文本文件，返回行列表。
 
-    - 默认先尝试 `utf-8`，若失败依次尝试 `gbk` 和 `latin-1`。
-    - max_lines: 若指定则只返回前若干行（用于探测）。
+def sniff_encoding_bytes(sample: bytes, *, complete: bool = True) -> str:
+    """由字节样本判定文本编码：BOM → 严格 utf-8 → gbk → latin-1。
+
+    - complete=False 表示样本是截断的文件前缀，末尾不完整的多字节字符不视为解码错误；
+    - UTF-16 BOM 仅在样本中出现 NUL 字节时采信（UTF-16 文本的换行/ASCII 必含 NUL），
+      避免把以 0xFF 0xFE 开头的单字节文件误判为 UTF-16。
     """
-    # 类型声明：encodings 可选且为字符串列表
+    for bom, enc in _BOMS:
+        if sample.startswith(bom):
+            if enc != "utf-16" or b"\x00" in sample[len(bom) :]:
+                return enc
+    for enc in ("utf-8", "gbk"):
+        try:
+            codecs.getincrementaldecoder(enc)("strict").decode(sample, final=complete)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return "latin-1"
+
+
+def sniff_encoding(file_path: Path) -> str:
+    """探测文本文件编码，只读取前 ENCODING_SNIFF_BYTES 字节。
+
+    结果存入 `FileCache` 元数据（键含路径、mtime 与大小），文件未变时不再读取。
+    文件不存在时抛出 FileNotFoundError。
+    """
+    p = Path(file_path)
+    cache = get_file_cache()
+    cached = cache.get_metadata(p, ENCODING_METADATA_KEY)
+    if cached:
+        return cached
+    with open(p, "rb") as fh:
+        sample = fh.read(ENCODING_SNIFF_BYTES + 1)
+    complete = len(sample) <= ENCODING_SNIFF_BYTES
+    enc = sniff_encoding_bytes(sample[:ENCODING_SNIFF_BYTES], complete=complete)
+    cache.set_metadata(p, ENCODING_METADATA_KEY, enc)
+    return enc
+
+
+def _fallback_encodings(sniffed: str) -> List[str]:
+    """探测结果之后的回退顺序：前缀之后仍可能出现无法解码的字节"""
+    order = [sniffed]
+    if sniffed in ("utf-8", "utf-8-sig"):
+        order.append("gbk")
+    if sniffed != "latin-1":
+        order.append("latin-1")
+    return order
+
+
+def _read_with_encodings(file_path: Path, encodings: Optional[List[str]], read):
+    """依次以候选编码打开文件并调用 read(fh)，返回第一个成功解码的结果。
+
+    未指定 encodings 时先用 `sniff_encoding` 的探测结果，只有前缀之后出现解码错误
+    才回退到后续编码，并把成功的编码写回缓存。
+    """
+    sniffed = None
     if encodings is None:
-        encodings = ["utf-8", "gbk", "latin-1"]
+        sniffed = sniff_encoding(file_path)
+        encodings = _fallback_encodings(sniffed)
 
     last_exc = None
     for enc in encodings:
         try:
             with open(file_path, "r", encoding=enc, errors="strict") as fh:
-                if max_lines is None:
-                    return fh.readlines()
-                # 读取全部并截取前若干行以避免产生空字符串占位
-                return fh.readlines()[:max_lines]
+                result = read(fh)
         except UnicodeDecodeError as e:
             last_exc = e
             logger.debug("尝试以编码 %s 读取文件失败，切换下一编码", enc)
@@ -48,13 +104,14 @@ def _read_text_file_lines(
             # 对于其他 I/O 错误，记录并重新抛出
             logger.debug("读取文件时遇到 I/O 错误: %s", e)
             raise
+        if sniffed is not None and enc != sniffed:
+            get_file_cache().set_metadata(Path(file_path), ENCODING_METADATA_KEY, enc)
+        return result
 
     # 最后保险回退：使用 latin-1 并允许替换不可解码字节
     try:
         with open(file_path, "r", encoding="latin-1", errors="replace") as fh:
-            if max_lines is None:
-                return fh.readlines()
-            return fh.readlines()[:max_lines]
+            return read(fh)
     except OSError as e:
         # 若此前有解码错误，优先抛出该错误以便上层判断编码问题
         if last_exc:
@@ -62,6 +119,43 @@ def _read_text_file_lines(
         raise
 
 
+def _read_text_file_lines(
+    file_path: Path,
+    *,
+    max_lines: Optional[int] = None,
+    encodings: Optional[List[str]] = None,
+) -> List[str]:
+    """读取文本文件，返回行列表。
+
+    - 默认按字节前缀探测编码（见 `sniff_encoding`），失败时依次回退到 `gbk`、`latin-1`；
+    - encodings 指定时按给定顺序尝试；
+    - max_lines: 若指定则只读取并返回前若干行（用于探测）。
+    """
+    if max_lines is None:
+        return _read_with_encodings(file_path, encodings, lambda fh: fh.readlines())
+    return _read_with_encodings(
+        file_path, encodings, lambda fh: list(islice(fh, max_lines))
+    )
+
+
+def _read_text_file(file_path: Path, *, encodings: Optional[List[str]] = None) -> str:
+    """以与 `_read_text_file_lines` 相同的编码规则读取整个文本文件，返回字符串。
+
+    换行按通用换行规则统一为 "\n"，供单次扫描的解析器直接在整段文本上定位数据块。
+    """
+    return _read_with_encodings(file_path, encodings, lambda fh: fh.read())
+
+
+def _consume_text_file(
+    file_path: Path, consume, *, encodings: Optional[List[str]] = None
+):
+    """以与 `_read_text_file` 相同的编码规则打开文件，交给 consume(fh) 增量读取并返回其结果。
+
+    前缀之后出现解码错误时以下一候选编码重新打开并再次调用 consume，consume 须从头处理。
+    """
+    return _read_with_encodings(file_path, encodings, consume)
+
+
 def _tokens_looks_like_header(tokens: List[str]) -> bool:
     """判断一组 token 是否像表头（包含 Alpha/CL/CD/Cm/Cx/Cy/Cz 等关键词）。"""
     if not tokens:
@@ -200,6 +294,9 @@ def looks_like_special_format(file_path: Path, *, max_probe_lines: int = 20) ->
 __all__ = [
     "RECOMMENDED_EXT",
     "SUPPORTED_EXTS",
+    "ENCODING_SNIFF_BYTES",
+    "sniff_encoding",
+    "sniff_encoding_bytes",
     "is_metadata_line",
     "is_summary_line",
     "is_data_line",
@@ -10,7 +10,9 @@
 
 # pylint: disable=wrong-import-position
 
+import io
 import logging
+import mmap
 import re
 import sys
 
@@ -21,22 +23,45 @@ _ROOT = Path(__file__).resolve().parent.parent
 if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
-from typing import Dict, List, Optional, Tuple  # noqa: E402
+from dataclasses import dataclass, field  # noqa: E402
+from typing import Dict, List, NamedTuple, Optional, Tuple  # noqa: E402
 
+import numpy as np  # noqa: E402
 import pandas as pd  # noqa: E402
 
+from src.file_cache import get_file_cache  # noqa: E402
 from src.special_format_detector import (  # noqa: E402
+    _consume_text_file,
     _read_text_file_lines,
     _tokens_looks_like_header,
     is_data_line,
     is_metadata_line,
     is_part_name_line,
     is_summary_line,
+    sniff_encoding,
 )
 
 logger = logging.getLogger(__name__)
 # 在调整 sys.path 后才导入本地模块，允许导入位置非顶层的检查
 
+# 连续的“行首为数字”的行：单次扫描时以此定位各 part 的数值块
+_DATA_RUN_RE = re.compile(r"(?:^[ \t]*[-+]?\.?\d[^\n]*(?:\n|\Z))+", re.M)
+# 除制表符与换行外的 ASCII 控制字符
+_CONTROL_CHAR_RE = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+# 大数值块按约该字符数分段批量转换，限制临时数组的内存
+BULK_PARSE_CHARS = 4 * 1024 * 1024
+# 字节级的数值行块（建立 part 偏移索引时使用，与 _DATA_RUN_RE 同义）
+_DATA_RUN_BYTES_RE = re.compile(rb"(?:^[ \t]*[-+]?\.?\d[^\n]*(?:\n|\Z))+", re.M)
+# 首个 token 不是普通十进制数的行（此类行需逐行判定，如 "1abc" 可能是 part 名）
+_NOT_PLAIN_NUMBER_LINE_RE = re.compile(
+    rb"^(?!\Z)[ \t]*(?![-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?(?:[ \t\r]|$))",
+    re.M,
+)
+# 换行字节固定为 0x0A 的编码（gbk 多字节字符的尾字节不会是 0x0A），可按字节偏移切分
+_BYTE_INDEXABLE_ENCODINGS = {"utf-8", "utf-8-sig", "gbk", "latin-1"}
+# part 偏移索引在 FileCache 元数据中的键名
+PART_INDEX_METADATA_KEY = "part_index"
+
 
 def _normalize_column_mapping(columns: List[str]) -> Dict[str, str]:
     """为给定列名列表返回一个从原始列名到标准列名的映射。
@@ -79,6 +104,24 @@ def _normalize_column_mapping(columns: List[str]) -> Dict[str, str]:
     return mapping
 
 
+def _build_part_frame(header: List[str], rows: List[List[str]]) -> pd.DataFrame:
+    """由表头与原始数据行构建 DataFrame：列名规范化并逐列转换为数值。"""
+    df = pd.DataFrame(rows, columns=header)
+    col_map = _normalize_column_mapping(list(df.columns))
+    df = df.rename(columns=col_map)
+    for col in df.columns:
+        try:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+        except (TypeError, ValueError) as exc:
+            logger.debug(
+                "列 %s 转换为数值失败，保留原始值: %s",
+                col,
+                exc,
+                exc_info=True,
+            )
+    return df
+
+
 def _finalize_part(
     current_part, current_header, current_data, result: Dict[str, pd.DataFrame]
 ):
@@ -86,101 +129,335 @@ def _finalize_part(
     if not (current_part and current_header and current_data):
         return
     try:
-        df = pd.DataFrame(current_data, columns=current_header)
-        col_map = _normalize_column_mapping(list(df.columns))
-        df = df.rename(columns=col_map)
-        for col in df.columns:
-            try:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-            except (TypeError, ValueError) as exc:
-                logger.debug(
-                    "列 %s 转换为数值失败，保留原始值: %s",
-                    col,
-                    exc,
-                    exc_info=True,
-                )
+        df = _build_part_frame(current_header, current_data)
         result[current_part] = df
         logger.info("解析 part '%s': %d 行数据", current_part, len(df))
     except ValueError as e:
         logger.warning("创建 DataFrame 失败 (part=%s): %s", current_part, e)
 
 
-def _extract_parts_from_lines(
-    lines: List[str], file_path: Path
-) -> Dict[str, Tuple[Optional[List[str]], List[List[str]]]]:
-    """从文本行中提取每个 part 的表头和原始数据行。
+class SpecialFormatLineParser:
+    """特殊格式的增量行解析器，保存跨调用的解析状态。
 
-    返回字典: part_name -> (header_tokens, list_of_rows)
+    状态包括当前 part、当前表头与各 part 已解析的数据行。part 名行的判定需要
+    看下一行（是否为表头），因此非数据行会暂存到下一行到达后再处理；数据行的
+    判定与下一行无关，到达即解析。`feed` 可被多次调用（如跟踪不断追加的文件），
+    `finish` 处理最后暂存的行，结果与一次性解析全部行相同。
     """
-    extracted_parts: Dict[str, Tuple[Optional[List[str]], List[List[str]]]] = {}
-    current_part = None
-    current_header = None
-    current_data: List[List[str]] = []
 
-    for idx, raw in enumerate(lines):
-        line = raw.strip()
-        if not line or is_metadata_line(line):
-            continue
-
-        next_line = lines[idx + 1].strip() if idx + 1 < len(lines) else None
+    def __init__(self, file_path=None) -> None:
+        self.file_path = file_path
+        # part_name -> (header_tokens, rows)；同名 part 再次出现时以最后一块为准
+        self.parts: Dict[str, Tuple[Optional[List[str]], List[List[str]]]] = {}
+        self.current_part: Optional[str] = None
+        self.current_header: Optional[List[str]] = None
+        self._pending: Optional[str] = None
+        self._new_rows: Dict[str, List[List[str]]] = {}
+
+    def feed(self, lines) -> Dict[str, List[List[str]]]:
+        """解析若干完整的文本行，返回本次新增的数据行 {part_name: rows}。"""
+        for raw in lines:
+            line = raw.strip()
+            self.resolve_pending(line)
+            if not line or is_metadata_line(line):
+                continue
+            if is_data_line(line):
+                # 数据行不可能是 part 名，无需等待下一行
+                self._consume(line, None)
+            else:
+                self._pending = line
+        return self._take_new_rows()
+
+    def finish(self) -> Dict[str, List[List[str]]]:
+        """处理暂存的最后一行（其后没有下一行），返回新增的数据行。"""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self._consume(pending, None)
+        return self._take_new_rows()
+
+    def resolve_pending(self, next_line: str) -> None:
+        """以 next_line 作为下一行处理暂存行（next_line 本身不被解析）。
+
+        供调用方自行处理紧随其后的数据行时使用：数据行不会成为暂存行，
+        处理完暂存行后状态与逐行送入时一致。
+        """
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self._consume(pending, next_line.strip())
+
+    def build_frame(
+        self, part_name: str, rows: List[List[str]]
+    ) -> Optional[pd.DataFrame]:
+        """按 part 当前表头把原始数据行构建为 DataFrame（无表头或无数据时返回 None）"""
+        header = self.parts.get(part_name, (None, []))[0]
+        if not header or not rows:
+            return None
+        return _build_part_frame(header, rows)
+
+    def _take_new_rows(self) -> Dict[str, List[List[str]]]:
+        new_rows, self._new_rows = self._new_rows, {}
+        return new_rows
+
+    def _consume(self, line: str, next_line: Optional[str]) -> None:
         if is_part_name_line(line, next_line):
             # 切换 part
-            if current_part:
-                extracted_parts[current_part] = (current_header, current_data)
-            current_part = line.strip()
-            current_header = None
-            current_data = []
-            continue
+            self.current_part = line
+            self.current_header = None
+            self.parts[line] = (None, [])
+            return
 
-        if current_part and current_header is None:
+        part = self.current_part
+        if part and self.current_header is None:
             tokens = line.split()
             if _tokens_looks_like_header(tokens):
-                current_header = tokens
-                continue
+                self.current_header = tokens
+                self.parts[part] = (tokens, self.parts[part][1])
+                return
 
-        if current_part and current_header and is_data_line(line):
+        if part and self.current_header and is_data_line(line):
             tokens = line.split()
-            if len(tokens) == len(current_header):
-                current_data.append([t.strip() for t in tokens])
+            if len(tokens) == len(self.current_header):
+                row = [t.strip() for t in tokens]
+                self.parts[part][1].append(row)
+                self._new_rows.setdefault(part, []).append(row)
             else:
                 logger.debug(
                     "跳过数据行（列数不匹配）：file=%s part=%s expected=%d got=%d line=%r",
-                    file_path,
-                    current_part,
-                    len(current_header),
+                    self.file_path,
+                    part,
+                    len(self.current_header),
                     len(tokens),
                     line,
                 )
-            continue
+        # 其余（汇总行等）忽略
 
-        if is_summary_line(line):
-            continue
 
-    # 结束时保存最后一个 part
-    if current_part:
-        extracted_parts[current_part] = (current_header, current_data)
+class _NumericBlock(NamedTuple):
+    """批量转换得到的数值块及其整数列标记（该列全部 token 为整数字面量）"""
+
+    values: np.ndarray
+    int_columns: np.ndarray
+
+
+def _is_int_token(tokens) -> np.ndarray:
+    """逐元素判断 token 是否为整数字面量（可带正负号，如 "-3"、"+7"）"""
+    return np.char.isdigit(np.char.lstrip(np.asarray(tokens, dtype=str), "+-"))
+
+
+def _integer_columns(block: str, values: np.ndarray) -> np.ndarray:
+    """数值块中全部 token 为整数字面量的列（与逐列 `pd.to_numeric` 推断为整型的列一致）。
+
+    只有取值全为整数的列才检查原始 token：先看首行快速排除 "2.00" 之类的列，
+    剩余列再整块读取为字符串逐一确认。
+    """
+    mask = np.all(
+        np.isfinite(values) & (values == np.trunc(values)) & (np.abs(values) < 2**63),
+        axis=0,
+    )
+    cands = np.flatnonzero(mask)
+    if cands.size:
+        first = block.split("\n", 1)[0].split()
+        cands = cands[_is_int_token([first[i] for i in cands])]
+        mask[:] = False
+    if cands.size:
+        tokens = np.loadtxt(
+            io.StringIO(block), dtype=str, comments=None, usecols=cands, ndmin=2
+        )
+        mask[cands] = _is_int_token(tokens).all(axis=0)
+    return mask
+
+
+def _bulk_parse_block(block: str, ncols: int) -> Optional[_NumericBlock]:
+    """把一段连续数据行一次性转换为 (行数, ncols) 的 float64 数组，并标记整数列。
+
+    任一行列数不符、含非 ASCII/控制字符或含无法解析为浮点数的 token 时返回 None，
+    由调用方回退到逐行解析（逐行解析会跳过列数不符的行）。
+    """
+    if not block or not block.isascii():
+        return None
+    # 仅以空格/制表符/换行分隔；其他控制字符在 str.split 中也算空白，交给逐行解析
+    if _CONTROL_CHAR_RE.search(block):
+        return None
+    try:
+        values = np.loadtxt(
+            io.StringIO(block), dtype=np.float64, comments=None, ndmin=2
+        )
+    except ValueError:
+        return None
+    if values.shape[1] != ncols:
+        return None
+    return _NumericBlock(values, _integer_columns(block, values))
+
+
+def _rows_to_float(rows: List[List[str]]) -> _NumericBlock:
+    """逐行解析得到的字符串行按列强制转换为 float64（非数值为 NaN），并标记整数列"""
+    df = pd.DataFrame(rows).apply(pd.to_numeric, errors="coerce")
+    int_columns = np.array([dtype.kind == "i" for dtype in df.dtypes], dtype=bool)
+    return _NumericBlock(df.to_numpy(dtype=np.float64), int_columns)
+
+
+def _iter_block_slices(text: str, start: int, end: int):
+    """把 text[start:end] 按行边界切分为不超过约 BULK_PARSE_CHARS 字符的片段"""
+    while start < end:
+        stop = end
+        if end - start > BULK_PARSE_CHARS:
+            nl = text.find("\n", start + BULK_PARSE_CHARS, end)
+            stop = end if nl < 0 else nl + 1
+        yield start, stop
+        start = stop
+
+
+def _scan_text(parser: SpecialFormatLineParser, text: str) -> None:
+    """把一段以整行结尾的文本送入 parser：非数据行交给逐行状态机，连续数据行整块批量转换。
+
+    数值块以 `_NumericBlock` 追加到 part 的行列表中（与逐行解析得到的字符串行按出现
+    顺序混排），同名 part 的覆盖、表头与 part 名判定规则与逐行解析完全一致。
+    暂存行跨调用保留，因此按行边界分段多次调用与整段调用一次的结果相同。
+    """
+    pos = 0
+    for match in _DATA_RUN_RE.finditer(text):
+        parser.feed(text[pos : match.start()].splitlines())
+        pos = match.end()
+        # 以数值块首行作为下一行，完成上一暂存行（通常为表头）的判定
+        first_end = text.find("\n", match.start(), pos)
+        parser.resolve_pending(
+            text[match.start() : first_end if first_end >= 0 else pos]
+        )
+        for lo, hi in _iter_block_slices(text, match.start(), pos):
+            header = parser.current_header
+            values = None
+            if parser.current_part and header:
+                values = _bulk_parse_block(text[lo:hi], len(header))
+            if values is None:
+                parser.feed(text[lo:hi].splitlines())
+            else:
+                parser.parts[parser.current_part][1].append(values)
+    parser.feed(text[pos:].splitlines())
+
+
+def _scan_parts(text: str, file_path) -> SpecialFormatLineParser:
+    """单次扫描整段文本（见 `_scan_text`）"""
+    parser = SpecialFormatLineParser(file_path)
+    _scan_text(parser, text)
+    parser.finish()
+    return parser
+
+
+def _scan_stream(fh, file_path) -> SpecialFormatLineParser:
+    """从文本流按约 BULK_PARSE_CHARS 字符分段读取并扫描，不把整个文件读入内存"""
+    parser = SpecialFormatLineParser(file_path)
+    carry = ""
+    while True:
+        piece = fh.read(BULK_PARSE_CHARS)
+        if not piece:
+            break
+        text = carry + piece
+        # 只扫描到最后一个完整行，不完整的末行并入下一段
+        cut = text.rfind("\n") + 1
+        carry = text[cut:]
+        if cut:
+            _scan_text(parser, text[:cut])
+    if carry:
+        _scan_text(parser, carry)
+    parser.finish()
+    return parser
+
+
+def _part_values(rows: list) -> _NumericBlock:
+    """合并 part 行列表中的数值块与字符串行为一个 float64 数组（保持原顺序）。
+
+    结果数组一次性预分配，各块复制后立即从 rows 中释放，峰值内存约为结果加一个块。
+    整数列为在所有块中均为整数列的列。
+    """
+    blocks: List[_NumericBlock] = []
+    pending: List[List[str]] = []
+    for item in rows:
+        if isinstance(item, _NumericBlock):
+            if pending:
+                blocks.append(_rows_to_float(pending))
+                pending = []
+            blocks.append(item)
+        else:
+            pending.append(item)
+    if pending:
+        blocks.append(_rows_to_float(pending))
+    rows.clear()
+    int_columns = np.logical_and.reduce([b.int_columns for b in blocks])
+    if len(blocks) == 1:
+        return blocks[0]
+    out = np.empty(
+        (sum(len(b.values) for b in blocks), blocks[0].values.shape[1]),
+        dtype=np.float64,
+    )
+    start = 0
+    blocks.reverse()
+    while blocks:
+        block = blocks.pop().values
+        out[start : start + len(block)] = block
+        start += len(block)
+    return _NumericBlock(out, int_columns)
+
+
+def _numeric_frame(values: np.ndarray, columns: List[str], int_columns) -> pd.DataFrame:
+    """由 float64 数组构建 DataFrame，int_columns 标记的列还原为 int64"""
+    if not np.any(int_columns):
+        return pd.DataFrame(values, columns=columns)
+    data = {
+        i: values[:, i].astype(np.int64) if is_int else values[:, i]
+        for i, is_int in enumerate(int_columns)
+    }
+    df = pd.DataFrame(data, copy=False)
+    # 按位置设置列名（规范化后可能出现重名列）
+    df.columns = columns
+    return df
+
+
+def _scanned_part_frame(part_name: str, hdr: List[str], rows: list) -> pd.DataFrame:
+    """由单次扫描得到的表头与行列表构建列名规范化后的数值 DataFrame。
+
+    与逐列 `pd.to_numeric` 一致：全部 token 为整数字面量的列为 int64，其余为 float64。
+    """
+    mapping = _normalize_column_mapping(hdr)
+    # 直接以规范化列名构建，避免 rename 复制整块数据
+    values, int_columns = _part_values(rows)
+    df = _numeric_frame(values, [mapping[h] for h in hdr], int_columns)
+    logger.info("解析 part '%s': %d 行数据", part_name, len(df))
+    return df
+
+
+def _extract_parts_from_lines(
+    lines: List[str], file_path: Path
+) -> Dict[str, Tuple[Optional[List[str]], List[List[str]]]]:
+    """从文本行中提取每个 part 的表头和原始数据行。
 
-    return extracted_parts
+    返回字典: part_name -> (header_tokens, list_of_rows)
+    """
+    parser = SpecialFormatLineParser(file_path)
+    parser.feed(lines)
+    parser.finish()
+    return parser.parts
 
 
 def parse_special_format_file(file_path: Path) -> Dict[str, pd.DataFrame]:
     """
     解析特殊格式文件，返回 {part_name: DataFrame} 字典
 
+    文件按约 BULK_PARSE_CHARS 字符分段流式读取、解码，不整体读入内存；每行只分类
+    一次，各 part 的连续数据行整块转换为 float64（非数值单元为 NaN），最后合并到预分配的
+    数组中；全部 token 为整数字面量的列还原为 int64（与逐列 `pd.to_numeric` 一致）。
+
     Args:
         file_path: 文件路径
 
     Returns:
         字典，键为 part 名称，值为对应的 DataFrame
     """
-    # 该函数实现相对复杂，包含多分支与早期返回；暂保留对过多语句的忽略，后续分步重构
-    # pylint: disable=R0915  # 待重构：逐步拆分此函数以移除此项
-    lines = _read_text_file_lines(file_path)
-
-    extracted = _extract_parts_from_lines(lines, file_path)
+    parser = _consume_text_file(file_path, lambda fh: _scan_stream(fh, file_path))
     result: Dict[str, pd.DataFrame] = {}
-    for part_name, (hdr, rows) in extracted.items():
-        _finalize_part(part_name, hdr, rows, result)
+    for part_name, (hdr, rows) in parser.parts.items():
+        if not (hdr and rows):
+            continue
+        result[part_name] = _scanned_part_frame(part_name, hdr, rows)
 
     return result
 
@@ -195,7 +472,9 @@ def process_special_format_file(
     part_row_selection: dict = None,
     timestamp_format: str = "%Y%m%d_%H%M%S",
     overwrite: bool = False,
+    output_format: str = None,
     return_report: bool = False,
+    max_workers: int = 1,
 ):
     """兼容入口：委托给 `src.special_format_processor.process_special_format_file`。"""
     # 以下延迟导入是为避免循环导入；同时该函数参数较多，暂在此处抑制 pylint 的相关复杂度/导入位置警告。
@@ -214,27 +493,198 @@ def process_special_format_file(
             "part_row_selection": part_row_selection,
             "timestamp_format": timestamp_format,
             "overwrite": overwrite,
+            "output_format": output_format,
         }
 
+    # 经解析缓存读取：GUI 预览已解析过的文件无需再次解析
+    _cache_mod = importlib.import_module("src.parse_cache")
     return _proc(
         file_path,
         project_data,
         output_dir,
         **part_kwargs,
         return_report=return_report,
-        parse_func=parse_special_format_file,
+        parse_func=_cache_mod.load_special_format_file,
+        max_workers=max_workers,
     )
 
 
-def get_part_names(file_path: Path) -> List[str]:
-    """快速获取文件中的所有 part 名称（不解析完整数据）。
+@dataclass
+class PartIndexEntry:
+    """part 在文件中的字节区间 [byte_start, byte_end)、表头 token 与数值行数。
 
-    Args:
-        file_path: 文件路径
+    区间从 part 名行开始，到下一个 part 名行（或文件末尾）为止；row_count 为表头之后
+    以数字开头的行数，列数不符的行在解析时会被跳过，因此是解析结果行数的上界。
+    """
 
-    Returns:
-        part 名称列表
+    byte_start: int
+    byte_end: int
+    header: Optional[List[str]] = None
+    row_count: int = 0
+
+
+@dataclass
+class PartIndex:
+    """特殊格式文件的 part 偏移索引（见 `get_part_index`）。
+
+    names 按出现顺序列出全部 part 名行（含重名）；parts 中重名 part 以最后一次出现
+    为准，与 `parse_special_format_file` 的覆盖规则一致。
+    """
+
+    encoding: str
+    size: int
+    names: List[str] = field(default_factory=list)
+    parts: Dict[str, PartIndexEntry] = field(default_factory=dict)
+
+
+class _PartIndexer(SpecialFormatLineParser):
+    """记录 part 名行字节偏移的行解析器：非数据行逐行判定，整块数据行只计数。"""
+
+    def __init__(self, file_path, index: PartIndex) -> None:
+        super().__init__(file_path)
+        self.index = index
+        self._pending_offset = 0
+        self._entry: Optional[PartIndexEntry] = None
+
+    def feed_bytes(self, buf, lo: int, hi: int) -> None:
+        """逐行解析 buf[lo:hi]，记录各行的起始字节偏移"""
+        offset = lo
+        for raw in buf[lo:hi].splitlines(keepends=True):
+            new_rows = self.feed((raw.decode(self.index.encoding),))
+            # feed 先处理上一暂存行，本行若成为暂存行则记下其偏移
+            if self._pending is not None:
+                self._pending_offset = offset
+            for part, rows in new_rows.items():
+                self.parts[part][1].clear()
+                self._count_rows(len(rows))
+            self._sync_header()
+            offset += len(raw)
+
+    def count_run(self, run: bytes) -> None:
+        """以数值块首行完成暂存行判定，并把整块行数计入当前 part"""
+        first_end = run.find(b"\n")
+        first = run[: first_end if first_end >= 0 else len(run)]
+        self.resolve_pending(first.decode(self.index.encoding))
+        self._sync_header()
+        if self.current_part and self.current_header:
+            self._count_rows(run.count(b"\n") + (0 if run.endswith(b"\n") else 1))
+
+    def close(self) -> PartIndex:
+        """处理最后的暂存行并返回索引"""
+        self.finish()
+        self._sync_header()
+        return self.index
+
+    def _count_rows(self, n: int) -> None:
+        if self._entry is not None:
+            self._entry.row_count += n
+
+    def _sync_header(self) -> None:
+        entry = self._entry
+        if entry is not None and entry.header is None and self.current_header:
+            entry.header = list(self.current_header)
+
+    def _consume(self, line: str, next_line: Optional[str]) -> None:
+        # part 名行只可能来自暂存行，其偏移即 _pending_offset
+        if is_part_name_line(line, next_line):
+            if self._entry is not None:
+                self._entry.byte_end = self._pending_offset
+            self._entry = PartIndexEntry(self._pending_offset, self.index.size)
+            self.index.names.append(line)
+            self.index.parts[line] = self._entry
+        super()._consume(line, next_line)
+
+
+def _scan_part_index(buf, index: PartIndex, file_path) -> PartIndex:
+    """单次扫描字节缓冲区建立索引；数值块由字节正则整块跳过，不逐行解码"""
+    indexer = _PartIndexer(file_path, index)
+    pos = 0
+    for match in _DATA_RUN_BYTES_RE.finditer(buf):
+        indexer.feed_bytes(buf, pos, match.start())
+        pos = match.end()
+        run = match.group()
+        if _NOT_PLAIN_NUMBER_LINE_RE.search(run):
+            # 含 "1abc" 之类的行：按行判定（可能是 part 名）
+            indexer.feed_bytes(buf, match.start(), pos)
+        else:
+            indexer.count_run(run)
+    indexer.feed_bytes(buf, pos, len(buf))
+    return indexer.close()
+
+
+def build_part_index(file_path: Path) -> Optional[PartIndex]:
+    """扫描一次文件，建立 part 名 → (字节区间, 表头, 行数) 的索引。
+
+    文件以 mmap 方式扫描，不整体读入内存。编码不支持按字节切分（如 UTF-16）或
+    前缀之后出现无法以探测编码解码的字节时返回 None，调用方应回退到整文件解析。
     """
+    p = Path(file_path)
+    encoding = sniff_encoding(p)
+    if encoding not in _BYTE_INDEXABLE_ENCODINGS:
+        return None
+    with open(p, "rb") as fh:
+        size = p.stat().st_size
+        index = PartIndex(encoding=encoding, size=size)
+        if size == 0:
+            return index
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            try:
+                return _scan_part_index(buf, index, p)
+            except UnicodeDecodeError:
+                logger.debug("以 %s 解码失败，放弃建立 part 索引: %s", encoding, p)
+                return None
+
+
+def get_part_index(file_path: Path) -> Optional[PartIndex]:
+    """返回文件的 part 偏移索引（按路径、mtime 与大小缓存于 `FileCache` 元数据）。
+
+    无法建立索引时返回 None（结果同样缓存）；文件不存在时抛出 FileNotFoundError。
+    """
+    p = Path(file_path)
+    cache = get_file_cache()
+    cached = cache.get_metadata(p, PART_INDEX_METADATA_KEY)
+    if cached is not None:
+        return cached or None
+    index = build_part_index(p)
+    cache.set_metadata(
+        p, PART_INDEX_METADATA_KEY, index if index is not None else False
+    )
+    return index
+
+
+def parse_special_format_part(
+    file_path: Path, part_name: str
+) -> Optional[pd.DataFrame]:
+    """只解析文件中的单个 part，返回其 DataFrame（part 不存在或无数据时返回 None）。
+
+    借助 `get_part_index` 定位字节区间后 seek 读取该片段，解析规则与
+    `parse_special_format_file` 相同；无法建立索引时回退到整文件解析。
+    """
+    p = Path(file_path)
+    index = get_part_index(p)
+    if index is None:
+        return parse_special_format_file(p).get(part_name)
+    entry = index.parts.get(part_name)
+    if entry is None or not entry.header or entry.row_count == 0:
+        return None
+    with open(p, "rb") as fh:
+        fh.seek(entry.byte_start)
+        data = fh.read(entry.byte_end - entry.byte_start)
+    try:
+        text = data.decode(index.encoding)
+    except UnicodeDecodeError:
+        logger.debug("part 片段解码失败，回退到整文件解析: %s", p)
+        return parse_special_format_file(p).get(part_name)
+    # 与文本模式读取一致的通用换行
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    hdr, rows = _scan_parts(text, p).parts.get(part_name, (None, []))
+    if not (hdr and rows):
+        return None
+    return _scanned_part_frame(part_name, hdr, rows)
+
+
+def _scan_part_names_from_lines(file_path: Path) -> List[str]:
+    """逐行扫描全部文本行得到 part 名列表（无法建立偏移索引时使用）"""
     part_names: List[str] = []
 
     lines = _read_text_file_lines(file_path)
@@ -256,6 +706,26 @@ def get_part_names(file_path: Path) -> List[str]:
     return part_names
 
 
+def get_part_names(file_path: Path) -> List[str]:
+    """快速获取文件中的所有 part 名称（不解析完整数据）。
+
+    优先使用缓存的 part 偏移索引，文件未变化时不再扫描。
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        part 名称列表（按出现顺序）
+    """
+    try:
+        index = get_part_index(file_path)
+    except OSError:
+        index = None
+    if index is not None:
+        return list(index.names)
+    return _scan_part_names_from_lines(file_path)
+
+
 if __name__ == "__main__":
     # 测试
     logging.basicConfig(level=logging.INFO)
@@ -1,9 +1,12 @@
 """特殊格式处理模块。
 
 负责将解析后的特殊格式数据按 part 调用 AeroCalculator 计算并输出结果。
+默认每个 part 输出一个结果文件；combine_parts=True 时同一输入文件的所有 part
+合并写入一个长表文件（见 `src.output_formats.LongFormatWriter`）。
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -11,6 +14,14 @@ from typing import Callable, Dict, List, Optional
 
 import pandas as pd
 
+from src.calculator_pool import get_calculator_pool
+from src.output_formats import (
+    DEFAULT_OUTPUT_FORMAT,
+    LongFormatWriter,
+    normalize_output_format,
+    output_suffix,
+    write_frame_atomic,
+)
 from src.part_inference import format_inference_error, infer_parts_for_file
 from src.physics import AeroCalculator
 
@@ -22,6 +33,7 @@ _PART_PROCESS_KEYS = (
     "part_row_selection",
     "timestamp_format",
     "overwrite",
+    "output_format",
 )
 
 
@@ -30,34 +42,93 @@ def _collect_part_kwargs(values: Dict[str, object]) -> Dict[str, object]:
     return {key: values.get(key) for key in _PART_PROCESS_KEYS}
 
 
+# 变换后追加到 part 数据之后的结果列（顺序与 `_transform_part_frame` 一致）
+_RESULT_COLUMNS = (
+    "Fx_new",
+    "Fy_new",
+    "Fz_new",
+    "Mx_new",
+    "My_new",
+    "Mz_new",
+    "Cx_new",
+    "Cy_new",
+    "Cz_new",
+    "Cl_new",
+    "Cm_new",
+    "Cn_new",
+)
+
+
+def _result_output_path(
+    output_dir: Path,
+    base_name: str,
+    timestamp_format: str,
+    overwrite: bool,
+    output_format: Optional[str],
+) -> Path:
+    """生成 `{base_name}_result_{ts}` 输出路径；不覆盖时若已存在则追加数字后缀。"""
+    ts = datetime.now().strftime(timestamp_format)
+    ext = output_suffix(output_format)
+    out_path = output_dir / f"{base_name}_result_{ts}{ext}"
+    if out_path.exists() and not overwrite:
+        suffix = 1
+        while True:
+            candidate = output_dir / f"{base_name}_result_{ts}_{suffix}{ext}"
+            if not candidate.exists():
+                out_path = candidate
+                break
+            suffix += 1
+    return out_path
+
+
+def _part_output_path(
+    file_path: Path,
+    output_dir: Path,
+    part_name: str,
+    timestamp_format: str,
+    overwrite: bool,
+    output_format: Optional[str],
+) -> Path:
+    """生成 part 的输出路径；不覆盖时若已存在则追加数字后缀。"""
+    return _result_output_path(
+        output_dir,
+        f"{file_path.stem}_{part_name}",
+        timestamp_format,
+        overwrite,
+        output_format,
+    )
+
+
+def _combined_output_path(
+    file_path: Path,
+    output_dir: Path,
+    timestamp_format: str,
+    overwrite: bool,
+    output_format: Optional[str],
+) -> Path:
+    """生成合并全部 part 的长表输出路径（`{stem}_parts_result_{ts}`）。"""
+    return _result_output_path(
+        output_dir,
+        f"{file_path.stem}_parts",
+        timestamp_format,
+        overwrite,
+        output_format,
+    )
+
+
 # pylint: disable=R0913,R0914,R0915,R0912,R0911
 # 这些函数将在后续迭代中进一步拆分和精简，以降低复杂度。
-def _process_single_part(
+def _resolve_part_pair(
     part_name,
-    df,
     *,
     file_path,
     project_data,
-    output_dir,
     part_target_mapping=None,
     part_source_mapping=None,
-    part_row_selection=None,
-    timestamp_format="%Y%m%d_%H%M%S",
-    overwrite=False,
 ):
-    """处理单个 part，返回 (out_path or None, report_entry)。
+    """确定 part 使用的 source/target，返回 ((source_part, target_part), None)。
 
-    Args:
-        part_name: 内部部件名
-        df: 该部件的数据
-        file_path: 输入文件路径
-        project_data: 项目配置
-        output_dir: 输出目录
-        part_target_mapping: 内部部件名 -> target部件名的映射
-        part_source_mapping: 内部部件名 -> source部件名的映射（新增）
-        part_row_selection: 行选择缓存
-        timestamp_format: 时间戳格式
-        overwrite: 是否覆盖
+    优先使用显式映射，否则智能推测；无法确定时返回 (None, report_entry)。
     """
     # Part 推测逻辑：优先使用显式映射，否则使用智能推测
     source_part = None
@@ -170,37 +241,34 @@ def _process_single_part(
                         "candidates": target_result.candidates,
                     }
 
-    # 行过滤逻辑（保持不变）
-    try:
-        selected = None
-        if isinstance(part_row_selection, dict):
-            selected = part_row_selection.get(part_name)
-        if selected is not None:
-            selected_idx = sorted({int(x) for x in selected})
-            df = df.iloc[selected_idx]
-    except (TypeError, ValueError, KeyError) as exc:
-        logger.debug(
-            "按行过滤失败，回退为全量处理 (part=%s): %s",
-            part_name,
-            exc,
-            exc_info=True,
-        )
+    return (source_part, target_part), None
 
-    if df is None or len(df) == 0:
-        msg = f"part '{part_name}' 未选择任何数据行，已跳过"
-        logger.warning(msg)
-        return None, {
-            "part": part_name,
-            "source_part": source_part,
-            "target_part": target_part,
-            "status": "skipped",
-            "reason": "no_rows_selected",
-            "message": msg,
-        }
 
-    # 移除旧的 target_part 推测逻辑（已被上面的智能推测替代）
-    # 智能推测已经确保 source_part 和 target_part 都存在于配置中
+def _get_part_calculator(project_data, source_part, target_part, calculators):
+    """返回 (source, target) 对应的计算器；calculators 为同一文件内按 part 对共享的缓存。"""
+    key = (source_part, target_part)
+    if calculators is not None and key in calculators:
+        return calculators[key]
+    # 同一几何在多个 part/文件间共享计算器实例
+    calc = get_calculator_pool().get(
+        project_data,
+        source_part=source_part,
+        target_part=target_part,
+        factory=AeroCalculator,
+    )
+    if calculators is not None:
+        calculators[key] = calc
+    return calc
+
 
+def _transform_part_frame(
+    part_name, df, *, source_part, target_part, project_data, calculators=None
+):
+    """对 part 数据做坐标变换，返回 (out_df, None)。
+
+    out_df 为原始列加上 *_new 结果列；无法处理时返回 (None, report_entry)。
+    calculators 提供时，解析到同一 (source, target) 的 part 共享其中的计算器。
+    """
     required_cols = ["Cx", "Cy", "Cz/FN", "CMx", "CMy", "CMz"]
     missing = [c for c in required_cols if c not in df.columns]
     if missing:
@@ -247,8 +315,8 @@ def _process_single_part(
             }
         # 构建 AeroCalculator 可能在 project_data 中找不到 target 时抛出 KeyError
         try:
-            calc = AeroCalculator(
-                project_data, source_part=source_part, target_part=target_part
+            calc = _get_part_calculator(
+                project_data, source_part, target_part, calculators
             )
         except KeyError as e:
             msg = f"part '{part_name}' 的 target 部件不存在: {e}，已跳过"
@@ -277,45 +345,147 @@ def _process_single_part(
         }
 
     out_df = df.copy()
-    out_df["Fx_new"] = results["force_transformed"][:, 0]
-    out_df["Fy_new"] = results["force_transformed"][:, 1]
-    out_df["Fz_new"] = results["force_transformed"][:, 2]
-    out_df["Mx_new"] = results["moment_transformed"][:, 0]
-    out_df["My_new"] = results["moment_transformed"][:, 1]
-    out_df["Mz_new"] = results["moment_transformed"][:, 2]
-    out_df["Cx_new"] = results["coeff_force"][:, 0]
-    out_df["Cy_new"] = results["coeff_force"][:, 1]
-    out_df["Cz_new"] = results["coeff_force"][:, 2]
-    out_df["Cl_new"] = results["coeff_moment"][:, 0]
-    out_df["Cm_new"] = results["coeff_moment"][:, 1]
-    out_df["Cn_new"] = results["coeff_moment"][:, 2]
+    result_keys = (
+        "force_transformed",
+        "moment_transformed",
+        "coeff_force",
+        "coeff_moment",
+    )
+    for i, col in enumerate(_RESULT_COLUMNS):
+        out_df[col] = results[result_keys[i // 3]][:, i % 3]
 
-    ts = datetime.now().strftime(timestamp_format)
-    out_path = output_dir / f"{file_path.stem}_{part_name}_result_{ts}.csv"
-    if out_path.exists() and not overwrite:
-        suffix = 1
-        while True:
-            candidate = (
-                output_dir / f"{file_path.stem}_{part_name}_result_{ts}_{suffix}.csv"
-            )
-            if not candidate.exists():
-                out_path = candidate
-                break
-            suffix += 1
+    return out_df, None
 
-    out_df.to_csv(out_path, index=False)
-    msg = f"part '{part_name}' 输出: {out_path.name}"
-    logger.info(msg)
-    return out_path, {
+
+def _compute_part_result(
+    part_name,
+    df,
+    *,
+    file_path,
+    project_data,
+    part_target_mapping=None,
+    part_source_mapping=None,
+    part_row_selection=None,
+    calculators=None,
+):
+    """确定 source/target、按行选择过滤并做坐标变换，不写出文件。
+
+    成功时返回 (out_df, entry)，entry 为含 source_part/target_part 的 success 报告项
+    （由调用方在写出后补充 message/out_path）；无法处理时返回 (None, report_entry)。
+    """
+    pair, entry = _resolve_part_pair(
+        part_name,
+        file_path=file_path,
+        project_data=project_data,
+        part_target_mapping=part_target_mapping,
+        part_source_mapping=part_source_mapping,
+    )
+    if pair is None:
+        return None, entry
+    source_part, target_part = pair
+
+    # 行过滤逻辑（保持不变）
+    try:
+        selected = None
+        if isinstance(part_row_selection, dict):
+            selected = part_row_selection.get(part_name)
+        if selected is not None:
+            selected_idx = sorted({int(x) for x in selected})
+            df = df.iloc[selected_idx]
+    except (TypeError, ValueError, KeyError) as exc:
+        logger.debug(
+            "按行过滤失败，回退为全量处理 (part=%s): %s",
+            part_name,
+            exc,
+            exc_info=True,
+        )
+
+    if df is None or len(df) == 0:
+        msg = f"part '{part_name}' 未选择任何数据行，已跳过"
+        logger.warning(msg)
+        return None, {
+            "part": part_name,
+            "source_part": source_part,
+            "target_part": target_part,
+            "status": "skipped",
+            "reason": "no_rows_selected",
+            "message": msg,
+        }
+
+    out_df, entry = _transform_part_frame(
+        part_name,
+        df,
+        source_part=source_part,
+        target_part=target_part,
+        project_data=project_data,
+        calculators=calculators,
+    )
+    if out_df is None:
+        return None, entry
+    return out_df, {
         "part": part_name,
         "source_part": source_part,
         "target_part": target_part,
         "status": "success",
-        "message": msg,
-        "out_path": str(out_path),
     }
 
 
+def _process_single_part(
+    part_name,
+    df,
+    *,
+    file_path,
+    project_data,
+    output_dir,
+    part_target_mapping=None,
+    part_source_mapping=None,
+    part_row_selection=None,
+    timestamp_format="%Y%m%d_%H%M%S",
+    overwrite=False,
+    output_format=None,
+    calculators=None,
+):
+    """处理单个 part，返回 (out_path or None, report_entry)。
+
+    Args:
+        part_name: 内部部件名
+        df: 该部件的数据
+        file_path: 输入文件路径
+        project_data: 项目配置
+        output_dir: 输出目录
+        part_target_mapping: 内部部件名 -> target部件名的映射
+        part_source_mapping: 内部部件名 -> source部件名的映射（新增）
+        part_row_selection: 行选择缓存
+        timestamp_format: 时间戳格式
+        overwrite: 是否覆盖
+        calculators: 同一文件内按 (source, target) 共享计算器的缓存
+    """
+    out_df, entry = _compute_part_result(
+        part_name,
+        df,
+        file_path=file_path,
+        project_data=project_data,
+        part_target_mapping=part_target_mapping,
+        part_source_mapping=part_source_mapping,
+        part_row_selection=part_row_selection,
+        calculators=calculators,
+    )
+    if out_df is None:
+        return None, entry
+
+    out_path = _part_output_path(
+        file_path, output_dir, part_name, timestamp_format, overwrite, output_format
+    )
+    if normalize_output_format(output_format) == DEFAULT_OUTPUT_FORMAT:
+        out_df.to_csv(out_path, index=False)
+    else:
+        write_frame_atomic(out_df, out_path, output_format)
+    msg = f"part '{part_name}' 输出: {out_path.name}"
+    logger.info(msg)
+    entry.update(message=msg, out_path=str(out_path))
+    return out_path, entry
+
+
 def _make_handle_single_part(
     file_path: Path,
     project_data,
@@ -326,18 +496,37 @@ def _make_handle_single_part(
     part_row_selection: dict = None,
     timestamp_format: str = "%Y%m%d_%H%M%S",
     overwrite: bool = False,
+    output_format: str = None,
+    write_output: bool = True,
 ):
-    """返回一个可调用对象，用于按 (part_name, df) 处理单个 part。"""
+    """返回一个可调用对象，用于按 (part_name, df) 处理单个 part。
+
+    write_output=False 时只计算不写出，返回 `_compute_part_result` 的 (out_df, entry)。
+    """
 
     part_kwargs = _collect_part_kwargs(locals())
+    # 同一文件内解析到相同 (source, target) 的 part 共享计算器
+    calculators: Dict[tuple, AeroCalculator] = {}
 
     def _handle(part_name: str, df):
+        if not write_output:
+            return _compute_part_result(
+                part_name,
+                df,
+                file_path=file_path,
+                project_data=project_data,
+                part_target_mapping=part_target_mapping,
+                part_source_mapping=part_source_mapping,
+                part_row_selection=part_row_selection,
+                calculators=calculators,
+            )
         return _process_single_part(
             part_name,
             df,
             file_path=file_path,
             project_data=project_data,
             output_dir=output_dir,
+            calculators=calculators,
             **part_kwargs,
         )
 
@@ -353,18 +542,98 @@ def _summarize_report(report: List[dict]):
     return total, success_count, skipped_count, failed_count
 
 
-def _process_parts(handle, data_dict: Dict[str, pd.DataFrame]):
-    """处理多个 part，返回 (outputs, report)。"""
+def _run_part(handle, part_name: str, df):
+    """调用 handle 处理单个 part；未预期的异常转为该 part 的 failed 报告项。"""
+    try:
+        return handle(part_name, df)
+    except Exception as e:  # pylint: disable=broad-except
+        msg = f"part '{part_name}' 处理时发生异常: {e}"
+        logger.error(msg, exc_info=True)
+        return None, {
+            "part": part_name,
+            "status": "failed",
+            "reason": "unexpected_error",
+            "message": msg,
+            "error": str(e),
+        }
+
+
+def _map_parts(handle, data_dict: Dict[str, pd.DataFrame], max_workers: int = 1):
+    """对每个 part 调用 handle，按 part 原始顺序逐个产出结果（生成器）。
+
+    调用方可在每个结果产出后立即写出并释放，不必等全部 part 完成。
+    max_workers > 1 时各 part 提交到线程池并行处理，按顺序从 `pool.map` 的迭代器取结果。
+    """
+    items = list(data_dict.items())
+    workers = min(max(int(max_workers or 1), 1), len(items))
+    if workers <= 1:
+        for part_name, df in items:
+            yield _run_part(handle, part_name, df)
+        return
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="special-part")
+    try:
+        yield from pool.map(lambda item: _run_part(handle, *item), items)
+    finally:
+        # 调用方提前结束迭代（如写出失败）时不再启动尚未开始的 part
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _process_parts(handle, data_dict: Dict[str, pd.DataFrame], max_workers: int = 1):
+    """处理多个 part，返回 (outputs, report)。
+
+    outputs 与 report 按 part 在文件中的原始顺序排列（与 max_workers 无关）。
+    """
     outputs: List[Path] = []
     report: List[dict] = []
-    for part_name, df in data_dict.items():
-        out_path, entry = handle(part_name, df)
+    for out_path, entry in _map_parts(handle, data_dict, max_workers):
         if out_path:
             outputs.append(out_path)
         report.append(entry)
     return outputs, report
 
 
+def _process_parts_combined(
+    handle,
+    data_dict: Dict[str, pd.DataFrame],
+    out_path: Path,
+    output_format: Optional[str],
+    max_workers: int = 1,
+):
+    """处理多个 part 并把成功的结果合并写入 out_path 一个长表文件，返回 (outputs, report)。
+
+    handle 需只计算不写出（见 `_make_handle_single_part(write_output=False)`）。每个 part 的结果
+    按原始顺序一产出就写入长表并释放，内存中不同时保留全部 part 的结果。长表的结果列为
+    所有 part 输入列的并集加变换结果列；没有任何 part 成功时不创建输出文件。
+    """
+    value_columns: List[str] = []
+    for df in data_dict.values():
+        value_columns.extend(str(c) for c in df.columns)
+    value_columns.extend(_RESULT_COLUMNS)
+
+    writer = None
+    report: List[dict] = []
+    try:
+        for out_df, entry in _map_parts(handle, data_dict, max_workers):
+            if out_df is not None:
+                if writer is None:
+                    writer = LongFormatWriter(out_path, output_format, value_columns)
+                writer.write_part(
+                    out_df, entry["part"], entry["source_part"], entry["target_part"]
+                )
+                msg = f"part '{entry['part']}' 输出到合并文件: {out_path.name}"
+                logger.info(msg)
+                entry.update(message=msg, out_path=str(out_path))
+            report.append(entry)
+    except Exception:
+        if writer is not None:
+            writer.abort()
+        raise
+    if writer is None:
+        return [], report
+    writer.close()
+    return [out_path], report
+
+
 @dataclass
 class ProcessOptions:
     """封装 process_special_format_file 的可选参数。"""
@@ -374,6 +643,11 @@ class ProcessOptions:
     part_row_selection: Optional[dict] = None
     timestamp_format: str = "%Y%m%d_%H%M%S"
     overwrite: bool = False
+    output_format: Optional[str] = None
+    # 并行处理 part 的线程数（1 表示逐个 part 串行处理）
+    max_workers: int = 1
+    # True 时所有 part 合并输出为一个长表文件，而非每个 part 一个文件
+    combine_parts: bool = False
 
 
 def _process_special_format_file_core(
@@ -392,10 +666,23 @@ def _process_special_format_file_core(
         file_path,
         project_data,
         output_dir,
+        write_output=not options.combine_parts,
         **_collect_part_kwargs(vars(options)),
     )
     data_dict = parse_func(file_path)
-    outputs, report = _process_parts(handle, data_dict)
+    if options.combine_parts:
+        out_path = _combined_output_path(
+            file_path,
+            output_dir,
+            options.timestamp_format,
+            options.overwrite,
+            options.output_format,
+        )
+        outputs, report = _process_parts_combined(
+            handle, data_dict, out_path, options.output_format, options.max_workers
+        )
+    else:
+        outputs, report = _process_parts(handle, data_dict, options.max_workers)
 
     logger.info(
         "文件 %s 处理完成：%d 个 part（%d 成功，%d 跳过，%d 失败）",
@@ -419,8 +706,11 @@ def process_special_format_file(
     part_row_selection: dict = None,
     timestamp_format: str = "%Y%m%d_%H%M%S",
     overwrite: bool = False,
+    output_format: Optional[str] = None,
     return_report: bool = False,
     parse_func: Optional[Callable[[Path], Dict[str, pd.DataFrame]]] = None,
+    max_workers: int = 1,
+    combine_parts: bool = False,
 ) -> List[Path]:
     """处理特殊格式文件并输出结果文件，供 CLI/GUI 复用。
 
@@ -433,13 +723,20 @@ def process_special_format_file(
         part_row_selection: 行选择缓存
         timestamp_format: 时间戳格式
         overwrite: 是否覆盖已存在的输出文件
+        output_format: 结果文件格式（csv/parquet/feather/npz，默认 csv）
         return_report: 是否返回处理报告
         parse_func: 解析函数（需传入 src.special_format_parser.parse_special_format_file）
+        max_workers: 并行处理 part 的线程数；报告项仍按 part 原始顺序排列
+        combine_parts: 是否把所有 part 合并输出为一个长表文件（含 part/source_part/target_part 列）
     """
     if parse_func is None:
         raise ValueError("parse_func 不能为空，请传入 parse_special_format_file")
 
-    options = ProcessOptions(**_collect_part_kwargs(locals()))
+    options = ProcessOptions(
+        **_collect_part_kwargs(locals()),
+        max_workers=max_workers,
+        combine_parts=combine_parts,
+    )
     return _process_special_format_file_core(
         file_path,
         project_data,
@@ -450,8 +747,102 @@ def process_special_format_file(
     )
 
 
+class SpecialFormatFollower:
+    """跟踪模式下按 part 追加输出：每个 part 只解析一次映射，新增行变换后追加写入 CSV。
+
+    part 首次出现时确定 source/target（与 `_process_single_part` 相同的映射与推测规则）
+    并以追加方式打开输出文件（仅新文件写表头，已有内容不清空），之后每批新增行只做
+    坐标变换并追加写出。无法处理的 part 只报告一次，其后续数据行被忽略。
+
+    同名 part 在文件中多次出现时，跟踪输出按出现顺序包含每一块的全部数据行；
+    这与批处理不同（批处理解析以最后一块为准），因为已追加的结果行无法撤回。
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        project_data,
+        output_dir: Path,
+        *,
+        part_target_mapping: dict = None,
+        part_source_mapping: dict = None,
+        timestamp_format: str = "%Y%m%d_%H%M%S",
+        overwrite: bool = False,
+    ) -> None:
+        self.file_path = Path(file_path)
+        self.project_data = project_data
+        self.output_dir = Path(output_dir)
+        self.part_target_mapping = part_target_mapping
+        self.part_source_mapping = part_source_mapping
+        self.timestamp_format = timestamp_format
+        self.overwrite = overwrite
+        # part_name -> (source_part, target_part, out_path)；无法处理的 part 为 None
+        self._parts: Dict[str, Optional[tuple]] = {}
+        # 尚未写出表头的输出（打开时为新文件或空文件）
+        self._needs_header: set = set()
+        self.report: List[dict] = []
+        self.rows_written = 0
+
+    @property
+    def outputs(self) -> List[Path]:
+        return [state[2] for state in self._parts.values() if state is not None]
+
+    def append(self, part_name: str, df: pd.DataFrame) -> int:
+        """变换 part 的新增数据行并追加到其输出文件，返回写出的行数。"""
+        if part_name not in self._parts:
+            self._parts[part_name] = self._open_part(part_name)
+        state = self._parts[part_name]
+        if state is None or df is None or len(df) == 0:
+            return 0
+        source_part, target_part, out_path = state
+        out_df, entry = _transform_part_frame(
+            part_name,
+            df,
+            source_part=source_part,
+            target_part=target_part,
+            project_data=self.project_data,
+        )
+        if out_df is None:
+            self.report.append(entry)
+            self._parts[part_name] = None
+            return 0
+        header = part_name in self._needs_header
+        out_df.to_csv(out_path, index=False, mode="a", header=header)
+        self._needs_header.discard(part_name)
+        self.rows_written += len(out_df)
+        return len(out_df)
+
+    def _open_part(self, part_name: str) -> Optional[tuple]:
+        pair, entry = _resolve_part_pair(
+            part_name,
+            file_path=self.file_path,
+            project_data=self.project_data,
+            part_target_mapping=self.part_target_mapping,
+            part_source_mapping=self.part_source_mapping,
+        )
+        if pair is None:
+            self.report.append(entry)
+            return None
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        out_path = _part_output_path(
+            self.file_path,
+            self.output_dir,
+            part_name,
+            self.timestamp_format,
+            self.overwrite,
+            DEFAULT_OUTPUT_FORMAT,
+        )
+        # 以追加方式打开：已存在的输出（覆盖模式下的同名文件）保留原内容，只有新文件写表头
+        with open(out_path, "a", encoding="utf-8") as fh:
+            if fh.tell() == 0:
+                self._needs_header.add(part_name)
+        logger.info("part '%s' 跟踪输出: %s", part_name, out_path.name)
+        return pair[0], pair[1], out_path
+
+
 __all__ = [
     "process_special_format_file",
+    "SpecialFormatFollower",
     "ProcessOptions",
     "_process_special_format_file_core",
 ]
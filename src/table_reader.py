@@ -0,0 +1,293 @@
+"""
+载荷表快速读取 - 按表头列投影，只解析力/力矩（或系数）与 Alpha/Beta 列
+
+宽表日志常带数百个通道，而坐标变换只用到其中 6 列（外加 Alpha/Beta）。本模块：
+1. 只嗅探一次表头，解析出 Fx..Mz / Cx..CMz / Alpha / Beta 列（忽略大小写与首尾空格）；
+2. 以 usecols 只解析这些列；整表读取在 pyarrow 可用时用 pyarrow 引擎并直接指定 float64；
+3. 解析为数值的列直接作为 float64 使用，仅解析失败（推断为 object）的列/数据块
+   才走 `pd.to_numeric(errors="coerce")` 的强制转换路径（见 `coerce_float_matrix`）；
+   分块读取时各块按 float64 dtype 解析，只有解析失败的块按推断类型重读。
+
+表头中找不到完整的载荷列时不做投影，由下游给出缺列错误。
+"""
+
+import io
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 尝试导入 pyarrow（可选，整表读取时作为 CSV 解析引擎）
+try:
+    import pyarrow  # noqa: F401  # pylint: disable=unused-import
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 有量纲载荷列与系数列（规范化后的小写列名）
+DIMENSIONAL_KEYS = ("fx", "fy", "fz", "mx", "my", "mz")
+COEFF_KEYS = ("cx", "cy", "cmx", "cmy", "cmz")
+COEFF_NORMAL_KEYS = ("cz", "fn")
+# 按原样保留（不强制 float64）的辅助列
+PASSTHROUGH_KEYS = ("alpha", "beta")
+
+# 分块读取时每次从文件读入的字节数
+_READ_BLOCK_BYTES = 4 * 1024 * 1024
+
+
+def _norm(name) -> str:
+    return str(name).strip().lower()
+
+
+@dataclass
+class ColumnProjection:
+    """表头解析结果：usecols 为需读取的列（文件中的列名与顺序），float_cols 为载荷列"""
+
+    usecols: List[str]
+    float_cols: List[str]
+
+
+def sniff_columns(file_path: Path, skip_rows: int = 0) -> List[str]:
+    """只读取表头，返回 pandas 解析出的列名（重复列名已按 pandas 规则改名）"""
+    return list(pd.read_csv(file_path, header=0, skiprows=skip_rows, nrows=0).columns)
+
+
+def resolve_projection(columns: Sequence) -> Optional[ColumnProjection]:
+    """由表头列名解析需读取的列；找不到完整的有量纲或系数载荷列时返回 None"""
+    keys = {_norm(c) for c in columns}
+    has_dimensional = all(k in keys for k in DIMENSIONAL_KEYS)
+    has_coeff = any(k in keys for k in COEFF_NORMAL_KEYS) and all(
+        k in keys for k in COEFF_KEYS
+    )
+    if not has_dimensional and not has_coeff:
+        return None
+    float_keys = set(DIMENSIONAL_KEYS + COEFF_KEYS + COEFF_NORMAL_KEYS)
+    wanted = float_keys | set(PASSTHROUGH_KEYS)
+    usecols = [c for c in columns if _norm(c) in wanted]
+    float_cols = [c for c in usecols if _norm(c) in float_keys]
+    return ColumnProjection(usecols=usecols, float_cols=float_cols)
+
+
+def sniff_projection(file_path: Path, skip_rows: int = 0) -> Optional[ColumnProjection]:
+    """嗅探 CSV 表头并解析列投影；非 CSV 或表头无法读取时返回 None"""
+    if Path(file_path).suffix.lower() != ".csv":
+        return None
+    try:
+        return resolve_projection(sniff_columns(file_path, skip_rows))
+    except Exception:  # pylint: disable=broad-except
+        logger.debug("嗅探表头失败，回退为读取全部列: %s", file_path, exc_info=True)
+        return None
+
+
+def _as_float_columns(df: pd.DataFrame, float_cols: Sequence) -> pd.DataFrame:
+    """已解析为数值的载荷列转为 float64；解析失败的 object 列保持原样留给强制转换路径"""
+    for col in float_cols:
+        if col in df.columns and df[col].dtype.kind in "iub":
+            df[col] = df[col].astype(np.float64)
+    return df
+
+
+def read_projected_csv(
+    file_path: Path, skip_rows: int = 0, projection: Optional[ColumnProjection] = None
+) -> pd.DataFrame:
+    """整表读取 CSV；提供 projection 时只解析投影列。
+
+    pyarrow 可用时先以 pyarrow 引擎按 float64 直接解析，失败（含非数值单元）
+    再以默认引擎按推断类型读取，非数值列交由下游强制转换。
+    """
+    if projection is None:
+        return pd.read_csv(file_path, header=0, skiprows=skip_rows)
+    if PYARROW_AVAILABLE:
+        try:
+            return pd.read_csv(
+                file_path,
+                header=0,
+                skiprows=skip_rows,
+                usecols=projection.usecols,
+                dtype={c: np.float64 for c in projection.float_cols},
+                engine="pyarrow",
+            )[projection.usecols]
+        except Exception:  # pylint: disable=broad-except
+            logger.debug("pyarrow 快速解析失败，回退到默认引擎: %s", file_path)
+    df = pd.read_csv(
+        file_path, header=0, skiprows=skip_rows, usecols=projection.usecols
+    )
+    return _as_float_columns(df, projection.float_cols)
+
+
+def _close_quotes(fh, text: bytes) -> bytes:
+    """text 中引号未闭合（字段内含换行）时续读后续行直到闭合"""
+    while text.count(b'"') % 2:
+        extra = fh.readline()
+        if not extra:
+            break
+        text += extra
+    return text
+
+
+def _newline_positions(data: bytes) -> np.ndarray:
+    return np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 0x0A)
+
+
+def _iter_line_blocks(fh, chunk_size: int) -> Iterator[bytes]:
+    """按物理行把二进制流切成最多 chunk_size 行的块（不在引号内的换行处切开）。
+
+    以定长字节块读取，用 numpy 定位换行符，避免逐行构造 bytes 对象。
+    """
+    pending = b""
+    pending_nl = np.empty(0, dtype=np.intp)
+    while True:
+        parts, offsets = [pending], [pending_nl]
+        size, lines = len(pending), len(pending_nl)
+        while lines < chunk_size:
+            piece = fh.read(_READ_BLOCK_BYTES)
+            if not piece:
+                break
+            newlines = _newline_positions(piece)
+            parts.append(piece)
+            offsets.append(newlines + size)
+            size += len(piece)
+            lines += len(newlines)
+        buf = b"".join(parts)
+        if not buf:
+            return
+        if lines < chunk_size:
+            block, pending = buf, b""
+            pending_nl = pending_nl[:0]
+        else:
+            newlines = np.concatenate(offsets)
+            cut = int(newlines[chunk_size - 1]) + 1
+            block, pending = buf[:cut], buf[cut:]
+            pending_nl = newlines[chunk_size:] - cut
+        if b'"' in block and block.count(b'"') % 2:
+            block, pending = _extend_to_closing_quote(fh, block, pending)
+            pending_nl = _newline_positions(pending)
+        yield block
+
+
+def _extend_to_closing_quote(fh, block: bytes, pending: bytes):
+    """block 末尾的引号未闭合（字段内含换行）时，从 pending/文件中逐行并入直到闭合"""
+    quotes = block.count(b'"')
+    while quotes % 2:
+        nl = pending.find(b"\n")
+        if nl < 0:
+            more = fh.read(_READ_BLOCK_BYTES)
+            if more:
+                pending += more
+                continue
+            # 引号直到文件末尾仍未闭合：剩余内容并入本块，由解析器报错
+            return block + pending, b""
+        quotes += pending.count(b'"', 0, nl + 1)
+        block += pending[: nl + 1]
+        pending = pending[nl + 1 :]
+    return block, pending
+
+
+def _read_header_line(fh, skip_rows: int) -> bytes:
+    """跳过 skip_rows 行及其后的空行，返回表头行（与 read_csv 的 header=0 一致）"""
+    for _ in range(skip_rows):
+        if not fh.readline():
+            break
+    for line in fh:
+        if line.strip():
+            line = _close_quotes(fh, line)
+            return line if line.endswith((b"\n", b"\r")) else line + b"\n"
+    raise pd.errors.EmptyDataError("No columns to parse from file")
+
+
+class _ByteRangeReader:  # pylint: disable=too-few-public-methods
+    """把二进制文件的读取限制在 [start, end) 字节区间内"""
+
+    def __init__(self, fh, start: int, end: int) -> None:
+        fh.seek(start)
+        self._fh = fh
+        self._remaining = max(end - start, 0)
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._fh.read(size)
+        self._remaining -= len(data)
+        return data
+
+
+def _parse_block(
+    header: bytes, block: bytes, projection: Optional[ColumnProjection]
+) -> pd.DataFrame:
+    """按 float64 解析一个数据块；含非数值单元时只对该块按推断类型重读（交由强制转换路径）"""
+    text = header + block
+    if projection is None:
+        return pd.read_csv(io.BytesIO(text), header=0)
+    try:
+        return pd.read_csv(
+            io.BytesIO(text),
+            header=0,
+            usecols=projection.usecols,
+            dtype={c: np.float64 for c in projection.float_cols},
+        )[projection.usecols]
+    except ValueError:
+        logger.debug("数据块含非数值单元，按推断类型重读该块")
+    df = pd.read_csv(io.BytesIO(text), header=0, usecols=projection.usecols)
+    return _as_float_columns(df[projection.usecols], projection.float_cols)
+
+
+def iter_projected_csv(
+    file_path: Path,
+    skip_rows: int,
+    chunk_size: int,
+    projection: Optional[ColumnProjection] = None,
+    *,
+    byte_range: Optional[Tuple[int, int]] = None,
+) -> Iterator[pd.DataFrame]:
+    """按块读取 CSV（只解析投影列），逐块产出；各块独立决定是否需要强制转换。
+
+    提供 projection 时按物理行切块，载荷列以 float64 dtype 直接解析；某块解析失败
+    （含非数值单元）时只重读该块。pandas 分块读取器在类型转换出错后不能继续使用，
+    因此切块由本函数完成，不依赖 read_csv 的 chunksize。
+
+    byte_range=(start, end) 时只读取该字节区间内的数据行（区间边界须位于换行之后，
+    表头仍取自文件开头），供文件内分片并行使用。
+    """
+    if projection is None and byte_range is None:
+        with pd.read_csv(
+            file_path, header=0, skiprows=skip_rows, chunksize=chunk_size
+        ) as reader:
+            yield from reader
+        return
+
+    with open(file_path, "rb") as fh:
+        header = _read_header_line(fh, skip_rows)
+        source = fh if byte_range is None else _ByteRangeReader(fh, *byte_range)
+        empty = True
+        for block in _iter_line_blocks(source, chunk_size):
+            chunk = _parse_block(header, block, projection)
+            if chunk.empty:
+                continue
+            empty = False
+            yield chunk
+        if empty:
+            yield _parse_block(header, b"", projection)
+
+
+def coerce_float_matrix(df: pd.DataFrame, cols: Sequence) -> np.ndarray:
+    """把 df 的若干列组合为 (N, len(cols)) float64 数组。
+
+    已是浮点/整数的列直接复制；其余列按 `pd.to_numeric(errors="coerce")` 转换，
+    非数值单元为 NaN（与逐列 apply 的结果一致）。
+    """
+    out = np.empty((len(df), len(cols)), dtype=np.float64)
+    for idx, col in enumerate(cols):
+        values = df[col]
+        if values.dtype.kind in "fiub":
+            out[:, idx] = values.to_numpy(dtype=np.float64)
+        else:
+            out[:, idx] = pd.to_numeric(values, errors="coerce").to_numpy(
+                dtype=np.float64
+            )
+    return out
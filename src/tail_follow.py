@@ -0,0 +1,150 @@
+"""
+增量跟踪（tail/follow）- 只读取并解析数据文件中新追加的字节
+
+采集过程中数据行不断追加到同一个打开的 `.mtfmt` 或 CSV 文件。本模块记录已读取的
+字节偏移与未以换行结尾的残行，每次轮询只读取新增字节并切分为完整行：
+- `TailReader`：字节偏移、残行缓冲与编码（首次读取时按 `sniff_encoding_bytes` 判定，
+  后续追加内容无法以该编码解码时重新判定并记录警告，不以替换符静默替换）；
+  文件被截断或替换（inode 变化）时返回 None，由调用方从头重建解析状态；
+- `CsvLineParser`：跳过 skip_rows 行后记住表头，之后把新增行解析为 DataFrame
+  （列投影与整表读取一致，见 `src.table_reader`）。
+
+特殊格式文件的增量解析见 `src.special_format_parser.SpecialFormatLineParser`。
+CSV 仅支持单行记录（引号内换行的字段不在跟踪范围内）。
+"""
+
+import io
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+from src.special_format_detector import sniff_encoding_bytes
+from src.table_reader import ColumnProjection, read_projected_csv, resolve_projection
+
+logger = logging.getLogger(__name__)
+
+# 单次轮询最多读取的字节数，避免首次跟踪大文件时一次性占用过多内存
+DEFAULT_READ_BLOCK = 16 * 1024 * 1024
+# 按换行字节切分会截断字符的编码（换行编码含 NUL 字节），跟踪模式不支持
+_UNSUPPORTED_ENCODINGS = ("utf-16",)
+
+
+class TailReader:
+    """按字节偏移增量读取文本文件，只返回以换行结尾的完整行。"""
+
+    def __init__(self, path, read_block: int = DEFAULT_READ_BLOCK) -> None:
+        self.path = Path(path)
+        self.read_block = int(read_block)
+        self.offset = 0
+        self.encoding: Optional[str] = None
+        self.bytes_read = 0
+        self._partial = b""
+        self._inode: Optional[int] = None
+
+    def reset(self) -> None:
+        """丢弃偏移、残行与编码，下次从文件开头读取"""
+        self.offset = 0
+        self.encoding = None
+        self._partial = b""
+        self._inode = None
+
+    def read_lines(self) -> Optional[List[str]]:
+        """读取自上次以来追加的完整行（保留换行符）。
+
+        文件不存在时返回空列表；文件被截断或替换时返回 None（调用方应 reset 并重建状态）。
+        """
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+        if self._inode is not None and (
+            st.st_ino != self._inode or st.st_size < self.offset
+        ):
+            return None
+        self._inode = st.st_ino
+        if st.st_size == self.offset:
+            return []
+        with open(self.path, "rb") as fh:
+            fh.seek(self.offset)
+            data = fh.read(min(st.st_size - self.offset, self.read_block))
+        self.offset += len(data)
+        self.bytes_read += len(data)
+        data = self._partial + data
+        cut = data.rfind(b"\n") + 1
+        self._partial = data[cut:]
+        return self._decode(data[:cut])
+
+    def flush_partial(self) -> List[str]:
+        """返回并清空未以换行结尾的最后一行（停止跟踪时视为完整行）"""
+        data, self._partial = self._partial, b""
+        return self._decode(data)
+
+    def _decode(self, data: bytes) -> List[str]:
+        if not data:
+            return []
+        if self.encoding is None:
+            self.encoding = self._sniff(data)
+        # 按换行切分后各行不会截断多字节字符，因此可逐块严格解码
+        try:
+            text = data.decode(self.encoding)
+        except UnicodeDecodeError:
+            # 如 ASCII 前缀判定为 utf-8 后追加了 gbk 字符：按本块重新判定
+            encoding = self._sniff(data)
+            logger.warning(
+                "追加内容无法以 %s 解码，改用 %s: %s",
+                self.encoding,
+                encoding,
+                self.path,
+            )
+            self.encoding = encoding
+            text = data.decode(encoding)
+        pieces = text.split("\n")
+        lines = [piece + "\n" for piece in pieces[:-1]]
+        if pieces[-1]:
+            lines.append(pieces[-1])
+        return lines
+
+    def _sniff(self, data: bytes) -> str:
+        encoding = sniff_encoding_bytes(data)
+        if encoding in _UNSUPPORTED_ENCODINGS:
+            raise ValueError(f"跟踪模式不支持 {encoding} 编码的文件: {self.path}")
+        return encoding
+
+
+class CsvLineParser:
+    """CSV 的增量解析器：先记住表头，之后把新增的数据行解析为 DataFrame。"""
+
+    def __init__(self, skip_rows: int = 0) -> None:
+        self.skip_rows = int(skip_rows or 0)
+        self.header_line: Optional[str] = None
+        self.projection: Optional[ColumnProjection] = None
+        self.rows = 0
+        self._skipped = 0
+
+    def feed(self, lines: List[str]) -> Optional[pd.DataFrame]:
+        """解析若干完整行；返回新增数据行构成的 DataFrame，无数据行时返回 None"""
+        idx = 0
+        while self.header_line is None and idx < len(lines):
+            line = lines[idx]
+            idx += 1
+            if self._skipped < self.skip_rows:
+                self._skipped += 1
+                continue
+            if not line.strip():
+                continue
+            self.header_line = line if line.endswith("\n") else line + "\n"
+            columns = list(
+                pd.read_csv(io.StringIO(self.header_line), header=0, nrows=0).columns
+            )
+            self.projection = resolve_projection(columns)
+        body = [ln for ln in lines[idx:] if ln.strip()]
+        if self.header_line is None or not body:
+            return None
+        df = read_projected_csv(
+            io.StringIO(self.header_line + "".join(body)), 0, self.projection
+        )
+        self.rows += len(df)
+        return df
@@ -0,0 +1,237 @@
+"""
+变换表 - 在项目加载时一次性预计算全部 source×target variant 对的几何量
+
+`AeroCalculator` 原本在每次构造时重建两组基矩阵、计算旋转矩阵与目标系下的力臂；
+成千上万个文件/part 共享同一份配置时，这些计算被大量重复。本模块在 `load_data` 时
+把所有 variant 的基矩阵各构造一次（S+T 次），再用广播矩阵乘法得到：
+- rotations: (S,T,3,3) 旋转矩阵 R = B_target · B_sourceᵀ
+- lever_arms_global: (S,T,3) 全局系力臂 r = source 力矩参考点 - target 矩心
+- lever_arms: (S,T,3) 投影到目标系的力臂 B_target · r
+- force_denominators: (T,) q·S；moment_denominators: (T,3) q·S·[b, c, b]
+
+按 frame 对象查找 pair 为 O(1)。基矩阵构造报错或发出警告（如不正交）的 variant 不进入表，
+其查找返回 None，由调用方回退到原有的逐个计算路径（保持原有的警告与异常行为）。
+
+表是加载时的快照：frame 对象被替换后按对象身份查找不到，自动回退；原地修改 frame 字段后
+需重新构建（`project.transform_table = build_transform_table(project)`）。
+"""
+
+import hashlib
+import logging
+import warnings
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from src import geometry
+
+logger = logging.getLogger(__name__)
+
+
+class PairGeometry(NamedTuple):
+    """单个 source/target variant 对的预计算几何量（表中数组的副本，可由调用方修改）"""
+
+    basis_source: np.ndarray
+    basis_target: np.ndarray
+    rotation: np.ndarray
+    lever_arm_global: np.ndarray
+    lever_arm: np.ndarray
+
+
+def _frame_fingerprint(frame) -> str:
+    """frame 的内容指纹（dataclass repr 覆盖全部字段，与计算器池的几何哈希口径一致）"""
+    return hashlib.sha1(repr(frame).encode("utf-8")).hexdigest()
+
+
+def _basis_or_none(frame) -> Optional[np.ndarray]:
+    """构造 frame 的基矩阵；报错或发出警告时返回 None（该 variant 不进入变换表）"""
+    try:
+        cs = frame.coord_system
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            return geometry.construct_basis_matrix(cs.x_axis, cs.y_axis, cs.z_axis)
+    except Exception:  # pylint: disable=broad-except
+        logger.debug("variant %s 未进入变换表", getattr(frame, "part_name", "?"))
+        return None
+
+
+def _vector_or_none(vec) -> Optional[np.ndarray]:
+    try:
+        arr = np.asarray(vec, dtype=float)
+    except (TypeError, ValueError):
+        return None
+    return arr if arr.shape == (3,) else None
+
+
+def _flatten_variants(parts: Dict[str, list]) -> Tuple[List[Tuple[str, int]], list]:
+    keys: List[Tuple[str, int]] = []
+    frames = []
+    for name, variants in (parts or {}).items():
+        for idx, frame in enumerate(variants or []):
+            keys.append((name, idx))
+            frames.append(frame)
+    return keys, frames
+
+
+@dataclass
+class TransformTable:  # pylint: disable=too-many-instance-attributes
+    """全部 source×target variant 对的预计算几何量（构造见 `TransformTable.build`）"""
+
+    source_keys: List[Tuple[str, int]]
+    target_keys: List[Tuple[str, int]]
+    source_frames: list = field(repr=False)
+    target_frames: list = field(repr=False)
+    source_bases: np.ndarray = field(repr=False)
+    target_bases: np.ndarray = field(repr=False)
+    rotations: np.ndarray = field(repr=False)
+    lever_arms_global: np.ndarray = field(repr=False)
+    lever_arms: np.ndarray = field(repr=False)
+    force_denominators: np.ndarray = field(repr=False)
+    moment_denominators: np.ndarray = field(repr=False)
+    source_valid: np.ndarray = field(repr=False)
+    target_valid: np.ndarray = field(repr=False)
+    source_fingerprints: List[str] = field(repr=False)
+    target_fingerprints: List[str] = field(repr=False)
+
+    def __post_init__(self) -> None:
+        self._source_by_id = {id(f): i for i, f in enumerate(self.source_frames)}
+        self._target_by_id = {id(f): i for i, f in enumerate(self.target_frames)}
+        self._source_by_key = {k: i for i, k in enumerate(self.source_keys)}
+        self._target_by_key = {k: i for i, k in enumerate(self.target_keys)}
+
+    @classmethod
+    def build(cls, project) -> "TransformTable":
+        """由 ProjectData 构建变换表：S+T 次基矩阵构造加几次广播运算"""
+        source_keys, source_frames = _flatten_variants(project.source_parts)
+        target_keys, target_frames = _flatten_variants(project.target_parts)
+        n_src, n_tgt = len(source_frames), len(target_frames)
+
+        nan3 = np.full(3, np.nan)
+        nan33 = np.full((3, 3), np.nan)
+        source_bases = np.empty((n_src, 3, 3))
+        source_refs = np.empty((n_src, 3))
+        source_valid = np.zeros(n_src, dtype=bool)
+        for i, frame in enumerate(source_frames):
+            basis = _basis_or_none(frame)
+            # 力臂优先使用 Source 的 MomentCenter，否则退回到 Source 的 origin
+            ref = frame.moment_center
+            if ref is None:
+                ref = getattr(frame.coord_system, "origin", None)
+            ref = _vector_or_none(ref)
+            source_valid[i] = basis is not None and ref is not None
+            source_bases[i] = basis if source_valid[i] else nan33
+            source_refs[i] = ref if source_valid[i] else nan3
+
+        target_bases = np.empty((n_tgt, 3, 3))
+        target_centers = np.empty((n_tgt, 3))
+        force_denominators = np.full(n_tgt, np.nan)
+        moment_denominators = np.full((n_tgt, 3), np.nan)
+        target_valid = np.zeros(n_tgt, dtype=bool)
+        for j, frame in enumerate(target_frames):
+            basis = _basis_or_none(frame)
+            center = _vector_or_none(frame.moment_center)
+            target_valid[j] = basis is not None and center is not None
+            target_bases[j] = basis if target_valid[j] else nan33
+            target_centers[j] = center if target_valid[j] else nan3
+            if frame.q is not None and frame.s_ref is not None:
+                force_denominators[j] = float(frame.q) * float(frame.s_ref)
+                b_val = float(frame.b_ref) if frame.b_ref is not None else 0.0
+                c_val = float(frame.c_ref) if frame.c_ref is not None else 0.0
+                moment_denominators[j] = force_denominators[j] * np.array(
+                    [b_val, c_val, b_val]
+                )
+
+        # R[s,t] = B_t[t] · B_s[s]ᵀ；r[s,t] = ref[s] - mc[t]；r_t[s,t] = B_t[t] · r[s,t]
+        # 广播 matmul 与逐个 np.dot 的结果仅可能在末位舍入上不同
+        with np.errstate(invalid="ignore"):
+            rotations = np.matmul(
+                target_bases[np.newaxis, :, :, :],
+                np.swapaxes(source_bases, 1, 2)[:, np.newaxis, :, :],
+            )
+            lever_arms_global = (
+                source_refs[:, np.newaxis, :] - target_centers[np.newaxis, :, :]
+            )
+            lever_arms = np.matmul(
+                target_bases[np.newaxis, :, :, :], lever_arms_global[..., np.newaxis]
+            )[..., 0]
+
+        return cls(
+            source_keys=source_keys,
+            target_keys=target_keys,
+            source_frames=source_frames,
+            target_frames=target_frames,
+            source_bases=source_bases,
+            target_bases=target_bases,
+            rotations=rotations,
+            lever_arms_global=lever_arms_global,
+            lever_arms=lever_arms,
+            force_denominators=force_denominators,
+            moment_denominators=moment_denominators,
+            source_valid=source_valid,
+            target_valid=target_valid,
+            source_fingerprints=[_frame_fingerprint(f) for f in source_frames],
+            target_fingerprints=[_frame_fingerprint(f) for f in target_frames],
+        )
+
+    def frame_indices(self, source_frame, target_frame) -> Optional[Tuple[int, int]]:
+        """返回 frame 对象在表中的 (s, t) 下标；不在表中（如构建后被替换）时返回 None"""
+        s = self._source_by_id.get(id(source_frame))
+        t = self._target_by_id.get(id(target_frame))
+        if s is None or t is None:
+            return None
+        if self.source_frames[s] is not source_frame:
+            return None
+        if self.target_frames[t] is not target_frame:
+            return None
+        return s, t
+
+    def pair_fingerprint(self, source_frame, target_frame) -> Optional[str]:
+        """source/target frame 对的内容指纹（构建时预先计算），不在表中时返回 None"""
+        idx = self.frame_indices(source_frame, target_frame)
+        if idx is None:
+            return None
+        s, t = idx
+        return f"{self.source_fingerprints[s]}:{self.target_fingerprints[t]}"
+
+    def lookup(self, source_frame, target_frame) -> Optional[PairGeometry]:
+        """按 frame 对象 O(1) 查找预计算几何；不在表中或该 variant 无效时返回 None"""
+        idx = self.frame_indices(source_frame, target_frame)
+        if idx is None:
+            return None
+        s, t = idx
+        if not (self.source_valid[s] and self.target_valid[t]):
+            return None
+        return PairGeometry(
+            basis_source=self.source_bases[s].copy(),
+            basis_target=self.target_bases[t].copy(),
+            rotation=self.rotations[s, t].copy(),
+            lever_arm_global=self.lever_arms_global[s, t].copy(),
+            lever_arm=self.lever_arms[s, t].copy(),
+        )
+
+    def lookup_parts(
+        self,
+        source_part: str,
+        target_part: str,
+        source_variant: int = 0,
+        target_variant: int = 0,
+    ) -> Optional[PairGeometry]:
+        """按 part 名与 variant 序号查找预计算几何（供 GUI/规划器按名称查询）"""
+        s = self._source_by_key.get((source_part, source_variant))
+        t = self._target_by_key.get((target_part, target_variant))
+        if s is None or t is None:
+            return None
+        return self.lookup(self.source_frames[s], self.target_frames[t])
+
+
+def build_transform_table(project) -> Optional[TransformTable]:
+    """构建变换表；失败时记录日志并返回 None（调用方回退为逐个计算）"""
+    try:
+        return TransformTable.build(project)
+    except Exception:  # pylint: disable=broad-except
+        logger.debug("构建变换表失败，回退为逐个计算", exc_info=True)
+        return None
+
+
+__all__ = ["PairGeometry", "TransformTable", "build_transform_table"]
@@ -0,0 +1,58 @@
+"""测试共用的数据构造工具：载荷 CSV 输入文件与多 target 项目配置。"""
+
+import os
+
+import pandas as pd
+
+from src.data_loader import CoordSystemDefinition, FrameConfiguration, ProjectData
+from src.geometry import euler_angles_to_basis
+
+LOAD_COLUMNS = ("Fx", "Fy", "Fz", "Mx", "My", "Mz")
+
+
+def write_load_csv(path, offset=0.0, rows=8, atomic=False):
+    """写入 rows 行有量纲载荷 CSV（第 r 行各列为 r + offset）。
+
+    atomic=True 时先写临时名再改名，模拟采集系统的原子落盘。
+    """
+    target = path.with_name(path.name + ".tmp") if atomic else path
+    pd.DataFrame(
+        {c: [float(r) + offset for r in range(rows)] for c in LOAD_COLUMNS}
+    ).to_csv(target, index=False)
+    if atomic:
+        os.replace(target, path)
+
+
+def make_frame(name, angles=(0.0, 0.0, 0.0), moment_center=None, q=100.0):
+    """按欧拉角构造坐标系的部件配置（参考量固定，q 可调）"""
+    basis = euler_angles_to_basis(*angles)
+    return FrameConfiguration(
+        part_name=name,
+        coord_system=CoordSystemDefinition(
+            origin=[0.1, 0.2, 0.3],
+            x_axis=basis[0].tolist(),
+            y_axis=basis[1].tolist(),
+            z_axis=basis[2].tolist(),
+        ),
+        moment_center=moment_center,
+        c_ref=0.5,
+        b_ref=2.0,
+        q=q,
+        s_ref=1.5,
+    )
+
+
+def make_multi_target_project(source_parts=None):
+    """目标部件为 Wing（两个变体）与 Tail 的项目；source_parts 默认仅含 S"""
+    if source_parts is None:
+        source_parts = {"S": [make_frame("S", (5.0, 2.0, -3.0))]}
+    return ProjectData(
+        source_parts=source_parts,
+        target_parts={
+            "Wing": [
+                make_frame("Wing", (0.0, 0.0, 10.0), [0.5, 0.0, 0.1]),
+                make_frame("Wing", (0.0, 4.0, 10.0), [0.6, 0.0, 0.1], q=80.0),
+            ],
+            "Tail": [make_frame("Tail", (30.0, 0.0, 0.0), [-2.0, 0.3, 0.4])],
+        },
+    )
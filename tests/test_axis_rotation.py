@@ -0,0 +1,139 @@
+"""按 Alpha/Beta 逐行轴系旋转（稳定轴/风轴）测试。"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import batch as b
+from src.batch_config import BatchConfig
+from src.data_loader import CoordSystemDefinition, FrameConfiguration, ProjectData
+from src.geometry import body_to_axes_matrices
+from src.physics import AeroCalculator, ResultBuffer
+
+
+def _make_calculator():
+    frame = FrameConfiguration(
+        part_name="T",
+        coord_system=CoordSystemDefinition(
+            origin=[0, 0, 0], x_axis=[1, 0, 0], y_axis=[0, 1, 0], z_axis=[0, 0, 1]
+        ),
+        moment_center=[0.2, 0.0, -0.1],
+        c_ref=0.4,
+        b_ref=3.0,
+        q=50.0,
+        s_ref=2.0,
+    )
+    return AeroCalculator(
+        ProjectData(source_parts={"T": [frame]}, target_parts={"T": [frame]})
+    )
+
+
+def test_axes_matrices_are_rotations():
+    alpha = np.array([0.0, 12.0, -7.5, 90.0])
+    beta = np.array([0.0, 3.0, 10.0, 0.0])
+    mats = body_to_axes_matrices(alpha, beta, axes="wind")
+
+    assert mats.shape == (4, 3, 3)
+    assert np.allclose(mats[0], np.eye(3))
+    assert np.allclose(np.matmul(mats, mats.transpose(0, 2, 1)), np.eye(3))
+    assert np.allclose(np.linalg.det(mats), 1.0)
+    # alpha=90°：体轴 X 指向风轴 -Z
+    assert np.allclose(mats[3] @ [1.0, 0.0, 0.0], [0.0, 0.0, -1.0])
+    # 稳定轴系忽略 beta
+    stab = body_to_axes_matrices(alpha, beta, axes="stability")
+    assert np.allclose(stab, body_to_axes_matrices(alpha, None, axes="wind"))
+    assert np.allclose(body_to_axes_matrices(alpha, axes="body"), np.eye(3))
+    with pytest.raises(ValueError):
+        body_to_axes_matrices(alpha, axes="earth")
+
+
+def test_process_batch_axis_rotations_matches_per_row_loop():
+    calc = _make_calculator()
+    rng = np.random.default_rng(3)
+    forces = rng.normal(size=(20, 3)) * 100
+    moments = rng.normal(size=(20, 3)) * 10
+    mats = body_to_axes_matrices(rng.uniform(-20, 20, 20), rng.uniform(-5, 5, 20))
+
+    base = calc.process_batch(forces, moments)
+    res = calc.process_batch(forces, moments, out=ResultBuffer(), axis_rotations=mats)
+
+    for i in range(20):
+        f = mats[i] @ base["force_transformed"][i]
+        m = mats[i] @ base["moment_transformed"][i]
+        assert np.allclose(res["force_transformed"][i], f)
+        assert np.allclose(res["moment_transformed"][i], m)
+        assert np.allclose(res["coeff_force"][i], f / (50.0 * 2.0))
+        assert np.allclose(res["coeff_moment"][i], m / (100.0 * np.array([3, 0.4, 3])))
+
+
+def test_process_df_chunk_wind_axes(tmp_path):
+    calc = _make_calculator()
+    df = pd.DataFrame(
+        {
+            "Fx": [10.0, 10.0],
+            "Fy": [0.0, 0.0],
+            "Fz": [0.0, 0.0],
+            "Mx": [0.0, 0.0],
+            "My": [0.0, 0.0],
+            "Mz": [0.0, 0.0],
+            "Alpha": [0.0, 90.0],
+        }
+    )
+    cfg = BatchConfig()
+    cfg.axis_frame = "wind"
+    out_path = tmp_path / "out.csv"
+    b.process_df_chunk(
+        df, calc, cfg, out_path, True, logging.getLogger("test"), ResultBuffer()
+    )
+
+    out = pd.read_csv(out_path)
+    assert np.allclose(out.loc[0, ["Fx_new", "Fz_new"]], [10.0, 0.0])
+    assert np.allclose(out.loc[1, ["Fx_new", "Fz_new"]], [0.0, -10.0])
+    assert list(out["Alpha"]) == [0.0, 90.0]
+
+    with pytest.raises(ValueError):
+        b.process_df_chunk(
+            df.drop(columns=["Alpha"]),
+            calc,
+            cfg,
+            tmp_path / "missing.csv",
+            True,
+            logging.getLogger("test"),
+        )
+
+
+@pytest.mark.parametrize(
+    "policy,rows,fx_new",
+    [("drop", 2, [10.0, 0.0]), ("zero", 3, [10.0, 10.0, 0.0]), ("nan", 3, None)],
+)
+def test_non_numeric_alpha_follows_policy(policy, rows, fx_new):
+    calc = _make_calculator()
+    df = pd.DataFrame(
+        {
+            "Fx": [10.0] * 3,
+            "Fy": [0.0] * 3,
+            "Fz": [0.0] * 3,
+            "Mx": [0.0] * 3,
+            "My": [0.0] * 3,
+            "Mz": [0.0] * 3,
+            "Alpha": ["0", "bad", "90"],
+        }
+    )
+    cfg = BatchConfig()
+    cfg.axis_frame = "wind"
+    cfg.treat_non_numeric = policy
+
+    out_df, dropped, n_non = b._compute_chunk_output(
+        df, calc, cfg, "in.csv", logging.getLogger("test")
+    )
+
+    # 非数值 Alpha 与非数值载荷一样计数，并按策略处理
+    assert n_non == 1
+    assert dropped == (1 if policy == "drop" else 0)
+    assert len(out_df) == rows
+    if fx_new is None:
+        assert out_df["Fx_new"].isna().tolist() == [False, True, False]
+    else:
+        assert np.allclose(out_df["Fx_new"], fx_new)
@@ -0,0 +1,97 @@
+"""串行与并行模式共用任务规划的一致性测试（文件级覆盖、行选择、dry-run）。"""
+
+import pandas as pd
+
+from batch import (
+    BatchConfig,
+    ParallelOptions,
+    resolve_worker_count,
+    run_batch_processing,
+)
+from src.batch_scheduler import FileJob, plan_batch_jobs
+
+
+def _write_inputs(root, n_files=3, rows=12):
+    paths = []
+    for i in range(n_files):
+        path = root / f"run_{i}.csv"
+        pd.DataFrame(
+            {
+                "Fx": [100.0 + i + r for r in range(rows)],
+                "Fy": [1.0] * rows,
+                "Fz": [-50.0 + r for r in range(rows)],
+                "Mx": [0.5] * rows,
+                "My": [10.0 + r for r in range(rows)],
+                "Mz": [0.0] * rows,
+            }
+        ).to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def _run(tmp_path, name, workers, **kwargs):
+    work = tmp_path / name
+    work.mkdir()
+    paths = _write_inputs(work)
+    cfg = BatchConfig()
+    cfg.name_template = "{stem}_result.csv"
+    # 按当前目录下的文件路径构造文件级覆盖
+    mapping = {str(paths[1]): {"source": "Global", "target": "LeftWing"}}
+    selection = {str(paths[2]): {0, 3, 7}}
+    result = run_batch_processing(
+        "data/input.json",
+        str(work),
+        cfg,
+        target_part="TestModel",
+        file_source_target_map=mapping,
+        file_row_selection=selection,
+        parallel=ParallelOptions(workers=workers),
+        **kwargs,
+    )
+    outputs = {p.name: p.read_bytes() for p in sorted(work.glob("*_result.csv"))}
+    return result, outputs
+
+
+def test_parallel_matches_serial_with_overrides(tmp_path):
+    serial, serial_out = _run(tmp_path, "serial", 1)
+    parallel, parallel_out = _run(tmp_path, "parallel", 2)
+
+    assert serial["fail"] == 0 and parallel["fail"] == 0
+    assert "pool" in parallel and "pool" not in serial
+    assert serial_out == parallel_out
+    assert len(serial_out) == 3
+    # 行选择与 part 覆盖在并行模式下同样生效
+    assert len(pd.read_csv(tmp_path / "parallel" / "run_2_result.csv")) == 3
+    assert serial_out["run_0_result.csv"] != serial_out["run_1_result.csv"]
+
+
+def test_dry_run_parallel_writes_nothing(tmp_path):
+    result, outputs = _run(tmp_path, "dry", 2, dry_run=True)
+    assert result["dry_run"]
+    assert result["total"] == 3
+    assert outputs == {}
+
+
+def test_plan_batch_jobs_task_payload(tmp_path):
+    a, b = tmp_path / "a.csv", tmp_path / "b.csv"
+    jobs = plan_batch_jobs(
+        [a, b],
+        file_source_target_map={str(b): {"target": "LeftWing"}},
+        file_row_selection={str(b): {1}},
+    )
+    assert jobs[0].task() == (0, str(a))
+    assert jobs[1].task() == (
+        1,
+        str(b),
+        {"target_part": "LeftWing", "selected_rows": {1}},
+    )
+
+
+def test_resolve_worker_count(tmp_path, monkeypatch):
+    jobs = [FileJob(path=tmp_path / f"{i}.csv") for i in range(3)]
+    assert resolve_worker_count(4, jobs) == 4
+    monkeypatch.setattr("batch.os.cpu_count", lambda: 8)
+    assert resolve_worker_count(None, jobs) == 3
+    assert resolve_worker_count(0, []) == 1
+    monkeypatch.setattr("batch.os.cpu_count", lambda: 1)
+    assert resolve_worker_count(None, jobs) == 1
@@ -0,0 +1,64 @@
+"""串行批处理 读取/计算/写出 流水线与严格顺序执行的一致性测试。"""
+
+import pandas as pd
+
+from batch import BatchConfig, run_batch_processing
+
+
+def _write_inputs(root):
+    for i in range(4):
+        rows = 10 + 7 * i
+        df = pd.DataFrame(
+            {
+                "Fx": [str(float(r + i)) for r in range(rows)],
+                "Fy": [1.0] * rows,
+                "Fz": [-2.0 * r for r in range(rows)],
+                "Mx": [0.5] * rows,
+                "My": [0.1 * r for r in range(rows)],
+                "Mz": [0.0] * rows,
+                "Alpha": list(range(rows)),
+            }
+        )
+        # 注入非数值行以覆盖逐文件的示例配额与 drop 统计
+        df.loc[3, "Fx"] = "bad"
+        df.to_csv(root / f"case_{i}.csv", index=False)
+    # 缺少必要列的文件应失败且不影响其余文件
+    pd.DataFrame({"A": [1, 2]}).to_csv(root / "case_broken.csv", index=False)
+
+
+def _run(tmp_path, name, depth, chunk_size):
+    work = tmp_path / name
+    work.mkdir()
+    _write_inputs(work)
+    cfg = BatchConfig()
+    cfg.name_template = "{stem}_result.csv"
+    cfg.treat_non_numeric = "drop"
+    cfg.chunk_size = chunk_size
+    result = run_batch_processing(
+        "data/input.json",
+        str(work),
+        cfg,
+        target_part="TestModel",
+        pipeline_depth=depth,
+    )
+    outputs = {p.name: p.read_bytes() for p in sorted(work.glob("*_result.csv"))}
+    return result, outputs, work
+
+
+def test_pipeline_matches_sequential(tmp_path):
+    for chunk_size in (0, 4):
+        seq, seq_out, _ = _run(tmp_path, f"seq_{chunk_size}", 0, chunk_size)
+        pipe, pipe_out, work = _run(tmp_path, f"pipe_{chunk_size}", 2, chunk_size)
+
+        assert seq_out == pipe_out
+        # 失败文件只留下空的占位输出
+        assert len(pipe_out) == 5 and pipe_out["case_broken_result.csv"] == b""
+        assert (seq["success"], seq["fail"]) == (4, 1)
+        assert (pipe["success"], pipe["fail"]) == (4, 1)
+        assert [r["file"] for r in pipe["files"]] == [
+            str(work / n)
+            for n in sorted(p.name for p in work.glob("case_*.csv"))
+            if "_result" not in n
+        ]
+        partial = next(work.glob("case_broken*.partial"))
+        assert "缺少必要列" in partial.read_text(encoding="utf-8")
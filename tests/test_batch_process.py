@@ -44,3 +44,55 @@ def test_process_single_file_chunksize_drop(tmp_path):
     df = pd.read_csv(files[0])
     # 原始数据共 12 行 + 表头，且每 4 行有 1 行非数值 -> 非数值 3 行，drop 后剩余 9 行
     assert len(df) == 9
+
+
+def _run_with_chunk_size(tmp_path, csv_path, chunk_size, treat, selected_rows=None):
+    project = load_data("data/input.json")
+    calc = AeroCalculator(project, target_part="TestModel")
+
+    cfg = BatchConfig()
+    cfg.treat_non_numeric = treat
+    cfg.chunk_size = chunk_size
+
+    out_dir = tmp_path / f"out_{chunk_size}_{treat}"
+    out_dir.mkdir()
+    assert process_single_file(
+        csv_path, calc, cfg, out_dir, selected_rows=selected_rows
+    )
+    return pd.read_csv(next(out_dir.glob("*.csv")))
+
+
+def test_streaming_matches_whole_file(tmp_path):
+    csv_path = tmp_path / "sample.csv"
+    write_sample_csv(csv_path, rows=30)
+
+    for treat in ("drop", "nan", "zero"):
+        whole = _run_with_chunk_size(tmp_path, csv_path, 0, treat)
+        streamed = _run_with_chunk_size(tmp_path, csv_path, 4, treat)
+        pd.testing.assert_frame_equal(whole, streamed)
+
+
+def test_streaming_selected_rows_cross_chunks(tmp_path):
+    csv_path = tmp_path / "sample.csv"
+    write_sample_csv(csv_path, rows=30)
+    selected = {1, 2, 3, 5, 9, 10, 17, 26}
+
+    whole = _run_with_chunk_size(tmp_path, csv_path, 0, "drop", selected)
+    streamed = _run_with_chunk_size(tmp_path, csv_path, 3, "drop", selected)
+    pd.testing.assert_frame_equal(whole, streamed)
+    assert len(streamed) == len(selected)
+
+
+def test_streaming_selected_rows_out_of_range_fails(tmp_path):
+    csv_path = tmp_path / "sample.csv"
+    write_sample_csv(csv_path, rows=10)
+    project = load_data("data/input.json")
+    calc = AeroCalculator(project, target_part="TestModel")
+    cfg = BatchConfig()
+    cfg.chunk_size = 4
+
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    assert not process_single_file(csv_path, calc, cfg, out_dir, selected_rows={2, 50})
+    partial = next(out_dir.glob("*.partial"))
+    assert "超出范围" in partial.read_text(encoding="utf-8")
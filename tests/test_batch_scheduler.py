@@ -0,0 +1,82 @@
+"""并行批处理调度（LPT 排序 / 有界提交）测试。"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.batch_scheduler import (
+    estimate_file_cost,
+    estimate_rows,
+    iter_bounded_submit,
+    plan_schedule,
+)
+
+
+def _write_lines(path, n):
+    path.write_text("".join(f"{i},1,2,3,4,5\n" for i in range(n)), encoding="utf-8")
+    return path
+
+
+def test_estimate_rows_small_and_extrapolated(tmp_path, monkeypatch):
+    small = _write_lines(tmp_path / "small.csv", 10)
+    assert estimate_rows(small, small.stat().st_size) == 10
+
+    # 缩小探测窗口以触发按平均行长外推
+    monkeypatch.setattr("src.batch_scheduler.ROW_PROBE_BYTES", 256)
+    big = _write_lines(tmp_path / "big.csv", 5000)
+    est = estimate_rows(big, big.stat().st_size)
+    assert 4000 < est < 6000
+
+
+def test_estimate_cost_weights_format(tmp_path):
+    csv = _write_lines(tmp_path / "a.csv", 100)
+    txt = _write_lines(tmp_path / "a.mtfmt", 100)
+    assert estimate_file_cost(txt).cost > estimate_file_cost(csv).cost
+    assert estimate_file_cost(tmp_path / "missing.csv").cost == 0
+
+
+def test_plan_schedule_orders(tmp_path):
+    paths = [
+        _write_lines(tmp_path / "a.csv", 5),
+        _write_lines(tmp_path / "b.csv", 500),
+        _write_lines(tmp_path / "c.csv", 50),
+    ]
+    assert [j.path.name for j in plan_schedule(paths, "name")] == [
+        "a.csv",
+        "b.csv",
+        "c.csv",
+    ]
+    for policy in ("size", "lpt"):
+        assert [j.path.name for j in plan_schedule(paths, policy)] == [
+            "b.csv",
+            "c.csv",
+            "a.csv",
+        ]
+    with pytest.raises(ValueError):
+        plan_schedule(paths, "random")
+
+
+def test_iter_bounded_submit_limits_in_flight():
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def work(x):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.01)
+        with lock:
+            state["running"] -= 1
+        return x * 2
+
+    with ThreadPoolExecutor(max_workers=8) as exe:
+        got = sorted(
+            fut.result()
+            for _, fut, _ in iter_bounded_submit(
+                exe, work, range(20), lambda i: i, max_in_flight=3
+            )
+        )
+    assert got == [i * 2 for i in range(20)]
+    assert state["peak"] <= 3
@@ -0,0 +1,160 @@
+"""文件内字节分片并行处理：输出与串行路径逐字节一致。"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import batch as b
+from batch import BatchConfig, process_single_file
+from src.data_loader import load_data
+from src.physics import AeroCalculator
+
+
+def _write_csv(path, rows=600, int_alpha=False):
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(
+        rng.normal(size=(rows, 6)) * 100, columns=["Fx", "Fy", "Fz", "Mx", "My", "Mz"]
+    )
+    df["Alpha"] = np.arange(rows) % 10
+    if not int_alpha:
+        df["Alpha"] = df["Alpha"] * 0.5
+    df = df.astype(object)
+    df.iloc[::37, 2] = "bad"
+    df.to_csv(path, index=False)
+
+
+def test_shard_ranges_are_newline_aligned(tmp_path):
+    csv_path = tmp_path / "in.csv"
+    _write_csv(csv_path, rows=200)
+    raw = csv_path.read_bytes()
+
+    data_start, ranges = b._compute_shard_ranges(csv_path, 0, 500)
+    assert raw[data_start - 1 : data_start] == b"\n"
+    assert ranges[0][0] == data_start and ranges[-1][1] == len(raw)
+    for (_, end), (start, _) in zip(ranges[:-1], ranges[1:]):
+        assert end == start and raw[end - 1 : end] == b"\n"
+    assert b"".join(raw[s:e] for s, e in ranges) == raw[data_start:]
+
+
+def test_sharded_output_identical_to_serial(tmp_path):
+    csv_path = tmp_path / "in.csv"
+    _write_csv(csv_path)
+
+    for treat in ("drop", "nan"):
+        cfg = BatchConfig()
+        cfg.treat_non_numeric = treat
+
+        serial_dir = tmp_path / f"serial_{treat}"
+        project = load_data("data/input.json")
+        calc = AeroCalculator(project, target_part="TestModel")
+        assert process_single_file(csv_path, calc, cfg, serial_dir)
+
+        shard_dir = tmp_path / f"sharded_{treat}"
+        with ProcessPoolExecutor(max_workers=2) as exe:
+            assert b.process_file_sharded(
+                csv_path,
+                cfg,
+                shard_dir,
+                "data/input.json",
+                exe,
+                shard_bytes=4096,
+                target_part="TestModel",
+            )
+
+        serial_out = next(serial_dir.glob("*.csv")).read_bytes()
+        sharded_out = next(shard_dir.glob("*.csv")).read_bytes()
+        assert sharded_out == serial_out
+        assert list(shard_dir.glob("*.complete"))
+        assert not list(shard_dir.glob("*.shards.*"))
+
+
+def test_sharded_multi_chunk_output_identical_to_serial(tmp_path):
+    csv_path = tmp_path / "in.csv"
+    _write_csv(csv_path, rows=900)
+    cfg = BatchConfig()
+    cfg.treat_non_numeric = "nan"
+    # 块远小于分片：每个分片内部按块流式处理
+    cfg.chunk_size = 50
+
+    serial_dir = tmp_path / "serial"
+    project = load_data("data/input.json")
+    calc = AeroCalculator(project, target_part="TestModel")
+    assert process_single_file(csv_path, calc, cfg, serial_dir)
+
+    shard_dir = tmp_path / "sharded"
+    with ProcessPoolExecutor(max_workers=2) as exe:
+        assert b.process_file_sharded(
+            csv_path,
+            cfg,
+            shard_dir,
+            "data/input.json",
+            exe,
+            shard_bytes=16384,
+            target_part="TestModel",
+        )
+
+    serial_out = next(serial_dir.glob("*.csv")).read_bytes()
+    assert next(shard_dir.glob("*.csv")).read_bytes() == serial_out
+    assert serial_out.count(b"\n") == 901
+
+
+def test_sharded_npz_output_matches_serial(tmp_path):
+    csv_path = tmp_path / "in.csv"
+    _write_csv(csv_path)
+    cfg = BatchConfig()
+    cfg.treat_non_numeric = "drop"
+    cfg.output_format = "npz"
+
+    serial_dir = tmp_path / "serial"
+    project = load_data("data/input.json")
+    calc = AeroCalculator(project, target_part="TestModel")
+    assert process_single_file(csv_path, calc, cfg, serial_dir)
+
+    shard_dir = tmp_path / "sharded"
+    with ProcessPoolExecutor(max_workers=2) as exe:
+        assert b.process_file_sharded(
+            csv_path,
+            cfg,
+            shard_dir,
+            "data/input.json",
+            exe,
+            shard_bytes=4096,
+            target_part="TestModel",
+        )
+
+    serial_out = b.read_output_frame(next(serial_dir.glob("*.npz")))
+    sharded_out = b.read_output_frame(next(shard_dir.glob("*.npz")))
+    pd.testing.assert_frame_equal(sharded_out, serial_out)
+    assert len(serial_out) == 600 - len(range(0, 600, 37))
+    assert not list(shard_dir.glob("*.shards.*"))
+
+
+def test_sharded_output_writes_integer_alpha_as_float(tmp_path):
+    csv_path = tmp_path / "in.csv"
+    _write_csv(csv_path, int_alpha=True)
+    cfg = BatchConfig()
+
+    serial_dir = tmp_path / "serial"
+    project = load_data("data/input.json")
+    calc = AeroCalculator(project, target_part="TestModel")
+    assert process_single_file(csv_path, calc, cfg, serial_dir)
+
+    shard_dir = tmp_path / "sharded"
+    with ProcessPoolExecutor(max_workers=2) as exe:
+        assert b.process_file_sharded(
+            csv_path,
+            cfg,
+            shard_dir,
+            "data/input.json",
+            exe,
+            shard_bytes=4096,
+            target_part="TestModel",
+        )
+
+    serial_out = pd.read_csv(next(serial_dir.glob("*.csv")), dtype=str)
+    sharded_out = pd.read_csv(next(shard_dir.glob("*.csv")), dtype=str)
+    # 串行输出保持读取到的整型；分片输出统一为浮点，数值相同
+    assert serial_out["Alpha"].tolist()[:3] == ["0", "1", "2"]
+    assert sharded_out["Alpha"].tolist()[:3] == ["0.0", "1.0", "2.0"]
+    assert sharded_out.drop(columns="Alpha").equals(serial_out.drop(columns="Alpha"))
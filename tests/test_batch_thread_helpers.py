@@ -1,6 +1,7 @@
 import pandas as pd
 
 from gui.batch_thread import BatchProcessThread
+from tests.helpers import write_load_csv
 
 
 class DummySignal:
@@ -47,3 +48,116 @@ def test_handle_special_report_emits_logs(tmp_path):
     assert "part 'P1' 处理成功" in ds.messages[0]
     assert "被跳过" in ds.messages[1]
     assert "处理失败" in ds.messages[2]
+
+
+class _FakeCalc:
+    def process_batch(self, forces, moments):
+        return {
+            "force_transformed": forces * 2.0,
+            "moment_transformed": moments + 1.0,
+            "coeff_force": forces,
+            "coeff_moment": moments,
+        }
+
+
+def _run_thread_loop(root, depth):
+    from gui.batch_thread import BatchThreadConfig
+
+    files = []
+    for i in range(4):
+        path = root / f"in_{i}.csv"
+        write_load_csv(path, offset=i, rows=5 + i)
+        files.append(path)
+    broken = root / "in_broken.csv"
+    pd.DataFrame({"A": [1]}).to_csv(broken, index=False)
+    files.insert(2, broken)
+
+    out_dir = root / "out"
+    thread = BatchProcessThread(
+        _FakeCalc(),
+        files,
+        out_dir,
+        {},
+        config=BatchThreadConfig(pipeline_depth=depth),
+    )
+    logs, progress = DummySignal(), DummySignal()
+    thread.log_message = logs
+    thread.progress = progress
+    thread.progress_detail = DummySignal()
+    success, elapsed = thread._run_main_loop()
+    outputs = {
+        p.name.split("_result_")[0]: p.read_bytes() for p in out_dir.glob("*.csv")
+    }
+    return success, elapsed, outputs, logs.messages, progress.messages
+
+
+def test_pipelined_main_loop_matches_sequential(tmp_path):
+    (tmp_path / "seq").mkdir()
+    (tmp_path / "pipe").mkdir()
+    seq = _run_thread_loop(tmp_path / "seq", 0)
+    pipe = _run_thread_loop(tmp_path / "pipe", 2)
+
+    assert seq[0] == pipe[0] == 4
+    assert len(seq[1]) == len(pipe[1]) == 5
+    assert seq[2] == pipe[2] and len(pipe[2]) == 4
+    assert pipe[4] == seq[4] == [20, 40, 60, 80, 100]
+    # 失败文件的消息按文件顺序出现
+    done = [m for m in pipe[3] if m.startswith("  ✓") or m.startswith("  ✗")]
+    assert [m.startswith("  ✗") for m in done] == [False, False, True, False, False]
+
+
+def test_main_loop_resume_skips_completed_files(tmp_path):
+    from gui.batch_thread import BatchThreadConfig
+
+    _run_thread_loop(tmp_path, 0)
+    files = sorted(tmp_path.glob("in_*.csv"))
+    thread = BatchProcessThread(
+        _FakeCalc(),
+        files,
+        tmp_path / "out",
+        {},
+        config=BatchThreadConfig(pipeline_depth=0, resume=True),
+    )
+    logs = DummySignal()
+    thread.log_message = logs
+    thread.progress = DummySignal()
+    thread.progress_detail = DummySignal()
+    success, _ = thread._run_main_loop()
+    # 仅上次失败的文件需要重新处理
+    assert success == 0
+    assert [p.name for p in thread.file_list] == ["in_broken.csv"]
+    assert "续跑：跳过 4 个已完成的文件" in logs.messages
+
+
+def test_journal_hashes_shared_config_once(tmp_path, monkeypatch):
+    import gui.batch_thread as bt
+
+    project_file = tmp_path / "project.json"
+    project_file.write_text("{}", encoding="utf-8")
+    project = object()
+    calls = []
+    orig = bt.config_hash
+    monkeypatch.setattr(bt, "config_hash", lambda *p: calls.append(p) or orig(*p))
+
+    files = [tmp_path / "a.csv", tmp_path / "b.csv"]
+    thread = BatchProcessThread(
+        _FakeCalc(),
+        files,
+        tmp_path / "out",
+        {},
+        config=bt.BatchThreadConfig(
+            project_data=project, project_config_path=str(project_file)
+        ),
+    )
+    thread._prepare_journal()
+    base = thread._journal_base
+    calls.clear()
+    hashes = [thread._journal_config_hash(fp) for fp in files * 2]
+    # 逐文件只哈希基准摘要与该文件的选择，不再序列化项目对象
+    assert all(parts[0] == base and len(parts) == 2 for parts in calls)
+    assert hashes[:2] == hashes[2:]
+
+    # 项目配置按文件内容计算摘要
+    project_file.write_text('{"Source": {}}', encoding="utf-8")
+    thread._prepare_journal()
+    assert thread._journal_base != base
@@ -0,0 +1,127 @@
+"""并行模式进程池 initializer / 任务协议测试。"""
+
+import json
+import sys
+
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+import batch
+from batch import (
+    _WORKER_STATE,
+    BatchConfig,
+    _batch_config_to_dict,
+    _init_worker,
+    _run_worker_job,
+    _summarize_pool_overhead,
+)
+
+
+def _write_csv(path, rows=8):
+    df = pd.DataFrame(
+        {
+            "Fx": range(rows),
+            "Fy": [1.0] * rows,
+            "Fz": [-2.0] * rows,
+            "Mx": [0.5] * rows,
+            "My": [0.1] * rows,
+            "Mz": [0.0] * rows,
+        }
+    )
+    df.to_csv(path, index=False)
+
+
+@pytest.fixture
+def _restore_worker_state():
+    saved = dict(vars(_WORKER_STATE))
+    yield
+    vars(_WORKER_STATE).clear()
+    vars(_WORKER_STATE).update(saved)
+
+
+def test_init_worker_then_run_job(tmp_path, _restore_worker_state):
+    csv_path = tmp_path / "a.csv"
+    _write_csv(csv_path)
+    _init_worker(
+        "data/input.json",
+        _batch_config_to_dict(BatchConfig()),
+        str(tmp_path),
+        {"target_part": "TestModel"},
+        [],
+    )
+    calc = _WORKER_STATE.calculator
+    assert calc is not None
+    assert _WORKER_STATE.init_sec > 0
+
+    record = _run_worker_job((7, str(csv_path)))
+    assert record["job_id"] == 7
+    assert record["success"], record["error"]
+    assert record["finished_at"] >= record["started_at"]
+    # 同一 worker 内的后续任务复用 initializer 加载的计算器
+    assert _run_worker_job((8, str(csv_path)))["success"]
+    assert _WORKER_STATE.calculator is calc
+
+
+def test_run_job_without_init_reports_error(tmp_path, _restore_worker_state):
+    vars(_WORKER_STATE).update(calculator=None, config_dict=None)
+    record = _run_worker_job((0, str(tmp_path / "missing.csv")))
+    assert not record["success"]
+    assert "未初始化" in record["error"]
+
+
+def test_summarize_pool_overhead():
+    records = [
+        {
+            "pid": 1,
+            "init_sec": 0.2,
+            "submitted_at": 10.0,
+            "started_at": 10.5,
+            "finished_at": 11.0,
+            "received_at": 11.1,
+        },
+        {
+            "pid": 1,
+            "init_sec": 0.2,
+            "submitted_at": 10.0,
+            "started_at": 11.0,
+            "finished_at": 11.2,
+            "received_at": 11.3,
+        },
+    ]
+    stats = _summarize_pool_overhead(9.9, records, 2)
+    assert stats["spinup_sec"] == pytest.approx(0.6)
+    assert stats["worker_processes"] == 1
+    assert stats["task_overhead_sec_max"] == pytest.approx(1.1)
+    assert stats["task_overhead_sec_total"] == pytest.approx(1.7)
+    assert _summarize_pool_overhead(0.0, [], 2) == {"workers": 2, "tasks": 0}
+
+
+def test_parallel_cli_reports_pool_overhead(tmp_path):
+    for name in ("a.csv", "b.csv", "c.csv"):
+        _write_csv(tmp_path / name)
+    out_json = tmp_path / "summary.json"
+    args = [
+        "-c",
+        "data/input.json",
+        "-i",
+        str(tmp_path),
+        "-p",
+        "*.csv",
+        "--workers",
+        "2",
+        "--target-part",
+        "TestModel",
+        "--output-json",
+        str(out_json),
+    ]
+    if sys.version_info >= (3, 11):
+        args += ["--max-tasks-per-child", "1"]
+    result = CliRunner().invoke(batch.main, args)
+    assert result.exit_code == 0, result.output
+    payload = json.loads(out_json.read_text(encoding="utf-8"))
+    assert payload["success"] == 3
+    pool = payload["pool"]
+    assert pool["tasks"] == 3
+    assert pool["spinup_sec"] >= 0
+    assert pool["task_overhead_sec_avg"] >= 0
@@ -0,0 +1,78 @@
+"""CalculatorPool：按几何内容复用 AeroCalculator 实例的测试。"""
+
+import copy
+
+import pytest
+
+from src.calculator_pool import CalculatorPool
+from src.data_loader import CoordSystemDefinition, FrameConfiguration, ProjectData
+
+
+def _frame(name, origin=(0.0, 0.0, 0.0)):
+    return FrameConfiguration(
+        part_name=name,
+        coord_system=CoordSystemDefinition(
+            origin=list(origin), x_axis=[1, 0, 0], y_axis=[0, 1, 0], z_axis=[0, 0, 1]
+        ),
+        moment_center=[0.0, 0.0, 0.0],
+        c_ref=1.0,
+        b_ref=1.0,
+        q=10.0,
+        s_ref=1.0,
+    )
+
+
+def _project():
+    return ProjectData(
+        source_parts={"S1": [_frame("S1")], "S2": [_frame("S2", (1.0, 0, 0))]},
+        target_parts={"T": [_frame("T")]},
+    )
+
+
+def test_identical_geometry_shares_instance_across_projects():
+    pool = CalculatorPool()
+    a = pool.get(_project(), source_part="S1", target_part="T")
+    # 重新加载的等价配置（不同对象、相同内容）复用同一实例
+    b = pool.get(copy.deepcopy(_project()), source_part="S1", target_part="T")
+    c = pool.get(_project(), source_part="S2", target_part="T")
+
+    assert a is b
+    assert c is not a
+    assert pool.stats()["hits"] == 1
+    assert pool.stats()["entries"] == 2
+
+
+def test_changed_geometry_builds_new_instance():
+    pool = CalculatorPool()
+    project = _project()
+    a = pool.get(project, source_part="S1", target_part="T")
+    project.target_parts["T"][0].q = 20.0
+    b = pool.get(project, source_part="S1", target_part="T")
+    assert a is not b
+    assert b.target_frame.q == 20.0
+
+
+def test_lru_eviction_and_factory_errors():
+    pool = CalculatorPool(max_entries=1)
+    project = _project()
+    a = pool.get(project, source_part="S1", target_part="T")
+    pool.get(project, source_part="S2", target_part="T")
+    assert pool.stats()["entries"] == 1
+    assert pool.get(project, source_part="S1", target_part="T") is not a
+
+    with pytest.raises(KeyError):
+        pool.get(project, source_part="S1", target_part="Missing")
+
+
+def test_custom_factory_receives_original_arguments():
+    calls = []
+
+    class FakeCalc:  # pylint: disable=too-few-public-methods
+        def __init__(self, project_data, source_part=None, target_part=None):
+            calls.append((source_part, target_part))
+
+    pool = CalculatorPool()
+    first = pool.get(_project(), source_part="S1", target_part="T", factory=FakeCalc)
+    again = pool.get(_project(), source_part="S1", target_part="T", factory=FakeCalc)
+    assert first is again
+    assert calls == [("S1", "T")]
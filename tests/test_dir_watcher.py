@@ -0,0 +1,168 @@
+"""目录轮询与监视模式（--watch）测试。"""
+
+import os
+import threading
+import time
+
+import pandas as pd
+
+from batch import BatchConfig, run_watch_mode
+from src.dir_watcher import DirectoryPoller
+from src.run_journal import JOURNAL_FILENAME
+from tests.helpers import write_load_csv
+
+
+def test_poller_reports_new_changed_and_settled_files(tmp_path):
+    (tmp_path / "sub").mkdir()
+    a = tmp_path / "a.csv"
+    b = tmp_path / "sub" / "b.csv"
+    a.write_text("x")
+    b.write_text("y")
+    (tmp_path / "note.txt").write_text("z")
+    poller = DirectoryPoller(tmp_path, "*.csv", settle_seconds=1.0)
+    t0 = time.time_ns()
+    sec = 1_000_000_000
+
+    # 首次观察：尚未稳定；两次轮询不变但静默不足 settle：仍未稳定
+    assert poller.poll(t0) == []
+    assert poller.poll(t0 + sec // 2) == []
+    assert poller.poll(t0 + sec) == [a, b]
+    assert poller.poll(t0 + 2 * sec) == []
+
+    poller.ignore([b])
+    a.write_text("xx")
+    assert poller.poll(t0 + 3 * sec) == []
+    # 静默期内再次变化：重新计时
+    a.write_text("xxx")
+    assert poller.poll(t0 + 4 * sec) == []
+    assert poller.poll(t0 + 4 * sec + sec // 2) == []
+    assert poller.poll(t0 + 5 * sec) == [a]
+
+    # mtime 很久以前的文件同样需要两次轮询
+    old = tmp_path / "old.csv"
+    old.write_text("o")
+    os.utime(old, (1, 1))
+    assert poller.poll(t0 + 10 * sec) == []
+    assert poller.poll(t0 + 11 * sec) == [old]
+
+
+def _run_watch(tmp_path, cfg, stop, box, **kwargs):
+    box["result"] = run_watch_mode(
+        "data/input.json",
+        str(tmp_path),
+        cfg,
+        target_part="TestModel",
+        poll_interval=0.01,
+        stop_event=stop,
+        **kwargs,
+    )
+
+
+def _wait_for(predicate, timeout=20):
+    deadline = time.time() + timeout
+    while time.time() < deadline and not predicate():
+        time.sleep(0.02)
+    return predicate()
+
+
+def _journal_lines(directory):
+    path = directory / JOURNAL_FILENAME
+    return len(path.read_text(encoding="utf-8").splitlines()) if path.exists() else 0
+
+
+def test_watch_mode_waits_for_appending_writer(tmp_path):
+    path = tmp_path / "run1.csv"
+    path.write_text("Fx,Fy,Fz,Mx,My,Mz\n", encoding="utf-8")
+    cfg = BatchConfig()
+    cfg.name_template = "{stem}_result.csv"
+    stop = threading.Event()
+    box = {}
+    worker = threading.Thread(
+        target=_run_watch,
+        args=(tmp_path, cfg, stop, box),
+        kwargs={"settle_seconds": 0.5},
+    )
+    worker.start()
+
+    def _append(rows):
+        with open(path, "a", encoding="utf-8") as fh:
+            for r in rows:
+                fh.write(",".join([str(float(r))] * 6) + "\n")
+
+    try:
+        # 采集系统每 100 ms 追加一行，间隔短于静默时长：写入期间不应被处理
+        for r in range(10):
+            _append([r])
+            time.sleep(0.1)
+        assert not list(tmp_path.glob("run1_result*.csv"))
+        assert _wait_for(lambda: _journal_lines(tmp_path) == 1)
+
+        # 处理后再次追加：重新处理并替换上次的输出，而非新增带序号的文件
+        _append(range(10, 15))
+        assert _wait_for(lambda: _journal_lines(tmp_path) == 2)
+    finally:
+        stop.set()
+        worker.join(timeout=30)
+
+    result = box["result"]
+    assert (result["total"], result["success"]) == (2, 2)
+    assert [p.name for p in tmp_path.glob("run1_result*.csv")] == ["run1_result.csv"]
+    assert len(pd.read_csv(tmp_path / "run1_result.csv")) == 15
+
+
+def test_watch_mode_processes_arrivals_once(tmp_path):
+    write_load_csv(tmp_path / "run_000.csv", atomic=True)
+    cfg = BatchConfig()
+    cfg.name_template = "{stem}_result.csv"
+    stop = threading.Event()
+    box = {}
+
+    def _watch():
+        box["result"] = run_watch_mode(
+            "data/input.json",
+            str(tmp_path),
+            cfg,
+            target_part="TestModel",
+            poll_interval=0.01,
+            settle_seconds=0.0,
+            stop_event=stop,
+        )
+
+    worker = threading.Thread(target=_watch)
+    worker.start()
+    try:
+        for i in range(1, 4):
+            write_load_csv(tmp_path / f"run_{i:03d}.csv", offset=i, atomic=True)
+        deadline = time.time() + 20
+        while time.time() < deadline:
+            if len(list(tmp_path.glob("run_*_result.csv"))) == 4:
+                break
+            time.sleep(0.02)
+        # 再等待几轮轮询，确认结果文件不会被当作新输入
+        time.sleep(0.2)
+    finally:
+        stop.set()
+        worker.join(timeout=30)
+
+    result = box["result"]
+    assert (result["total"], result["success"]) == (4, 4)
+    assert sorted(os.path.basename(r["file"]) for r in result["files"]) == [
+        f"run_{i:03d}.csv" for i in range(4)
+    ]
+    assert all("latency_sec" in r for r in result["files"])
+    assert not list(tmp_path.glob("*_result_result.csv"))
+
+    # 重启后已完成的文件与历史结果文件都不会被重新处理
+    stop = threading.Event()
+    timer = threading.Timer(0.3, stop.set)
+    timer.start()
+    again = run_watch_mode(
+        "data/input.json",
+        str(tmp_path),
+        cfg,
+        target_part="TestModel",
+        settle_seconds=0.0,
+        stop_event=stop,
+    )
+    timer.join()
+    assert (again["total"], again["skipped"]) == (0, 4) and again["polls"] > 1
@@ -39,6 +39,26 @@ def test_header_and_metadata(tmp_path):
     assert fc.get_metadata(p, "fmt") is None
 
 
+def test_metadata_cache_is_bounded_lru(tmp_path):
+    fc = FileCache(max_metadata_entries=2)
+    paths = []
+    for i in range(3):
+        p = tmp_path / f"m{i}.txt"
+        p.write_text(str(i))
+        paths.append(p)
+
+    fc.set_metadata(paths[0], "k", 0)
+    fc.set_metadata(paths[1], "k", 1)
+    # 访问 m0 使其成为最近使用，随后写入 m2 时淘汰 m1
+    assert fc.get_metadata(paths[0], "k") == 0
+    fc.set_metadata(paths[2], "k", 2)
+
+    assert fc.get_cache_stats()["metadata_cached"] == 2
+    assert fc.get_metadata(paths[0], "k") == 0
+    assert fc.get_metadata(paths[1], "k") is None
+    assert fc.get_metadata(paths[2], "k") == 2
+
+
 def test_clear_and_singleton(tmp_path):
     p = tmp_path / "a.txt"
     p.write_text("a")
@@ -0,0 +1,73 @@
+"""读/算/写三级流水线测试。"""
+
+import threading
+import time
+
+import pytest
+
+from src.io_pipeline import run_pipeline
+
+
+def test_pipeline_preserves_order_and_stages():
+    seen = []
+    threads = {}
+
+    def source():
+        for i in range(50):
+            threads["read"] = threading.current_thread().name
+            yield i
+
+    def compute(x):
+        threads["compute"] = threading.current_thread().name
+        return x * x
+
+    def sink(y):
+        threads["write"] = threading.current_thread().name
+        seen.append(y)
+
+    stats = run_pipeline(source(), compute, sink, read_ahead=3, write_behind=2)
+    assert seen == [i * i for i in range(50)]
+    assert stats.items == 50
+    assert len(set(threads.values())) == 3
+
+
+def test_pipeline_backpressure_bounds_read_ahead():
+    produced = []
+    consumed = []
+    max_gap = []
+
+    def source():
+        for i in range(30):
+            produced.append(i)
+            max_gap.append(len(produced) - len(consumed))
+            yield i
+
+    def sink(x):
+        time.sleep(0.002)
+        consumed.append(x)
+
+    run_pipeline(source(), lambda x: x, sink, read_ahead=2, write_behind=2)
+    assert consumed == list(range(30))
+    # 预取队列 + 写出队列 + 各阶段手中各 1 项
+    assert max(max_gap) <= 2 + 2 + 3
+
+
+@pytest.mark.parametrize("stage", ["read", "compute", "write"])
+def test_pipeline_propagates_stage_errors(stage):
+    def source():
+        for i in range(100):
+            if stage == "read" and i == 5:
+                raise ValueError("read failed")
+            yield i
+
+    def compute(x):
+        if stage == "compute" and x == 5:
+            raise ValueError("compute failed")
+        return x
+
+    def sink(x):
+        if stage == "write" and x == 5:
+            raise ValueError("write failed")
+
+    with pytest.raises(ValueError, match=f"{stage} failed"):
+        run_pipeline(source(), compute, sink, read_ahead=2, write_behind=2)
@@ -0,0 +1,236 @@
+"""结果输出格式（逐块写出、读回与批处理集成）测试。"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from batch import BatchConfig, run_batch_processing
+from src.output_formats import (
+    PYARROW_AVAILABLE,
+    LongFormatWriter,
+    ensure_output_format_available,
+    get_output_plugin,
+    open_output_writer,
+    read_output_frame,
+    with_output_suffix,
+    write_frame_atomic,
+)
+from src.plugin import OutputPlugin, PluginMetadata, get_plugin_registry
+
+
+def _chunks():
+    for i in range(3):
+        yield pd.DataFrame(
+            {
+                "Alpha": np.arange(4, dtype=np.int64) + 4 * i,
+                "Fx_new": np.linspace(0.0, 1.0, 4) + i,
+                "Tag": [f"r{i}_{k}" for k in range(4)],
+            }
+        )
+
+
+def test_npz_chunked_roundtrip(tmp_path):
+    out = tmp_path / "res.npz"
+    with open_output_writer(out, "npz") as writer:
+        for chunk in _chunks():
+            writer.write_chunk(chunk)
+
+    expected = pd.concat(list(_chunks()), ignore_index=True)
+    got = read_output_frame(out)
+    assert list(got.columns) == ["Alpha", "Fx_new", "Tag"]
+    assert got["Alpha"].dtype == np.int64
+    np.testing.assert_array_equal(got["Fx_new"], expected["Fx_new"])
+    assert list(got["Tag"]) == list(expected["Tag"])
+    # 临时列文件已清理
+    assert [p.name for p in tmp_path.iterdir()] == ["res.npz"]
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="需要 pyarrow")
+@pytest.mark.parametrize("fmt", ["parquet", "feather"])
+def test_arrow_chunked_roundtrip(tmp_path, fmt):
+    out = tmp_path / f"res.{fmt}"
+    with open_output_writer(out, fmt) as writer:
+        for chunk in _chunks():
+            writer.write_chunk(chunk)
+    expected = pd.concat(list(_chunks()), ignore_index=True)
+    pd.testing.assert_frame_equal(read_output_frame(out), expected)
+
+
+def _mixed_chunks():
+    # 首块为整数列，后续块出现小数与 NaN，需要提升为 float64
+    yield pd.DataFrame({"a": [1, 2], "b": [True, False]})
+    yield pd.DataFrame({"a": [1.7, np.nan], "b": [2, 3]})
+
+
+@pytest.mark.parametrize(
+    "fmt",
+    [
+        "npz",
+        pytest.param(
+            "parquet",
+            marks=pytest.mark.skipif(not PYARROW_AVAILABLE, reason="需要 pyarrow"),
+        ),
+        pytest.param(
+            "feather",
+            marks=pytest.mark.skipif(not PYARROW_AVAILABLE, reason="需要 pyarrow"),
+        ),
+    ],
+)
+def test_chunked_writer_promotes_numeric_dtype(tmp_path, fmt):
+    out = tmp_path / f"res.{fmt}"
+    with open_output_writer(out, fmt) as writer:
+        for chunk in _mixed_chunks():
+            writer.write_chunk(chunk)
+
+    got = read_output_frame(out)
+    assert got["a"].dtype == np.float64
+    np.testing.assert_array_equal(got["a"], [1.0, 2.0, 1.7, np.nan])
+    assert got["b"].tolist() == [1, 0, 2, 3]
+    assert [p.name for p in tmp_path.iterdir()] == [out.name]
+
+
+def test_npz_writer_rejects_non_numeric_chunk_for_numeric_column(tmp_path):
+    writer = open_output_writer(tmp_path / "res.npz", "npz")
+    writer.write_chunk(pd.DataFrame({"a": [1.0, 2.0]}))
+    with pytest.raises(ValueError, match="不兼容"):
+        writer.write_chunk(pd.DataFrame({"a": ["x", "y"]}))
+    writer.abort()
+
+
+@pytest.mark.skipif(PYARROW_AVAILABLE, reason="仅在缺少 pyarrow 时检查报错")
+def test_arrow_formats_require_pyarrow():
+    with pytest.raises(ValueError, match="pyarrow"):
+        ensure_output_format_available("parquet")
+    assert ensure_output_format_available("npz") == "npz"
+
+
+def test_write_frame_atomic_and_suffix(tmp_path):
+    df = pd.DataFrame({"a": [1.5, 2.5]})
+    out = with_output_suffix(tmp_path / "x_result.csv", "npz")
+    assert out.name == "x_result.npz"
+    write_frame_atomic(df, out, "npz")
+    pd.testing.assert_frame_equal(read_output_frame(out), df)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["x_result.npz"]
+    with pytest.raises(ValueError):
+        with_output_suffix(out, "xml")
+
+
+@pytest.mark.parametrize("fmt", ["csv", "npz"])
+def test_long_format_writer_aligns_parts(tmp_path, fmt):
+    out = tmp_path / f"all.{fmt}"
+    with LongFormatWriter(out, fmt, ["Alpha", "Fx_new", "Beta"]) as writer:
+        writer.write_part(
+            pd.DataFrame({"Alpha": [1.0], "Fx_new": [2.0]}), "P1", "S", "T"
+        )
+        writer.write_part(
+            pd.DataFrame({"Fx_new": [3.0, 4.0], "Beta": [5.0, 6.0]}), "P2", "S", "T2"
+        )
+    assert writer.rows_written == 3
+    assert [p.name for p in tmp_path.iterdir()] == [out.name]
+
+    got = read_output_frame(out)
+    assert list(got.columns) == [
+        "part",
+        "source_part",
+        "target_part",
+        "Alpha",
+        "Fx_new",
+        "Beta",
+    ]
+    assert list(got["part"]) == ["P1", "P2", "P2"]
+    assert list(got["target_part"]) == ["T", "T2", "T2"]
+    np.testing.assert_array_equal(got["Fx_new"], [2.0, 3.0, 4.0])
+    assert np.isnan(got["Alpha"][1]) and np.isnan(got["Beta"][0])
+
+
+def test_long_format_writer_renames_key_columns_and_cleans_up_on_error(tmp_path):
+    out = tmp_path / "x.csv"
+    with LongFormatWriter(out, "csv", ["part", "part_data", "Fx_new"]) as writer:
+        writer.write_part(
+            pd.DataFrame({"part": [7.0], "part_data": [8.0], "Fx_new": [1.0]}), "P"
+        )
+    assert writer.renames == {"part": "part_data_data"}
+    got = read_output_frame(out)
+    assert list(got.columns[3:]) == ["part_data_data", "part_data", "Fx_new"]
+    assert (got["part"][0], got["part_data_data"][0]) == ("P", 7.0)
+    out.unlink()
+
+    with pytest.raises(RuntimeError):
+        with LongFormatWriter(tmp_path / "y.csv", "csv", ["Fx_new"]) as writer:
+            writer.write_part(pd.DataFrame({"Fx_new": [1.0]}), "P")
+            raise RuntimeError("stop")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_registered_plugin_overrides_builtin(tmp_path):
+    class _Recorder(OutputPlugin):
+        def __init__(self):
+            self.written = []
+
+        @property
+        def metadata(self):
+            return PluginMetadata("npz_recorder", "0", "t", "", "output")
+
+        def get_supported_formats(self):
+            return ["npz"]
+
+        def write(self, data, output_path, **kwargs):
+            self.written.append((sorted(data), len(data["Alpha"])))
+
+    plugin = _Recorder()
+    registry = get_plugin_registry()
+    registry.register(plugin)
+    try:
+        assert get_output_plugin("npz") is plugin
+        # 默认写出会话缓存数据块并在 close 时一次性调用 write
+        with open_output_writer(tmp_path / "r.npz", "npz") as writer:
+            for chunk in _chunks():
+                writer.write_chunk(chunk)
+        assert plugin.written == [(["Alpha", "Fx_new", "Tag"], 12)]
+    finally:
+        registry.unregister("npz_recorder")
+    assert get_output_plugin("npz") is not plugin
+
+
+def _write_inputs(root):
+    for i in range(2):
+        rows = 9 + i
+        pd.DataFrame(
+            {
+                "Fx": [float(r + i) for r in range(rows)],
+                "Fy": [1.0] * rows,
+                "Fz": [-2.0 * r for r in range(rows)],
+                "Mx": [0.5] * rows,
+                "My": [0.1 * r for r in range(rows)],
+                "Mz": [0.0] * rows,
+                "Alpha": list(range(rows)),
+            }
+        ).to_csv(root / f"case_{i}.csv", index=False)
+
+
+@pytest.mark.parametrize("depth", [0, 2])
+def test_batch_npz_matches_csv(tmp_path, depth):
+    results = {}
+    for fmt in ("csv", "npz"):
+        work = tmp_path / fmt
+        work.mkdir()
+        _write_inputs(work)
+        cfg = BatchConfig()
+        cfg.name_template = "{stem}_result.csv"
+        cfg.chunk_size = 4
+        cfg.output_format = fmt
+        summary = run_batch_processing(
+            "data/input.json",
+            str(work),
+            cfg,
+            target_part="TestModel",
+            pipeline_depth=depth,
+        )
+        assert summary["fail"] == 0
+        results[fmt] = {
+            p.stem: read_output_frame(p) for p in sorted(work.glob(f"*_result.{fmt}"))
+        }
+
+    assert sorted(results["npz"]) == ["case_0_result", "case_1_result"]
+    for stem, csv_df in results["csv"].items():
+        pd.testing.assert_frame_equal(results["npz"][stem], csv_df)
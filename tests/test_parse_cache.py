@@ -0,0 +1,97 @@
+"""特殊格式解析结果的二进制 sidecar 缓存测试。"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from src import parse_cache as pc
+from src import special_format_parser as sfp
+from src.config import SystemConfig, get_config, set_config
+
+_CONTENT = "PartA\nAlpha CL CD\n1 2 3\n4 5 6\n\nPartB\nAlpha Cx\n7 8\n"
+
+
+def _use_cache_dir(monkeypatch, cache_dir, max_mb=512.0):
+    cfg = SystemConfig()
+    cfg.batch.parse_cache_enabled = True
+    cfg.batch.parse_cache_dir = str(cache_dir)
+    cfg.batch.parse_cache_max_mb = max_mb
+    old = get_config()
+    set_config(cfg)
+    monkeypatch.setattr(pc, "_PARSE_CACHE_MANAGER", pc.ParseCacheManager())
+    return old
+
+
+def test_load_special_format_file_hits_cache_and_invalidates(tmp_path, monkeypatch):
+    old = _use_cache_dir(monkeypatch, tmp_path / "cache")
+    try:
+        src = tmp_path / "a.mtfmt"
+        src.write_text(_CONTENT, encoding="utf-8")
+        calls = []
+        orig = sfp.parse_special_format_file
+        monkeypatch.setattr(
+            sfp, "parse_special_format_file", lambda p: calls.append(p) or orig(p)
+        )
+
+        first = pc.load_special_format_file(src)
+        second = pc.load_special_format_file(src)
+        assert len(calls) == 1
+        assert list(second) == ["PartA", "PartB"]
+        for name, df in first.items():
+            pd.testing.assert_frame_equal(second[name], df)
+        assert pc.get_parse_cache().stats()["hits"] == 1
+
+        # 内容变化（大小与 mtime 均变化）后重新解析
+        src.write_text(_CONTENT + "9 10\n", encoding="utf-8")
+        st = os.stat(src)
+        os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        third = pc.load_special_format_file(src)
+        assert len(calls) == 2
+        assert third["PartB"].to_numpy().tolist() == [[7.0, 8.0], [9.0, 10.0]]
+    finally:
+        set_config(old)
+
+
+def test_parse_cache_key_depends_on_parser_version(monkeypatch):
+    key = pc.parse_cache_key("abc")
+    monkeypatch.setattr(pc, "PARSER_VERSION", pc.PARSER_VERSION + 1)
+    assert pc.parse_cache_key("abc") != key
+    assert pc.parse_cache_key(None) is None
+
+
+def test_parse_cache_lru_eviction_by_bytes(tmp_path):
+    data = {"P": pd.DataFrame(np.zeros((100, 2)), columns=["Cx", "Cy"])}
+    probe = pc.ParseCache(tmp_path / "probe")
+    assert probe.store("k", data)
+    entry_size = os.path.getsize(probe.cache_dir / "k.npz")
+    # 预算容纳两个条目
+    cache = pc.ParseCache(tmp_path / "cache", max_bytes=2 * entry_size + 10)
+
+    assert cache.store("k0", data) and cache.store("k1", data)
+    # 访问 k0 使其成为最近使用
+    os.utime(cache.cache_dir / "k1.npz", ns=(0, 1))
+    os.utime(cache.cache_dir / "k0.npz", ns=(0, 2))
+    assert cache.load("k0") is not None
+
+    # 超出预算时淘汰最久未使用的 k1
+    assert cache.store("k2", data)
+    assert not (cache.cache_dir / "k1.npz").exists()
+    assert (cache.cache_dir / "k0.npz").exists()
+    assert cache.load("k1") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_parse_cache_skips_non_float_frames_and_disabled_config(tmp_path):
+    cache = pc.ParseCache(tmp_path / "cache")
+    assert not cache.store("k", {"P": pd.DataFrame({"name": ["a"]})})
+
+    old = get_config()
+    cfg = SystemConfig()
+    # 默认关闭
+    assert not cfg.batch.parse_cache_enabled
+    set_config(cfg)
+    try:
+        assert pc.get_parse_cache() is None
+    finally:
+        set_config(old)
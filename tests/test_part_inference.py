@@ -1,10 +1,18 @@
 """测试 Part 推测引擎功能"""
 
+import random
+import re
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 
 from src.part_inference import (
     PartInferenceResult,
+    PartNameIndex,
     format_inference_error,
+    get_part_name_index,
+    infer_parts_for_file,
     infer_source_part,
     infer_target_part,
 )
@@ -181,3 +189,89 @@ def test_inference_result_is_successful():
 
     failure = PartInferenceResult(None, "none", "failed")
     assert not failure.is_successful()
+
+
+def _linear_contains(query, names):
+    """逐个候选比较的包含匹配（索引实现的参照）"""
+
+    def norm(name):
+        return re.sub(r"[_\-\s]+", "", name.lower())
+
+    q = norm(query)
+    if not q:
+        return None
+    for name in names:
+        if norm(name) and norm(name) in q:
+            return name
+    for name in names:
+        if norm(name) and q in norm(name):
+            return name
+    return None
+
+
+def test_part_name_index_contains_matches_linear_scan():
+    """n-gram 包含索引与逐个比较的结果一致（含短名称与多个候选的顺序）"""
+    rng = random.Random(7)
+    alphabet = "abcde_-"
+    names = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 8)))]
+    names += [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 8)))
+        for _ in range(60)
+    ]
+    index = PartNameIndex(names, [])
+    queries = [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        for _ in range(500)
+    ]
+    for query in queries:
+        assert index.sources.contains(query) == _linear_contains(query, names), query
+
+
+def test_part_name_index_memoizes_and_matches_functions():
+    sources = {"Wing_Left": {}, "Wing_Right": {}, "Body": {}}
+    targets = {"WingLeft": {}, "Fuselage": {}}
+    index = PartNameIndex(sources, targets)
+    path = Path("run_fuselage.csv")
+
+    first = index.infer_parts("wing-left", file_path=path)
+    assert index.infer_parts("wing-left", file_path=path)[0] is first[0]
+    expected_source = infer_source_part("wing-left", sources)
+    expected_target = infer_target_part(
+        expected_source.part_name, targets, file_path=path
+    )
+    assert (first[0].part_name, first[0].method) == ("Wing_Left", "fuzzy")
+    assert first[1].part_name == expected_target.part_name == "WingLeft"
+
+    results = index.infer_many(["BODY", "wing-left"], file_paths=[None, path])
+    assert [r[0].part_name for r in results] == ["Body", "Wing_Left"]
+    assert results[1][0] is first[0]
+    with pytest.raises(ValueError):
+        index.infer_many(["a", "b"], file_paths=[None])
+
+    # 仅名称匹配，不使用默认值
+    assert index.match_source("xyz") is None
+    assert index.match_target("fuselage") == "Fuselage"
+
+
+def test_match_source_rejects_ambiguous_hits_and_strips_all_specials():
+    """GUI 映射：大小写/标准化命中多个候选时不选择；标准化去除全部特殊字符"""
+    index = PartNameIndex(["wing", "WING", "Part1", "机翼-左"], ["Tail", "TAIL_"])
+    assert index.match_source("Wing") is None
+    assert index.match_source("wing") == "wing"
+    assert index.match_source("Part.1") == "Part1"
+    assert index.match_source("机翼 左") == "机翼-左"
+    # 大小写不敏感唯一命中
+    assert index.match_target("tail_") == "TAIL_"
+    # 去特殊字符后两个候选都命中
+    assert index.match_target("ta.il") is None
+
+
+def test_get_part_name_index_shared_and_follows_name_changes():
+    project = SimpleNamespace(source_parts={"A": []}, target_parts={"T": []})
+    index = get_part_name_index(project)
+    assert get_part_name_index(project) is index
+    assert infer_parts_for_file("A", project)[1].part_name == "T"
+
+    project.source_parts["B"] = []
+    assert get_part_name_index(project) is not index
+    assert get_part_name_index(project).sources.names == ["A", "B"]
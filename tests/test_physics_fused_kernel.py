@@ -0,0 +1,127 @@
+"""融合变换算子（process_stacked / process_batch）与参考路径的等价性测试。"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from src.data_loader import CoordSystemDefinition, FrameConfiguration, ProjectData
+from src.geometry import euler_angles_to_basis, skew_symmetric_matrix
+from src.physics import AeroCalculator
+
+
+def _make_project(q=120.0, s_ref=0.8, b_ref=2.0, c_ref=0.3):
+    basis = euler_angles_to_basis(10.0, -5.0, 30.0)
+    src = FrameConfiguration(
+        part_name="S",
+        coord_system=CoordSystemDefinition(
+            origin=[0.1, 0.2, 0.3],
+            x_axis=basis[0].tolist(),
+            y_axis=basis[1].tolist(),
+            z_axis=basis[2].tolist(),
+        ),
+    )
+    tgt = FrameConfiguration(
+        part_name="T",
+        coord_system=CoordSystemDefinition(
+            origin=[0, 0, 0], x_axis=[1, 0, 0], y_axis=[0, 1, 0], z_axis=[0, 0, 1]
+        ),
+        moment_center=[0.5, -0.2, 1.0],
+        c_ref=c_ref,
+        b_ref=b_ref,
+        q=q,
+        s_ref=s_ref,
+    )
+    return ProjectData(source_parts={"S": [src]}, target_parts={"T": [tgt]})
+
+
+def _assert_equivalent(res, ref):
+    for key in (
+        "force_transformed",
+        "moment_transformed",
+        "coeff_force",
+        "coeff_moment",
+    ):
+        assert np.allclose(res[key], ref[key], rtol=1e-12, atol=1e-12, equal_nan=True)
+        assert np.array_equal(np.isnan(res[key]), np.isnan(ref[key]))
+
+
+def test_skew_symmetric_matrix_matches_cross():
+    r = np.array([0.3, -1.2, 2.5])
+    v = np.array([4.0, 0.5, -1.0])
+    assert np.allclose(skew_symmetric_matrix(r) @ v, np.cross(r, v))
+
+
+def test_fused_matches_reference_path():
+    calc = AeroCalculator(_make_project())
+    rng = np.random.default_rng(0)
+    forces = rng.normal(size=(500, 3)) * 100
+    moments = rng.normal(size=(500, 3)) * 10
+
+    _assert_equivalent(
+        calc.process_batch(forces, moments),
+        calc._process_batch_reference(forces, moments),
+    )
+
+
+def test_process_stacked_layout():
+    calc = AeroCalculator(_make_project())
+    loads = np.array([[10.0, 2.0, -3.0, 1.0, 0.5, -0.2]])
+    out = calc.process_stacked(loads)
+    ref = calc._process_batch_reference(loads[:, :3], loads[:, 3:])
+
+    assert out.shape == (1, 12)
+    assert np.allclose(out[:, 0:3], ref["force_transformed"])
+    assert np.allclose(out[:, 3:6], ref["moment_transformed"])
+    assert np.allclose(out[:, 6:9], ref["coeff_force"])
+    assert np.allclose(out[:, 9:12], ref["coeff_moment"])
+
+
+def test_non_finite_rows_keep_reference_semantics():
+    calc = AeroCalculator(_make_project())
+    forces = np.ones((4, 3))
+    moments = np.ones((4, 3))
+    moments[1, 2] = np.nan
+    forces[2, 0] = np.inf
+
+    res = calc.process_batch(forces, moments)
+    _assert_equivalent(res, calc._process_batch_reference(forces, moments))
+    # 仅力矩含 NaN 的行，其力结果不应被污染
+    assert np.all(np.isfinite(res["force_transformed"][1]))
+
+
+def test_zero_denominators_warn_and_zero_coefficients():
+    calc = AeroCalculator(_make_project(q=0.0))
+    with pytest.warns(UserWarning):
+        res = calc.process_batch([[1.0, 2.0, 3.0]], [[0.0, 0.0, 0.0]])
+    assert np.allclose(res["coeff_force"], 0.0)
+    assert np.allclose(res["coeff_moment"], 0.0)
+
+
+def test_kernel_rebuilt_after_geometry_mutation():
+    calc = AeroCalculator(_make_project())
+    forces = np.array([[1.0, 2.0, 3.0]])
+    moments = np.array([[0.0, 0.0, 0.0]])
+    calc.process_batch(forces, moments)
+
+    calc.rotation_matrix = np.eye(3)
+    calc.r_target = np.zeros(3)
+    res = calc.process_batch(forces, moments)
+    assert np.allclose(res["force_transformed"], forces)
+    assert np.allclose(res["moment_transformed"], 0.0)
+
+
+def test_non_finite_rows_warn_once_without_touching_filters():
+    calc = AeroCalculator(_make_project(q=0.0))
+    loads = np.ones((3, 6))
+    loads[1, 4] = np.nan
+    filters_before = list(warnings.filters)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        calc.process_stacked(loads)
+
+    messages = [str(w.message) for w in caught]
+    # 参考路径重算非有限行时不重复发出分母警告
+    assert len(messages) == len(set(messages)) > 0
+    assert warnings.filters == filters_before
@@ -0,0 +1,56 @@
+"""MultiTargetCalculator：一次遍历变换到全部 target 的等价性测试。"""
+
+import numpy as np
+import pytest
+
+from src.physics import AeroCalculator, MultiTargetCalculator
+from tests.helpers import make_multi_target_project
+
+
+def test_all_targets_match_individual_calculators():
+    project = make_multi_target_project()
+    multi = MultiTargetCalculator(project)
+    assert multi.targets == [("Wing", 0), ("Wing", 1), ("Tail", 0)]
+    assert multi.rotation_matrices.shape == (3, 3, 3)
+    assert multi.lever_arms.shape == (3, 3)
+
+    rng = np.random.default_rng(1)
+    forces = rng.normal(size=(50, 3)) * 100
+    moments = rng.normal(size=(50, 3)) * 10
+    result = multi.process_batch(forces, moments)
+    assert result.array.shape == (3, 50, 12)
+
+    for (part, variant), per_target in result:
+        single = AeroCalculator(
+            project, target_part=part, target_variant=variant
+        ).process_batch(forces, moments)
+        for key in single:
+            assert np.allclose(per_target[key], single[key], rtol=1e-12, atol=1e-12)
+
+
+def test_result_lookup_by_name_and_views():
+    multi = MultiTargetCalculator(
+        make_multi_target_project(), targets=[("Tail", 0), ("Wing", 1)]
+    )
+    result = multi.process_batch([[1.0, 2.0, 3.0]], [[0.1, 0.2, 0.3]])
+
+    assert np.shares_memory(result["Tail"]["coeff_force"], result.array)
+    assert np.array_equal(
+        result[("Wing", 1)]["force_transformed"], result.array[1, :, 0:3]
+    )
+    with pytest.raises(KeyError):
+        result["Missing"]
+
+
+def test_non_finite_rows_follow_single_target_semantics():
+    project = make_multi_target_project()
+    multi = MultiTargetCalculator(project)
+    loads = np.ones((3, 6))
+    loads[1, 4] = np.nan
+
+    out = multi.process_stacked(loads)
+    for idx, (part, variant) in enumerate(multi.targets):
+        single = AeroCalculator(project, target_part=part, target_variant=variant)
+        expected = single.process_stacked(loads)
+        assert np.allclose(out[idx], expected, equal_nan=True)
+        assert np.all(np.isfinite(out[idx, 1, 0:3]))
@@ -0,0 +1,100 @@
+"""ResultBuffer / out= 工作区复用测试。"""
+
+import numpy as np
+import pytest
+
+from src.data_loader import CoordSystemDefinition, FrameConfiguration, ProjectData
+from src.performance import get_performance_monitor, reset_performance_monitor
+from src.physics import AeroCalculator, ResultBuffer
+
+
+def _make_project():
+    src = FrameConfiguration(
+        part_name="S",
+        coord_system=CoordSystemDefinition(
+            origin=[0.1, 0.2, 0.3],
+            x_axis=[0, 1, 0],
+            y_axis=[-1, 0, 0],
+            z_axis=[0, 0, 1],
+        ),
+    )
+    tgt = FrameConfiguration(
+        part_name="T",
+        coord_system=CoordSystemDefinition(
+            origin=[0, 0, 0], x_axis=[1, 0, 0], y_axis=[0, 1, 0], z_axis=[0, 0, 1]
+        ),
+        moment_center=[0.5, -0.2, 1.0],
+        c_ref=0.3,
+        b_ref=2.0,
+        q=120.0,
+        s_ref=0.8,
+    )
+    return ProjectData(source_parts={"S": [src]}, target_parts={"T": [tgt]})
+
+
+@pytest.fixture(autouse=True)
+def _fresh_monitor():
+    reset_performance_monitor()
+    yield
+    reset_performance_monitor()
+
+
+def _loads(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(n, 3)) * 100, rng.normal(size=(n, 3)) * 10
+
+
+def test_out_array_matches_default_path():
+    calc = AeroCalculator(_make_project())
+    forces, moments = _loads(64)
+    out = np.empty((64, 12))
+
+    res = calc.process_batch(forces, moments, out=out)
+    ref = calc.process_batch(forces, moments)
+    for key in ref:
+        assert np.allclose(res[key], ref[key])
+    assert np.shares_memory(res["coeff_moment"], out)
+
+
+def test_out_array_validation():
+    calc = AeroCalculator(_make_project())
+    loads = np.zeros((4, 6))
+    with pytest.raises(ValueError):
+        calc.process_stacked(loads, out=np.empty((3, 12)))
+    with pytest.raises(TypeError):
+        calc.process_stacked(loads, out=np.empty((4, 12), dtype=np.float32))
+    with pytest.raises(ValueError):
+        calc.process_stacked(loads, out=np.empty((12, 4)).T)
+
+
+def test_result_buffer_reused_across_chunks():
+    calc = AeroCalculator(_make_project())
+    buf = ResultBuffer()
+
+    forces, moments = _loads(100)
+    first = calc.process_batch(forces, moments, out=buf)
+    ref = calc.process_batch(forces, moments)
+    for key in ref:
+        assert np.allclose(first[key], ref[key])
+    workspace = buf.result(100)
+
+    # 相同或更小的块不再分配
+    forces2, moments2 = _loads(60, seed=1)
+    second = calc.process_batch(forces2, moments2, out=buf)
+    calc.process_batch(forces, moments, out=buf)
+    assert buf.allocations == 1
+    assert buf.reuses == 2
+    assert np.shares_memory(second["force_transformed"], workspace)
+    assert buf.bytes_saved == (60 + 100) * 18 * 8
+
+    counters = get_performance_monitor().get_counters()
+    assert counters[ResultBuffer.METRIC_BYTES_SAVED] == buf.bytes_saved
+
+
+def test_result_buffer_grows_geometrically():
+    buf = ResultBuffer(10)
+    assert buf.capacity == 10
+    assert buf.reserve(11)
+    assert buf.capacity == 15
+    assert not buf.reserve(15)
+    assert buf.stats()["allocations"] == 2
@@ -0,0 +1,108 @@
+"""按内容寻址的结果缓存与 stat 校验的文件哈希测试。"""
+
+import hashlib
+import os
+
+import pytest
+
+from batch import BatchConfig, ParallelOptions, run_batch_processing
+from src import result_cache
+from src.file_cache import get_file_hash
+from src.result_cache import ResultCache, output_options, result_cache_key
+from tests.helpers import write_load_csv
+
+
+def test_get_file_hash_revalidates_on_stat_change(tmp_path):
+    f = tmp_path / "a.bin"
+    f.write_bytes(b"first")
+    assert get_file_hash(str(f)) == hashlib.md5(b"first").hexdigest()
+
+    f.write_bytes(b"second!")
+    st = os.stat(f)
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert get_file_hash(str(f)) == hashlib.md5(b"second!").hexdigest()
+
+
+def test_result_cache_fetch_store_and_lru_eviction(tmp_path):
+    cache = ResultCache(tmp_path / "cache", max_bytes=250)
+    srcs = []
+    for i in range(3):
+        src = tmp_path / f"out_{i}.csv"
+        src.write_bytes(bytes([65 + i]) * 100)
+        srcs.append(src)
+
+    assert not cache.lookup("k0")
+    assert cache.store("k0", srcs[0]) and cache.store("k1", srcs[1])
+    # 访问 k0 使其成为最近使用
+    os.utime(cache.cache_dir / "k1", ns=(0, 1))
+    assert cache.fetch("k0", tmp_path / "restored.csv")
+    assert (tmp_path / "restored.csv").read_bytes() == srcs[0].read_bytes()
+
+    # 超出预算时淘汰最久未使用的 k1
+    assert cache.store("k2", srcs[2])
+    assert cache.lookup("k0") and cache.lookup("k2")
+    assert not cache.lookup("k1")
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["hits"] == 1
+
+
+def test_result_cache_key_requires_both_hashes():
+    assert result_cache_key("", "g", {}) is None
+    assert result_cache_key("i", "g", {"a": 1}) != result_cache_key("i", "g", {"a": 2})
+
+
+def test_result_cache_key_tracks_format_version_not_chunk_size(monkeypatch):
+    small, large = BatchConfig(), BatchConfig()
+    small.chunk_size, large.chunk_size = 1000, 50000
+    assert output_options(small) == output_options(large)
+
+    key = result_cache_key("i", "g", output_options(small))
+    monkeypatch.setattr(
+        result_cache, "RESULT_FORMAT_VERSION", result_cache.RESULT_FORMAT_VERSION + 1
+    )
+    assert result_cache_key("i", "g", output_options(small)) != key
+
+
+@pytest.mark.parametrize(
+    "depth,workers", [(0, 1), (2, 1), (0, 2)], ids=["serial", "pipelined", "pool"]
+)
+def test_batch_reuses_cached_results(tmp_path, depth, workers):
+    inputs = tmp_path / "in"
+    inputs.mkdir()
+    for i in range(3):
+        write_load_csv(inputs / f"case_{i}.csv", offset=i)
+    cfg = BatchConfig()
+    cfg.name_template = "{stem}_result.csv"
+    cfg.overwrite = True
+    cfg.result_cache_dir = str(tmp_path / "cache")
+
+    def _run():
+        return run_batch_processing(
+            "data/input.json",
+            str(inputs),
+            cfg,
+            target_part="TestModel",
+            pattern="case_?.csv",
+            pipeline_depth=depth,
+            parallel=ParallelOptions(workers=workers),
+        )
+
+    first = _run()
+    assert first["cache"] == {"hits": 0, "misses": 3, "hit_rate": 0.0}
+    before = {p.name: p.read_bytes() for p in inputs.glob("*_result.csv")}
+    for p in inputs.glob("*_result.csv"):
+        p.unlink()
+
+    second = _run()
+    assert second["success"] == 3
+    assert second["cache"] == {"hits": 3, "misses": 0, "hit_rate": 1.0}
+    after = {p.name: p.read_bytes() for p in inputs.glob("*_result.csv")}
+    assert after == before
+    assert all(r["cache"] == "hit" for r in second["files"])
+
+    # 修改一个输入、或改变影响输出的选项后不再命中
+    write_load_csv(inputs / "case_1.csv", offset=9.0)
+    third = _run()
+    assert third["cache"]["hits"] == 2
+    cfg.treat_non_numeric = "nan"
+    assert _run()["cache"]["hits"] == 0
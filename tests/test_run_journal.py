@@ -0,0 +1,122 @@
+"""运行日志与批处理续跑（--resume）测试。"""
+
+import os
+
+import pytest
+
+from batch import BatchConfig, run_batch_processing
+from src.run_journal import (
+    JOURNAL_FILENAME,
+    STATUS_COMPLETE,
+    STATUS_FAILED,
+    RunJournal,
+    config_hash,
+    stat_fingerprint,
+)
+from tests.helpers import write_load_csv
+
+
+def test_journal_last_record_wins_and_tolerates_torn_line(tmp_path):
+    src = tmp_path / "a.csv"
+    out = tmp_path / "a_out.csv"
+    write_load_csv(src)
+    out.write_text("x")
+    journal = RunJournal(tmp_path)
+    journal.record_outcome(src, "h1", False, error="boom")
+    journal.record_outcome(src, "h1", True, outputs=[out])
+    # 模拟崩溃时写了一半的行
+    with open(journal.path, "a", encoding="utf-8") as fh:
+        fh.write('{"input": "trunc')
+
+    fresh = RunJournal(tmp_path)
+    entries = fresh.load()
+    assert len(entries) == 1
+    rec = next(iter(entries.values()))
+    assert rec["status"] == STATUS_COMPLETE and rec["sha256"]
+    assert fresh.is_complete(src, "h1")
+    assert not fresh.is_complete(src, "h2")
+
+    # 输出被删除后不再视为完成
+    out.unlink()
+    assert not fresh.is_complete(src, "h1")
+
+
+def test_journal_fingerprint_checks_content_not_only_mtime(tmp_path):
+    src = tmp_path / "a.csv"
+    out = tmp_path / "a_out.csv"
+    write_load_csv(src)
+    out.write_text("x")
+    journal = RunJournal(tmp_path)
+    journal.record_outcome(src, "h", True, outputs=[out])
+
+    # 仅 mtime 变化：内容摘要一致，仍视为完成
+    st = os.stat(src)
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    assert journal.is_complete(src, "h")
+
+    # 同样大小但内容不同：需要重新处理
+    data = bytearray(src.read_bytes())
+    data[-2:-1] = b"9"
+    src.write_bytes(bytes(data))
+    assert not journal.is_complete(src, "h")
+
+
+def test_journal_marks_inputs_modified_during_processing(tmp_path):
+    src = tmp_path / "a.csv"
+    write_load_csv(src)
+    planned = stat_fingerprint(src)
+    write_load_csv(src, offset=100.0, rows=20)
+    rec = RunJournal(tmp_path).record_outcome(
+        src, "h", True, outputs=[src], planned=planned
+    )
+    assert rec["status"] == STATUS_FAILED
+
+
+def test_config_hash_is_stable_for_sets_and_objects():
+    cfg_a, cfg_b = BatchConfig(), BatchConfig()
+    assert config_hash(cfg_a, {"rows": {3, 1, 2}}) == config_hash(
+        cfg_b, {"rows": {2, 3, 1}}
+    )
+    cfg_b.treat_non_numeric = "drop"
+    assert config_hash(cfg_a) != config_hash(cfg_b)
+
+
+@pytest.mark.parametrize("depth", [0, 2])
+def test_batch_resume_skips_completed_inputs(tmp_path, depth):
+    for i in range(3):
+        write_load_csv(tmp_path / f"case_{i}.csv", offset=i)
+    cfg = BatchConfig()
+    cfg.name_template = "{stem}_result.csv"
+
+    def _run(**kwargs):
+        return run_batch_processing(
+            "data/input.json",
+            str(tmp_path),
+            cfg,
+            target_part="TestModel",
+            pipeline_depth=depth,
+            **kwargs,
+        )
+
+    first = _run()
+    assert (first["success"], first["skipped"]) == (3, 0)
+    assert (tmp_path / JOURNAL_FILENAME).exists()
+    before = {p.name: p.read_bytes() for p in tmp_path.glob("*_result.csv")}
+
+    # 模式只匹配输入文件，避免把结果文件当作新的输入
+    resumed = _run(pattern="case_?.csv", resume=True)
+    assert (resumed["total"], resumed["skipped"]) == (0, 3)
+
+    # 配置变化使全部文件重算（覆盖写出以保持输出文件名不变）
+    cfg.overwrite = True
+    again = _run(pattern="case_?.csv", resume=True)
+    assert (again["total"], again["skipped"]) == (3, 0)
+
+    # 修改一个输入后只重算该文件
+    write_load_csv(tmp_path / "case_1.csv", offset=75.0)
+    again = _run(pattern="case_?.csv", resume=True)
+    assert (again["total"], again["success"], again["skipped"]) == (1, 1, 2)
+    assert [os.path.basename(r["file"]) for r in again["files"]] == ["case_1.csv"]
+    after = {p.name: p.read_bytes() for p in tmp_path.glob("*_result.csv")}
+    assert after["case_0_result.csv"] == before["case_0_result.csv"]
+    assert after["case_1_result.csv"] != before["case_1_result.csv"]
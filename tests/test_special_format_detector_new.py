@@ -65,3 +65,68 @@ def test_looks_like_special_format_basic(tmp_path):
 
     # non-existent file with unknown extension -> False (触发读取异常分支)
     assert sfd.looks_like_special_format(Path(tmp_path / "nope.unknown")) is False
+
+
+def test_sniff_encoding_bytes_bom_utf8_and_gbk():
+    assert sfd.sniff_encoding_bytes(b"\xef\xbb\xbfFx,Fy\n") == "utf-8-sig"
+    assert sfd.sniff_encoding_bytes("机翼\n".encode("utf-16")) == "utf-16"
+    assert sfd.sniff_encoding_bytes("机翼\n".encode("utf-8")) == "utf-8"
+    assert sfd.sniff_encoding_bytes("机翼\n".encode("gbk")) == "gbk"
+    # 前缀在多字节字符中间截断时不视为解码错误
+    truncated = "机翼".encode("utf-8")[:4]
+    assert sfd.sniff_encoding_bytes(truncated, complete=False) == "utf-8"
+    assert sfd.sniff_encoding_bytes(truncated, complete=True) != "utf-8"
+
+
+def test_sniff_encoding_reads_prefix_once_and_revalidates(tmp_path, monkeypatch):
+    from src.file_cache import get_file_cache
+
+    get_file_cache().clear()
+    p = tmp_path / "big.mtfmt"
+    p.write_bytes("参考面积：9.73m2\n".encode("gbk") + b"1 2 3\n" * 50000)
+    reads = []
+    real_open = open
+
+    def _open(path, mode="r", *args, **kwargs):
+        fh = real_open(path, mode, *args, **kwargs)
+        if "b" in mode:
+            real_read = fh.read
+
+            class _Probe:
+                def __enter__(self):
+                    return self
+
+                def __exit__(self, *exc):
+                    fh.close()
+
+                def read(self, n=-1):
+                    data = real_read(n)
+                    reads.append(len(data))
+                    return data
+
+            return _Probe()
+        return fh
+
+    monkeypatch.setattr("builtins.open", _open)
+    assert sfd.sniff_encoding(p) == "gbk"
+    assert sfd.sniff_encoding(p) == "gbk"
+    assert reads == [sfd.ENCODING_SNIFF_BYTES + 1]
+    monkeypatch.undo()
+
+    # 文件变化后重新探测
+    p.write_text("机翼\n", encoding="utf-8")
+    assert sfd.sniff_encoding(p) == "utf-8"
+
+
+def test_read_text_file_falls_back_after_prefix(tmp_path, monkeypatch):
+    from src.file_cache import get_file_cache
+
+    get_file_cache().clear()
+    monkeypatch.setattr(sfd, "ENCODING_SNIFF_BYTES", 16)
+    p = tmp_path / "late.mtfmt"
+    p.write_bytes(b"ascii prefix line\n" + "机翼\n".encode("gbk"))
+    assert sfd.sniff_encoding(p) == "utf-8"
+    assert sfd._read_text_file(p) == "ascii prefix line\n机翼\n"
+    # 回退成功的编码写回缓存
+    assert sfd.sniff_encoding(p) == "gbk"
+    assert sfd._read_text_file_lines(p, max_lines=1) == ["ascii prefix line\n"]
@@ -130,3 +130,181 @@ def test__process_single_part_writes_output(tmp_path, monkeypatch):
 
 if __name__ == "__main__":
     pytest.main(["-q", "tests/test_special_format_parser.py"])
+
+
+def test_parse_bulk_blocks_match_line_parser(tmp_path):
+    """数值块整块转换，结果（含整数列的 int64 类型）与逐行状态机提取的行一致。"""
+    lines = [
+        "说明：批量解析",
+        "PartA",
+        "Alpha CL CD",
+        "1 2 3",
+        "4.5 -6 7e-3",
+        "CLa Cdmin",
+        "0.1 0.2",
+        "",
+        "PartB",
+        "Alpha CL CD",
+        "1 NA 3",
+        "2 3",
+        "nan 5 6",
+        "PartA",
+        "Alpha CL CD",
+        "7 8 9",
+    ]
+    p = tmp_path / "bulk.mtfmt"
+    p.write_text("\n".join(lines), encoding="utf-8")
+
+    parsed = sfp.parse_special_format_file(p)
+    # 同名 part 再次出现时以最后一块为准（与逐行解析一致）
+    assert parsed["PartA"].to_numpy().tolist() == [[7.0, 8.0, 9.0]]
+    part_b = parsed["PartB"]
+    # 全为整数字面量的列为 int64，与逐列 pd.to_numeric 一致
+    assert [str(t) for t in part_b.dtypes] == ["float64", "float64", "int64"]
+    # 列数不符的行被跳过；非数值单元为 NaN
+    assert part_b.shape == (2, 3)
+    assert part_b.isna().to_numpy().tolist() == [
+        [False, True, False],
+        [True, False, False],
+    ]
+
+    extracted = sfp._extract_parts_from_lines(lines, p)
+    assert sorted(parsed) == sorted(k for k, (_, rows) in extracted.items() if rows)
+
+
+def test_bulk_parse_restores_integer_columns(tmp_path):
+    """整块转换后只把全部 token 为整数字面量的列还原为 int64（"2.00" 这类列保持 float64）"""
+    lines = ["PartA", "Alpha Run CL CD"]
+    lines += [f"{a}.00 {a + 1} {a * 0.1:.3f} {a:+d}" for a in range(-2, 40)]
+    p = tmp_path / "ints.mtfmt"
+    p.write_text("\n".join(lines), encoding="utf-8")
+
+    df = sfp.parse_special_format_file(p)["PartA"]
+    assert [str(t) for t in df.dtypes] == ["float64", "int64", "float64", "int64"]
+    assert df["Run"].tolist() == list(range(-1, 41))
+
+    header, rows = sfp._extract_parts_from_lines(lines, p)["PartA"]
+    expected = sfp._build_part_frame(header, rows)
+    pd.testing.assert_frame_equal(df, expected)
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 7, 64])
+def test_streamed_parse_matches_whole_text_at_any_chunk_size(
+    tmp_path, monkeypatch, chunk_chars
+):
+    """按行边界分段流式扫描的结果与整段扫描一致（分段可落在任意行内或 part 名行处）"""
+    lines = [
+        "说明：流式解析",
+        "PartA",
+        "Alpha CL CD",
+        "1 2 3",
+        "4.5 -6 7e-3",
+        "2 3",
+        "PartB",
+        "Alpha CL CD",
+        "1 NA 3",
+        "nan 5 6",
+        "PartA",
+        "Alpha CL CD",
+        "7 8 9",
+        "10 11 12",
+    ]
+    text = "\n".join(lines)
+    p = tmp_path / "stream.mtfmt"
+    p.write_text(text, encoding="utf-8")
+    expected = {
+        name: sfp._scanned_part_frame(name, hdr, rows)
+        for name, (hdr, rows) in sfp._scan_parts(text, p).parts.items()
+        if hdr and rows
+    }
+
+    monkeypatch.setattr(sfp, "BULK_PARSE_CHARS", chunk_chars)
+    parsed = sfp.parse_special_format_file(p)
+    assert list(parsed) == list(expected)
+    for name, df in expected.items():
+        pd.testing.assert_frame_equal(parsed[name], df)
+    assert parsed["PartA"].to_numpy().tolist() == [[7, 8, 9], [10, 11, 12]]
+
+
+def test_bulk_parse_block_rejects_ragged_or_non_numeric():
+    block = sfp._bulk_parse_block("1 2 3\n4 5.0 6\n", 3)
+    assert block.values.shape == (2, 3)
+    assert block.int_columns.tolist() == [True, False, True]
+    assert sfp._bulk_parse_block("1 2 3\n4 5\n", 3) is None
+    assert sfp._bulk_parse_block("1 2 3\n4 5 x\n", 3) is None
+    assert sfp._bulk_parse_block("1 2 3\n", 2) is None
+
+
+_INDEX_LINES = [
+    "计算坐标系:X向后",
+    "",
+    "quanji",
+    "Alpha CL CD",
+    "-2.00 -0.1 0.03",
+    "0.00 0.006 0.034",
+    "CLa Cdmin CmCL",
+    "",
+    "机身",
+    "Alpha CL CD",
+    "1 2 3",
+    "1abc",
+    "Alpha CL",
+    "1 2",
+    "quanji",
+    "Alpha CL",
+    "9 9",
+]
+
+
+@pytest.mark.parametrize("encoding,newline", [("utf-8", "\n"), ("gbk", "\r\n")])
+def test_part_index_offsets_match_full_parse(tmp_path, encoding, newline):
+    """part 索引的字节区间可单独解析，结果与整文件解析一致。"""
+    p = tmp_path / "indexed.mtfmt"
+    p.write_bytes(newline.join(_INDEX_LINES).encode(encoding))
+
+    index = sfp.get_part_index(p)
+    assert index.encoding == encoding
+    # names 保留重名 part 的出现顺序，parts 以最后一次出现为准
+    assert index.names == ["quanji", "机身", "1abc", "quanji"]
+    assert sfp.get_part_names(p) == sfp._scan_part_names_from_lines(p)
+    entry = index.parts["机身"]
+    assert entry.header == ["Alpha", "CL", "CD"]
+    assert entry.row_count == 1
+    raw = p.read_bytes()[entry.byte_start : entry.byte_end].decode(encoding)
+    assert raw.startswith("机身")
+    assert "1abc" not in raw
+
+    full = sfp.parse_special_format_file(p)
+    for name, df in full.items():
+        pd.testing.assert_frame_equal(sfp.parse_special_format_part(p, name), df)
+    assert sfp.parse_special_format_part(p, "missing") is None
+
+
+def test_part_index_cached_and_rebuilt_when_file_changes(tmp_path, monkeypatch):
+    """索引按文件 stat 缓存：未变化时不重新扫描，内容变化后重建。"""
+    p = tmp_path / "cached.mtfmt"
+    p.write_text("PartA\nAlpha CL\n1 2\n", encoding="utf-8")
+    calls = []
+    orig = sfp.build_part_index
+    monkeypatch.setattr(
+        sfp, "build_part_index", lambda fp: calls.append(fp) or orig(fp)
+    )
+
+    assert sfp.get_part_names(p) == ["PartA"]
+    assert sfp.get_part_names(p) == ["PartA"]
+    assert len(calls) == 1
+
+    p.write_text("PartA\nAlpha CL\n1 2\nPartB\nAlpha CL\n3 4\n", encoding="utf-8")
+    assert sfp.get_part_names(p) == ["PartA", "PartB"]
+    assert len(calls) == 2
+    assert sfp.parse_special_format_part(p, "PartB").to_numpy().tolist() == [[3, 4]]
+
+
+def test_part_index_unavailable_for_utf16_falls_back(tmp_path):
+    """UTF-16 文件无法按字节切分：不建立索引，回退到整文件解析。"""
+    p = tmp_path / "utf16.mtfmt"
+    p.write_text("PartA\nAlpha CL\n1 2\n", encoding="utf-16")
+
+    assert sfp.get_part_index(p) is None
+    assert sfp.get_part_names(p) == ["PartA"]
+    assert sfp.parse_special_format_part(p, "PartA").to_numpy().tolist() == [[1, 2]]
@@ -1,3 +1,4 @@
+import io
 import sys
 import types
 from pathlib import Path
@@ -60,8 +61,12 @@ def test_parse_and_get_part_names_monkeypatched_read():
     ]
 
     orig = parser._read_text_file_lines
+    orig_text = parser._consume_text_file
     try:
         parser._read_text_file_lines = lambda fp: lines
+        parser._consume_text_file = lambda fp, consume: consume(
+            io.StringIO("\n".join(lines))
+        )
         parts = parser.get_part_names(Path("ignored"))
         assert "PartX" in parts and "PartY" in parts
 
@@ -70,6 +75,7 @@ def test_parse_and_get_part_names_monkeypatched_read():
         assert parsed["PartX"].shape[0] == 1
     finally:
         parser._read_text_file_lines = orig
+        parser._consume_text_file = orig_text
 
 
 def test_process_special_format_file_delegates(monkeypatch):
@@ -111,7 +117,11 @@ def test_parse_special_format_file_basic_and_mismatch(monkeypatch, tmp_path):
         "7 8 9\n",
     ]
 
-    monkeypatch.setattr(parser, "_read_text_file_lines", lambda p: lines)
+    monkeypatch.setattr(
+        parser,
+        "_consume_text_file",
+        lambda p, consume: consume(io.StringIO("".join(lines))),
+    )
     result = parser.parse_special_format_file(Path("dummy"))
     assert "PartA" in result and "PartB" in result
     assert isinstance(result["PartA"], pd.DataFrame)
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from src import special_format_processor as proc_mod
 
@@ -131,3 +132,150 @@ def test_process_parts_and_summarize():
     assert total == 2
     assert s == 1
     assert sk == 1
+
+
+def test_process_parts_parallel_keeps_order_and_reports_errors():
+    """并行处理时报告项保持 part 原始顺序，单个 part 的异常转为 failed 项。"""
+    import threading
+    import time
+
+    seen_threads = set()
+
+    def handle(name, df):
+        seen_threads.add(threading.get_ident())
+        # 让靠前的 part 更晚完成，检验顺序不依赖完成先后
+        time.sleep(0.02 * (5 - int(name[1:])))
+        if name == "p2":
+            raise RuntimeError("boom")
+        return Path(f"{name}.csv"), {"part": name, "status": "success"}
+
+    data = {f"p{i}": make_df() for i in range(5)}
+    outputs, report = proc_mod._process_parts(handle, data, max_workers=4)
+
+    assert [r["part"] for r in report] == list(data)
+    assert outputs == [Path(f"p{i}.csv") for i in (0, 1, 3, 4)]
+    assert report[2]["status"] == "failed"
+    assert report[2]["reason"] == "unexpected_error"
+    assert "boom" in report[2]["message"]
+    assert len(seen_threads) > 1
+
+
+def test_handle_shares_calculator_between_parts_with_same_pair(monkeypatch, tmp_path):
+    """同一文件内解析到相同 (source, target) 的 part 只向计算器池请求一次。"""
+    requests = []
+
+    class FakeCalc:
+        def process_batch(self, forces, moments):
+            keys = ("force_transformed", "moment_transformed")
+            keys += ("coeff_force", "coeff_moment")
+            return {k: forces * 0.0 for k in keys}
+
+    class FakePool:
+        def get(self, project_data, **kwargs):
+            requests.append((kwargs["source_part"], kwargs["target_part"]))
+            return FakeCalc()
+
+    monkeypatch.setattr(proc_mod, "get_calculator_pool", FakePool)
+    handle = proc_mod._make_handle_single_part(
+        Path("f.mtfmt"),
+        object(),
+        tmp_path,
+        part_source_mapping={"a": "S", "b": "S", "c": "S2"},
+        part_target_mapping={"a": "T", "b": "T", "c": "T"},
+    )
+    data = {name: make_df() for name in ("a", "b", "c")}
+    outputs, report = proc_mod._process_parts(handle, data)
+
+    assert [r["status"] for r in report] == ["success"] * 3
+    assert len(outputs) == 3
+    assert requests == [("S", "T"), ("S2", "T")]
+
+
+def test_combine_parts_writes_one_long_format_file(monkeypatch, tmp_path):
+    """combine_parts=True 时所有成功的 part 写入一个带 part 键列的长表文件。"""
+
+    class FakeCalc:
+        def process_batch(self, forces, moments):
+            keys = ("force_transformed", "moment_transformed")
+            keys += ("coeff_force", "coeff_moment")
+            return {k: forces + 1.0 for k in keys}
+
+    class FakePool:
+        def get(self, project_data, **kwargs):
+            return FakeCalc()
+
+    monkeypatch.setattr(proc_mod, "get_calculator_pool", FakePool)
+    extra = make_df().assign(Alpha=[0.0, 4.0])
+    data = {"a": make_df(), "bad": make_df().drop(columns=["CMz"]), "b": extra}
+    kwargs = dict(
+        part_source_mapping={"a": "S", "bad": "S", "b": "S2"},
+        part_target_mapping={"a": "T", "bad": "T", "b": "T2"},
+        return_report=True,
+        parse_func=lambda _p: data,
+    )
+
+    outputs, report = proc_mod.process_special_format_file(
+        tmp_path / "f.mtfmt",
+        object(),
+        tmp_path / "out",
+        combine_parts=True,
+        max_workers=2,
+        **kwargs,
+    )
+
+    assert len(outputs) == 1 and outputs[0].name.startswith("f_parts_result_")
+    assert [r["status"] for r in report] == ["success", "skipped", "success"]
+    assert report[0]["out_path"] == str(outputs[0])
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == [outputs[0].name]
+
+    got = pd.read_csv(outputs[0])
+    assert list(got.columns[:3]) == ["part", "source_part", "target_part"]
+    assert list(got["part"]) == ["a", "a", "b", "b"]
+    assert list(got["target_part"]) == ["T", "T", "T2", "T2"]
+    assert got["Alpha"].isna().tolist() == [True, True, False, False]
+    assert got["Fx_new"].tolist() == [2.0, 3.0, 2.0, 3.0]
+
+    # 逐 part 输出仍是默认行为，各结果列与长表中对应行一致
+    per_part = proc_mod.process_special_format_file(
+        tmp_path / "f.mtfmt", object(), tmp_path / "per_part", **kwargs
+    )[0]
+    assert len(per_part) == 2
+    b_df = pd.read_csv(per_part[1])
+    pd.testing.assert_frame_equal(
+        got[got["part"] == "b"][list(b_df.columns)].reset_index(drop=True), b_df
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_combined_output_writes_each_part_as_it_completes(
+    monkeypatch, tmp_path, workers
+):
+    """合并输出逐个写出 part：写出第一个 part 时后续 part 尚未全部完成。"""
+    events = []
+
+    def handle(part_name, df):
+        events.append(("done", part_name))
+        return df.assign(Fx_new=1.0), {
+            "part": part_name,
+            "status": "success",
+            "source_part": "S",
+            "target_part": "T",
+        }
+
+    orig = proc_mod.LongFormatWriter.write_part
+
+    def write_part(self, df, part, *args):
+        events.append(("write", part))
+        return orig(self, df, part, *args)
+
+    monkeypatch.setattr(proc_mod.LongFormatWriter, "write_part", write_part)
+    data = {f"p{i}": make_df() for i in range(4)}
+    outputs, report = proc_mod._process_parts_combined(
+        handle, data, tmp_path / "all.csv", "csv", max_workers=workers
+    )
+
+    assert len(outputs) == 1 and [r["part"] for r in report] == list(data)
+    writes = [p for kind, p in events if kind == "write"]
+    assert writes == list(data)
+    if workers == 1:
+        assert events.index(("write", "p0")) < events.index(("done", "p1"))
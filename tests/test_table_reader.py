@@ -0,0 +1,102 @@
+"""载荷表列投影与类型化读取测试。"""
+
+import numpy as np
+import pandas as pd
+
+from src.table_reader import (
+    coerce_float_matrix,
+    iter_projected_csv,
+    read_projected_csv,
+    resolve_projection,
+    sniff_projection,
+)
+
+
+def _write_wide(path, rows=12, bad_row=None):
+    df = pd.DataFrame({f"ch{i}": np.arange(rows) * 0.5 for i in range(30)})
+    for k, name in enumerate(["Fx", "Fy", " fz ", "Mx", "My", "Mz"]):
+        df.insert(3 * k, name, np.arange(rows, dtype=float) + k)
+    df["Alpha"] = np.arange(rows)
+    df = df.astype(object)
+    if bad_row is not None:
+        df.loc[bad_row, "Fy"] = "bad"
+    df.to_csv(path, index=False)
+
+
+def test_resolve_projection_variants():
+    dim = resolve_projection(["t", "FX", "Fy", "Fz", "Mx", "My", "Mz", "Beta"])
+    assert dim.usecols == ["FX", "Fy", "Fz", "Mx", "My", "Mz", "Beta"]
+    assert "Beta" not in dim.float_cols
+
+    coeff = resolve_projection(["Cx", "Cy", "Fn", "CMx", "CMy", "CMz", "x"])
+    assert coeff.usecols == ["Cx", "Cy", "Fn", "CMx", "CMy", "CMz"]
+
+    # 缺少载荷列时不投影，保留下游的缺列报错
+    assert resolve_projection(["Fx", "Fy", "Fz", "Mx", "My"]) is None
+
+
+def test_projected_read_only_loads_needed_columns(tmp_path):
+    path = tmp_path / "wide.csv"
+    _write_wide(path)
+    projection = sniff_projection(path)
+    df = read_projected_csv(path, 0, projection)
+    assert list(df.columns) == ["Fx", "Fy", " fz ", "Mx", "My", "Mz", "Alpha"]
+    assert all(df[c].dtype == np.float64 for c in projection.float_cols)
+    assert sniff_projection(tmp_path / "x.xlsx") is None
+
+
+def test_only_dirty_chunk_takes_coercing_path(tmp_path):
+    path = tmp_path / "dirty.csv"
+    _write_wide(path, rows=12, bad_row=9)
+    projection = sniff_projection(path)
+    chunks = list(iter_projected_csv(path, 0, 4, projection))
+    assert [c["Fy"].dtype.kind for c in chunks] == ["f", "f", "O"]
+
+    full = pd.read_csv(path)
+    got = np.vstack([coerce_float_matrix(c, projection.float_cols) for c in chunks])
+    expected = (
+        full[projection.float_cols].apply(pd.to_numeric, errors="coerce").to_numpy()
+    )
+    np.testing.assert_array_equal(got, expected)
+    assert np.isnan(got[9, 1])
+
+
+def test_chunked_read_is_float64_and_rereads_only_dirty_chunk(tmp_path):
+    path = tmp_path / "mixed.csv"
+    header = "note\nFx,Fy,Fz,Mx,My,Mz,Alpha\n"
+    rows = ["1,2,3,4,5,6,0", "", "7,8,9,10,11,12,1", "1,x,3,4,5,6,2", "1.5,2,3,4,5,6,3"]
+    path.write_text(header + "\n".join(rows) + "\n", encoding="utf-8")
+    projection = sniff_projection(path, 1)
+    chunks = list(iter_projected_csv(path, 1, 2, projection))
+
+    # 整数块也按 float64 解析；只有含 "x" 的块走强制转换路径
+    assert [c["Fx"].dtype.kind for c in chunks] == ["f", "f", "f"]
+    assert [c["Fy"].dtype.kind for c in chunks] == ["f", "O", "f"]
+    assert [len(c) for c in chunks] == [1, 2, 1]
+    got = np.vstack([coerce_float_matrix(c, projection.float_cols) for c in chunks])
+    full = pd.read_csv(path, skiprows=1)
+    expected = (
+        full[projection.float_cols].apply(pd.to_numeric, errors="coerce").to_numpy()
+    )
+    np.testing.assert_array_equal(got, expected)
+
+
+def test_byte_range_chunks_match_full_read(tmp_path):
+    path = tmp_path / "ranged.csv"
+    _write_wide(path, rows=20, bad_row=13)
+    raw = path.read_bytes()
+    data_start = raw.index(b"\n") + 1
+    cut = raw.index(b"\n", (data_start + len(raw)) // 2) + 1
+    projection = sniff_projection(path)
+
+    for proj in (projection, None):
+        full = pd.concat(list(iter_projected_csv(path, 0, 100, proj)))
+        parts = [
+            chunk
+            for start, end in ((data_start, cut), (cut, len(raw)))
+            for chunk in iter_projected_csv(path, 0, 3, proj, byte_range=(start, end))
+        ]
+        got = np.vstack([coerce_float_matrix(c, full.columns[:6]) for c in parts])
+        expected = coerce_float_matrix(full, full.columns[:6])
+        np.testing.assert_array_equal(got, expected)
+        assert list(parts[0].columns) == list(full.columns)
@@ -0,0 +1,230 @@
+"""跟踪模式（--follow）：增量读取、增量解析与结果追加测试。"""
+
+import logging
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from batch import (
+    BatchConfig,
+    _FileFollower,
+    load_project_calculator,
+    process_single_file,
+    run_follow_mode,
+)
+from src.special_format_parser import (
+    SpecialFormatLineParser,
+    _extract_parts_from_lines,
+    parse_special_format_file,
+    process_special_format_file,
+)
+from src.special_format_processor import SpecialFormatFollower
+from src.tail_follow import CsvLineParser, TailReader
+
+DATA_FILE = Path("data/data.mtfmt")
+
+
+def _csv_lines(rows, start=0):
+    lines = ["Fx,Fy,Fz,Mx,My,Mz,Note\n"] if start == 0 else []
+    for r in range(start, start + rows):
+        lines.append(",".join(str(float(r) + k) for k in range(6)) + ",x\n")
+    return lines
+
+
+def test_tail_reader_returns_only_complete_lines(tmp_path):
+    f = tmp_path / "a.csv"
+    f.write_bytes(b"h1\nrow")
+    reader = TailReader(f)
+    assert reader.read_lines() == ["h1\n"]
+    with open(f, "ab") as fh:
+        fh.write(b"1\nrow2")
+    assert reader.read_lines() == ["row1\n"]
+    assert reader.read_lines() == []
+    assert reader.flush_partial() == ["row2"]
+
+    # 截断后提示调用方从头重建
+    f.write_bytes(b"new\n")
+    assert reader.read_lines() is None
+    reader.reset()
+    assert reader.read_lines() == ["new\n"]
+
+
+def test_tail_reader_detects_gbk_encoding(tmp_path):
+    f = tmp_path / "a.mtfmt"
+    f.write_bytes("参考面积：9.73m2\n机翼\n".encode("gbk"))
+    reader = TailReader(f)
+    assert reader.read_lines() == ["参考面积：9.73m2\n", "机翼\n"]
+    assert reader.encoding == "gbk"
+
+
+def test_tail_reader_resniffs_when_appended_bytes_change_encoding(tmp_path, caplog):
+    f = tmp_path / "a.mtfmt"
+    f.write_bytes(b"\xef\xbb\xbfPart1\nAlpha CL\n")
+    reader = TailReader(f)
+    # BOM 由 sniff_encoding_bytes 判定并在解码时去除
+    assert reader.read_lines() == ["Part1\n", "Alpha CL\n"]
+    assert reader.encoding == "utf-8-sig"
+
+    f.write_bytes(b"ascii only\n")
+    reader.reset()
+    assert reader.read_lines() == ["ascii only\n"]
+    assert reader.encoding == "utf-8"
+    with open(f, "ab") as fh:
+        fh.write("机翼\n".encode("gbk"))
+    with caplog.at_level(logging.WARNING, logger="src.tail_follow"):
+        lines = reader.read_lines()
+    assert lines == ["机翼\n"]
+    assert reader.encoding == "gbk"
+    assert "改用 gbk" in caplog.text
+
+
+def test_csv_line_parser_keeps_header_across_feeds():
+    parser = CsvLineParser(skip_rows=1)
+    assert parser.feed(["# comment\n"]) is None
+    lines = _csv_lines(3)
+    first = parser.feed(lines[:2])
+    second = parser.feed(lines[2:])
+    assert list(first.columns) == ["Fx", "Fy", "Fz", "Mx", "My", "Mz"]
+    assert first["Fx"].tolist() == [0.0] and second["Fx"].tolist() == [1.0, 2.0]
+    assert parser.rows == 3
+
+
+def test_special_format_line_parser_matches_full_parse():
+    lines = DATA_FILE.read_text(encoding="utf-8").splitlines(keepends=True)
+    parser = SpecialFormatLineParser()
+    new_rows = {}
+    for i in range(0, len(lines), 3):
+        for part, rows in parser.feed(lines[i : i + 3]).items():
+            new_rows.setdefault(part, []).extend(rows)
+    parser.finish()
+    expected = _extract_parts_from_lines(lines, DATA_FILE)
+    assert parser.parts == expected
+    assert new_rows == {part: rows for part, (_, rows) in expected.items() if rows}
+
+
+def test_follow_csv_appends_and_matches_full_run(tmp_path):
+    project_data, calculator = load_project_calculator(
+        "data/input.json", target_part="TestModel"
+    )
+    cfg = BatchConfig()
+    cfg.name_template = "{stem}_result.csv"
+    src = tmp_path / "live.csv"
+    src.write_text("")
+    follower = _FileFollower(
+        src, calculator, project_data, cfg, tmp_path, logging.getLogger("batch")
+    )
+
+    text = "".join(_csv_lines(5) + _csv_lines(7, start=5))
+    # 按任意字节边界追加（包括行中间）
+    for cut in (10, 57, 58, 140, 300):
+        with open(src, "a", encoding="utf-8") as fh:
+            fh.write(text[len(src.read_text()) : cut])
+        follower.poll()
+    with open(src, "a", encoding="utf-8") as fh:
+        fh.write(text[len(src.read_text()) :])
+    follower.poll()
+    follower.close()
+    assert follower.rows == 12
+    assert follower.reader.bytes_read == len(text.encode())
+
+    ref_dir = tmp_path / "ref"
+    ref_dir.mkdir()
+    assert process_single_file(src, calculator, cfg, ref_dir)
+    live = (tmp_path / "live_result.csv").read_bytes()
+    assert live == (ref_dir / "live_result.csv").read_bytes()
+    assert (tmp_path / "live_result.csv.complete").exists()
+
+
+def test_follow_special_format_matches_full_run(tmp_path):
+    project_data, calculator = load_project_calculator(
+        "data/input.json", target_part="TestModel"
+    )
+    cfg = BatchConfig()
+    lines = DATA_FILE.read_text(encoding="utf-8").splitlines(keepends=True)
+    src = tmp_path / "live.mtfmt"
+    src.write_text("")
+    out_dir = tmp_path / "out"
+    follower = _FileFollower(
+        src, calculator, project_data, cfg, out_dir, logging.getLogger("batch")
+    )
+    for i in range(0, len(lines), 4):
+        with open(src, "a", encoding="utf-8") as fh:
+            fh.writelines(lines[i : i + 4])
+        follower.poll()
+    follower.close()
+
+    ref_dir = tmp_path / "ref"
+    refs = process_special_format_file(src, project_data, ref_dir)
+    assert len(follower.outputs) == len(refs) == 4
+    for ref in refs:
+        part = ref.name.split("_")[1]
+        (live,) = [p for p in follower.outputs if p.name.split("_")[1] == part]
+        pd.testing.assert_frame_equal(pd.read_csv(live), pd.read_csv(ref))
+
+
+@pytest.mark.parametrize("truncate", [False, True])
+def test_run_follow_mode_stops_and_restarts_on_truncation(tmp_path, truncate):
+    src = tmp_path / "live.csv"
+    src.write_text("".join(_csv_lines(3)))
+    cfg = BatchConfig()
+    cfg.name_template = "{stem}_{timestamp}.csv"
+    cfg.timestamp_format = "%H%M%S%f"
+    stop = threading.Event()
+
+    def _writer():
+        stop.wait(0.2)
+        if truncate:
+            src.write_text("".join(_csv_lines(2)))
+            stop.wait(0.2)
+        with open(src, "a", encoding="utf-8") as fh:
+            fh.write("".join(_csv_lines(2, start=10)).rstrip("\n"))
+        stop.wait(0.2)
+        stop.set()
+
+    thread = threading.Thread(target=_writer)
+    thread.start()
+    summary = run_follow_mode(
+        "data/input.json",
+        str(src),
+        cfg,
+        target_part="TestModel",
+        poll_interval=0.01,
+        stop_event=stop,
+    )
+    thread.join()
+    assert summary["restarts"] == int(truncate)
+    assert len(summary["outputs"]) == 1 + int(truncate)
+    final = pd.read_csv(summary["outputs"][-1])
+    # 未以换行结尾的最后一行在退出时按完整行处理
+    assert len(final) == (4 if truncate else 5)
+    assert summary["rows"] == (7 if truncate else 5)
+
+
+def test_special_format_follower_appends_without_truncating(tmp_path):
+    project_data, _ = load_project_calculator(
+        "data/input.json", target_part="TestModel"
+    )
+    part, df = next(iter(parse_special_format_file(DATA_FILE).items()))
+
+    def _follower():
+        return SpecialFormatFollower(
+            DATA_FILE,
+            project_data,
+            tmp_path,
+            timestamp_format="fixed",
+            overwrite=True,
+        )
+
+    first = _follower()
+    assert first.append(part, df.iloc[:2]) == 2
+    assert first.append(part, df.iloc[2:]) == len(df) - 2
+    (out_path,) = first.outputs
+    # 重新打开同名输出（覆盖模式、跟踪重启）时不清空已有内容，也不重复写表头
+    second = _follower()
+    assert second.append(part, df) == len(df)
+    assert second.outputs == [out_path]
+    out = pd.read_csv(out_path)
+    assert len(out) == 2 * len(df)
+    assert out_path.read_text(encoding="utf-8").count("Fx_new") == 1
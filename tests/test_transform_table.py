@@ -0,0 +1,133 @@
+"""项目加载时预计算的 source×target 变换表测试。"""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from src.calculator_pool import _frames_content_hash
+from src.data_loader import ProjectData, load_data
+from src.physics import AeroCalculator
+from src.run_journal import config_hash
+from src.transform_table import TransformTable, build_transform_table
+from tests.helpers import make_frame, make_multi_target_project
+
+
+def _make_project():
+    project = make_multi_target_project(
+        {
+            "S": [make_frame("S", (5.0, 2.0, -3.0), [0.2, -0.1, 0.0])],
+            "S2": [make_frame("S2", (0.0, 7.0, 0.0))],
+        }
+    )
+    project.transform_table = build_transform_table(project)
+    return project
+
+
+def _calc(project, source, target, source_variant=0, target_variant=0):
+    return AeroCalculator(
+        project,
+        source_part=source,
+        source_variant=source_variant,
+        target_part=target,
+        target_variant=target_variant,
+    )
+
+
+def test_table_shapes_and_denominators():
+    table = _make_project().transform_table
+    assert isinstance(table, TransformTable)
+    assert table.rotations.shape == (2, 3, 3, 3)
+    assert table.lever_arms.shape == (2, 3, 3)
+    assert table.source_valid.all() and table.target_valid.all()
+    assert np.allclose(table.force_denominators, [150.0, 120.0, 150.0])
+    assert np.allclose(table.moment_denominators[1], [240.0, 60.0, 240.0])
+
+
+def test_calculator_geometry_matches_per_pair_path():
+    project = _make_project()
+    plain = dataclasses.replace(project)
+    assert plain.transform_table is None
+    rng = np.random.default_rng(3)
+    forces = rng.normal(size=(20, 3)) * 100
+    moments = rng.normal(size=(20, 3)) * 10
+    for (source, sv), (target, tv) in [
+        (s, t)
+        for s in project.transform_table.source_keys
+        for t in project.transform_table.target_keys
+    ]:
+        fast = _calc(project, source, target, sv, tv)
+        slow = _calc(plain, source, target, sv, tv)
+        for attr in ("basis_source", "basis_target", "rotation_matrix", "r_target"):
+            # 小向量 np.dot 的末位舍入依赖内存对齐，逐个计算路径本身也只在 ULP 级一致
+            assert np.allclose(getattr(fast, attr), getattr(slow, attr), 1e-15, 1e-15)
+        fast_res = fast.process_batch(forces, moments)
+        slow_res = slow.process_batch(forces, moments)
+        for key in slow_res:
+            assert np.allclose(fast_res[key], slow_res[key], rtol=1e-12, atol=1e-12)
+
+
+def test_lookup_parts_and_fingerprint():
+    project = _make_project()
+    table = project.transform_table
+    pair = table.lookup_parts("S", "Wing", target_variant=1)
+    assert pair is not None
+    assert np.array_equal(pair.rotation, table.rotations[0, 1])
+    # 返回副本，修改不影响表
+    pair.rotation[:] = 0.0
+    assert not np.array_equal(table.rotations[0, 1], pair.rotation)
+    assert table.lookup_parts("S", "Missing") is None
+
+    src = project.source_parts["S"][0]
+    tgt = project.target_parts["Tail"][0]
+    # 计算器池直接使用预计算指纹作为几何键
+    assert table.pair_fingerprint(src, tgt) == _frames_content_hash(
+        project, "S", 0, "Tail", 0
+    )
+    assert table.pair_fingerprint(src, tgt) != table.pair_fingerprint(
+        src, project.target_parts["Wing"][0]
+    )
+
+
+def test_replaced_frame_falls_back():
+    project = _make_project()
+    table = project.transform_table
+    old = project.target_parts["Tail"][0]
+    new = dataclasses.replace(old, moment_center=[1.0, 1.0, 1.0])
+    project.target_parts["Tail"][0] = new
+    assert table.lookup(project.source_parts["S"][0], new) is None
+    calc = _calc(project, "S", "Tail")
+    expected = calc.basis_target @ (np.array([0.2, -0.1, 0.0]) - np.ones(3))
+    assert np.allclose(calc.r_target, expected)
+
+
+def test_non_orthogonal_frame_excluded_and_still_warns():
+    project = _make_project()
+    bad = project.target_parts["Tail"][0]
+    bad.coord_system.y_axis = [0.3, 1.0, 0.0]
+    project.transform_table = build_transform_table(project)
+    table = project.transform_table
+    assert not table.target_valid[table.target_keys.index(("Tail", 0))]
+    assert table.lookup_parts("S", "Tail") is None
+    with pytest.warns(UserWarning):
+        _calc(project, "S", "Tail")
+
+
+def test_table_excluded_from_serialization():
+    project = _make_project()
+    assert "transform_table" not in dataclasses.asdict(project)
+    assert config_hash(project) == config_hash(
+        ProjectData(project.source_parts, project.target_parts)
+    )
+
+
+def test_load_data_attaches_table():
+    loaded = load_data("data/input.json")
+    table = loaded.transform_table
+    assert isinstance(table, TransformTable)
+    assert len(table.source_keys) == sum(map(len, loaded.source_parts.values()))
+    assert len(table.target_keys) == sum(map(len, loaded.target_parts.values()))
+    assert (
+        load_data("data/input.json", build_transform_table=False).transform_table
+        is None
+    )